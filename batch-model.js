@@ -0,0 +1,67 @@
+/**
+ * 德国独立储能电站投资测算系统 - 批量模型运行
+ * @description 读取情景列表（saveModel() 的 modelData 结构：{ parameters, spotPrices }），逐个运行网页版模型，
+ *              以按字段分列的JSON输出，供 Python 一致性校验等工具读取
+ * @usage node batch-model.js scenarios.json > results.json   （省略文件名时从stdin读取）
+ * @version 1.0
+ */
+
+const fs = require('fs');
+const { loadModel, defaultSpotPrices } = require('./node-model');
+
+/** @type {string[]} 输出的逐年分节（与 runModel() 返回的字段名一致） */
+const YEARLY_SECTIONS = ['opexData', 'revenueData', 'depreciationData', 'loanData',
+                         'incomeData', 'cashFlowData', 'balanceData'];
+
+/**
+ * 读取输入JSON
+ * @param {string} [file] 文件路径
+ * @returns {Object[]} 情景列表
+ */
+function readScenarios(file) {
+    const text = fs.readFileSync(file || 0, 'utf8');
+    const data = JSON.parse(text);
+    return Array.isArray(data) ? data : data.scenarios;
+}
+
+/**
+ * 将一次模型结果追加到分列输出
+ * @param {Object} columns 分列结果 { '分节.字段': [各情景的值] }
+ * @param {Object} results runModel() 结果
+ * @param {Object} extras 附加指标
+ */
+function appendResults(columns, results, extras) {
+    const push = (key, value) => (columns[key] || (columns[key] = [])).push(value);
+    Object.keys(results.capex).forEach(name => push(`capex.${name}`, results.capex[name]));
+    YEARLY_SECTIONS.forEach(section => {
+        const rows = results[section];
+        Object.keys(rows[0]).forEach(name => {
+            if (name !== 'year') {
+                push(`${section}.${name}`, rows.map(row => row[name]));
+            }
+        });
+    });
+    const indicators = Object.assign({}, results.indicators, extras);
+    Object.keys(indicators).forEach(name => push(`indicators.${name}`, indicators[name]));
+}
+
+function main() {
+    const model = loadModel();
+    const scenarios = readScenarios(process.argv[2]);
+    const columns = {};
+
+    scenarios.forEach(scenario => {
+        const params = scenario.parameters;
+        const spotPrices = scenario.spotPrices || defaultSpotPrices(params.operation_years);
+        const results = model.runModel(params, spotPrices);
+        appendResults(columns, results, {
+            npv: model.calculateNPV(results.cashFlowData.map(d => d.projectCashFlow), 0.08),
+            min_dscr: model.calculateMinDSCR(results.incomeData, results.loanData, params)
+        });
+    });
+
+    // NaN/Infinity 在JSON中输出为null
+    process.stdout.write(JSON.stringify({ count: scenarios.length, columns: columns }));
+}
+
+main();
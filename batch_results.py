@@ -0,0 +1,263 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+德国独立储能电站财务测算系统 - 列式批量结果
+@description 把 model_engine.run_arrays / run_batch 的分节结果整理为列式容器：每个逐年分项一块连续的
+             (情景数, 年份数) 数组（第0列为建设期，不含建设期的分节该列为NaN），CAPEX与指标为 (情景数,) 数组；
+             取分项、取情景均为视图不复制，可零拷贝交给 NumPy 或 pandas（长表：每行一个情景年份）；
+             CSV 与 Parquet 按情景分块流式写出，不构造逐行字典，百万行输出的内存占用只与分块大小有关
+@usage python batch_results.py 模型目录 --csv 逐年结果.csv --parquet 逐年结果.parquet --block 2000
+@version 1.0
+"""
+
+import argparse
+import sys
+import time
+
+import numpy as np
+
+import model_engine
+from scenario_store import YEARLY_SECTIONS
+
+# 分节在列名中的前缀：列名为 '前缀.分项'，如 income.netProfit、cash_flow.projectCashFlow
+SECTION_PREFIXES = {
+    'revenueData': 'revenue', 'opexData': 'opex', 'depreciationData': 'depreciation', 'loanData': 'loan',
+    'incomeData': 'income', 'cashFlowData': 'cash_flow', 'balanceData': 'balance',
+}
+
+# 流式写出时每块的情景数
+DEFAULT_BLOCK = 2000
+
+# CSV 数值格式（10位有效数字，NaN 写为 nan）
+CSV_FLOAT_FORMAT = '%.10g'
+
+# ==================== 列式结果 ====================
+
+class BatchResults:
+    """
+    列式批量结果
+    yearly：{列名: (情景数, 年份数) 数组}，第t列为第t年（第0列为建设期）；
+    scalars：{列名: (情景数,) 数组}，CAPEX 为 'capex.分项'，指标为 'indicators.指标名'；
+    ids：情景编号（分块计算时为全局序号）；
+    width：年份列数，取自逐年数组的列数（切片后仍为整批的列数，不随所含情景的运营年限变化）
+    """
+
+    def __init__(self, yearly, scalars, years, ids=None):
+        self.yearly = yearly
+        self.scalars = scalars
+        self.years = np.asarray(years).astype(int)
+        self.ids = np.arange(len(self.years)) if ids is None else np.asarray(ids)
+        if yearly:
+            self.width = next(iter(yearly.values())).shape[1]
+        else:
+            self.width = int(self.years.max()) + 1 if len(self.years) else 0
+
+    @classmethod
+    def from_run(cls, results, ids=None):
+        """
+        由 run_arrays 的分节结果构建；不含建设期的分节补一列NaN（每个分项复制一次，之后的取用均为视图）
+        @param ids: 情景编号，缺省为 0..情景数-1；分块计算时可传入 offset + arange
+        """
+        years = np.asarray(results['years']).astype(int)
+        width = int(years.max()) + 1
+        yearly = {}
+        for section, prefix in SECTION_PREFIXES.items():
+            with_initial = YEARLY_SECTIONS[section]
+            for name, values in results[section].items():
+                values = np.asarray(values)
+                if with_initial:
+                    column = np.ascontiguousarray(values)
+                else:
+                    column = np.full((len(years), width), np.nan, dtype=values.dtype)
+                    column[:, 1:] = values
+                yearly[f'{prefix}.{name}'] = column
+        scalars = {f'capex.{name}': np.asarray(values) for name, values in results['capex'].items()}
+        scalars.update({f'indicators.{name}': np.asarray(values) for name, values in results['indicators'].items()})
+        return cls(yearly, scalars, years, ids)
+
+    def __len__(self):
+        return len(self.years)
+
+    def __getitem__(self, name):
+        """取一列（视图）：逐年分项为 (情景数, 年份数)，CAPEX与指标为 (情景数,)"""
+        return self.yearly[name] if name in self.yearly else self.scalars[name]
+
+    def scenario(self, index):
+        """单个情景的全部数据（各列的行视图）"""
+        return {name: values[index] for name, values in {**self.yearly, **self.scalars}.items()}
+
+    def slice(self, start, stop):
+        """情景 [start, stop) 的子集（视图）"""
+        return BatchResults({name: values[start:stop] for name, values in self.yearly.items()},
+                            {name: values[start:stop] for name, values in self.scalars.items()},
+                            self.years[start:stop], self.ids[start:stop])
+
+    def active(self):
+        """(情景数, 年份数) 布尔数组：建设期及运营年限以内的年份"""
+        return np.arange(self.width) <= self.years[:, None]
+
+    def long_columns(self, names=None, active_only=False):
+        """
+        长表列：{'scenario', 'year', 列名...}，每行一个情景年份
+        active_only 为假时各分项列为底层数组 ravel() 后的视图（零拷贝），超出运营年限的行保留（数值为0）；
+        为真时按运营年限筛行（按块复制）
+        """
+        names = list(self.yearly) if names is None else list(names)
+        count, width = len(self), self.width
+        columns = {'scenario': np.repeat(self.ids, width), 'year': np.tile(np.arange(width), count)}
+        columns.update({name: self.yearly[name].ravel() for name in names})
+        if active_only:
+            mask = self.active().ravel()
+            columns = {name: values[mask] for name, values in columns.items()}
+        return columns
+
+    def to_pandas(self, names=None, active_only=False):
+        """逐年长表 DataFrame（需安装 pandas；各列直接引用底层数组，不复制）"""
+        import pandas as pd
+        return pd.DataFrame(self.long_columns(names, active_only), copy=False)
+
+    def scalars_to_pandas(self):
+        """每个情景一行的 CAPEX 与指标 DataFrame（需安装 pandas）"""
+        import pandas as pd
+        return pd.DataFrame(self.scalars, index=pd.Index(self.ids, name='scenario'), copy=False)
+
+    def write_csv(self, path, names=None, block=DEFAULT_BLOCK):
+        """流式写出逐年长表 CSV"""
+        with CsvResultWriter(path, list(self.yearly) if names is None else names) as writer:
+            writer.write(self, block)
+
+    def write_parquet(self, path, names=None, block=DEFAULT_BLOCK):
+        """流式写出逐年长表 Parquet（需安装 pyarrow）"""
+        with ParquetResultWriter(path, list(self.yearly) if names is None else names) as writer:
+            writer.write(self, block)
+
+# ==================== 流式写出 ====================
+
+class CsvResultWriter:
+    """
+    逐年长表CSV写出器：可多次 write（分块计算时逐块追加），每块按情景再分段格式化写入，只保留运营年限以内的行
+    """
+
+    def __init__(self, path, names):
+        self.names = list(names)
+        self.file = open(path, 'w', encoding='utf-8', newline='')
+        self.file.write(','.join(['scenario', 'year'] + self.names) + '\n')
+        self.format = ['%d', '%d'] + [CSV_FLOAT_FORMAT] * len(self.names)
+        self.rows = 0
+
+    def write(self, batch, block=DEFAULT_BLOCK):
+        for start in range(0, len(batch), block):
+            columns = batch.slice(start, start + block).long_columns(self.names, active_only=True)
+            matrix = np.column_stack([columns[name] for name in ['scenario', 'year'] + self.names])
+            np.savetxt(self.file, matrix, fmt=self.format, delimiter=',')
+            self.rows += len(matrix)
+
+    def close(self):
+        self.file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+class ParquetResultWriter:
+    """逐年长表Parquet写出器：每次写入的每个情景块为一个行组（需安装 pyarrow）"""
+
+    def __init__(self, path, names):
+        try:
+            import pyarrow
+            import pyarrow.parquet
+        except ImportError:
+            raise ImportError('写出Parquet需要安装 pyarrow：pip install pyarrow') from None
+        self.pa = pyarrow
+        self.pq = pyarrow.parquet
+        self.names = list(names)
+        self.path = path
+        self.writer = None
+        self.rows = 0
+
+    def write(self, batch, block=DEFAULT_BLOCK):
+        for start in range(0, len(batch), block):
+            columns = batch.slice(start, start + block).long_columns(self.names, active_only=True)
+            table = self.pa.table({name: self.pa.array(values) for name, values in columns.items()})
+            if self.writer is None:
+                self.writer = self.pq.ParquetWriter(self.path, table.schema)
+            self.writer.write_table(table)
+            self.rows += table.num_rows
+
+    def close(self):
+        if self.writer is not None:
+            self.writer.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+# ==================== 分块计算 ====================
+
+def iter_results(params, spot, block=DEFAULT_BLOCK, dtype=None):
+    """
+    按情景分块批量计算，逐块产出 BatchResults（ids 为全局序号），整批逐年表不会同时驻留内存
+    @param params / spot: run_arrays 的输入（见 model_engine.stack_parameters、model_loader.ParameterMatrix.to_params）
+    """
+    count = len(spot)
+    for start in range(0, count, block):
+        stop = min(count, start + block)
+        subset = {name: np.asarray(values)[start:stop] for name, values in params.items()}
+        width = int(np.asarray(subset['operation_years']).astype(int).max())
+        results = model_engine.run_arrays(subset, np.asarray(spot)[start:stop, :width], dtype)
+        yield BatchResults.from_run(results, np.arange(start, stop))
+
+# ==================== 命令行 ====================
+
+def main():
+    parser = argparse.ArgumentParser(description='批量计算模型文件并流式写出逐年结果（CSV / Parquet）')
+    parser.add_argument('directory', help='模型文件目录（含子目录）')
+    parser.add_argument('--csv', help='逐年长表CSV')
+    parser.add_argument('--parquet', help='逐年长表Parquet（需安装 pyarrow）')
+    parser.add_argument('--items', help='只写出这些分项（逗号分隔，如 income.netProfit,cash_flow.projectCashFlow）')
+    parser.add_argument('--block', type=int, default=DEFAULT_BLOCK, help='每块计算与写出的情景数')
+    parser.add_argument('--float32', action='store_true', help='以float32计算逐年表')
+    parser.add_argument('--workers', type=int, default=None, help='导入模型文件的进程数')
+    args = parser.parse_args()
+    if not args.csv and not args.parquet:
+        parser.error('请至少指定 --csv 或 --parquet')
+
+    from model_loader import load_directory
+    start = time.perf_counter()
+    matrix = load_directory(args.directory, workers=args.workers)
+    print(f'导入 {len(matrix.files)} 个模型，{len(matrix.errors)} 个文件未通过校验')
+    if not matrix.files:
+        return 1
+
+    writers = []
+    try:
+        for index, results in enumerate(iter_results(matrix.to_params(), matrix.spot, args.block,
+                                                     'float32' if args.float32 else None)):
+            if not writers:
+                names = args.items.split(',') if args.items else list(results.yearly)
+                unknown = [name for name in names if name not in results.yearly]
+                if unknown:
+                    print(f'未知分项: {", ".join(unknown)}')
+                    return 1
+                if args.csv:
+                    writers.append(CsvResultWriter(args.csv, names))
+                if args.parquet:
+                    try:
+                        writers.append(ParquetResultWriter(args.parquet, names))
+                    except ImportError as e:
+                        print(e)
+                        return 1
+            for writer in writers:
+                writer.write(results, args.block)
+    finally:
+        for writer in writers:
+            writer.close()
+    print(f'已写出 {writers[0].rows} 行（{time.perf_counter() - start:.2f} 秒），情景编号为导入顺序（0起）')
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,126 @@
+/**
+ * 德国独立储能电站投资测算系统 - 模型引擎基准测试
+ * @description 计时单次模型计算、50×50双变量敏感性网格、1万组现金流IRR求解，结果以JSON输出到stdout
+ * @usage node benchmark-model.js [--repeat 5] [--seed 42]
+ * @version 1.0
+ */
+
+const { performance } = require('perf_hooks');
+const { loadModel, defaultParameters, defaultSpotPrices } = require('./node-model');
+
+/**
+ * 解析命令行参数
+ * @returns {Object} 配置
+ */
+function parseArgs(argv) {
+    const options = { repeat: 5, seed: 42 };
+    for (let i = 0; i < argv.length; i++) {
+        if (argv[i] === '--repeat') options.repeat = parseInt(argv[++i], 10);
+        if (argv[i] === '--seed') options.seed = parseInt(argv[++i], 10);
+    }
+    return options;
+}
+
+/**
+ * 可复现的伪随机数生成器（mulberry32）
+ * @param {number} seed 种子
+ * @returns {Function} 返回[0,1)均匀分布随机数的函数
+ */
+function createRandom(seed) {
+    let state = seed >>> 0;
+    return function() {
+        state = (state + 0x6D2B79F5) >>> 0;
+        let t = state;
+        t = Math.imul(t ^ (t >>> 15), t | 1);
+        t ^= t + Math.imul(t ^ (t >>> 7), t | 61);
+        return ((t ^ (t >>> 14)) >>> 0) / 4294967296;
+    };
+}
+
+/**
+ * 多次运行并统计耗时
+ * @param {Function} fn 被测函数
+ * @param {number} repeat 重复次数
+ * @param {number} inner 每次重复内的调用次数（用于极短操作）
+ * @returns {Object} 耗时统计（毫秒/次）
+ */
+function timeIt(fn, repeat, inner = 1) {
+    fn(); // 预热
+    const samples = [];
+    for (let r = 0; r < repeat; r++) {
+        const start = performance.now();
+        for (let i = 0; i < inner; i++) {
+            fn();
+        }
+        samples.push((performance.now() - start) / inner);
+    }
+    samples.sort((a, b) => a - b);
+    return {
+        median_ms: samples[Math.floor(samples.length / 2)],
+        min_ms: samples[0],
+        max_ms: samples[samples.length - 1],
+        repeat: repeat,
+        inner: inner
+    };
+}
+
+/**
+ * 生成1万组典型项目现金流（建设期投资为负，运营期为正）
+ * @param {Function} random 随机数函数
+ * @param {number} count 组数
+ * @param {number} years 运营年数
+ * @returns {number[][]} 现金流数组
+ */
+function generateCashFlows(random, count, years) {
+    const vectors = [];
+    for (let k = 0; k < count; k++) {
+        const investment = 3000 + random() * 5000;
+        const flows = [-investment];
+        const annual = investment * (0.06 + random() * 0.12);
+        for (let y = 1; y <= years; y++) {
+            flows.push(annual * (0.8 + random() * 0.4));
+        }
+        vectors.push(flows);
+    }
+    return vectors;
+}
+
+function main() {
+    const options = parseArgs(process.argv.slice(2));
+    const model = loadModel();
+    const params = defaultParameters(model);
+    const spotPrices = defaultSpotPrices(params.operation_years);
+    const results = {};
+
+    // 1. 单次模型计算（不经缓存）
+    results.model_single = timeIt(() => model.runModel(params, spotPrices), options.repeat, 200);
+
+    // 2. 50×50 双变量敏感性网格（每次重复前清空缓存，计入冷启动）
+    const changes = [];
+    for (let i = 0; i < 50; i++) {
+        changes.push(Math.round((-0.25 + i * 0.01) * 100) / 100);
+    }
+    results.sensitivity_grid_50x50 = timeIt(() => {
+        model.modelCache.clear();
+        model.runDoubleVariableSensitivity(params, 'capex', 'tolling_price', 'equity_irr', changes, spotPrices);
+    }, options.repeat);
+    results.sensitivity_grid_50x50.cache = model.modelCache.getStats();
+
+    // 3. 1万组现金流IRR求解
+    const cashFlows = generateCashFlows(createRandom(options.seed), 10000, params.operation_years);
+    results.irr_10k = timeIt(() => {
+        for (let k = 0; k < cashFlows.length; k++) {
+            model.calculateIRR(cashFlows[k]);
+        }
+    }, options.repeat);
+
+    results.memory = {
+        heap_used_bytes: process.memoryUsage().heapUsed,
+        rss_bytes: process.memoryUsage().rss
+    };
+    results.node_version = process.version;
+
+    process.stdout.write(JSON.stringify(results, null, 2) + '\n');
+}
+
+main();
@@ -0,0 +1,202 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+德国独立储能电站财务测算系统 - 性能基准测试
+@description 计时模型引擎（通过 Node.js 运行网页版模型）与 Excel 生成器，结果写入 JSON 以便跨提交对比回归
+@version 1.0
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_OUTPUT_DIR = os.path.join(BASE_DIR, 'benchmark_results')
+
+# 对比时视为回归的耗时/内存增长倍数
+DEFAULT_REGRESSION_THRESHOLD = 1.25
+
+# ==================== 计时工具 ====================
+
+def time_repeated(func, repeat):
+    """重复执行并返回耗时统计（毫秒），首次调用作为预热不计入"""
+    func()
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        samples.append((time.perf_counter() - start) * 1000)
+    return {
+        'median_ms': statistics.median(samples),
+        'min_ms': min(samples),
+        'max_ms': max(samples),
+        'repeat': repeat,
+    }
+
+def measure_peak_memory(func):
+    """使用tracemalloc测量单次执行的峰值内存（与计时分开运行，避免追踪开销影响耗时）"""
+    tracemalloc.start()
+    try:
+        func()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak
+
+# ==================== 模型引擎基准 ====================
+
+def run_model_benchmarks(repeat, seed):
+    """通过 Node.js 运行 benchmark-model.js，返回其JSON结果"""
+    node = shutil.which('node')
+    if node is None:
+        return {'skipped': '未找到 node，可执行文件不在PATH中'}
+    completed = subprocess.run(
+        [node, os.path.join(BASE_DIR, 'benchmark-model.js'), '--repeat', str(repeat), '--seed', str(seed)],
+        capture_output=True, text=True, encoding='utf-8', check=True,
+    )
+    return json.loads(completed.stdout)
+
+# ==================== Excel生成器基准 ====================
+
+def run_excel_benchmarks(repeat):
+    """计时 create_excel_file() 的耗时与峰值内存（顺序与并行构建工作表），以及生成文件的回读耗时"""
+    import openpyxl
+    from generate_excel import create_excel_file, parallel_workers, shutdown_pool
+
+    results = {}
+    with tempfile.TemporaryDirectory() as tmpdir:
+        filepath = os.path.join(tmpdir, 'benchmark.xlsx')
+
+        def generate():
+            with contextlib.redirect_stdout(io.StringIO()):
+                create_excel_file(filepath)
+
+        results['create_excel_file'] = time_repeated(generate, repeat)
+        results['create_excel_file']['peak_memory_bytes'] = measure_peak_memory(generate)
+        results['create_excel_file']['file_size_bytes'] = os.path.getsize(filepath)
+
+        # 并行构建工作表（CPU核数个进程）：time_repeated 的预热调用启动进程池，计时的各次调用复用进程池
+        def generate_parallel():
+            with contextlib.redirect_stdout(io.StringIO()):
+                create_excel_file(filepath, workers=None)
+
+        try:
+            parallel = time_repeated(generate_parallel, repeat)
+            parallel['workers'] = parallel_workers(None)
+            parallel['speedup'] = results['create_excel_file']['median_ms'] / parallel['median_ms']
+            results['create_excel_file_parallel'] = parallel
+        finally:
+            shutdown_pool()
+        print(f"  工作表并行构建: {parallel['workers']} 个进程，加速比 {parallel['speedup']:.2f}x")
+
+        results['workbook_readback'] = time_repeated(lambda: openpyxl.load_workbook(filepath), repeat)
+        results['workbook_readback']['peak_memory_bytes'] = measure_peak_memory(
+            lambda: openpyxl.load_workbook(filepath))
+        results['openpyxl_version'] = openpyxl.__version__
+    return results
+
+# ==================== 结果读写与对比 ====================
+
+def get_git_commit():
+    """获取当前提交号，非git环境返回None"""
+    try:
+        completed = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=BASE_DIR,
+                                   capture_output=True, text=True, check=True)
+        return completed.stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+def collect_environment():
+    """收集运行环境信息"""
+    return {
+        'commit': get_git_commit(),
+        'timestamp': datetime.now().isoformat(timespec='seconds'),
+        'python_version': platform.python_version(),
+        'platform': platform.platform(),
+        'cpu_count': os.cpu_count(),
+    }
+
+def flatten_metrics(results, prefix=''):
+    """将结果展平为 {指标路径: 数值}，只保留可对比的耗时与内存指标"""
+    metrics = {}
+    for key, value in results.items():
+        path = f'{prefix}{key}'
+        if isinstance(value, dict):
+            metrics.update(flatten_metrics(value, path + '.'))
+        elif key in ('median_ms', 'peak_memory_bytes') and isinstance(value, (int, float)):
+            metrics[path] = value
+    return metrics
+
+def compare_results(baseline, current, threshold):
+    """对比两次基准结果，打印变化表并返回回归指标列表"""
+    base_metrics = flatten_metrics(baseline['results'])
+    curr_metrics = flatten_metrics(current['results'])
+    regressions = []
+    print(f"{'指标':<52}{'基准':>14}{'当前':>14}{'倍数':>8}")
+    for path in sorted(set(base_metrics) & set(curr_metrics)):
+        base, curr = base_metrics[path], curr_metrics[path]
+        ratio = curr / base if base else float('inf')
+        flag = ''
+        if ratio > threshold:
+            flag = '  ← 回归'
+            regressions.append(path)
+        print(f"{path:<52}{base:>14.2f}{curr:>14.2f}{ratio:>8.2f}{flag}")
+    return regressions
+
+def write_results(document, output):
+    """写入JSON结果文件，缺省按时间戳和提交号命名"""
+    if output is None:
+        os.makedirs(DEFAULT_OUTPUT_DIR, exist_ok=True)
+        stamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+        output = os.path.join(DEFAULT_OUTPUT_DIR, f"bench_{stamp}_{document['environment']['commit'] or 'nogit'}.json")
+    with open(output, 'w', encoding='utf-8') as f:
+        json.dump(document, f, indent=2, ensure_ascii=False)
+    return output
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='模型引擎与Excel生成器性能基准测试')
+    parser.add_argument('--repeat', type=int, default=5, help='每项基准的重复次数')
+    parser.add_argument('--seed', type=int, default=42, help='随机现金流的种子')
+    parser.add_argument('--output', help='结果JSON路径，缺省写入 benchmark_results/')
+    parser.add_argument('--compare', help='与指定的基准结果JSON对比')
+    parser.add_argument('--threshold', type=float, default=DEFAULT_REGRESSION_THRESHOLD,
+                        help='判定回归的倍数阈值')
+    parser.add_argument('--skip-model', action='store_true', help='跳过模型引擎基准')
+    parser.add_argument('--skip-excel', action='store_true', help='跳过Excel生成器基准')
+    args = parser.parse_args(argv)
+
+    results = {}
+    if not args.skip_model:
+        print('运行模型引擎基准...')
+        results['model'] = run_model_benchmarks(args.repeat, args.seed)
+    if not args.skip_excel:
+        print('运行Excel生成器基准...')
+        results['excel'] = run_excel_benchmarks(args.repeat)
+
+    document = {'environment': collect_environment(), 'results': results}
+    output = write_results(document, args.output)
+    print(f'基准结果已写入: {output}')
+
+    if args.compare:
+        with open(args.compare, 'r', encoding='utf-8') as f:
+            baseline = json.load(f)
+        regressions = compare_results(baseline, document, args.threshold)
+        if regressions:
+            print(f'✗ {len(regressions)} 项指标超过 {args.threshold}x 阈值')
+            return 1
+        print('✓ 无性能回归')
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
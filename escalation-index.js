@@ -0,0 +1,115 @@
+/**
+ * 德国独立储能电站投资测算系统 - 指数曲线
+ * @description 通胀、各项OPEX增长、Tolling调价、容量衰减等逐年系数的统一来源：
+ *              按（变化率或逐年变化率曲线, 年数）以累乘一次算出指数曲线并缓存，收入与成本各项直接按年查表
+ * @version 1.0
+ */
+
+// ==================== 指数曲线构建 ====================
+
+/** @type {number} 缓存的曲线条数上限（超出时清空重建） */
+const ESCALATION_CACHE_MAX_ENTRIES = 256;
+
+/**
+ * 判断是否为逐年变化率曲线
+ * @param {*} rate 变化率或曲线
+ * @returns {boolean}
+ */
+function isRateCurve(rate) {
+    return Array.isArray(rate) || ArrayBuffer.isView(rate);
+}
+
+/**
+ * 累乘构建指数曲线：第1年为1，第t年 = 第t-1年 × (1 + sign × 变化率)
+ * @param {number|number[]} rate 固定年变化率，或逐年变化率曲线（第k项为第k+2年相对第k+1年的变化率，长度不足时沿用最后一项）
+ * @param {number} years 年数
+ * @param {number} [sign=1] 变化方向，容量衰减等逐年递减的系数传 -1
+ * @returns {Float64Array} 第i项为第i+1年的指数
+ */
+function buildEscalationIndex(rate, years, sign = 1) {
+    const index = new Float64Array(Math.max(years, 0));
+    const curve = isRateCurve(rate);
+    let value = 1;
+    for (let t = 0; t < index.length; t++) {
+        if (t > 0) {
+            const r = curve ? rate[Math.min(t - 1, rate.length - 1)] : rate;
+            value *= 1 + sign * r;
+        }
+        index[t] = value;
+    }
+    return index;
+}
+
+// ==================== 指数曲线缓存 ====================
+
+/**
+ * 指数曲线缓存
+ * @description 相同（变化率/曲线, 年数, 方向）只计算一次；返回的数组在调用方之间共享，不得修改
+ */
+class EscalationIndexCache {
+    /**
+     * @param {number} [maxEntries] 最多缓存的曲线条数
+     */
+    constructor(maxEntries = ESCALATION_CACHE_MAX_ENTRIES) {
+        this.maxEntries = maxEntries;
+        this.entries = new Map();
+        this.hits = 0;
+        this.misses = 0;
+    }
+
+    /**
+     * 获取指数曲线
+     * @param {number|number[]} rate 固定年变化率或逐年变化率曲线
+     * @param {number} years 年数
+     * @param {number} [sign=1] 变化方向
+     * @returns {Float64Array} 第i项为第i+1年的指数（只读）
+     */
+    get(rate, years, sign = 1) {
+        const key = (isRateCurve(rate) ? Array.prototype.join.call(rate, ',') : String(rate)) +
+                    '|' + years + '|' + sign;
+        let index = this.entries.get(key);
+        if (index) {
+            this.hits++;
+            return index;
+        }
+        this.misses++;
+        index = buildEscalationIndex(rate, years, sign);
+        if (this.entries.size >= this.maxEntries) {
+            this.entries.clear();
+        }
+        this.entries.set(key, index);
+        return index;
+    }
+
+    clear() {
+        this.entries.clear();
+        this.hits = 0;
+        this.misses = 0;
+    }
+
+    /**
+     * 获取命中统计
+     * @returns {Object} 命中/未命中次数与缓存条数
+     */
+    getStats() {
+        return { hits: this.hits, misses: this.misses, entries: this.entries.size };
+    }
+}
+
+/** @type {EscalationIndexCache} 全局指数曲线缓存 */
+const escalationIndexCache = new EscalationIndexCache();
+
+/**
+ * 获取参数对应的指数曲线
+ * @description 参数 `${name}_curve` 为非空数组时按逐年曲线计算（如 inflation_rate_curve），否则按固定变化率 params[name]
+ * @param {Object} params 参数
+ * @param {string} name 变化率参数名，如 'inflation_rate'、'opex_grid_esc'、'degradation_rate'
+ * @param {number} years 年数
+ * @param {number} [sign=1] 变化方向，容量衰减传 -1
+ * @returns {Float64Array} 第i项为第i+1年的指数（只读）
+ */
+function escalationIndex(params, name, years, sign = 1) {
+    const curve = params[name + '_curve'];
+    const rate = isRateCurve(curve) && curve.length > 0 ? curve : params[name];
+    return escalationIndexCache.get(rate, years, sign);
+}
@@ -0,0 +1,154 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+德国独立储能电站财务测算系统 - Excel 工作表部件序列化与组装
+@description 把单张工作表序列化为工作表XML和它自己的样式表，再按工作表顺序合并样式，组装为 .xlsx，
+             供 generate_excel 并行构建工作表使用。
+             本模块用到 openpyxl 的内部接口：WorksheetWriter、工作簿的样式列表、ExcelWriter.write_worksheet。
+             这些接口已按 requirements.txt 固定的 openpyxl 版本验证。导入时会检查接口是否存在，
+             缺失时 AVAILABLE 为假，generate_excel 改为顺序构建，并用公开的 Workbook.save 保存
+@version 1.0
+"""
+
+import re
+from datetime import datetime
+from io import BytesIO
+from zipfile import ZipFile, ZipInfo, ZIP_DEFLATED
+
+import openpyxl
+from openpyxl.packaging.relationship import RelationshipList
+from openpyxl.styles.cell_style import StyleArray
+from openpyxl.styles.numbers import BUILTIN_FORMATS, BUILTIN_FORMATS_REVERSE
+
+# 已验证的 openpyxl 版本（与 requirements.txt 一致），其他版本先检查接口再使用
+VERIFIED_OPENPYXL_VERSION = '3.1.5'
+
+# 工作簿上用到的内部样式列表
+_STYLE_LISTS = ('_fonts', '_fills', '_borders', '_alignments', '_protections', '_number_formats', '_cell_styles')
+
+def _check_internals():
+    """检查用到的 openpyxl 内部接口，返回不可用的原因（可用时为None）"""
+    try:
+        from openpyxl.worksheet._writer import WorksheetWriter
+        from openpyxl.writer.excel import ExcelWriter
+    except ImportError as e:
+        return f'缺少 openpyxl 内部模块: {e}'
+    for name in ('write', 'read'):
+        if not hasattr(WorksheetWriter, name):
+            return f'WorksheetWriter 缺少 {name}()'
+    for name in ('write_worksheet', 'write_data'):
+        if not hasattr(ExcelWriter, name):
+            return f'ExcelWriter 缺少 {name}()'
+    wb = openpyxl.Workbook()
+    missing = [name for name in _STYLE_LISTS if not hasattr(wb, name)]
+    if missing:
+        return f'Workbook 缺少样式列表: {", ".join(missing)}'
+    return None
+
+UNAVAILABLE_REASON = _check_internals()
+AVAILABLE = UNAVAILABLE_REASON is None
+
+if AVAILABLE:
+    from openpyxl.worksheet._writer import WorksheetWriter
+    from openpyxl.writer.excel import ExcelWriter
+else:
+    ExcelWriter = object
+
+# 固定的文件属性时间与zip条目时间：相同输入生成逐字节相同的文件
+WORKBOOK_TIMESTAMP = datetime(2024, 1, 1)
+ZIP_TIMESTAMP = (1980, 1, 1, 0, 0, 0)
+
+# 工作表XML中的样式索引：单元格与行为 s 属性，列为 style 属性
+STYLE_PATTERNS = (
+    re.compile(rb'(<c [^>]*?\bs=")([0-9]+)"'),
+    re.compile(rb'(<row [^>]*?\bs=")([0-9]+)"'),
+    re.compile(rb'(<col [^>]*?\bstyle=")([0-9]+)"'),
+)
+
+# ==================== 单表序列化 ====================
+
+def serialize_sheet(ws):
+    """
+    序列化工作表（所在工作簿应只含这一张表）
+    @return: (工作表XML, 样式表)；XML中的样式索引指向本表的样式表，
+             样式表每项为 (字体, 填充, 边框, 对齐, 保护, 数字格式, pivotButton, quotePrefix, xfId)
+    """
+    writer = WorksheetWriter(ws, BytesIO())
+    writer.write()
+    xml = writer.read()
+    # openpyxl 以内联字符串写出文本单元格，没有共享字符串需要合并，只需合并样式
+    wb = ws.parent
+    styles = [(wb._fonts[style.fontId], wb._fills[style.fillId], wb._borders[style.borderId],
+               wb._alignments[style.alignmentId], wb._protections[style.protectionId],
+               BUILTIN_FORMATS[style.numFmtId] if style.numFmtId < 164 else wb._number_formats[style.numFmtId - 164],
+               style.pivotButton, style.quotePrefix, style.xfId)
+              for style in wb._cell_styles]
+    return xml, styles
+
+# ==================== 样式合并 ====================
+
+def merge_styles(wb, styles):
+    """把一张工作表的样式表并入工作簿，返回 本表样式索引 -> 工作簿样式索引"""
+    mapping = []
+    for font, fill, border, alignment, protection, number_format, pivot_button, quote_prefix, xf_id in styles:
+        if number_format in BUILTIN_FORMATS_REVERSE:
+            format_id = BUILTIN_FORMATS_REVERSE[number_format]
+        else:
+            format_id = 164 + wb._number_formats.add(number_format)
+        style = StyleArray([wb._fonts.add(font), wb._fills.add(fill), wb._borders.add(border), format_id,
+                            wb._protections.add(protection), wb._alignments.add(alignment),
+                            pivot_button, quote_prefix, xf_id])
+        mapping.append(wb._cell_styles.add(style))
+    return mapping
+
+def remap_styles(xml, mapping):
+    """把工作表XML中单元格、行、列的样式索引改写为工作簿样式索引"""
+    if mapping == list(range(len(mapping))):
+        return xml
+    replace = lambda m: m.group(1) + str(mapping[int(m.group(2))]).encode() + b'"'
+    for pattern in STYLE_PATTERNS:
+        xml = pattern.sub(replace, xml)
+    return xml
+
+# ==================== 组装写出 ====================
+
+class StableZipFile(ZipFile):
+    """条目时间固定的zip文件，使相同内容的工作簿逐字节一致"""
+
+    def writestr(self, zinfo_or_arcname, data, compress_type=None, compresslevel=None):
+        if not isinstance(zinfo_or_arcname, ZipInfo):
+            zinfo_or_arcname = ZipInfo(zinfo_or_arcname, date_time=ZIP_TIMESTAMP)
+            zinfo_or_arcname.external_attr = 0o600 << 16
+            compress_type = self.compression if compress_type is None else compress_type
+            compresslevel = self.compresslevel if compresslevel is None else compresslevel
+        super().writestr(zinfo_or_arcname, data, compress_type, compresslevel)
+
+class SheetPartWriter(ExcelWriter):
+    """工作表XML已预先生成的工作簿写出器：其余部件（样式、工作簿、清单等）仍由 openpyxl 写出"""
+
+    def __init__(self, workbook, archive, parts):
+        super().__init__(workbook, archive)
+        self.parts = parts
+
+    def write_worksheet(self, ws):
+        ws._drawing = None
+        ws._rels = RelationshipList()
+        self._archive.writestr(ws.path[1:], self.parts[ws.title])
+        self.manifest.append(ws)
+
+def assemble_workbook(filepath, parts):
+    """
+    把各工作表组装为 .xlsx：按工作表顺序合并样式（与各表的构建先后无关），一次顺序写出zip
+    @param parts: [(表名, 工作表XML, 样式表)]，按工作表顺序排列
+    """
+    wb = openpyxl.Workbook()
+    wb.properties.created = wb.properties.modified = WORKBOOK_TIMESTAMP
+    xml_parts = {}
+    for index, (title, xml, styles) in enumerate(parts):
+        if index == 0:
+            wb.active.title = title
+        else:
+            wb.create_sheet(title)
+        xml_parts[title] = remap_styles(xml, merge_styles(wb, styles))
+    with StableZipFile(filepath, 'w', ZIP_DEFLATED, allowZip64=True) as archive:
+        SheetPartWriter(wb, archive, xml_parts).write_data()
@@ -1,7 +1,7 @@
 /**
  * 德国独立储能电站投资测算系统 - 财务模型计算引擎
- * @description 包含所有财务计算逻辑、报表生成和敏感性分析
- * @version 1.0
+ * @description 页面交互、参数读取、报表渲染与敏感性分析调度；纯计算函数见 model-core.js
+ * @version 1.1
  */
 
 // ==================== 全局变量 ====================
@@ -19,12 +19,22 @@ let calculationResults = {
     indicators: {}
 };
 
+/** @type {Object} 报表表格（增量渲染，见 statement-renderer.js） */
+const statementTables = {
+    income: new StatementTable('income_table', 'income_body'),
+    cashFlow: new StatementTable('cashflow_table', 'cashflow_body'),
+    balance: new StatementTable('balance_table', 'balance_body')
+};
+
 /** @type {Object} 图表实例 */
 let charts = {
     revenue: null,
     sensitivity: null
 };
 
+/** @type {Object} 隐藏标签页待执行的渲染（标签页ID -> 渲染函数），切换到该标签页时执行 */
+const pendingTabRenders = {};
+
 // ==================== 数字格式化工具函数 ====================
 
 /**
@@ -219,10 +229,39 @@ function initNavigation() {
                 tab.classList.remove('active');
             });
             document.getElementById(tabId).classList.add('active');
+            flushTabRender(tabId);
         });
     });
 }
 
+/**
+ * 渲染标签页内容：标签页可见时立即渲染，否则推迟到首次切换到该标签页时
+ * @description 同一标签页只保留最近一次的渲染，重复计算不会为看不到的报表反复绘制表格与图表
+ * @param {string} tabId 标签页元素ID
+ * @param {Function} render 渲染函数
+ */
+function renderTab(tabId, render) {
+    const tab = document.getElementById(tabId);
+    if (tab && tab.classList && !tab.classList.contains('active')) {
+        pendingTabRenders[tabId] = render;
+        return;
+    }
+    delete pendingTabRenders[tabId];
+    render();
+}
+
+/**
+ * 执行标签页推迟的渲染
+ * @param {string} tabId 标签页元素ID
+ */
+function flushTabRender(tabId) {
+    const render = pendingTabRenders[tabId];
+    if (render) {
+        delete pendingTabRenders[tabId];
+        render();
+    }
+}
+
 /**
  * 防抖函数
  * @param {Function} func 要执行的函数
@@ -1005,6 +1044,13 @@ function getParameters() {
         trade_tax_rate: parseFloat(document.getElementById('trade_tax_rate').value) / 100 || 0.14,
         vat_rate: parseFloat(document.getElementById('vat_rate').value) / 100 || 0.19,
         other_tax_rate: parseFloat(document.getElementById('other_tax_rate').value) / 100 || 0,
+        tax_method: document.getElementById('tax_method').value || 'german',
+        loss_offset_threshold: parseFloat(document.getElementById('loss_offset_threshold').value) || 1000000,
+        min_taxation_ratio: parseFloat(document.getElementById('min_taxation_ratio').value) / 100 || 0.6,
+        interest_barrier_ratio: parseFloat(document.getElementById('interest_barrier_ratio').value) / 100 || 0.3,
+        interest_barrier_threshold: parseFloat(document.getElementById('interest_barrier_threshold').value) || 3000000,
+        trade_tax_addback_ratio: parseFloat(document.getElementById('trade_tax_addback_ratio').value) / 100 || 0.25,
+        trade_tax_addback_allowance: parseFloat(document.getElementById('trade_tax_addback_allowance').value) || 200000,
         
         // Tolling参数 - 德国储能Tolling市场
         tolling_years: parseInt(document.getElementById('tolling_years').value) || 10,
@@ -1103,147 +1149,7 @@ function getSpotPrices(years) {
     return prices;
 }
 
-// ==================== CAPEX计算 ====================
-
-/**
- * 计算CAPEX明细
- * @param {Object} params 参数
- * @returns {Object} CAPEX明细
- */
-function calculateCapex(params) {
-    const capex = {};
-    
-    // ========== 一、主设备费用 ==========
-    // 电池系统
-    capex.battery = params.capacity_mwh * 1000 * params.battery_unit_price / 10000; // 万EUR
-    // PCS系统
-    capex.pcs = params.power_mw * 1000 * params.pcs_unit_price / 10000;
-    // 中压变压器
-    capex.mv_transformer = params.mv_transformer_count * params.mv_transformer_price / 10000;
-    // 升压变压器
-    capex.hv_transformer = params.hv_transformer_count * params.hv_transformer_price / 10000;
-    
-    // ========== 二、辅助设备费用 ==========
-    // EMS能量管理系统
-    capex.ems = params.ems_cost / 10000;
-    // SCADA监控系统
-    capex.scada = params.scada_cost / 10000;
-    // 开关柜
-    capex.switchgear = params.switchgear_count * params.switchgear_price / 10000;
-    // 集电线路
-    capex.collector_line = params.collector_line_cost / 10000;
-    // 热管理系统
-    capex.thermal = params.capacity_mwh * 1000 * params.thermal_cost / 10000;
-    // 消防系统
-    capex.fire_protection = params.capacity_mwh * 1000 * params.fire_protection_cost / 10000;
-    
-    // 主设备小计
-    const equipmentSubtotal = capex.battery + capex.pcs + capex.mv_transformer + capex.hv_transformer +
-                              capex.ems + capex.scada + capex.switchgear + capex.collector_line +
-                              capex.thermal + capex.fire_protection;
-    
-    // ========== 三、电网接入费用 ==========
-    // 变电站建设/扩容
-    capex.substation = params.substation_cost / 10000;
-    // 接入线路
-    capex.grid_line = params.grid_line_cost / 10000;
-    // 并网申请与研究费
-    capex.grid_study = params.grid_study_cost / 10000;
-    // 计量与保护设备
-    capex.metering = params.metering_cost / 10000;
-    
-    // 电网接入小计
-    capex.grid_connection_subtotal = capex.substation + capex.grid_line + capex.grid_study + capex.metering;
-    
-    // ========== 四、土地与基础建设 ==========
-    // 土地获取成本
-    capex.land_acquisition = params.power_mw * 1000 * params.land_acquisition_cost / 10000;
-    // 混凝土基础
-    capex.concrete = params.power_mw * 1000 * params.concrete_cost / 10000;
-    // 围栏与安防
-    capex.fence = params.fence_cost / 10000;
-    // 道路建设
-    capex.road = params.road_cost / 10000;
-    // 排水系统
-    capex.drainage = params.drainage_cost / 10000;
-    
-    // 土地与基建小计
-    capex.civil_subtotal = capex.land_acquisition + capex.concrete + capex.fence + capex.road + capex.drainage;
-    
-    // ========== 五、安装与施工费用 ==========
-    // 机电安装
-    capex.installation = equipmentSubtotal * params.installation_cost_pct;
-    // 施工管理费
-    capex.construction_mgmt = equipmentSubtotal * params.construction_mgmt_pct;
-    // 调试费用
-    capex.commissioning = params.commissioning_cost / 10000;
-    
-    // 安装施工小计
-    capex.installation_subtotal = capex.installation + capex.construction_mgmt + capex.commissioning;
-    
-    // ========== 六、建设期保险费用 ==========
-    // 建设工程一切险(CAR)
-    capex.car_insurance = equipmentSubtotal * params.car_insurance_pct;
-    // 安装工程一切险(EAR)
-    capex.ear_insurance = equipmentSubtotal * params.ear_insurance_pct;
-    // 货物运输保险
-    capex.cargo_insurance = equipmentSubtotal * params.cargo_insurance_pct;
-    // 第三方责任险
-    capex.liability_insurance = params.liability_insurance / 10000;
-    
-    // 保险费小计
-    capex.insurance_subtotal = capex.car_insurance + capex.ear_insurance + capex.cargo_insurance + capex.liability_insurance;
-    
-    // ========== 七、开发与业主费用 ==========
-    // SPV公司收购成本
-    capex.spv_acquisition = params.spv_acquisition_cost / 10000;
-    // 许可与规划费
-    capex.permit = params.permit_cost / 10000;
-    // 环境咨询费
-    capex.environmental = params.environmental_cost / 10000;
-    // 法律咨询费
-    capex.legal = params.legal_cost / 10000;
-    // 工程设计费
-    capex.engineering = equipmentSubtotal * params.engineering_pct;
-    
-    // 小计（用于计算项目管理费和不可预见费）
-    const subtotalBeforeMgmt = equipmentSubtotal + capex.grid_connection_subtotal + 
-                               capex.civil_subtotal + capex.installation_subtotal +
-                               capex.insurance_subtotal +
-                               capex.spv_acquisition + capex.permit + capex.environmental + capex.legal + capex.engineering;
-    
-    // 项目管理费（按总投资比例）
-    capex.project_mgmt = subtotalBeforeMgmt * params.project_mgmt_pct;
-    
-    // 开发费用小计
-    capex.dev_subtotal = capex.spv_acquisition + capex.permit + capex.environmental + capex.legal + capex.engineering + capex.project_mgmt;
-    
-    // ========== 八、不可预见费 ==========
-    const subtotalBeforeContingency = subtotalBeforeMgmt + capex.project_mgmt;
-    capex.contingency = subtotalBeforeContingency * params.contingency_pct;
-    
-    // ========== 总计 ==========
-    // 拆除准备金改为逐年摊销，不计入CAPEX
-    capex.total = subtotalBeforeContingency + capex.contingency;
-    
-    // 建设期利息计算
-    // 建设期利息 = 贷款金额 × 贷款利率 × 建设期 × 资金占用比例
-    const loanAmount = capex.total * (1 - params.equity_ratio);
-    capex.construction_interest = loanAmount * params.loan_rate * params.construction_period * params.construction_fund_usage;
-    
-    // 动态投资总额
-    capex.dynamic_total = capex.total + capex.construction_interest;
-    
-    // 保存各类小计用于显示
-    capex.equipment_subtotal = equipmentSubtotal;
-    
-    // 添加别名字段，用于折旧、现金流、资产负债表计算
-    // dev_cost 对应开发费用小计，land 对应土地获取成本
-    capex.dev_cost = capex.dev_subtotal;
-    capex.land = capex.land_acquisition;
-    
-    return capex;
-}
+// ==================== CAPEX表格 ====================
 
 /**
  * 更新CAPEX表格显示
@@ -1507,50 +1413,7 @@ function updateCapexTable(capex, params) {
     document.getElementById('total_capex').textContent = formatNumber(capex.total) + ' 万EUR';
 }
 
-// ==================== OPEX计算 ====================
-
-/**
- * 计算年度OPEX
- * @param {Object} params 参数
- * @param {Object} capex CAPEX数据
- * @returns {Object[]} 年度OPEX数组
- */
-function calculateOpex(params, capex) {
-    const opexData = [];
-    
-    // 如果选择逐年计提，计算每年应计提的拆除准备金
-    const annualDecommissioning = params.decommissioning_total
-        ? (params.decommissioning_total / params.operation_years / 10000)
-        : 0;
-    
-    for (let year = 1; year <= params.operation_years; year++) {
-        // 计算通胀因子：考虑通货膨胀对OPEX的影响
-        // 通胀影响 = (1 + 通胀率)^(年数-1)
-        const inflationFactor = Math.pow(1 + params.inflation_rate, year - 1);
-        
-        // 各项OPEX = 基础值 × (1 + 各自增长率)^(年数-1) × 通胀因子
-        const yearData = {
-            year: year,
-            technical: params.opex_technical * params.power_mw * 1000 * 
-                      Math.pow(1 + params.opex_technical_esc, year - 1) * inflationFactor / 10000,
-            insurance: capex.total * params.opex_insurance * 
-                      Math.pow(1 + params.opex_insurance_esc, year - 1) * inflationFactor,
-            grid: params.opex_grid * params.power_mw * 
-                  Math.pow(1 + params.opex_grid_esc, year - 1) * inflationFactor / 10000,
-            land: params.opex_land * Math.pow(1 + params.opex_land_esc, year - 1) * inflationFactor / 10000,
-            commercial: params.opex_commercial * params.power_mw * 
-                       Math.pow(1 + params.opex_commercial_esc, year - 1) * inflationFactor / 10000,
-            other: params.opex_other * params.power_mw * 
-                  Math.pow(1 + params.opex_other_esc, year - 1) * inflationFactor / 10000,
-            decommissioning: annualDecommissioning * inflationFactor  // 拆除准备金也受通胀影响
-        };
-        yearData.total = yearData.technical + yearData.insurance + yearData.grid + 
-                         yearData.land + yearData.commercial + yearData.other + yearData.decommissioning;
-        opexData.push(yearData);
-    }
-    
-    return opexData;
-}
+// ==================== OPEX表格 ====================
 
 /**
  * 更新OPEX年度表格
@@ -1585,35 +1448,7 @@ function updateOpexTable(opexData) {
  * @returns {Object[]} 年度收入数组
  */
 function calculateRevenue(params) {
-    const revenueData = [];
-    const spotPrices = getSpotPrices(params.operation_years);
-    
-    for (let year = 1; year <= params.operation_years; year++) {
-        // 计算当年可用容量
-        const capacityFactor = params.initial_capacity_pct / 100 * 
-                               Math.pow(1 - params.degradation_rate, year - 1);
-        
-        // Tolling收入
-        let tollingRevenue = 0;
-        if (year <= params.tolling_years) {
-            const tollingPrice = params.tolling_price * Math.pow(1 + params.tolling_escalation, year - 1);
-            tollingRevenue = tollingPrice * params.power_mw * 1000 * params.tolling_ratio / 10000;
-        }
-        
-        // 现货收入
-        const spotRatio = year <= params.tolling_years ? (1 - params.tolling_ratio) : 1;
-        const spotRevenue = spotPrices[year - 1] * params.power_mw * spotRatio * capacityFactor / 10000;
-        
-        revenueData.push({
-            year: year,
-            capacityFactor: capacityFactor * 100,
-            tollingRevenue: tollingRevenue,
-            spotRevenue: spotRevenue,
-            totalRevenue: tollingRevenue + spotRevenue
-        });
-    }
-    
-    return revenueData;
+    return calculateRevenueWithPrices(params, getSpotPrices(params.operation_years));
 }
 
 /**
@@ -1637,124 +1472,7 @@ function updateRevenueTable(revenueData) {
     });
 }
 
-// ==================== 折旧计算 ====================
-
-/**
- * 计算年度折旧
- * @param {Object} params 参数
- * @param {Object} capex CAPEX数据
- * @returns {Object[]} 年度折旧数组
- */
-function calculateDepreciation(params, capex) {
-    const depreciationData = [];
-    
-    // 无形资产（开发费用+土地）
-    const intangibleAssets = (capex.dev_cost || 0) + (capex.land || 0);
-    
-    // 固定资产原值 = 动态总投资 - 无形资产（建设期利息已资本化）
-    const fixedAssetOriginal = capex.dynamic_total - intangibleAssets;
-    const depreciableAmount = fixedAssetOriginal * (1 - params.salvage_rate);
-    
-    for (let year = 1; year <= params.operation_years; year++) {
-        let depreciation = 0;
-        
-        if (year <= params.depreciation_years) {
-            switch (params.depreciation_method) {
-                case 'straight_line':
-                    depreciation = depreciableAmount / params.depreciation_years;
-                    break;
-                case 'double_declining':
-                    const rate = 2 / params.depreciation_years;
-                    let bookValue = fixedAssetOriginal;
-                    for (let i = 1; i < year; i++) {
-                        bookValue -= bookValue * rate;
-                    }
-                    depreciation = Math.min(bookValue * rate, bookValue - fixedAssetOriginal * params.salvage_rate);
-                    break;
-                case 'sum_of_years':
-                    const sumYears = params.depreciation_years * (params.depreciation_years + 1) / 2;
-                    depreciation = depreciableAmount * (params.depreciation_years - year + 1) / sumYears;
-                    break;
-            }
-        }
-        
-        // 无形资产摊销
-        const amortization = year <= params.amortization_years ? 
-                            intangibleAssets / params.amortization_years : 0;
-        
-        depreciationData.push({
-            year: year,
-            depreciation: depreciation,
-            amortization: amortization,
-            total: depreciation + amortization
-        });
-    }
-    
-    return depreciationData;
-}
-
-// ==================== 贷款计算 ====================
-
-/**
- * 计算贷款还款计划
- * @param {Object} params 参数
- * @param {Object} capex CAPEX数据
- * @returns {Object[]} 贷款还款计划
- */
-function calculateLoan(params, capex) {
-    const loanData = [];
-    const loanAmount = capex.dynamic_total * (1 - params.equity_ratio);
-    let balance = loanAmount;
-    const repaymentYears = Math.max(params.loan_years - params.grace_period, 0);
-    
-    for (let year = 1; year <= params.loan_years; year++) {
-        const interest = balance * params.loan_rate;
-        let principal = 0;
-        
-        if (year > params.grace_period && repaymentYears > 0) {
-            if (params.repayment_method === 'equal_principal') {
-                // 等额本金
-                principal = loanAmount / repaymentYears;
-            } else {
-                // 等额本息
-                const n = repaymentYears;
-                const r = params.loan_rate;
-                const payment = r === 0
-                    ? loanAmount / n
-                    : loanAmount * r * Math.pow(1 + r, n) / (Math.pow(1 + r, n) - 1);
-                principal = payment - interest;
-            }
-        }
-        
-        const payment = interest + principal;
-        const endBalance = balance - principal;
-        
-        loanData.push({
-            year: year,
-            beginBalance: balance,
-            interest: interest,
-            principal: principal,
-            payment: payment,
-            endBalance: Math.max(0, endBalance)
-        });
-        
-        balance = Math.max(0, endBalance);
-    }
-    
-    // 补充剩余年份(贷款已还清)
-    for (let year = params.loan_years + 1; year <= params.operation_years; year++) {
-        loanData.push({
-            year: year,
-            beginBalance: 0,
-            interest: 0,
-            principal: 0,
-            payment: 0,
-            endBalance: 0
-        });
-    }
-    
-    return loanData;
-}
+// ==================== 贷款表格 ====================
 
 /**
  * 更新贷款还款表格
@@ -1780,71 +1498,13 @@ function updateLoanTable(loanData) {
     });
 }
 
-// ==================== 利润表计算 ====================
-
-/**
- * 计算利润表
- * @param {Object} params 参数
- * @param {Object[]} revenueData 收入数据
- * @param {Object[]} opexData OPEX数据
- * @param {Object[]} depreciationData 折旧数据
- * @param {Object[]} loanData 贷款数据
- * @returns {Object[]} 利润表数据
- */
-function calculateIncomeStatement(params, revenueData, opexData, depreciationData, loanData) {
-    const incomeData = [];
-    
-    // 计算综合税率
-    const effectiveTaxRate = params.corporate_tax_rate * (1 + params.solidarity_tax_rate) + 
-                            params.trade_tax_rate + params.other_tax_rate;
-    
-    for (let year = 0; year < params.operation_years; year++) {
-        const revenue = revenueData[year].totalRevenue;
-        const opex = opexData[year].total;
-        const depreciation = depreciationData[year].total;
-        const interest = loanData[year].interest;
-        
-        const grossProfit = revenue - opex;
-        const ebitda = grossProfit;
-        const ebit = ebitda - depreciation;
-        const ebt = ebit - interest;
-        const tax = Math.max(0, ebt * effectiveTaxRate);
-        const netProfit = ebt - tax;
-        
-        incomeData.push({
-            year: year + 1,
-            revenue: revenue,
-            opex: opex,
-            grossProfit: grossProfit,
-            ebitda: ebitda,
-            depreciation: depreciation,
-            ebit: ebit,
-            interest: interest,
-            ebt: ebt,
-            tax: tax,
-            netProfit: netProfit
-        });
-    }
-    
-    return incomeData;
-}
+// ==================== 利润表显示 ====================
 
 /**
  * 更新利润表显示
  * @param {Object[]} incomeData 利润表数据
  */
 function updateIncomeTable(incomeData) {
-    const table = document.getElementById('income_table');
-    const thead = table.querySelector('thead tr');
-    const tbody = document.getElementById('income_body');
-    
-    // 生成表头
-    thead.innerHTML = '<th>项目（万EUR）</th>';
-    incomeData.forEach(data => {
-        thead.innerHTML += `<th>第${data.year}年</th>`;
-    });
-    
-    // 生成表体
     const rows = [
         { label: '营业收入', key: 'revenue', class: '' },
         { label: '减：运营成本', key: 'opex', class: '' },
@@ -1858,126 +1518,16 @@ function updateIncomeTable(incomeData) {
         { label: '净利润', key: 'netProfit', class: 'total' }
     ];
     
-    tbody.innerHTML = '';
-    rows.forEach(row => {
-        const tr = document.createElement('tr');
-        tr.className = row.class;
-        tr.innerHTML = `<td>${row.label}</td>`;
-        incomeData.forEach(data => {
-            tr.innerHTML += `<td>${formatNumber(data[row.key])}</td>`;
-        });
-        tbody.appendChild(tr);
-    });
+    statementTables.income.render(rows, incomeData, data => `第${data.year}年`);
 }
 
-// ==================== 现金流量表计算 ====================
-
-/**
- * 计算现金流量表
- * @param {Object} params 参数
- * @param {Object} capex CAPEX数据
- * @param {Object[]} incomeData 利润表数据
- * @param {Object[]} depreciationData 折旧数据
- * @param {Object[]} loanData 贷款数据
- * @returns {Object[]} 现金流量表数据
- */
-function calculateCashFlow(params, capex, incomeData, depreciationData, loanData) {
-    const cashFlowData = [];
-    
-    // 第0年 - 建设期
-    const equity = capex.dynamic_total * params.equity_ratio;
-    const loan = capex.dynamic_total * (1 - params.equity_ratio);
-    
-    cashFlowData.push({
-        year: 0,
-        // 经营活动
-        netProfit: 0,
-        depreciation: 0,
-        workingCapital: 0,
-        operatingCashFlow: 0,
-        // 投资活动
-        capex: -capex.dynamic_total,
-        investingCashFlow: -capex.dynamic_total,
-        // 筹资活动
-        equityInflow: equity,
-        loanInflow: loan,
-        loanRepayment: 0,
-        financingCashFlow: equity + loan,
-        // 现金净增加
-        netCashFlow: 0,
-        // 全投资现金流
-        projectCashFlow: -capex.dynamic_total,
-        // 资本金现金流
-        equityCashFlow: -equity
-    });
-    
-    // 运营期
-    for (let i = 0; i < params.operation_years; i++) {
-        const income = incomeData[i];
-        const depreciation = depreciationData[i].total;
-        const loanInfo = loanData[i];
-        
-        const operatingCashFlow = income.netProfit + depreciation;
-        const investingCashFlow = 0;
-        const financingCashFlow = -loanInfo.principal;
-        const netCashFlow = operatingCashFlow + investingCashFlow + financingCashFlow;
-        
-        // 全投资现金流 = 经营现金流 (不考虑融资)
-        const projectCashFlow = income.ebitda - income.tax;
-        
-        // 资本金现金流 = 净现金流
-        const equityCashFlow = netCashFlow;
-        
-        cashFlowData.push({
-            year: i + 1,
-            netProfit: income.netProfit,
-            depreciation: depreciation,
-            workingCapital: 0,
-            operatingCashFlow: operatingCashFlow,
-            capex: 0,
-            investingCashFlow: investingCashFlow,
-            equityInflow: 0,
-            loanInflow: 0,
-            loanRepayment: -loanInfo.principal,
-            financingCashFlow: financingCashFlow,
-            netCashFlow: netCashFlow,
-            projectCashFlow: projectCashFlow,
-            equityCashFlow: equityCashFlow
-        });
-    }
-    
-    // 添加残值回收（基于固定资产原值，即动态投资减去无形资产）
-    const intangibleAssets = (capex.dev_cost || 0) + (capex.land || 0);
-    const fixedAssetOriginal = capex.dynamic_total - intangibleAssets;
-    const salvageValue = fixedAssetOriginal * params.salvage_rate;
-    
-    if (cashFlowData.length > params.operation_years) {
-        const lastYearIndex = params.operation_years;
-        cashFlowData[lastYearIndex].investingCashFlow += salvageValue;
-        cashFlowData[lastYearIndex].netCashFlow += salvageValue;
-        cashFlowData[lastYearIndex].projectCashFlow += salvageValue;
-        cashFlowData[lastYearIndex].equityCashFlow += salvageValue;
-    }
-    
-    return cashFlowData;
-}
+// ==================== 现金流量表显示 ====================
 
 /**
  * 更新现金流量表显示
  * @param {Object[]} cashFlowData 现金流量表数据
  */
 function updateCashFlowTable(cashFlowData) {
-    const table = document.getElementById('cashflow_table');
-    const thead = table.querySelector('thead tr');
-    const tbody = document.getElementById('cashflow_body');
-    
-    // 生成表头
-    thead.innerHTML = '<th>项目（万EUR）</th>';
-    cashFlowData.forEach(data => {
-        thead.innerHTML += `<th>${data.year === 0 ? '建设期' : '第' + data.year + '年'}</th>`;
-    });
-    
-    // 生成表体
     const rows = [
         { label: '一、经营活动现金流', key: null, class: 'section-header' },
         { label: '  净利润', key: 'netProfit', class: '' },
@@ -1995,129 +1545,17 @@ function updateCashFlowTable(cashFlowData) {
         { label: '资本金现金流(税后)', key: 'equityCashFlow', class: 'total' }
     ];
     
-    tbody.innerHTML = '';
-    rows.forEach(row => {
-        const tr = document.createElement('tr');
-        tr.className = row.class;
-        if (row.key === null) {
-            tr.innerHTML = `<td colspan="${cashFlowData.length + 1}">${row.label}</td>`;
-        } else {
-            tr.innerHTML = `<td>${row.label}</td>`;
-            cashFlowData.forEach(data => {
-                tr.innerHTML += `<td>${formatNumber(data[row.key])}</td>`;
-            });
-        }
-        tbody.appendChild(tr);
-    });
+    statementTables.cashFlow.render(rows, cashFlowData,
+        data => data.year === 0 ? '建设期' : '第' + data.year + '年');
 }
 
-// ==================== 资产负债表计算 ====================
-
-/**
- * 计算资产负债表
- * @param {Object} params 参数
- * @param {Object} capex CAPEX数据
- * @param {Object[]} incomeData 利润表数据
- * @param {Object[]} depreciationData 折旧数据
- * @param {Object[]} loanData 贷款数据
- * @param {Object[]} cashFlowData 现金流数据
- * @returns {Object[]} 资产负债表数据
- */
-function calculateBalanceSheet(params, capex, incomeData, depreciationData, loanData, cashFlowData) {
-    const balanceData = [];
-    
-    let accumulatedDepreciation = 0;
-    let retainedEarnings = 0;
-    let cash = 0;
-    const equity = capex.dynamic_total * params.equity_ratio;
-    const loanAmount = capex.dynamic_total * (1 - params.equity_ratio);
-    
-    // 固定资产原值 = 总投资 - 无形资产（开发费用+土地）
-    // 建设期利息已资本化计入固定资产
-    const intangibleAssetsOriginal = capex.dev_cost + capex.land;
-    const fixedAssetOriginal = capex.dynamic_total - intangibleAssetsOriginal;
-    
-    // 初始资产负债表 (建设完成时点)
-    balanceData.push({
-        year: 0,
-        // 资产
-        cash: 0,
-        fixedAssetOriginal: fixedAssetOriginal,
-        accumulatedDepreciation: 0,
-        fixedAssetNet: fixedAssetOriginal,
-        intangibleAssets: intangibleAssetsOriginal,
-        totalAssets: capex.dynamic_total,
-        // 负债
-        longTermLoan: loanAmount,
-        totalLiabilities: loanAmount,
-        // 所有者权益
-        paidInCapital: equity,
-        retainedEarnings: 0,
-        totalEquity: equity,
-        // 验证
-        totalLiabilitiesAndEquity: loanAmount + equity
-    });
-    
-    for (let i = 0; i < params.operation_years; i++) {
-        accumulatedDepreciation += depreciationData[i].depreciation;
-        retainedEarnings += incomeData[i].netProfit;
-        
-        // 累计现金流（从运营期第1年开始）
-        cash += cashFlowData[i + 1].netCashFlow;
-        
-        let fixedAssetNet = fixedAssetOriginal - accumulatedDepreciation;
-        const accumulatedAmortization = depreciationData.slice(0, i + 1).reduce((a, b) => a + b.amortization, 0);
-        let intangibleAssets = Math.max(0, intangibleAssetsOriginal - accumulatedAmortization);
-        const longTermLoan = i < loanData.length ? loanData[i].endBalance : 0;
-        
-        // 最后一年：固定资产处置（残值已回收计入现金），资产清零
-        if (i === params.operation_years - 1) {
-            // 残值已通过现金流回收，固定资产净值设为0
-            fixedAssetNet = 0;
-            intangibleAssets = 0;
-        }
-        
-        // 总资产 = 货币资金 + 固定资产净值 + 无形资产
-        const totalAssets = cash + fixedAssetNet + intangibleAssets;
-        const totalEquity = equity + retainedEarnings;
-        const totalLiabilitiesAndEquity = longTermLoan + totalEquity;
-        
-        balanceData.push({
-            year: i + 1,
-            cash: cash,
-            fixedAssetOriginal: fixedAssetOriginal,
-            accumulatedDepreciation: accumulatedDepreciation,
-            fixedAssetNet: fixedAssetNet,
-            intangibleAssets: intangibleAssets,
-            totalAssets: totalAssets,
-            longTermLoan: longTermLoan,
-            totalLiabilities: longTermLoan,
-            paidInCapital: equity,
-            retainedEarnings: retainedEarnings,
-            totalEquity: totalEquity,
-            totalLiabilitiesAndEquity: totalLiabilitiesAndEquity
-        });
-    }
-    
-    return balanceData;
-}
+// ==================== 资产负债表显示 ====================
 
 /**
  * 更新资产负债表显示
  * @param {Object[]} balanceData 资产负债表数据
  */
 function updateBalanceTable(balanceData) {
-    const table = document.getElementById('balance_table');
-    const thead = table.querySelector('thead tr');
-    const tbody = document.getElementById('balance_body');
-    
-    // 生成表头
-    thead.innerHTML = '<th>项目（万EUR）</th>';
-    balanceData.forEach(data => {
-        thead.innerHTML += `<th>${data.year === 0 ? '期初' : '第' + data.year + '年末'}</th>`;
-    });
-    
-    // 生成表体
     const rows = [
         { label: '资产', key: null, class: 'section-header' },
         { label: '  货币资金', key: 'cash', class: '' },
@@ -2136,220 +1574,11 @@ function updateBalanceTable(balanceData) {
         { label: '负债和所有者权益合计', key: 'totalLiabilitiesAndEquity', class: 'total' }
     ];
     
-    tbody.innerHTML = '';
-    rows.forEach(row => {
-        const tr = document.createElement('tr');
-        tr.className = row.class;
-        if (row.key === null) {
-            tr.innerHTML = `<td colspan="${balanceData.length + 1}">${row.label}</td>`;
-        } else {
-            tr.innerHTML = `<td>${row.label}</td>`;
-            balanceData.forEach(data => {
-                tr.innerHTML += `<td>${formatNumber(data[row.key])}</td>`;
-            });
-        }
-        tbody.appendChild(tr);
-    });
+    statementTables.balance.render(rows, balanceData,
+        data => data.year === 0 ? '期初' : '第' + data.year + '年末');
 }
 
-// ==================== 财务指标计算 ====================
-
-/**
- * 计算IRR (内部收益率)
- * @param {number[]} cashFlows 现金流数组
- * @returns {number} IRR百分比
- */
-function calculateIRR(cashFlows) {
-    const maxIterations = 1000;
-    const tolerance = 0.00001;
-    let rate = 0.1;
-    
-    for (let i = 0; i < maxIterations; i++) {
-        let npv = 0;
-        let dnpv = 0;
-        
-        for (let j = 0; j < cashFlows.length; j++) {
-            npv += cashFlows[j] / Math.pow(1 + rate, j);
-            dnpv -= j * cashFlows[j] / Math.pow(1 + rate, j + 1);
-        }
-        
-        const newRate = rate - npv / dnpv;
-        
-        if (Math.abs(newRate - rate) < tolerance) {
-            return newRate * 100;
-        }
-        
-        rate = newRate;
-        
-        // 防止发散
-        if (rate < -0.99 || rate > 10 || isNaN(rate)) {
-            return NaN;
-        }
-    }
-    
-    return rate * 100;
-}
-
-/**
- * 计算NPV (净现值)
- * @param {number[]} cashFlows 现金流数组
- * @param {number} discountRate 折现率
- * @returns {number} NPV
- */
-function calculateNPV(cashFlows, discountRate) {
-    let npv = 0;
-    for (let i = 0; i < cashFlows.length; i++) {
-        npv += cashFlows[i] / Math.pow(1 + discountRate, i);
-    }
-    return npv;
-}
-
-/**
- * 计算静态回收期
- * @param {number[]} cashFlows 现金流数组
- * @returns {number} 回收期（年）
- */
-function calculateStaticPayback(cashFlows) {
-    let cumulative = 0;
-    for (let i = 0; i < cashFlows.length; i++) {
-        cumulative += cashFlows[i];
-        if (cumulative >= 0) {
-            // 插值计算精确年份
-            const prevCumulative = cumulative - cashFlows[i];
-            return i - 1 + Math.abs(prevCumulative) / cashFlows[i];
-        }
-    }
-    return cashFlows.length; // 未回收
-}
-
-/**
- * 计算动态回收期
- * @param {number[]} cashFlows 现金流数组
- * @param {number} discountRate 折现率
- * @returns {number} 动态回收期（年）
- */
-function calculateDynamicPayback(cashFlows, discountRate) {
-    let cumulative = 0;
-    for (let i = 0; i < cashFlows.length; i++) {
-        const discountedCF = cashFlows[i] / Math.pow(1 + discountRate, i);
-        cumulative += discountedCF;
-        if (cumulative >= 0) {
-            const prevCumulative = cumulative - discountedCF;
-            return i - 1 + Math.abs(prevCumulative) / discountedCF;
-        }
-    }
-    return cashFlows.length;
-}
-
-/**
- * 计算所有财务指标
- * @param {Object} params 参数
- * @param {Object} capex CAPEX数据
- * @param {Object[]} revenueData 收入数据
- * @param {Object[]} incomeData 利润表数据
- * @param {Object[]} cashFlowData 现金流数据
- * @param {Object[]} balanceData 资产负债表数据
- * @param {Object[]} loanData 贷款数据
- * @returns {Object} 财务指标
- */
-function calculateIndicators(params, capex, revenueData, incomeData, cashFlowData, balanceData, loanData) {
-    // 提取全投资现金流
-    const projectCashFlows = cashFlowData.map(d => d.projectCashFlow);
-    
-    // 提取资本金现金流
-    const equityCashFlows = cashFlowData.map(d => d.equityCashFlow);
-    
-    // 计算各项指标
-    const totalRevenue = revenueData.reduce((a, b) => a + b.totalRevenue, 0);
-    const avgRevenue = totalRevenue / params.operation_years;
-    const first3Revenue = revenueData.slice(0, 3).reduce((a, b) => a + b.totalRevenue, 0);
-    
-    const totalProfit = incomeData.reduce((a, b) => a + b.ebt, 0);
-    const avgProfit = totalProfit / params.operation_years;
-    const first3Profit = incomeData.slice(0, 3).reduce((a, b) => a + b.ebt, 0);
-    
-    const totalNetProfit = incomeData.reduce((a, b) => a + b.netProfit, 0);
-    const avgNetProfit = totalNetProfit / params.operation_years;
-    const first3NetProfit = incomeData.slice(0, 3).reduce((a, b) => a + b.netProfit, 0);
-    
-    // IRR计算
-    const projectIRR = calculateIRR(projectCashFlows);
-    const equityIRR = calculateIRR(equityCashFlows);
-    
-    // 回收期计算
-    const staticPayback = calculateStaticPayback(projectCashFlows);
-    const equityStaticPayback = calculateStaticPayback(equityCashFlows);
-    const dynamicPayback = calculateDynamicPayback(projectCashFlows, 0.08);
-    const equityDynamicPayback = calculateDynamicPayback(equityCashFlows, 0.08);
-    
-    // ROE (第三年净资产收益率)
-    const year3NetProfit = incomeData.length >= 3 ? incomeData[2].netProfit : 0;
-    const year3Equity = balanceData.length >= 4 ? balanceData[3].totalEquity : capex.dynamic_total * params.equity_ratio;
-    const roe3 = year3Equity > 0 ? (year3NetProfit / year3Equity) * 100 : 0;
-    
-    // ROI (总投资收益率)
-    const roi = (avgNetProfit / capex.dynamic_total) * 100;
-    
-    // EBITDA回报率
-    const avgEBITDA = incomeData.reduce((a, b) => a + b.ebitda, 0) / params.operation_years;
-    const ebitdaReturn = (avgEBITDA / capex.dynamic_total) * 100;
-    
-    // DSCR (债务偿付覆盖率) - 使用运营期平均值
-    let totalDebtService = 0;
-    let totalEBITDA = 0;
-    let debtServiceYears = 0;
-    
-    for (let i = 0; i < params.loan_years && i < incomeData.length; i++) {
-        if (loanData[i].payment > 0) {
-            totalDebtService += loanData[i].payment;
-            totalEBITDA += incomeData[i].ebitda;
-            debtServiceYears++;
-        }
-    }
-    
-    const dscr = debtServiceYears > 0 && totalDebtService > 0 ? 
-                 totalEBITDA / totalDebtService : 0;
-
-    // LCOE (平准化度电成本，EUR/MWh)
-    /** @type {number} */
-    const totalOpex = incomeData.reduce((a, b) => a + b.opex, 0);
-    /** @type {number} */
-    const totalCostEur = (capex.dynamic_total + totalOpex) * 10000;
-    /** @type {number} */
-    const totalEnergyMwh = incomeData.reduce((sum, _, index) => {
-        const year = index + 1;
-        const capacityFactor = params.initial_capacity_pct / 100 * Math.pow(1 - params.degradation_rate, year - 1);
-        const annualEnergy = params.capacity_mwh * capacityFactor * params.annual_cycles *
-            params.charge_efficiency * params.discharge_efficiency;
-        return sum + annualEnergy;
-    }, 0);
-    const lcoe = totalEnergyMwh > 0 ? totalCostEur / totalEnergyMwh : 0;
-    
-    return {
-        static_investment: capex.total,
-        dynamic_investment: capex.dynamic_total,
-        total_revenue: totalRevenue,
-        avg_revenue: avgRevenue,
-        first3_revenue: first3Revenue,
-        total_profit: totalProfit,
-        avg_profit: avgProfit,
-        first3_profit: first3Profit,
-        total_net_profit: totalNetProfit,
-        avg_net_profit: avgNetProfit,
-        first3_net_profit: first3NetProfit,
-        project_irr: projectIRR,
-        equity_irr: equityIRR,
-        static_payback: staticPayback,
-        equity_payback: equityStaticPayback,
-        dynamic_payback: dynamicPayback,
-        equity_dynamic_payback: equityDynamicPayback,
-        roe_year3: roe3,
-        roi: roi,
-        ebitda_return: ebitdaReturn,
-        dscr: dscr,
-        lcoe: lcoe
-    };
-}
+// ==================== 财务指标显示 ====================
 
 /**
  * 更新财务指标显示
@@ -2453,8 +1682,13 @@ function updateRevenueChart(revenueData) {
 
 // ==================== 敏感性分析 ====================
 
+/** @type {SensitivityWorkerPool} 敏感性分析Web Worker池（每核一个Worker） */
+const sensitivityPool = new SensitivityWorkerPool();
+
 /**
  * 运行敏感性分析
+ * @description 网格格点分块交给Worker池并行计算，结果逐块回传并刷新表格，页面在大网格下保持可操作；
+ *              计算中再次点击时取消上一次计算
  */
 function runSensitivityAnalysis() {
     const var1 = document.getElementById('sens_var1').value;
@@ -2465,168 +1699,64 @@ function runSensitivityAnalysis() {
     const step = parseFloat(document.getElementById('sens_step').value) / 100;
     
     const baseParams = getParameters();
+    // 现货价格只读取一次，Worker中的计算不访问DOM
+    const spotPrices = getSpotPrices(baseParams.operation_years);
     const changes = [];
     for (let c = minChange; c <= maxChange + 0.001; c += step) {
         changes.push(Math.round(c * 100) / 100);
     }
     
-    if (!var2) {
-        // 单变量敏感性分析
-        const results = runSingleVariableSensitivity(baseParams, var1, target, changes);
-        displaySingleVariableSensitivity(results, var1, target, changes);
-        document.getElementById('sensitivity_matrix_card').style.display = 'none';
-    } else {
-        // 双变量敏感性分析
-        const results = runDoubleVariableSensitivity(baseParams, var1, var2, target, changes);
-        displayDoubleVariableSensitivity(results, var1, var2, target, changes);
-    }
-}
-
-/**
- * 单变量敏感性分析
- */
-function runSingleVariableSensitivity(baseParams, variable, target, changes) {
-    const results = [];
-    
-    changes.forEach(change => {
-        const params = JSON.parse(JSON.stringify(baseParams));
-        applyVariableChange(params, variable, change);
-        const value = calculateTargetIndicator(params, target);
-        results.push({
-            change: change * 100,
-            value: value
-        });
-    });
-    
-    return results;
-}
-
-/**
- * 双变量敏感性分析
- */
-function runDoubleVariableSensitivity(baseParams, var1, var2, target, changes) {
-    const results = [];
+    const job = createSensitivityJob(baseParams, var1, var2, target, changes, spotPrices);
+    const display = (values, progress) => {
+        const results = sensitivityResults(job, values);
+        if (!var2) {
+            // 单变量敏感性分析
+            displaySingleVariableSensitivity(results, var1, target, changes, progress);
+            document.getElementById('sensitivity_matrix_card').style.display = 'none';
+        } else {
+            // 双变量敏感性分析
+            displayDoubleVariableSensitivity(results, var1, var2, target, changes, progress);
+        }
+    };
     
-    changes.forEach(change1 => {
-        const row = [];
-        changes.forEach(change2 => {
-            const params = JSON.parse(JSON.stringify(baseParams));
-            applyVariableChange(params, var1, change1);
-            applyVariableChange(params, var2, change2);
-            const value = calculateTargetIndicator(params, target);
-            row.push(value);
-        });
-        results.push(row);
+    // 进度刷新按帧合并，避免每个分块都重绘表格
+    let pending = null;
+    const schedule = typeof requestAnimationFrame === 'function' ? requestAnimationFrame : (fn => setTimeout(fn, 16));
+    sensitivityPool.run(job, (values, completed, total) => {
+        if (pending === null) {
+            schedule(() => {
+                if (pending !== null) display(pending.values, pending.completed / pending.total);
+                pending = null;
+            });
+        }
+        pending = { values, completed, total };
+    }).then(values => {
+        pending = null;
+        display(values, 1);
+    }).catch(error => {
+        if (!error.cancelled) {
+            console.error('敏感性分析错误:', error);
+            alert('敏感性分析过程中发生错误，请检查输入参数');
+        }
     });
-    
-    return results;
-}
-
-/**
- * 应用变量变化
- */
-function applyVariableChange(params, variable, change) {
-    switch (variable) {
-        case 'capex':
-            params.battery_unit_price *= (1 + change);
-            params.pcs_unit_price *= (1 + change);
-            params.mv_transformer_price *= (1 + change);
-            params.hv_transformer_price *= (1 + change);
-            break;
-        case 'tolling_price':
-            params.tolling_price *= (1 + change);
-            break;
-        case 'spot_price':
-            // 这里需要特殊处理现货价格
-            params.spot_price_change = change;
-            break;
-        case 'opex':
-            params.opex_technical *= (1 + change);
-            params.opex_insurance *= (1 + change);
-            params.opex_grid *= (1 + change);
-            params.opex_land *= (1 + change);
-            params.opex_commercial *= (1 + change);
-            params.opex_other *= (1 + change);
-            break;
-        case 'loan_rate':
-            params.loan_rate *= (1 + change);
-            break;
-        case 'degradation':
-            params.degradation_rate *= (1 + change);
-            break;
-    }
 }
 
 /**
  * 计算目标指标
+ * @param {Object} params 参数
+ * @param {string} target 目标指标
+ * @param {number[]} [spotPrices] 基准现货价格，缺省时从页面读取
+ * @returns {number} 指标值
  */
-function calculateTargetIndicator(params, target) {
-    // 重新计算所有数据
-    const capex = calculateCapex(params);
-    const opexData = calculateOpex(params, capex);
-    
-    // 处理现货价格变化
-    const originalSpotPrices = getSpotPrices(params.operation_years);
-    const spotPriceChange = params.spot_price_change || 0;
-    const adjustedSpotPrices = originalSpotPrices.map(p => p * (1 + spotPriceChange));
-    
-    // 临时修改DOM值来计算收入
-    const revenueData = calculateRevenueWithPrices(params, adjustedSpotPrices);
-    
-    const depreciationData = calculateDepreciation(params, capex);
-    const loanData = calculateLoan(params, capex);
-    const incomeData = calculateIncomeStatement(params, revenueData, opexData, depreciationData, loanData);
-    const cashFlowData = calculateCashFlow(params, capex, incomeData, depreciationData, loanData);
-    const balanceData = calculateBalanceSheet(params, capex, incomeData, depreciationData, loanData, cashFlowData);
-    
-    const indicators = calculateIndicators(params, capex, revenueData, incomeData, cashFlowData, balanceData, loanData);
-    
-    switch (target) {
-        case 'project_irr': return indicators.project_irr;
-        case 'equity_irr': return indicators.equity_irr;
-        case 'npv': 
-            const projectCashFlows = cashFlowData.map(d => d.projectCashFlow);
-            return calculateNPV(projectCashFlows, 0.08);
-        case 'payback': return indicators.static_payback;
-        default: return 0;
-    }
-}
-
-/**
- * 使用指定价格计算收入
- */
-function calculateRevenueWithPrices(params, spotPrices) {
-    const revenueData = [];
-    
-    for (let year = 1; year <= params.operation_years; year++) {
-        const capacityFactor = params.initial_capacity_pct / 100 * 
-                               Math.pow(1 - params.degradation_rate, year - 1);
-        
-        let tollingRevenue = 0;
-        if (year <= params.tolling_years) {
-            const tollingPrice = params.tolling_price * Math.pow(1 + params.tolling_escalation, year - 1);
-            tollingRevenue = tollingPrice * params.power_mw * 1000 * params.tolling_ratio / 10000;
-        }
-        
-        const spotRatio = year <= params.tolling_years ? (1 - params.tolling_ratio) : 1;
-        const spotRevenue = spotPrices[year - 1] * params.power_mw * spotRatio * capacityFactor / 10000;
-        
-        revenueData.push({
-            year: year,
-            capacityFactor: capacityFactor * 100,
-            tollingRevenue: tollingRevenue,
-            spotRevenue: spotRevenue,
-            totalRevenue: tollingRevenue + spotRevenue
-        });
-    }
-    
-    return revenueData;
+function calculateTargetIndicator(params, target, spotPrices) {
+    return evaluateTarget(params, target, spotPrices || getSpotPrices(params.operation_years));
 }
 
 /**
  * 显示单变量敏感性分析结果
+ * @param {number} [progress=1] 计算进度（0~1），未完成时未算出的格点显示为"-"，图表在完成后绘制
  */
-function displaySingleVariableSensitivity(results, variable, target, changes) {
+function displaySingleVariableSensitivity(results, variable, target, changes, progress = 1) {
     const varNames = {
         capex: '投资成本',
         tolling_price: 'Tolling价格',
@@ -2669,16 +1799,22 @@ function displaySingleVariableSensitivity(results, variable, target, changes) {
     });
     
     tableHTML += '</tbody></table>';
+    if (progress < 1) {
+        tableHTML += `<p class="hint-text">计算中… ${formatNumber(progress * 100, 0)}%</p>`;
+    }
     resultDiv.innerHTML = tableHTML;
     
     // 更新图表
-    updateSensitivityChart(results, varNames[variable], targetNames[target]);
+    if (progress >= 1) {
+        updateSensitivityChart(results, varNames[variable], targetNames[target]);
+    }
 }
 
 /**
  * 显示双变量敏感性分析结果
+ * @param {number} [progress=1] 计算进度（0~1），未完成时未算出的格点显示为"-"
  */
-function displayDoubleVariableSensitivity(results, var1, var2, target, changes) {
+function displayDoubleVariableSensitivity(results, var1, var2, target, changes, progress = 1) {
     const varNames = {
         capex: '投资成本',
         tolling_price: 'Tolling价格',
@@ -2715,7 +1851,9 @@ function displayDoubleVariableSensitivity(results, var1, var2, target, changes)
     table.innerHTML = html;
     
     // 清空单变量结果区
-    document.getElementById('sensitivity_result').innerHTML = '<p class="hint-text">双变量分析结果见下方矩阵</p>';
+    document.getElementById('sensitivity_result').innerHTML = progress < 1
+        ? `<p class="hint-text">计算中… ${formatNumber(progress * 100, 0)}%</p>`
+        : '<p class="hint-text">双变量分析结果见下方矩阵</p>';
     
     // 清空图表
     if (charts.sensitivity) {
@@ -2814,74 +1952,69 @@ function switchStatement(type) {
  */
 function calculateAll() {
     try {
-        // 获取参数
-        const params = getParameters();
-        
-        // 初始化现货价格表（如果年限变化）
-        initSpotPriceTable();
-        fillSpotPrices();
-        
-        // 计算CAPEX
-        const capex = calculateCapex(params);
-        updateCapexTable(capex, params);
-        
-        // 计算OPEX
-        const opexData = calculateOpex(params, capex);
-        updateOpexTable(opexData);
-        
-        // 计算收入
-        const revenueData = calculateRevenue(params);
-        updateRevenueTable(revenueData);
-        updateRevenueChart(revenueData);
-        
-        // 计算折旧
-        const depreciationData = calculateDepreciation(params, capex);
-        
-        // 计算贷款
-        const loanData = calculateLoan(params, capex);
-        updateLoanTable(loanData);
-        
-        // 计算利润表
-        const incomeData = calculateIncomeStatement(params, revenueData, opexData, depreciationData, loanData);
-        updateIncomeTable(incomeData);
-        
-        // 计算现金流量表
-        const cashFlowData = calculateCashFlow(params, capex, incomeData, depreciationData, loanData);
-        updateCashFlowTable(cashFlowData);
-        
-        // 计算资产负债表
-        const balanceData = calculateBalanceSheet(params, capex, incomeData, depreciationData, loanData, cashFlowData);
-        updateBalanceTable(balanceData);
-        
-        // 计算财务指标
-        const indicators = calculateIndicators(params, capex, revenueData, incomeData, cashFlowData, balanceData, loanData);
-        updateIndicatorsDisplay(indicators);
-        
-        // 保存结果
-        calculationResults = {
-            params,
-            capex,
-            opexData,
-            revenueData,
-            depreciationData,
-            loanData,
-            incomeData,
-            cashFlowData,
-            balanceData,
-            indicators
-        };
-        
-        // 更新融资报告
-        updateBankReport(params, capex, revenueData, opexData, incomeData, cashFlowData, balanceData, loanData, indicators);
-        
-        console.log('计算完成', calculationResults);
-        
+        profileStage('calculateAll', calculateAllStages);
     } catch (error) {
         console.error('计算错误:', error);
         alert('计算过程中发生错误，请检查输入参数');
     }
 }
 
+/**
+ * 主计算流程的各阶段（计算 + 渲染）
+ */
+function calculateAllStages() {
+    // 获取参数
+    const params = profileStage('input.parameters', getParameters);
+    
+    // 初始化现货价格表（如果年限变化）
+    const spotPrices = profileStage('input.spotPrices', () => {
+        initSpotPriceTable();
+        fillSpotPrices();
+        return getSpotPrices(params.operation_years);
+    });
+    
+    // 计算全部结果（参数未变化时直接命中缓存）
+    const results = runModelCached(params, spotPrices);
+    const { capex, opexData, revenueData, depreciationData, loanData,
+            incomeData, cashFlowData, balanceData, indicators } = results;
+    
+    // 更新CAPEX
+    profileStage('render.capexTable', () => updateCapexTable(capex, params));
+    
+    // 更新OPEX
+    profileStage('render.opexTable', () => updateOpexTable(opexData));
+    
+    // 更新收入
+    renderTab('revenue', () => {
+        profileStage('render.revenueTable', () => updateRevenueTable(revenueData));
+        profileStage('render.revenueChart', () => updateRevenueChart(revenueData));
+    });
+    
+    // 更新利润表、现金流量表、资产负债表与贷款表
+    renderTab('statements', () => {
+        profileStage('render.loanTable', () => updateLoanTable(loanData));
+        profileStage('render.incomeTable', () => updateIncomeTable(incomeData));
+        profileStage('render.cashFlowTable', () => updateCashFlowTable(cashFlowData));
+        profileStage('render.balanceTable', () => updateBalanceTable(balanceData));
+    });
+    const imbalances = findBalanceImbalances(balanceData);
+    if (imbalances.length > 0) {
+        console.warn('资产负债表不平衡（资产总计 - 负债和权益总计）:', imbalances);
+    }
+    
+    // 更新财务指标
+    profileStage('render.indicators', () => updateIndicatorsDisplay(indicators));
+    
+    // 保存结果
+    calculationResults = results;
+    
+    // 更新融资报告（含图表、风险分析与附录，切换到融资报告页时才渲染）
+    renderTab('bankReport', () => profileStage('render.bankReport', () =>
+        updateBankReport(params, capex, revenueData, opexData, incomeData, cashFlowData, balanceData, loanData, indicators)));
+    
+    console.log('计算完成', calculationResults, getModelCacheStats());
+}
+
 // ==================== 融资报告生成 ====================
 
 /** @type {Object} 融资报告图表实例 */
@@ -2914,28 +2047,28 @@ function updateBankReport(params, capex, revenueData, opexData, incomeData, cash
     document.getElementById('report_date').textContent = new Date().toLocaleDateString('zh-CN');
     
     // 更新项目概要
-    updateProjectSummary(params, capex, indicators);
+    profileStage('report.projectSummary', () => updateProjectSummary(params, capex, indicators));
     
     // 更新收入分析图表
-    updateRevenueAnalysisCharts(params, revenueData);
+    profileStage('report.revenueCharts', () => updateRevenueAnalysisCharts(params, revenueData));
     
     // 更新偿债能力分析
-    updateDebtServiceAnalysis(params, incomeData, loanData);
+    profileStage('report.debtService', () => updateDebtServiceAnalysis(params, incomeData, loanData));
     
     // 更新盈利能力分析
-    updateProfitabilityAnalysis(params, incomeData, revenueData, capex);
+    profileStage('report.profitability', () => updateProfitabilityAnalysis(params, incomeData, revenueData, capex));
     
     // 更新风险分析
-    updateRiskAnalysis(params, capex, indicators);
+    profileStage('report.risk', () => updateRiskAnalysis(params, capex, indicators));
     
     // 更新财务结构分析
-    updateFinancialStructure(params, balanceData, incomeData);
+    profileStage('report.financialStructure', () => updateFinancialStructure(params, balanceData, incomeData));
     
     // 更新结论与建议
-    updateConclusion(params, indicators, incomeData, loanData);
+    profileStage('report.conclusion', () => updateConclusion(params, indicators, incomeData, loanData));
     
     // 更新附录表格
-    updateAppendixTables(params, incomeData, cashFlowData, balanceData);
+    profileStage('report.appendix', () => updateAppendixTables(params, incomeData, cashFlowData, balanceData));
 }
 
 /**
@@ -2971,22 +2104,6 @@ function updateProjectSummary(params, capex, indicators) {
     document.getElementById('rpt_min_dscr').textContent = `${formatNumber(minDSCR)}x`;
 }
 
-/**
- * 计算最低DSCR
- */
-function calculateMinDSCR(incomeData, loanData, params) {
-    let minDSCR = Infinity;
-    for (let i = 0; i < Math.min(params.loan_years, incomeData.length); i++) {
-        if (loanData[i].payment > 0) {
-            const dscr = incomeData[i].ebitda / loanData[i].payment;
-            if (dscr < minDSCR) {
-                minDSCR = dscr;
-            }
-        }
-    }
-    return minDSCR === Infinity ? 0 : minDSCR;
-}
-
 /**
  * 更新收入分析图表
  */
@@ -3397,16 +2514,10 @@ function updateRiskAnalysis(params, capex, indicators) {
         applyVariableChange(testParams, 'tolling_price', scenario.priceChange);
         applyVariableChange(testParams, 'spot_price', scenario.priceChange);
         
-        const irr = calculateTargetIndicator(testParams, 'project_irr');
-        
-        // 计算最低DSCR
-        const testCapex = calculateCapex(testParams);
-        const testOpex = calculateOpex(testParams, testCapex);
-        const testRevenue = calculateRevenueWithPrices(testParams, getSpotPrices(testParams.operation_years).map(p => p * (1 + scenario.priceChange)));
-        const testDepreciation = calculateDepreciation(testParams, testCapex);
-        const testLoan = calculateLoan(testParams, testCapex);
-        const testIncome = calculateIncomeStatement(testParams, testRevenue, testOpex, testDepreciation, testLoan);
-        const minDSCR = calculateMinDSCR(testIncome, testLoan, testParams);
+        // IRR与最低DSCR取自同一次（缓存的）模型运行
+        const testResults = runAdjustedModelCached(testParams, getSpotPrices(testParams.operation_years));
+        const irr = testResults.indicators.project_irr;
+        const minDSCR = calculateMinDSCR(testResults.incomeData, testResults.loanData, testParams);
         
         const row = document.createElement('tr');
         row.innerHTML = `
@@ -3674,6 +2785,10 @@ function handleModelImport(event) {
             if (!modelData.modelVersion || !modelData.parameters) {
                 throw new Error('无效的模型文件格式');
             }
+            // 1.0 版文件保存时按综合税率计税（与 model_loader.py 的格式迁移一致）
+            if (modelData.modelVersion === '1.0' && !modelData.parameters.tax_method) {
+                modelData.parameters.tax_method = 'flat';
+            }
             
             // 恢复参数到界面
             restoreParameters(modelData.parameters);
@@ -3734,6 +2849,13 @@ function restoreParameters(params) {
         trade_tax_rate: { id: 'trade_tax_rate', transform: v => v * 100 },
         vat_rate: { id: 'vat_rate', transform: v => v * 100 },
         other_tax_rate: { id: 'other_tax_rate', transform: v => v * 100 },
+        tax_method: 'tax_method',
+        loss_offset_threshold: 'loss_offset_threshold',
+        min_taxation_ratio: { id: 'min_taxation_ratio', transform: v => v * 100 },
+        interest_barrier_ratio: { id: 'interest_barrier_ratio', transform: v => v * 100 },
+        interest_barrier_threshold: 'interest_barrier_threshold',
+        trade_tax_addback_ratio: { id: 'trade_tax_addback_ratio', transform: v => v * 100 },
+        trade_tax_addback_allowance: 'trade_tax_addback_allowance',
         tolling_years: 'tolling_years',
         tolling_ratio: { id: 'tolling_ratio', transform: v => v * 100 },
         tolling_price: 'tolling_price',
@@ -3798,7 +2920,7 @@ function saveModel() {
         const spotPrices = getSpotPrices(params.operation_years);
         
         const modelData = {
-            modelVersion: '1.0',
+            modelVersion: '1.1',
             modelName: '德国独立储能电站财务模型',
             savedAt: new Date().toISOString(),
             parameters: params,
@@ -3932,6 +3054,7 @@ function exportToPDF() {
         tab.classList.remove('active');
     });
     document.getElementById('bankReport').classList.add('active');
+    flushTabRender('bankReport');
     
     // 延迟打印以确保页面渲染完成
     setTimeout(() => {
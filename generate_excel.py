@@ -9,11 +9,14 @@
 import openpyxl
 from openpyxl.styles import Font, PatternFill, Alignment, Border, Side
 from openpyxl.utils import get_column_letter
-from openpyxl.chart import LineChart, Reference
 from openpyxl.worksheet.datavalidation import DataValidation
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
+from itertools import repeat
+import atexit
 import os
-import json
+import excel_parts
+from profiling import profiler
 
 # ==================== 颜色定义（符合国际通用习惯） ====================
 INPUT_COLOR = "E7F3FF"  # 浅蓝色 - 用户输入
@@ -24,6 +27,147 @@ SUBTOTAL_COLOR = "D9D9D9"  # 浅灰色 - 小计行
 WARNING_COLOR = "FFE699"  # 浅橙色 - 重要提示
 HEADER_FONT_COLOR = "FFFFFF"  # 白色字体
 
+# ==================== 表格布局 ====================
+MODEL_YEARS = 20  # 工作簿的运营期年数（逐年表格行数）
+FIRST_YEAR_ROW = 4  # 逐年表格第1年所在行（标题、空行、表头之后）
+
+def year_row(year):
+    """逐年表格（OPEX、收入、折旧、贷款、利润表、现货价格）中第year年所在行"""
+    return FIRST_YEAR_ROW + year - 1
+
+def flow_row(year):
+    """现金流量表、资产负债表中第year年所在行（第0年为建设期/建设完成）"""
+    return FIRST_YEAR_ROW + year
+
+def capex_ref(label):
+    """按项目名称动态查找CAPEX明细金额的公式片段"""
+    return f'INDEX(CAPEX明细!D:D,MATCH("{label}",CAPEX明细!A:A,0))'
+
+# 常用CAPEX引用：动态投资总额、不含建设期利息的静态投资、无形资产（开发费用+土地）、固定资产原值
+CAPEX_DYNAMIC_TOTAL = capex_ref("CAPEX总计（含建设期利息）")
+CAPEX_STATIC_TOTAL = capex_ref("CAPEX总计（不含建设期利息）")
+INTANGIBLE_ASSETS = f'({capex_ref("开发费用小计")}+{capex_ref("土地获取成本")})'
+FIXED_ASSET_ORIGINAL = f'({CAPEX_DYNAMIC_TOTAL}-{INTANGIBLE_ASSETS})'
+
+# 网页版参数（getParameters）与工作表输入单元格的对应关系：参数名 -> (工作表, 单元格, 换算系数)
+# 工作表中以百分数录入的比例参数换算系数为100
+PARAMETER_CELLS = {
+    'power_mw': ('边界设定', 'B2', 1),
+    'capacity_mwh': ('边界设定', 'B3', 1),
+    'initial_capacity_pct': ('边界设定', 'B5', 1),
+    'operation_years': ('边界设定', 'B6', 1),
+    'equity_ratio': ('边界设定', 'B7', 100),
+    'loan_years': ('边界设定', 'B8', 1),
+    'loan_rate': ('边界设定', 'B9', 100),
+    'grace_period': ('边界设定', 'B10', 1),
+    'repayment_method': ('边界设定', 'B11', None),
+    'construction_period': ('边界设定', 'B12', 1),
+    'construction_fund_usage': ('边界设定', 'B13', 100),
+    'inflation_rate': ('边界设定', 'B14', 100),
+    'depreciation_years': ('边界设定', 'B15', 1),
+    'salvage_rate': ('边界设定', 'B16', 100),
+    'depreciation_method': ('边界设定', 'B17', None),
+    'amortization_years': ('边界设定', 'B18', 1),
+    'vat_rate': ('边界设定', 'B19', 100),
+    'corporate_tax_rate': ('边界设定', 'B20', 100),
+    'solidarity_tax_rate': ('边界设定', 'B21', 100),
+    'trade_tax_rate': ('边界设定', 'B22', 100),
+    'other_tax_rate': ('边界设定', 'B23', 100),
+    'tolling_years': ('边界设定', 'B24', 1),
+    'tolling_ratio': ('边界设定', 'B25', 100),
+    'tolling_price': ('边界设定', 'B26', 1),
+    'tolling_escalation': ('边界设定', 'B27', 100),
+    'charge_efficiency': ('边界设定', 'B28', 100),
+    'discharge_efficiency': ('边界设定', 'B29', 100),
+    'degradation_rate': ('边界设定', 'B30', 100),
+    'tax_method': ('边界设定', 'B33', None),
+    'loss_offset_threshold': ('边界设定', 'B34', 1),
+    'min_taxation_ratio': ('边界设定', 'B35', 100),
+    'interest_barrier_ratio': ('边界设定', 'B36', 100),
+    'interest_barrier_threshold': ('边界设定', 'B37', 1),
+    'trade_tax_addback_ratio': ('边界设定', 'B38', 100),
+    'trade_tax_addback_allowance': ('边界设定', 'B39', 1),
+    'battery_unit_price': ('设备配置', 'B2', 1),
+    'pcs_unit_price': ('设备配置', 'B5', 1),
+    'mv_transformer_price': ('设备配置', 'B7', 1),
+    'mv_transformer_count': ('设备配置', 'B8', 1),
+    'hv_transformer_price': ('设备配置', 'B9', 1),
+    'hv_transformer_count': ('设备配置', 'B10', 1),
+    'ems_cost': ('设备配置', 'B13', 1),
+    'scada_cost': ('设备配置', 'B14', 1),
+    'switchgear_price': ('设备配置', 'B15', 1),
+    'switchgear_count': ('设备配置', 'B16', 1),
+    'collector_line_cost': ('设备配置', 'B17', 1),
+    'thermal_cost': ('设备配置', 'B18', 1),
+    'fire_protection_cost': ('设备配置', 'B19', 1),
+    'substation_cost': ('设备配置', 'B22', 1),
+    'grid_line_cost': ('设备配置', 'B23', 1),
+    'grid_study_cost': ('设备配置', 'B24', 1),
+    'metering_cost': ('设备配置', 'B25', 1),
+    'land_acquisition_cost': ('设备配置', 'B27', 1),
+    'concrete_cost': ('设备配置', 'B28', 1),
+    'fence_cost': ('设备配置', 'B29', 1),
+    'road_cost': ('设备配置', 'B30', 1),
+    'drainage_cost': ('设备配置', 'B31', 1),
+    'installation_cost_pct': ('设备配置', 'B33', 100),
+    'construction_mgmt_pct': ('设备配置', 'B34', 100),
+    'commissioning_cost': ('设备配置', 'B35', 1),
+    'car_insurance_pct': ('设备配置', 'B36', 100),
+    'ear_insurance_pct': ('设备配置', 'B37', 100),
+    'cargo_insurance_pct': ('设备配置', 'B38', 100),
+    'liability_insurance': ('设备配置', 'B39', 1),
+    'spv_acquisition_cost': ('设备配置', 'B40', 1),
+    'permit_cost': ('设备配置', 'B41', 1),
+    'environmental_cost': ('设备配置', 'B42', 1),
+    'legal_cost': ('设备配置', 'B43', 1),
+    'engineering_pct': ('设备配置', 'B44', 100),
+    'project_mgmt_pct': ('设备配置', 'B45', 100),
+    'contingency_pct': ('设备配置', 'B46', 100),
+    'decommissioning_total': ('设备配置', 'B47', 1),
+    'opex_technical': ('设备配置', 'B50', 1),
+    'opex_technical_esc': ('设备配置', 'B51', 100),
+    'opex_insurance': ('设备配置', 'B52', 100),
+    'opex_insurance_esc': ('设备配置', 'B53', 100),
+    'opex_grid': ('设备配置', 'B54', 1),
+    'opex_grid_esc': ('设备配置', 'B55', 100),
+    'opex_land': ('设备配置', 'B56', 1),
+    'opex_land_esc': ('设备配置', 'B57', 100),
+    'opex_commercial': ('设备配置', 'B58', 1),
+    'opex_commercial_esc': ('设备配置', 'B59', 100),
+    'opex_other': ('设备配置', 'B60', 1),
+    'opex_other_esc': ('设备配置', 'B61', 100),
+}
+
+# 指数曲线：(参数名, 名称, 默认变化率单元格, 方向)；方向为-1时逐年递减（容量衰减）
+INDEX_CURVES = [
+    ('inflation_rate', '通胀', '边界设定!B14', 1),
+    ('opex_technical_esc', '技术运维', '设备配置!B51', 1),
+    ('opex_insurance_esc', '保险', '设备配置!B53', 1),
+    ('opex_grid_esc', '电网费用', '设备配置!B55', 1),
+    ('opex_land_esc', '土地租金', '设备配置!B57', 1),
+    ('opex_commercial_esc', '商务费用', '设备配置!B59', 1),
+    ('opex_other_esc', '其他', '设备配置!B61', 1),
+    ('tolling_escalation', 'Tolling调价', '边界设定!B27', 1),
+    ('degradation_rate', '容量衰减', '边界设定!B30', -1),
+]
+
+# 指数曲线工作表的列：参数名 -> (逐年变化率列, 指数列)，每条曲线占两列，从B列开始
+CURVE_CELLS = {
+    name: (get_column_letter(2 + 2 * i), get_column_letter(3 + 2 * i))
+    for i, (name, _, _, _) in enumerate(INDEX_CURVES)
+}
+
+def index_ref(name, year):
+    """第year年的指数单元格引用（第1年为1）"""
+    return f'指数曲线!{CURVE_CELLS[name][1]}{year_row(year)}'
+
+# 文本参数取值与工作表下拉选项的对应关系
+PARAMETER_OPTIONS = {
+    'repayment_method': {'equal_principal': '等额本金', 'equal_payment': '等额本息'},
+    'depreciation_method': {'straight_line': '直线法', 'double_declining': '双倍余额递减法', 'sum_of_years': '年数总和法'},
+    'tax_method': {'german': '德国税法', 'flat': '综合税率'},
+}
+
 # ==================== 样式函数 ====================
 
 def apply_header_style(cell):
@@ -124,6 +268,13 @@ def create_parameters_sheet(wb):
         (30, "年电池容量衰减率", 2.5, "%/年", "线性衰减模式：固定年衰减率"),
         (31, "系统综合效率(RTE)", "=B28*B29/100", "%", "自动计算"),
         (32, "衰减模式", "线性衰减", "", "线性衰减/非线性衰减/循环次数衰减"),
+        (33, "所得税计算方法", "德国税法", "", "德国税法（亏损结转、利息限制）/综合税率"),
+        (34, "亏损全额抵扣限额", 1000000, "EUR", "§10d EStG，超出部分按下一行比例抵扣"),
+        (35, "超限额部分可抵扣比例", 60, "%", "最低课税(Mindestbesteuerung)"),
+        (36, "利息限制比例", 30, "% EBITDA", "Zinsschranke §4h EStG"),
+        (37, "利息限制免征额", 3000000, "EUR", "净利息低于该额时全额扣除"),
+        (38, "贸易税利息加计比例", 25, "%", "§8 Nr.1 GewStG"),
+        (39, "贸易税利息加计免征额", 200000, "EUR", ""),
     ]
     
     for row, name, value, unit, note in params:
@@ -143,6 +294,12 @@ def create_parameters_sheet(wb):
                 dv.errorTitle = '无效输入'
                 dv.add(cell.coordinate)
                 ws.add_data_validation(dv)
+            if name == '所得税计算方法':
+                dv = DataValidation(type="list", formula1='"德国税法,综合税率"', allow_blank=False)
+                dv.error = '请从列表中选择所得税计算方法'
+                dv.errorTitle = '无效输入'
+                dv.add(cell.coordinate)
+                ws.add_data_validation(dv)
             if name == '还款方式':
                 repayment_methods = ["等额本金", "等额本息"]
                 list_str = ",".join(repayment_methods)
@@ -387,150 +544,93 @@ def create_capex_sheet(wb):
         apply_header_style(cell)
     row += 1
     
-    # 一、主设备
+    # 金额公式中 {row} 为当前行，{项目名称} 为该项目所在行（按名称解析，避免硬编码行号）
+    equipment_base = "=D{设备费小计}+D{辅助设备小计}"
+    subtotals_before_dev = "D{设备费小计}+D{辅助设备小计}+D{电网接入小计}+D{土地与基建小计}+D{安装施工小计}+D{保险费小计}"
     capex_items = [
         ("一、主设备", None, None, None),
-        ("电池系统", "=设备配置!B2", "=边界设定!B3", "=B{0}*C{0}*1000/10000"),
-        ("PCS系统", "=设备配置!B5", "=边界设定!B2", "=B{0}*C{0}*1000/10000"),
-        ("中压变压器", "=设备配置!B7", "=设备配置!B8", "=B{0}*C{0}/10000"),
-        ("升压变压器", "=设备配置!B9", "=设备配置!B10", "=B{0}*C{0}/10000"),
-        ("设备费小计", None, None, "=SUM(D5:D9)"),
+        ("电池系统", "=设备配置!B2", "=边界设定!B3", "=B{row}*C{row}*1000/10000"),
+        ("PCS系统", "=设备配置!B5", "=边界设定!B2", "=B{row}*C{row}*1000/10000"),
+        ("中压变压器", "=设备配置!B7", "=设备配置!B8", "=B{row}*C{row}/10000"),
+        ("升压变压器", "=设备配置!B9", "=设备配置!B10", "=B{row}*C{row}/10000"),
+        ("设备费小计", None, None, "=SUM(D{电池系统}:D{升压变压器})"),
         ("", None, None, None),
         ("二、辅助设备", None, None, None),
-        ("EMS系统", "=设备配置!B13", "1", "=B{0}*C{0}/10000"),
-        ("SCADA系统", "=设备配置!B14", "1", "=B{0}*C{0}/10000"),
-        ("开关柜", "=设备配置!B15", "=设备配置!B16", "=B{0}*C{0}/10000"),
-        ("集电线路", "=设备配置!B17", "1", "=B{0}*C{0}/10000"),
-        ("热管理系统", "=设备配置!B18", "=边界设定!B3", "=B{0}*C{0}*1000/10000"),
-        ("消防系统", "=设备配置!B19", "=边界设定!B3", "=B{0}*C{0}*1000/10000"),
-        ("辅助设备小计", None, None, "=SUM(D{0}:D{1})"),
+        ("EMS系统", "=设备配置!B13", 1, "=B{row}*C{row}/10000"),
+        ("SCADA系统", "=设备配置!B14", 1, "=B{row}*C{row}/10000"),
+        ("开关柜", "=设备配置!B15", "=设备配置!B16", "=B{row}*C{row}/10000"),
+        ("集电线路", "=设备配置!B17", 1, "=B{row}*C{row}/10000"),
+        ("热管理系统", "=设备配置!B18", "=边界设定!B3", "=B{row}*C{row}*1000/10000"),
+        ("消防系统", "=设备配置!B19", "=边界设定!B3", "=B{row}*C{row}*1000/10000"),
+        ("辅助设备小计", None, None, "=SUM(D{EMS系统}:D{消防系统})"),
         ("", None, None, None),
         ("三、电网接入", None, None, None),
-        ("变电站建设", "=设备配置!B22", "1", "=B{0}/10000"),
-        ("接入线路", "=设备配置!B23", "1", "=B{0}/10000"),
-        ("并网申请与研究", "=设备配置!B24", "1", "=B{0}/10000"),
-        ("计量与保护设备", "=设备配置!B25", "1", "=B{0}/10000"),
-        ("电网接入小计", None, None, "=SUM(D{0}:D{1})"),
+        ("变电站建设", "=设备配置!B22", 1, "=B{row}/10000"),
+        ("接入线路", "=设备配置!B23", 1, "=B{row}/10000"),
+        ("并网申请与研究", "=设备配置!B24", 1, "=B{row}/10000"),
+        ("计量与保护设备", "=设备配置!B25", 1, "=B{row}/10000"),
+        ("电网接入小计", None, None, "=SUM(D{变电站建设}:D{计量与保护设备})"),
         ("", None, None, None),
         ("四、土地与基建", None, None, None),
-        ("土地获取成本", "=设备配置!B27", "=边界设定!B2", "=B{0}*C{0}*1000/10000"),
-        ("混凝土基础", "=设备配置!B28", "=边界设定!B2", "=B{0}*C{0}*1000/10000"),
-        ("围栏与安防", "=设备配置!B29", "1", "=B{0}/10000"),
-        ("道路建设", "=设备配置!B30", "1", "=B{0}/10000"),
-        ("排水系统", "=设备配置!B31", "1", "=B{0}/10000"),
-        ("土地与基建小计", None, None, "=SUM(D{0}:D{1})"),
+        ("土地获取成本", "=设备配置!B27", "=边界设定!B2", "=B{row}*C{row}*1000/10000"),
+        ("混凝土基础", "=设备配置!B28", "=边界设定!B2", "=B{row}*C{row}*1000/10000"),
+        ("围栏与安防", "=设备配置!B29", 1, "=B{row}/10000"),
+        ("道路建设", "=设备配置!B30", 1, "=B{row}/10000"),
+        ("排水系统", "=设备配置!B31", 1, "=B{row}/10000"),
+        ("土地与基建小计", None, None, "=SUM(D{土地获取成本}:D{排水系统})"),
         ("", None, None, None),
         ("五、安装与施工", None, None, None),
-        ("机电安装", "=设备配置!B33", "=D5+D9", "=B{0}*C{0}/100"),
-        ("施工管理费", "=设备配置!B34", "=D5+D9", "=B{0}*C{0}/100"),
-        ("调试费用", "=设备配置!B35", "1", "=B{0}/10000"),
-        ("安装施工小计", None, None, "=SUM(D{0}:D{1})"),
+        ("机电安装", "=设备配置!B33", equipment_base, "=B{row}*C{row}/100"),
+        ("施工管理费", "=设备配置!B34", equipment_base, "=B{row}*C{row}/100"),
+        ("调试费用", "=设备配置!B35", 1, "=B{row}/10000"),
+        ("安装施工小计", None, None, "=SUM(D{机电安装}:D{调试费用})"),
         ("", None, None, None),
         ("六、建设期保险", None, None, None),
-        ("CAR保险", "=设备配置!B36", "=D5+D9", "=B{0}*C{0}/100"),
-        ("EAR保险", "=设备配置!B37", "=D5+D9", "=B{0}*C{0}/100"),
-        ("货物运输保险", "=设备配置!B38", "=D5+D9", "=B{0}*C{0}/100"),
-        ("第三方责任险", "=设备配置!B39", "1", "=B{0}/10000"),
-        ("保险费小计", None, None, "=SUM(D{0}:D{1})"),
+        ("CAR保险", "=设备配置!B36", equipment_base, "=B{row}*C{row}/100"),
+        ("EAR保险", "=设备配置!B37", equipment_base, "=B{row}*C{row}/100"),
+        ("货物运输保险", "=设备配置!B38", equipment_base, "=B{row}*C{row}/100"),
+        ("第三方责任险", "=设备配置!B39", 1, "=B{row}/10000"),
+        ("保险费小计", None, None, "=SUM(D{CAR保险}:D{第三方责任险})"),
         ("", None, None, None),
         ("七、开发与业主费用", None, None, None),
-        ("SPV公司收购成本", "=设备配置!B40", "1", "=B{0}/10000"),
-        ("许可与规划费", "=设备配置!B41", "1", "=B{0}/10000"),
-        ("环境咨询费", "=设备配置!B42", "1", "=B{0}/10000"),
-        ("法律咨询费", "=设备配置!B43", "1", "=B{0}/10000"),
-        ("工程设计费", "=设备配置!B44", "=D5+D9", "=B{0}*C{0}/100"),
-        ("项目管理费", "=设备配置!B45", "=SUM(D5:D{0})", "=B{0}*C{0}/100"),
-        ("开发费用小计", None, None, "=SUM(D{0}:D{1})"),
+        ("SPV公司收购成本", "=设备配置!B40", 1, "=B{row}/10000"),
+        ("许可与规划费", "=设备配置!B41", 1, "=B{row}/10000"),
+        ("环境咨询费", "=设备配置!B42", 1, "=B{row}/10000"),
+        ("法律咨询费", "=设备配置!B43", 1, "=B{row}/10000"),
+        ("工程设计费", "=设备配置!B44", equipment_base, "=B{row}*C{row}/100"),
+        ("项目管理费", "=设备配置!B45", f"={subtotals_before_dev}+SUM(D{{SPV公司收购成本}}:D{{工程设计费}})", "=B{row}*C{row}/100"),
+        ("开发费用小计", None, None, "=SUM(D{SPV公司收购成本}:D{项目管理费})"),
         ("", None, None, None),
         ("八、其他", None, None, None),
-        ("不可预见费", "=设备配置!B46", "=SUM(D5:D{0})", "=B{0}*C{0}/100"),
-        ("拆除准备金", "=设备配置!B47", "1", "=B{0}/10000"),
-        ("CAPEX总计（不含建设期利息）", None, None, "=SUM(D5:D{0})"),
-        ("建设期利息", None, None, "=D{0}*(1-边界设定!B7/100)*边界设定!B9/100*边界设定!B12*边界设定!B13/100"),
-        ("CAPEX总计（含建设期利息）", None, None, "=D{0}+D{1}"),
+        ("不可预见费", "=设备配置!B46", f"={subtotals_before_dev}+D{{开发费用小计}}", "=B{row}*C{row}/100"),
+        # 拆除准备金在运营期逐年计提（见OPEX设定），此处仅列示，不计入CAPEX总计
+        ("拆除准备金（运营期计提）", "=设备配置!B47", 1, "=B{row}/10000"),
+        ("CAPEX总计（不含建设期利息）", None, None, f"={subtotals_before_dev}+D{{开发费用小计}}+D{{不可预见费}}"),
+        ("建设期利息", None, None, "=D{CAPEX总计（不含建设期利息）}*(1-边界设定!B7/100)*边界设定!B9/100*边界设定!B12*边界设定!B13/100"),
+        ("CAPEX总计（含建设期利息）", None, None, "=D{CAPEX总计（不含建设期利息）}+D{建设期利息}"),
     ]
     
-    start_row = row
-    section_start_row = None  # 记录每个分组的起始行
-    data_rows = []  # 记录每个分组的数据行范围
-    capex_total_row = None  # 记录CAPEX总计行的行号
-    capex_total_with_interest_row = None  # 记录含建设期利息的CAPEX总计行号
-    
-    for item in capex_items:
-        name, price, qty, amount = item
-        if name:
-            # 如果是分组标题，记录起始行
-            if name.startswith('一、') or name.startswith('二、') or name.startswith('三、') or \
-               name.startswith('四、') or name.startswith('五、') or name.startswith('六、') or \
-               name.startswith('七、') or name.startswith('八、'):
-                section_start_row = row + 1  # 下一行是数据开始
-                ws.cell(row, 1, name)
-                ws.cell(row, 1).font = Font(bold=True)
-                ws.cell(row, 1).fill = PatternFill(start_color=SUBTOTAL_COLOR, end_color=SUBTOTAL_COLOR, fill_type='solid')
-            else:
-                ws.cell(row, 1, name)
-                if price:
-                    cell = ws.cell(row, 2)
-                    if isinstance(price, str) and price.startswith('='):
-                        cell.value = price
-                    else:
-                        cell.value = price
-                    apply_calc_style(cell)
-                if qty:
-                    cell = ws.cell(row, 3)
-                    if isinstance(qty, str) and qty.startswith('='):
-                        cell.value = qty
-                    else:
-                        cell.value = qty
-                    apply_calc_style(cell)
-                if amount:
-                    cell = ws.cell(row, 4)
-                    if isinstance(amount, str) and amount.startswith('='):
-                        # 处理包含 {0} 和 {1} 的公式
-                        if 'SUM(D{0}:D{1})' in amount:
-                            # 小计行：需要起始行和当前行前一行
-                            if section_start_row:
-                                formula = amount.replace('{0}', str(section_start_row)).replace('{1}', str(row - 1))
-                            else:
-                                formula = amount.replace('{0}', '5').replace('{1}', str(row - 1))
-                        elif 'D{0}+D{1}' in amount:
-                            # 总计行：需要引用前面的两个单元格
-                            # 找到前面的总计行和建设期利息行
-                            # 注意：这里需要找到实际的CAPEX总计行和建设期利息行
-                            # 由于行号是动态的，我们需要向上查找
-                            prev_total_row = row - 2  # CAPEX总计（不含建设期利息）行
-                            prev_interest_row = row - 1  # 建设期利息行
-                            if prev_total_row >= start_row and prev_interest_row >= start_row:
-                                formula = amount.replace('{0}', str(prev_total_row)).replace('{1}', str(prev_interest_row))
-                            else:
-                                # 如果行号无效，使用默认值
-                                formula = amount.replace('{0}', 'D50').replace('{1}', 'D51')
-                        elif 'SUM(D5:D{0})' in amount:
-                            # 需要找到前面的总计行
-                            formula = amount.replace('{0}', str(row - 1))
-                        elif '{0}' in amount:
-                            # 只包含 {0} 的公式，替换为当前行号
-                            formula = amount.replace('{0}', str(row))
-                        else:
-                            formula = amount
-                        cell.value = formula
-                    else:
-                        cell.value = amount
-                    apply_calc_style(cell)
-                    if '小计' in name or '总计' in name:
-                        if '小计' in name:
-                            apply_subtotal_style(cell)
-                        else:
-                            apply_result_style(cell)
-                            # 记录CAPEX总计行的行号
-                            if 'CAPEX总计（不含建设期利息）' in name:
-                                capex_total_row = row
-                            elif 'CAPEX总计（含建设期利息）' in name:
-                                capex_total_with_interest_row = row
+    rows_by_name = {name: row + offset for offset, (name, _, _, _) in enumerate(capex_items) if name}
+    section_prefixes = ('一、', '二、', '三、', '四、', '五、', '六、', '七、', '八、')
+    
+    for name, price, qty, amount in capex_items:
+        if name.startswith(section_prefixes):
+            ws.cell(row, 1, name)
+            ws.cell(row, 1).font = Font(bold=True)
+            ws.cell(row, 1).fill = PatternFill(start_color=SUBTOTAL_COLOR, end_color=SUBTOTAL_COLOR, fill_type='solid')
+        elif name:
+            ws.cell(row, 1, name)
+            for col, value in ((2, price), (3, qty), (4, amount)):
+                if value is None:
+                    continue
+                cell = ws.cell(row, col)
+                cell.value = value.format(row=row, **rows_by_name) if isinstance(value, str) else value
+                apply_calc_style(cell)
+            if '小计' in name:
+                apply_subtotal_style(ws.cell(row, 4))
+            elif '总计' in name:
+                apply_result_style(ws.cell(row, 4))
         row += 1
-    
-    # 注意：所有公式已使用INDEX和MATCH动态查找CAPEX总计行
-    # 不再需要硬编码行号，提高了公式的健壮性
 
 def create_spot_price_sheet(wb):
     """创建现货价格工作表"""
@@ -542,7 +642,7 @@ def create_spot_price_sheet(wb):
     row = 1
     ws.merge_cells(f'A{row}:B{row}')
     cell = ws[f'A{row}']
-    cell.value = "现货价格表（EUR/MWh）"
+    cell.value = "现货价格表（EUR/MW/年）"
     cell.font = Font(bold=True, size=16)
     cell.alignment = Alignment(horizontal='center', vertical='center')
     row += 2
@@ -554,13 +654,57 @@ def create_spot_price_sheet(wb):
     apply_header_style(cell)
     row += 1
     
-    # 生成20年的价格行（默认值，用户可修改）
-    for year in range(1, 21):
+    # 生成逐年价格行（默认值与网页版一致：首年35000 EUR/MW，年增长1.5%，用户可修改）
+    for year in range(1, MODEL_YEARS + 1):
         ws.cell(row, 1, f"第{year}年")
-        cell = ws.cell(row, 2, 80)  # 默认价格
+        cell = ws.cell(row, 2, round(35000 * 1.015 ** (year - 1)))
         apply_input_style(cell)
         row += 1
 
+def create_index_sheet(wb):
+    """创建指数曲线工作表（逐年变化率默认取边界设定/设备配置中的固定值，可逐年改写为曲线）"""
+    ws = wb.create_sheet("指数曲线")
+    
+    last_col = get_column_letter(1 + 2 * len(INDEX_CURVES))
+    ws.column_dimensions['A'].width = 12
+    for col in range(2, 2 + 2 * len(INDEX_CURVES)):
+        ws.column_dimensions[get_column_letter(col)].width = 14
+    
+    row = 1
+    ws.merge_cells(f'A{row}:{last_col}{row}')
+    cell = ws[f'A{row}']
+    cell.value = "指数曲线（变化率为当年相对上年，%；指数以第1年为1）"
+    cell.font = Font(bold=True, size=16)
+    cell.alignment = Alignment(horizontal='center', vertical='center')
+    row += 2
+    
+    # 表头
+    apply_header_style(ws.cell(row, 1, "年份"))
+    for name, label, _, _ in INDEX_CURVES:
+        rate_col, index_col = CURVE_CELLS[name]
+        apply_header_style(ws[f'{rate_col}{row}'])
+        ws[f'{rate_col}{row}'].value = f"{label}变化率(%)"
+        apply_header_style(ws[f'{index_col}{row}'])
+        ws[f'{index_col}{row}'].value = f"{label}指数"
+    row += 1
+    
+    # 逐年累乘：第t年指数 = 第t-1年指数 × (1 ± 第t年变化率)
+    for year in range(1, MODEL_YEARS + 1):
+        ws.cell(row, 1, f'第{year}年')
+        for name, _, source, sign in INDEX_CURVES:
+            rate_col, index_col = CURVE_CELLS[name]
+            if year == 1:
+                cell = ws[f'{index_col}{row}']
+                cell.value = 1
+            else:
+                cell = ws[f'{rate_col}{row}']
+                cell.value = f'={source}'
+                apply_input_style(cell)
+                cell = ws[f'{index_col}{row}']
+                cell.value = f'={index_col}{row - 1}*(1{"+" if sign > 0 else "-"}{rate_col}{row}/100)'
+            apply_calc_style(cell)
+        row += 1
+
 def create_opex_sheet(wb):
     """创建OPEX设定工作表"""
     ws = wb.create_sheet("OPEX设定")
@@ -584,17 +728,18 @@ def create_opex_sheet(wb):
     row += 1
     
     # 生成年度数据行（使用公式）
-    for year in range(1, 21):
+    for year in range(1, MODEL_YEARS + 1):
         ws.cell(row, 1, f'第{year}年')
-        inflation_factor = f'POWER(1+边界设定!B14/100,{year-1})'
+        inflation_factor = index_ref('inflation_rate', year)
         formulas = [
-            f'=设备配置!B50*边界设定!B2*1000*POWER(1+设备配置!B51/100,{year-1})*{inflation_factor}/10000',
-            f'=IFERROR(INDEX(CAPEX明细!D:D,MATCH("CAPEX总计（不含建设期利息）",CAPEX明细!A:A,0)),0)*设备配置!B52/100*POWER(1+设备配置!B53/100,{year-1})*{inflation_factor}',
-            f'=设备配置!B54*边界设定!B2*POWER(1+设备配置!B55/100,{year-1})*{inflation_factor}/10000',
-            f'=设备配置!B56*POWER(1+设备配置!B57/100,{year-1})*{inflation_factor}/10000',
-            f'=设备配置!B58*边界设定!B2*POWER(1+设备配置!B59/100,{year-1})*{inflation_factor}/10000',
-            f'=设备配置!B60*边界设定!B2*POWER(1+设备配置!B61/100,{year-1})*{inflation_factor}/10000',
-            '=0'
+            f"=设备配置!B50*边界设定!B2*1000*{index_ref('opex_technical_esc', year)}*{inflation_factor}/10000",
+            f"=IFERROR({CAPEX_STATIC_TOTAL},0)*设备配置!B52/100*{index_ref('opex_insurance_esc', year)}*{inflation_factor}",
+            f"=设备配置!B54*边界设定!B2*{index_ref('opex_grid_esc', year)}*{inflation_factor}/10000",
+            f"=设备配置!B56*{index_ref('opex_land_esc', year)}*{inflation_factor}/10000",
+            f"=设备配置!B58*边界设定!B2*{index_ref('opex_commercial_esc', year)}*{inflation_factor}/10000",
+            f"=设备配置!B60*边界设定!B2*{index_ref('opex_other_esc', year)}*{inflation_factor}/10000",
+            # 拆除准备金按运营年限逐年计提
+            f'=IFERROR(设备配置!B47/边界设定!B6/10000,0)*{inflation_factor}'
         ]
         for col_idx, formula in enumerate(formulas, 2):
             cell = ws.cell(row, col_idx)
@@ -629,19 +774,19 @@ def create_revenue_sheet(wb):
     row += 1
     
     # 生成年度数据行
-    for year in range(1, 21):
+    for year in range(1, MODEL_YEARS + 1):
         ws.cell(row, 1, f'第{year}年')
         # 可用容量比例（考虑衰减）
         cell = ws.cell(row, 2)
-        cell.value = f'=边界设定!B5/100*POWER(1-边界设定!B30/100,{year-1})*100'
+        cell.value = f"=边界设定!B5/100*{index_ref('degradation_rate', year)}*100"
         apply_calc_style(cell)
         # Tolling收入
         cell = ws.cell(row, 3)
-        cell.value = f'=IF({year}<=边界设定!B24,边界设定!B26*边界设定!B2*1000*边界设定!B25/100/10000*POWER(1+边界设定!B27/100,{year-1}),0)'
+        cell.value = f"=IF({year}<=边界设定!B24,边界设定!B26*{index_ref('tolling_escalation', year)}*边界设定!B2*1000*边界设定!B25/100/10000,0)"
         apply_calc_style(cell)
         # 现货收入
         cell = ws.cell(row, 4)
-        cell.value = f'=现货价格!B{year+2}*边界设定!B2*IF({year}<=边界设定!B24,1-边界设定!B25/100,1)*B{row}/100/10000'
+        cell.value = f'=现货价格!B{year_row(year)}*边界设定!B2*IF({year}<=边界设定!B24,1-边界设定!B25/100,1)*B{row}/100/10000'
         apply_calc_style(cell)
         # 总收入
         cell = ws.cell(row, 5)
@@ -671,20 +816,26 @@ def create_depreciation_sheet(wb):
         apply_header_style(cell)
     row += 1
     
+    # 固定资产原值 = 动态总投资 - 无形资产（开发费用+土地），建设期利息已资本化
+    original = f'IFERROR({FIXED_ASSET_ORIGINAL},0)'
+    salvage = '边界设定!B16/100'
+    life = '边界设定!B15'
+    
     # 生成年度数据行（使用公式）
-    for year in range(1, 21):
+    for year in range(1, MODEL_YEARS + 1):
         ws.cell(row, 1, f'第{year}年')
-        # 固定资产折旧（直线法）
-        # 使用动态查找CAPEX总计行，而不是硬编码D50
+        # 固定资产折旧（按边界设定的折旧方法）
         cell = ws.cell(row, 2)
-        # 查找"CAPEX总计（含建设期利息）"所在行，使用IFERROR处理找不到的情况
-        # 使用命名公式提高可读性和性能
-        cell.value = f'=IF({year}<=边界设定!B15,IFERROR((INDEX(CAPEX明细!D:D,MATCH("CAPEX总计（含建设期利息）",CAPEX明细!A:A,0))-INDEX(CAPEX明细!D:D,MATCH("CAPEX总计（含建设期利息）",CAPEX明细!A:A,0))*边界设定!B16/100)/边界设定!B15,0),0)'
+        straight_line = f'{original}*(1-{salvage})/{life}'
+        book_value = f'{original}*POWER(1-2/{life},{year-1})'
+        double_declining = f'MIN({book_value}*2/{life},{book_value}-{original}*{salvage})'
+        sum_of_years = f'{original}*(1-{salvage})*({life}-{year}+1)/({life}*({life}+1)/2)'
+        cell.value = (f'=IF({year}<={life},IF(边界设定!B17="双倍余额递减法",{double_declining},'
+                      f'IF(边界设定!B17="年数总和法",{sum_of_years},{straight_line})),0)')
         apply_calc_style(cell)
         # 无形资产摊销（开发费用+土地）
         cell = ws.cell(row, 3)
-        # 计算无形资产 = 开发费用小计 + 土地获取成本，使用IFERROR处理找不到的情况
-        cell.value = f'=IF({year}<=边界设定!B18,IFERROR((INDEX(CAPEX明细!D:D,MATCH("开发费用小计",CAPEX明细!A:A,0))+INDEX(CAPEX明细!D:D,MATCH("土地获取成本",CAPEX明细!A:A,0)))/边界设定!B18,0),0)'
+        cell.value = f'=IF({year}<=边界设定!B18,IFERROR({INTANGIBLE_ASSETS}/边界设定!B18,0),0)'
         apply_calc_style(cell)
         # 折旧合计
         cell = ws.cell(row, 4)
@@ -692,7 +843,7 @@ def create_depreciation_sheet(wb):
         apply_calc_style(cell)
         # 累计折旧
         cell = ws.cell(row, 5)
-        cell.value = f'=SUM(B$5:B{row})+SUM(C$5:C{row})'
+        cell.value = f'=SUM(B${FIRST_YEAR_ROW}:B{row})+SUM(C${FIRST_YEAR_ROW}:C{row})'
         apply_calc_style(cell)
         row += 1
 
@@ -718,25 +869,26 @@ def create_loan_sheet(wb):
         apply_header_style(cell)
     row += 1
     
-    # 生成年度数据行（使用公式，等额本金方式）
-    for year in range(1, 21):
+    loan_amount = f'IFERROR({CAPEX_DYNAMIC_TOTAL}*(1-边界设定!B7/100),0)'
+    repayment_years = '(边界设定!B8-边界设定!B10)'
+    
+    # 生成年度数据行（贷款年限之后各项为0）
+    for year in range(1, MODEL_YEARS + 1):
         ws.cell(row, 1, f'第{year}年')
         # 期初余额
         cell = ws.cell(row, 2)
-        if year == 1:
-            # 使用动态查找CAPEX总计，使用IFERROR处理找不到的情况
-            cell.value = '=IFERROR(INDEX(CAPEX明细!D:D,MATCH("CAPEX总计（含建设期利息）",CAPEX明细!A:A,0))*(1-边界设定!B7/100),0)'
-        else:
-            cell.value = f'=F{row-1}'
+        opening = loan_amount if year == 1 else f'F{row-1}'
+        cell.value = f'=IF({year}<=边界设定!B8,{opening},0)'
         apply_calc_style(cell)
         # 利息
         cell = ws.cell(row, 3)
         cell.value = f'=B{row}*边界设定!B9/100'
         apply_calc_style(cell)
-        # 本金
+        # 本金（宽限期后按等额本金或等额本息偿还）
         cell = ws.cell(row, 4)
-        # 使用动态查找CAPEX总计，使用IFERROR处理找不到的情况
-        cell.value = f'=IF({year}>边界设定!B10,IF(边界设定!B11="等额本金",IFERROR((INDEX(CAPEX明细!D:D,MATCH("CAPEX总计（含建设期利息）",CAPEX明细!A:A,0))*(1-边界设定!B7/100))/(边界设定!B8-边界设定!B10),0),IFERROR(PMT(边界设定!B9/100,边界设定!B8-边界设定!B10,-INDEX(CAPEX明细!D:D,MATCH("CAPEX总计（含建设期利息）",CAPEX明细!A:A,0))*(1-边界设定!B7/100))-C{row},0)),0)'
+        equal_payment = f'PMT(边界设定!B9/100,{repayment_years},-{loan_amount})-C{row}'
+        cell.value = (f'=IF(AND({year}>边界设定!B10,{year}<=边界设定!B8,{repayment_years}>0),'
+                      f'IF(边界设定!B11="等额本金",{loan_amount}/{repayment_years},{equal_payment}),0)')
         apply_calc_style(cell)
         # 还款额
         cell = ws.cell(row, 5)
@@ -771,15 +923,15 @@ def create_income_sheet(wb):
     row += 1
     
     # 生成年度数据行
-    for year in range(1, 21):
+    for year in range(1, MODEL_YEARS + 1):
         ws.cell(row, 1, f'第{year}年')
         # 营业收入
         cell = ws.cell(row, 2)
-        cell.value = f'=收入预测!E{year+2}'
+        cell.value = f'=收入预测!E{year_row(year)}'
         apply_calc_style(cell)
         # 营业成本（OPEX）
         cell = ws.cell(row, 3)
-        cell.value = f'=OPEX设定!I{year+2}'
+        cell.value = f'=OPEX设定!I{year_row(year)}'
         apply_calc_style(cell)
         # 毛利润
         cell = ws.cell(row, 4)
@@ -791,7 +943,7 @@ def create_income_sheet(wb):
         apply_calc_style(cell)
         # 折旧
         cell = ws.cell(row, 6)
-        cell.value = f'=折旧计算!D{year+2}'
+        cell.value = f'=折旧计算!D{year_row(year)}'
         apply_calc_style(cell)
         # EBIT
         cell = ws.cell(row, 7)
@@ -799,7 +951,7 @@ def create_income_sheet(wb):
         apply_calc_style(cell)
         # 利息
         cell = ws.cell(row, 8)
-        cell.value = f'=贷款计算!C{year+2}'
+        cell.value = f'=贷款计算!C{year_row(year)}'
         apply_calc_style(cell)
         # EBT
         cell = ws.cell(row, 9)
@@ -807,7 +959,7 @@ def create_income_sheet(wb):
         apply_calc_style(cell)
         # 所得税
         cell = ws.cell(row, 10)
-        cell.value = f'=MAX(0,I{row}*(边界设定!B20/100*(1+边界设定!B21/100)+边界设定!B22/100+边界设定!B23/100))'
+        cell.value = f'=税务计算!V{row}'
         apply_calc_style(cell)
         # 净利润
         cell = ws.cell(row, 11)
@@ -815,6 +967,71 @@ def create_income_sheet(wb):
         apply_result_style(cell)
         row += 1
 
+def create_tax_sheet(wb):
+    """创建税务计算工作表（德国税制逐年计算：利息限制、亏损结转、企业所得税与贸易税分别计税）"""
+    ws = wb.create_sheet("税务计算")
+    
+    ws.column_dimensions['A'].width = 12
+    for col in range(2, 23):
+        ws.column_dimensions[get_column_letter(col)].width = 14
+    
+    row = 1
+    ws.merge_cells(f'A{row}:V{row}')
+    cell = ws[f'A{row}']
+    cell.value = "税务计算表（万EUR）"
+    cell.font = Font(bold=True, size=16)
+    cell.alignment = Alignment(horizontal='center', vertical='center')
+    row += 2
+    
+    # 表头
+    headers = ['年份', 'EBIT', '利息', 'EBITDA', '利息结转(期初)', '可扣除利息', '利息结转(期末)',
+               '所得(抵亏前)', '亏损结转(期初)', '亏损抵扣', '亏损结转(期末)', '企业所得税应税所得',
+               '贸易税所得(抵亏前)', '贸易税亏损结转(期初)', '贸易税亏损抵扣', '贸易税亏损结转(期末)',
+               '贸易税应税所得', '企业所得税', '团结附加税', '贸易税', '其他税费', '所得税合计']
+    for col, header in enumerate(headers, 1):
+        cell = ws.cell(row, col, header)
+        apply_header_style(cell)
+    row += 1
+    
+    threshold = '边界设定!B34/10000'
+    ratio = '边界设定!B35/100'
+    for year in range(1, MODEL_YEARS + 1):
+        r, prev = row, row - 1
+        first = year == 1
+        ws.cell(row, 1, f'第{year}年')
+        formulas = [
+            f'=利润表!G{r}',
+            f'=利润表!H{r}',
+            f'=利润表!E{r}',
+            0 if first else f'=G{prev}',
+            # 利息限制：低于免征额全额扣除，否则不超过EBITDA的一定比例
+            f'=IF(C{r}+E{r}<边界设定!B37/10000,C{r}+E{r},MIN(C{r}+E{r},边界设定!B36/100*MAX(0,D{r})))',
+            f'=C{r}+E{r}-F{r}',
+            f'=B{r}-F{r}',
+            0 if first else f'=K{prev}',
+            # 最低课税：限额以内全额抵扣，超出部分按比例抵扣
+            f'=IF(H{r}>0,MIN(I{r},MIN(H{r},{threshold})+{ratio}*MAX(0,H{r}-{threshold})),0)',
+            f'=I{r}-J{r}+MAX(0,-H{r})',
+            f'=MAX(0,H{r}-J{r})',
+            f'=H{r}+边界设定!B38/100*MAX(0,F{r}-边界设定!B39/10000)',
+            0 if first else f'=P{prev}',
+            f'=IF(M{r}>0,MIN(N{r},MIN(M{r},{threshold})+{ratio}*MAX(0,M{r}-{threshold})),0)',
+            f'=N{r}-O{r}+MAX(0,-M{r})',
+            f'=MAX(0,M{r}-O{r})',
+            f'=L{r}*边界设定!B20/100',
+            f'=R{r}*边界设定!B21/100',
+            f'=Q{r}*边界设定!B22/100',
+            f'=MAX(0,利润表!I{r})*边界设定!B23/100',
+            # 综合税率模式沿用原算法：综合税率 × 当年利润，亏损不结转
+            f'=IF(边界设定!B33="综合税率",MAX(0,利润表!I{r}*(边界设定!B20/100*(1+边界设定!B21/100)+边界设定!B22/100+边界设定!B23/100)),R{r}+S{r}+T{r}+U{r})',
+        ]
+        for col, formula in enumerate(formulas, 2):
+            cell = ws.cell(row, col)
+            cell.value = formula
+            apply_calc_style(cell)
+        apply_result_style(ws.cell(row, 22))
+        row += 1
+
 def create_cashflow_sheet(wb):
     """创建现金流量表工作表"""
     ws = wb.create_sheet("现金流量表")
@@ -837,48 +1054,49 @@ def create_cashflow_sheet(wb):
         apply_header_style(cell)
     row += 1
     
+    dynamic_total = f'IFERROR({CAPEX_DYNAMIC_TOTAL},0)'
+    
     # 建设期
     ws.cell(row, 1, '建设期')
     cell = ws.cell(row, 2)
     cell.value = 0
     apply_calc_style(cell)
     cell = ws.cell(row, 3)
-    # 使用动态查找CAPEX总计，使用IFERROR处理找不到的情况
-    cell.value = '=-IFERROR(INDEX(CAPEX明细!D:D,MATCH("CAPEX总计（含建设期利息）",CAPEX明细!A:A,0)),0)'
+    cell.value = f'=-{dynamic_total}'
     apply_calc_style(cell)
     cell = ws.cell(row, 4)
-    cell.value = '=IFERROR(INDEX(CAPEX明细!D:D,MATCH("CAPEX总计（含建设期利息）",CAPEX明细!A:A,0)),0)'
+    cell.value = f'={dynamic_total}'
     apply_calc_style(cell)
     cell = ws.cell(row, 5)
-    cell.value = '=-IFERROR(INDEX(CAPEX明细!D:D,MATCH("CAPEX总计（含建设期利息）",CAPEX明细!A:A,0)),0)'
+    cell.value = f'=-{dynamic_total}'
     apply_result_style(cell)
     cell = ws.cell(row, 6)
-    cell.value = '=-IFERROR(INDEX(CAPEX明细!D:D,MATCH("CAPEX总计（含建设期利息）",CAPEX明细!A:A,0)),0)*边界设定!B7/100'
+    cell.value = f'=-{dynamic_total}*边界设定!B7/100'
     apply_result_style(cell)
     row += 1
     
     # 运营期
-    for year in range(1, 21):
+    for year in range(1, MODEL_YEARS + 1):
         ws.cell(row, 1, f'第{year}年')
         # 经营活动现金流
         cell = ws.cell(row, 2)
-        cell.value = f'=利润表!K{year+2}+折旧计算!D{year+2}'
+        cell.value = f'=利润表!K{year_row(year)}+折旧计算!D{year_row(year)}'
         apply_calc_style(cell)
         # 投资活动现金流
         cell = ws.cell(row, 3)
-        if year == 20:
-            # 残值回收 = 固定资产原值 * 残值率，使用IFERROR处理找不到的情况
-            cell.value = f'=IFERROR(INDEX(CAPEX明细!D:D,MATCH("CAPEX总计（含建设期利息）",CAPEX明细!A:A,0)),0)*边界设定!B16/100'
+        if year == MODEL_YEARS:
+            # 残值回收 = 固定资产原值 * 残值率
+            cell.value = f'=IFERROR({FIXED_ASSET_ORIGINAL},0)*边界设定!B16/100'
         else:
             cell.value = 0
         apply_calc_style(cell)
         # 筹资活动现金流
         cell = ws.cell(row, 4)
-        cell.value = f'=-贷款计算!D{year+2}'
+        cell.value = f'=-贷款计算!D{year_row(year)}'
         apply_calc_style(cell)
-        # 全投资现金流
+        # 全投资现金流（EBITDA - 所得税 + 残值回收）
         cell = ws.cell(row, 5)
-        cell.value = f'=利润表!E{year+2}-利润表!J{year+2}+B{row}'
+        cell.value = f'=利润表!E{year_row(year)}-利润表!J{year_row(year)}+C{row}'
         apply_result_style(cell)
         # 资本金现金流
         cell = ws.cell(row, 6)
@@ -890,7 +1108,7 @@ def create_balance_sheet(wb):
     """创建资产负债表工作表"""
     ws = wb.create_sheet("资产负债表")
     
-    for col in ['A', 'B', 'C', 'D', 'E', 'F', 'G', 'H']:
+    for col in ['A', 'B', 'C', 'D', 'E', 'F', 'G', 'H', 'I', 'J']:
         ws.column_dimensions[col].width = 18
     
     row = 1
@@ -902,25 +1120,26 @@ def create_balance_sheet(wb):
     row += 2
     
     # 表头
-    headers = ['年份', '货币资金', '固定资产净值', '无形资产', '资产总计', '长期借款', '实收资本', '未分配利润', '负债和权益总计']
+    headers = ['年份', '货币资金', '固定资产净值', '无形资产', '资产总计', '长期借款', '实收资本', '未分配利润', '负债和权益总计', '平衡差额']
     for col, header in enumerate(headers, 1):
         cell = ws.cell(row, col, header)
         apply_header_style(cell)
     row += 1
     
+    capex_total_formula = f'IFERROR({CAPEX_DYNAMIC_TOTAL},0)'
+    
     # 初始资产负债表
     ws.cell(row, 1, '建设完成')
     cell = ws.cell(row, 2)
     cell.value = 0
     apply_calc_style(cell)
     cell = ws.cell(row, 3)
-    # 固定资产净值 = CAPEX总计 - 残值，使用IFERROR处理找不到的情况
-    capex_total_formula = 'IFERROR(INDEX(CAPEX明细!D:D,MATCH("CAPEX总计（含建设期利息）",CAPEX明细!A:A,0)),0)'
-    cell.value = f'={capex_total_formula}-{capex_total_formula}*边界设定!B16/100'
+    # 固定资产原值 = 动态总投资 - 无形资产
+    cell.value = f'=IFERROR({FIXED_ASSET_ORIGINAL},0)'
     apply_calc_style(cell)
     cell = ws.cell(row, 4)
-    # 无形资产 = 开发费用 + 土地，使用IFERROR处理找不到的情况
-    cell.value = f'=IFERROR(INDEX(CAPEX明细!D:D,MATCH("开发费用小计",CAPEX明细!A:A,0)),0)+IFERROR(INDEX(CAPEX明细!D:D,MATCH("土地获取成本",CAPEX明细!A:A,0)),0)'
+    # 无形资产 = 开发费用 + 土地
+    cell.value = f'=IFERROR({INTANGIBLE_ASSETS},0)'
     apply_calc_style(cell)
     cell = ws.cell(row, 5)
     cell.value = f'=B{row}+C{row}+D{row}'
@@ -935,24 +1154,27 @@ def create_balance_sheet(wb):
     cell.value = 0
     apply_calc_style(cell)
     cell = ws.cell(row, 9)
-    cell.value = f'=E{row}+F{row}+G{row}+H{row}'
+    cell.value = f'=F{row}+G{row}+H{row}'
     apply_result_style(cell)
+    cell = ws.cell(row, 10)
+    cell.value = f'=E{row}-I{row}'
+    apply_calc_style(cell)
     row += 1
     
     # 运营期
-    for year in range(1, 21):
+    for year in range(1, MODEL_YEARS + 1):
         ws.cell(row, 1, f'第{year}年')
-        # 货币资金（累计现金流）
+        # 货币资金（累计净现金流，含残值回收）
         cell = ws.cell(row, 2)
-        cell.value = f'=SUM(现金流量表!B5:B{year+3})'
+        cell.value = f'=B{row-1}+现金流量表!B{flow_row(year)}+现金流量表!C{flow_row(year)}+现金流量表!D{flow_row(year)}'
         apply_calc_style(cell)
-        # 固定资产净值
+        # 固定资产净值（最后一年处置，残值已计入现金）
         cell = ws.cell(row, 3)
-        cell.value = f'=MAX(0,C{row-1}-折旧计算!B{year+2})'
+        cell.value = 0 if year == MODEL_YEARS else f'=C{row-1}-折旧计算!B{year_row(year)}'
         apply_calc_style(cell)
         # 无形资产
         cell = ws.cell(row, 4)
-        cell.value = f'=MAX(0,D{row-1}-折旧计算!C{year+2})'
+        cell.value = 0 if year == MODEL_YEARS else f'=MAX(0,D{row-1}-折旧计算!C{year_row(year)})'
         apply_calc_style(cell)
         # 资产总计
         cell = ws.cell(row, 5)
@@ -960,20 +1182,24 @@ def create_balance_sheet(wb):
         apply_result_style(cell)
         # 长期借款
         cell = ws.cell(row, 6)
-        cell.value = f'=贷款计算!F{year+2}'
+        cell.value = f'=贷款计算!F{year_row(year)}'
         apply_calc_style(cell)
-        # 实收资本，使用IFERROR处理找不到的情况
+        # 实收资本
         cell = ws.cell(row, 7)
-        cell.value = '=IFERROR(INDEX(CAPEX明细!D:D,MATCH("CAPEX总计（含建设期利息）",CAPEX明细!A:A,0)),0)*边界设定!B7/100'
+        cell.value = f'={capex_total_formula}*边界设定!B7/100'
         apply_calc_style(cell)
         # 未分配利润
         cell = ws.cell(row, 8)
-        cell.value = f'=H{row-1}+利润表!K{year+2}'
+        cell.value = f'=H{row-1}+利润表!K{year_row(year)}'
         apply_calc_style(cell)
         # 负债和权益总计
         cell = ws.cell(row, 9)
-        cell.value = f'=E{row}+F{row}+G{row}+H{row}'
+        cell.value = f'=F{row}+G{row}+H{row}'
         apply_result_style(cell)
+        # 平衡差额（资产总计 - 负债和权益总计，非零即不平衡）
+        cell = ws.cell(row, 10)
+        cell.value = f'=E{row}-I{row}'
+        apply_calc_style(cell)
         row += 1
 
 def create_indicators_sheet(wb):
@@ -991,33 +1217,156 @@ def create_indicators_sheet(wb):
     cell.alignment = Alignment(horizontal='center', vertical='center')
     row += 2
     
-    # 指标列表
+    first_flow, last_flow = flow_row(0), flow_row(MODEL_YEARS)
+    first_year, last_year = year_row(1), year_row(MODEL_YEARS)
+    year3_equity = f'资产负债表!G{flow_row(3)}+资产负债表!H{flow_row(3)}'
+    
+    # 指标列表：(名称, 公式, 是否按百分比显示)
     indicators = [
-        ("全投资IRR", "=IRR(现金流量表!E5:E25)"),
-        ("资本金IRR", "=IRR(现金流量表!F5:F25)"),
-        ("全投资NPV（8%）", "=NPV(0.08,现金流量表!E5:E25)"),
-        ("静态回收期", "计算回收期"),
-        ("动态回收期", "计算动态回收期"),
-        ("ROI", "=IFERROR(SUM(利润表!I5:I24)/IFERROR(INDEX(CAPEX明细!D:D,MATCH(\"CAPEX总计（含建设期利息）\",CAPEX明细!A:A,0)),1),0)"),
-        ("ROE（第3年）", "=利润表!K7/资产负债表!H7"),
-        ("DSCR（平均）", "=IFERROR(AVERAGE(利润表!E5:E24/贷款计算!E5:E24),0)"),
+        ("全投资IRR", f"=IRR(现金流量表!E{first_flow}:E{last_flow})", True),
+        ("资本金IRR", f"=IRR(现金流量表!F{first_flow}:F{last_flow})", True),
+        # 第0年不折现，与网页版一致
+        ("全投资NPV（8%）", f"=现金流量表!E{first_flow}+NPV(0.08,现金流量表!E{first_flow + 1}:E{last_flow})", False),
+        ("静态回收期", "计算回收期", False),
+        ("动态回收期", "计算动态回收期", False),
+        ("ROI", f"=IFERROR(AVERAGE(利润表!K{first_year}:K{last_year})/{CAPEX_DYNAMIC_TOTAL},0)", True),
+        ("ROE（第3年）", f"=IF({year3_equity}>0,利润表!K{year_row(3)}/({year3_equity}),0)", True),
+        # 还款期内EBITDA合计 / 还本付息合计
+        ("DSCR（平均）", f'=IFERROR(SUMIF(贷款计算!E{first_year}:E{last_year},">0",利润表!E{first_year}:E{last_year})'
+                        f'/SUMIF(贷款计算!E{first_year}:E{last_year},">0"),0)', False),
     ]
     
-    for name, formula in indicators:
+    for name, formula, is_percent in indicators:
         ws.cell(row, 1, name)
         ws.cell(row, 1).font = Font(bold=True)
         cell = ws.cell(row, 2)
-        if formula.startswith('='):
-            cell.value = formula
-        else:
-            cell.value = formula  # 文本说明
+        cell.value = formula
         apply_calc_style(cell)
-        if 'IRR' in name or 'NPV' in name or 'ROI' in name or 'ROE' in name:
+        if is_percent:
             cell.number_format = '0.00%'
         row += 1
 
-def create_excel_file():
-    """创建完整的Excel文件"""
+# 按工作表顺序排列的构建函数
+SHEET_BUILDERS = [
+    create_parameters_sheet,
+    create_equipment_sheet,
+    create_capex_sheet,
+    create_spot_price_sheet,
+    create_index_sheet,
+    create_opex_sheet,
+    create_revenue_sheet,
+    create_depreciation_sheet,
+    create_loan_sheet,
+    create_income_sheet,
+    create_tax_sheet,
+    create_cashflow_sheet,
+    create_balance_sheet,
+    create_indicators_sheet,
+]
+
+def apply_model_data(wb, model_data):
+    """把 saveModel() 的 modelData（参数、现货价格、逐年变化率曲线）写入工作簿的输入单元格"""
+    parameters = model_data.get('parameters') or {}
+    # 并行构建时每个进程的工作簿只含一张工作表，只写入该表的单元格
+    sheets = set(wb.sheetnames)
+    for name, (sheet, coordinate, scale) in PARAMETER_CELLS.items():
+        if name not in parameters or sheet not in sheets:
+            continue
+        value = parameters[name]
+        wb[sheet][coordinate].value = PARAMETER_OPTIONS[name][value] if scale is None else value * scale
+    if '现货价格' in sheets:
+        for year, price in enumerate((model_data.get('spotPrices') or [])[:MODEL_YEARS], 1):
+            wb['现货价格'][f'B{year_row(year)}'].value = price
+    # 曲线第k项为第k+2年相对第k+1年的变化率，长度不足时沿用最后一项
+    for name, (rate_col, _) in CURVE_CELLS.items():
+        curve = parameters.get(name + '_curve')
+        if curve and '指数曲线' in sheets:
+            for year in range(2, MODEL_YEARS + 1):
+                wb['指数曲线'][f'{rate_col}{year_row(year)}'].value = curve[min(year - 2, len(curve) - 1)] * 100
+
+# ==================== 并行构建与组装 ====================
+
+# 并行构建的门槛：工作表数低于此值时顺序构建（进程调度与结果传输的开销大于收益）
+PARALLEL_MIN_SHEETS = 4
+
+# 复用的进程池（同一进程中多次生成工作簿时只启动一次）
+_pool = None
+_pool_workers = None
+
+def build_sheet_part(index, model_data=None):
+    """
+    在独立工作簿中构建第index张工作表并序列化（可在子进程中运行）
+    @return: (表名, 工作表XML, 样式表)，见 excel_parts.serialize_sheet
+    """
+    builder = SHEET_BUILDERS[index]
+    wb = openpyxl.Workbook()
+    builder(wb)
+    ws = wb.worksheets[-1]
+    if model_data is not None:
+        apply_model_data(wb, model_data)
+    xml, styles = excel_parts.serialize_sheet(ws)
+    return ws.title, xml, styles
+
+def _get_pool(workers):
+    """取复用的进程池，进程数变化时重建"""
+    global _pool, _pool_workers
+    if _pool is None or _pool_workers != workers:
+        shutdown_pool()
+        _pool = ProcessPoolExecutor(max_workers=workers)
+        _pool_workers = workers
+    return _pool
+
+def shutdown_pool():
+    """关闭复用的进程池"""
+    global _pool, _pool_workers
+    if _pool is not None:
+        _pool.shutdown()
+        _pool = _pool_workers = None
+
+atexit.register(shutdown_pool)
+
+def parallel_workers(workers):
+    """
+    本次构建实际使用的进程数：None为CPU核数，且不超过工作表数；
+    工作表数低于 PARALLEL_MIN_SHEETS 或 openpyxl 内部接口不可用时为1（顺序构建）
+    """
+    workers = (os.cpu_count() or 1) if workers is None else workers
+    if not excel_parts.AVAILABLE or len(SHEET_BUILDERS) < PARALLEL_MIN_SHEETS:
+        return 1
+    return max(1, min(workers, len(SHEET_BUILDERS)))
+
+def build_sheet_parts(model_data=None, workers=1):
+    """
+    构建全部工作表，按 SHEET_BUILDERS 顺序返回 build_sheet_part 的结果
+    @param workers: 进程数，1时在当前进程顺序构建，None为CPU核数（见 parallel_workers）
+    """
+    indices = range(len(SHEET_BUILDERS))
+    workers = parallel_workers(workers)
+    if workers > 1:
+        with profiler.stage('sheets.parallel'):
+            return list(_get_pool(workers).map(build_sheet_part, indices, repeat(model_data)))
+    parts = []
+    for index in indices:
+        with profiler.stage(f"sheet.{SHEET_BUILDERS[index].__name__[len('create_'):-len('_sheet')]}"):
+            parts.append(build_sheet_part(index, model_data))
+    return parts
+
+def build_workbook(model_data=None):
+    """顺序构建完整工作簿（openpyxl 内部接口不可用时使用）"""
+    wb = openpyxl.Workbook()
+    for builder in SHEET_BUILDERS:
+        with profiler.stage(f"sheet.{builder.__name__[len('create_'):-len('_sheet')]}"):
+            builder(wb)
+    if model_data is not None:
+        apply_model_data(wb, model_data)
+    return wb
+
+def create_excel_file(filepath=None, model_data=None, workers=1):
+    """
+    创建完整的Excel文件（filepath缺省时保存到脚本目录，按时间戳命名；给出modelData时写入其参数）
+    @param workers: 并行构建工作表的进程数，1时在当前进程顺序构建，None为CPU核数（见 parallel_workers）；
+                    相同输入的输出逐字节一致（openpyxl 内部接口不可用而退回 Workbook.save 时除外）
+    """
     # 修复Windows控制台编码问题
     try:
         import sys
@@ -1028,26 +1377,21 @@ def create_excel_file():
         pass
     
     print("正在生成Excel文件...")
-    wb = openpyxl.Workbook()
-    
-    # 创建各个工作表
-    create_parameters_sheet(wb)
-    create_equipment_sheet(wb)
-    create_capex_sheet(wb)
-    create_spot_price_sheet(wb)
-    create_opex_sheet(wb)
-    create_revenue_sheet(wb)
-    create_depreciation_sheet(wb)
-    create_loan_sheet(wb)
-    create_income_sheet(wb)
-    create_cashflow_sheet(wb)
-    create_balance_sheet(wb)
-    create_indicators_sheet(wb)
+    if excel_parts.AVAILABLE:
+        parts = build_sheet_parts(model_data, workers)
+    else:
+        print(f"openpyxl 内部接口不可用（{excel_parts.UNAVAILABLE_REASON}），改为顺序构建")
+        wb = build_workbook(model_data)
     
     # 保存文件
-    filename = f"德国独立储能电站财务测算表_{datetime.now().strftime('%Y%m%d_%H%M%S')}.xlsx"
-    filepath = os.path.join(os.path.dirname(__file__), filename)
-    wb.save(filepath)
+    if filepath is None:
+        filename = f"德国独立储能电站财务测算表_{datetime.now().strftime('%Y%m%d_%H%M%S')}.xlsx"
+        filepath = os.path.join(os.path.dirname(__file__), filename)
+    with profiler.stage('workbook.save'):
+        if excel_parts.AVAILABLE:
+            excel_parts.assemble_workbook(filepath, parts)
+        else:
+            wb.save(filepath)
     
     # 修复Windows控制台编码问题
     try:
@@ -1062,8 +1406,22 @@ def create_excel_file():
     return filepath
 
 if __name__ == "__main__":
+    import argparse
+    parser = argparse.ArgumentParser(description='生成德国独立储能电站财务测算Excel')
+    parser.add_argument('--output', help='输出文件路径，缺省按时间戳保存到脚本目录')
+    parser.add_argument('--workers', type=int, default=1, help='并行构建工作表的进程数（默认1顺序构建，0为CPU核数）')
+    parser.add_argument('--profile', metavar='TRACE_JSON',
+                        help='开启分阶段剖析，打印汇总表并写入Chrome Trace JSON')
+    args = parser.parse_args()
+    if args.profile:
+        profiler.enable()
     try:
-        create_excel_file()
+        with profiler.stage('create_excel_file'):
+            create_excel_file(args.output, workers=args.workers or None)
+        if profiler.enabled:
+            profiler.print_summary()
+            if args.profile:
+                print(f"剖析结果已写入: {profiler.write_chrome_trace(args.profile)}")
     except Exception as e:
         print(f"错误: {e}")
         import traceback
@@ -0,0 +1,637 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+德国独立储能电站财务测算系统 - 本地作业队列
+@description 蒙特卡洛模拟、敏感性网格与多站点Excel批量生成等耗时作业的提交、并行执行与进度查询；
+             作业拆分为若干分块，队列与分块状态保存在本地SQLite（无需消息中间件），每个分块完成即写出检查点文件，
+             中断（Ctrl+C、进程退出）后再次启动工作进程只补算未完成的分块；支持取消与恢复
+@usage python job_queue.py submit montecarlo 模型.json --paths 100000
+       python job_queue.py work --workers 4
+       python job_queue.py status --watch
+@version 1.0
+"""
+
+import argparse
+import datetime
+import json
+import multiprocessing
+import os
+import socket
+import sqlite3
+import sys
+import time
+import traceback
+
+import numpy as np
+
+import model_engine
+import price_paths
+from model_loader import migrate
+from scenario_store import normalize_model_data
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_DB = os.path.join(BASE_DIR, 'jobs.db')
+DEFAULT_OUTPUT_DIR = os.path.join(BASE_DIR, 'job_results')
+
+# 分块结果中保存的指标
+RESULT_INDICATORS = ('project_irr', 'equity_irr', 'npv', 'min_dscr', 'lcoe')
+
+# 蒙特卡洛默认的不确定参数：参数名 -> 相对标准差；spot 为现货价格整体水平
+DEFAULT_SPREADS = {
+    'spot': 0.2,
+    'battery_unit_price': 0.1,
+    'tolling_price': 0.05,
+    'opex_technical': 0.1,
+    'degradation_rate': 0.2,
+    'loan_rate': 0.1,
+}
+
+# 现货价格逐年波动的相对标准差
+SPOT_YEARLY_NOISE = 0.1
+
+# 工作进程无分块可领取时的轮询间隔（秒）
+POLL_INTERVAL = 1.0
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id INTEGER PRIMARY KEY,
+    kind TEXT NOT NULL,
+    params TEXT NOT NULL,
+    status TEXT NOT NULL,
+    total INTEGER NOT NULL,
+    done INTEGER NOT NULL DEFAULT 0,
+    cancel_requested INTEGER NOT NULL DEFAULT 0,
+    worker TEXT,
+    created_at TEXT,
+    started_at TEXT,
+    finished_at TEXT,
+    result TEXT,
+    error TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_jobs_status ON jobs(status);
+CREATE TABLE IF NOT EXISTS chunks (
+    job_id INTEGER NOT NULL,
+    chunk INTEGER NOT NULL,
+    status TEXT NOT NULL,
+    worker TEXT,
+    path TEXT,
+    seconds REAL,
+    PRIMARY KEY (job_id, chunk)
+);
+CREATE INDEX IF NOT EXISTS idx_chunks_status ON chunks(status, job_id);
+"""
+
+def _now():
+    return datetime.datetime.now().isoformat(timespec='seconds')
+
+def _save_npz(path, **arrays):
+    """先写临时文件再改名，中断时不会留下半个检查点"""
+    temp = path + '.tmp.npz'
+    np.savez(temp, **arrays)
+    os.replace(temp, path)
+
+def _load_columns(paths):
+    """按分块顺序读取检查点并逐列拼接"""
+    columns = {}
+    for path in paths:
+        with np.load(path) as data:
+            for name in data.files:
+                columns.setdefault(name, []).append(data[name])
+    return {name: np.concatenate(parts) for name, parts in columns.items()}
+
+def _distribution(values):
+    """指标分布摘要（忽略NaN）"""
+    finite = values[np.isfinite(values)]
+    if not len(finite):
+        return {'count': 0}
+    p5, p50, p95 = np.percentile(finite, [5, 50, 95])
+    return {'count': int(len(finite)), 'mean': float(finite.mean()), 'p5': float(p5), 'p50': float(p50),
+            'p95': float(p95)}
+
+def _indicator_columns(params, spot, dtype=None):
+    """批量计算并取出 RESULT_INDICATORS（dtype 为 'float32' 时以低精度计算逐年表）"""
+    indicators = model_engine.run_arrays(params, spot, dtype)['indicators']
+    return {name: indicators[name] for name in RESULT_INDICATORS}
+
+def _precision(params, sample):
+    """低精度作业：在第0块的输入（sample(params, 0)）上与 float64 比较，报告各指标最大偏差"""
+    if params.get('dtype', 'float64') == 'float64':
+        return {}
+    arrays, spot, _ = sample(params, 0)
+    return {'precision': model_engine.precision_report(arrays, spot, params['dtype'], indicators=RESULT_INDICATORS)}
+
+def _repeat_parameters(model_data, count):
+    """把单个情景的参数复制为 count 行的参数数组与现货价格矩阵"""
+    params = model_engine.stack_parameters([model_data['parameters']])
+    params = {name: np.repeat(values, count, axis=0) for name, values in params.items()}
+    years = params['operation_years'].astype(int)
+    spot = np.repeat(model_engine.stack_spot_prices([model_data['spotPrices']], years[:1]), count, axis=0)
+    return params, spot
+
+# ==================== 作业类型 ====================
+
+class MonteCarloJob:
+    """
+    蒙特卡洛模拟：不确定参数按 N(1, 相对标准差) 的乘数抽样（截断为非负），现货价格另加逐年波动
+    参数：model（modelData）、paths（路径数）、chunk_size、seed、spreads（{参数名: 相对标准差}）、
+    price_process（可选，price_paths 标定的价格过程：给出时现货价格改由随机价格路径生成，不再叠加逐年波动）、
+    dtype（'float64' 或 'float32'，float32 时结果附第0块抽样的精度报告）
+    第k个分块的随机数由 (seed, k) 确定，结果与工作进程数、中断与恢复无关
+    """
+
+    @staticmethod
+    def prepare(params):
+        params['model'] = normalize_model_data(params['model'])
+        params.setdefault('chunk_size', 5000)
+        params.setdefault('seed', 1)
+        params.setdefault('spreads', DEFAULT_SPREADS)
+        params.setdefault('price_process', None)
+        params.setdefault('dtype', 'float64')
+        return -(-params['paths'] // params['chunk_size'])
+
+    @staticmethod
+    def chunk_filename(params, chunk):
+        return f'chunk_{chunk:05d}.npz'
+
+    @staticmethod
+    def sample(params, chunk):
+        """第 chunk 块的输入：(参数数组, 现货价格矩阵, {参数名: 抽样乘数})"""
+        size = min(params['chunk_size'], params['paths'] - chunk * params['chunk_size'])
+        rng = np.random.default_rng([params['seed'], chunk])
+        arrays, spot = _repeat_parameters(params['model'], size)
+        process = params.get('price_process')
+        if process is not None:
+            factor = price_paths.storage_factor(params['model']['parameters'])
+            spot = price_paths.simulate(process, size, spot.shape[1], rng, factor)
+        samples = {}
+        for name, spread in sorted(params['spreads'].items()):
+            factor = np.maximum(0, rng.normal(1, spread, size))
+            samples[name] = factor
+            if name == 'spot':
+                spot = spot * factor[:, None]
+            else:
+                arrays[name] = arrays[name] * factor
+        if process is None:
+            spot = spot * np.maximum(0, rng.normal(1, SPOT_YEARLY_NOISE, spot.shape))
+        return arrays, spot, samples
+
+    @staticmethod
+    def run_chunk(params, chunk, path):
+        arrays, spot, samples = MonteCarloJob.sample(params, chunk)
+        columns = _indicator_columns(arrays, spot, params.get('dtype'))
+        _save_npz(path, **columns, **{'factor_' + name: values for name, values in samples.items()})
+
+    @staticmethod
+    def finish(params, paths, directory):
+        columns = _load_columns(paths)
+        result_path = os.path.join(directory, 'result.npz')
+        _save_npz(result_path, **columns)
+        return {'path': result_path, 'paths': params['paths'],
+                'indicators': {name: _distribution(columns[name]) for name in RESULT_INDICATORS}} | \
+            _precision(params, MonteCarloJob.sample)
+
+class GridJob:
+    """
+    敏感性网格：对若干参数的取值列表做全组合
+    参数：model（modelData）、grid（{参数名: 取值列表}）、chunk_size、dtype（同 MonteCarloJob）
+    """
+
+    @staticmethod
+    def prepare(params):
+        if 'operation_years' in params['grid']:
+            raise ValueError('网格不支持运营年限（现货价格序列长度随之变化），请分别提交')
+        params['model'] = normalize_model_data(params['model'])
+        params.setdefault('chunk_size', 5000)
+        params.setdefault('dtype', 'float64')
+        points = int(np.prod([len(values) for values in params['grid'].values()]))
+        params['points'] = points
+        return -(-points // params['chunk_size'])
+
+    chunk_filename = MonteCarloJob.chunk_filename
+
+    @staticmethod
+    def sample(params, chunk):
+        """第 chunk 块的输入：(参数数组, 现货价格矩阵, (网格点数, 网格参数数) 取值矩阵)"""
+        start = chunk * params['chunk_size']
+        grid = [np.asarray(values, dtype=float) for values in params['grid'].values()]
+        # 由展平序号直接解出各参数的取值下标（与 itertools.product 的顺序一致，最后一个参数变化最快）
+        flat = np.arange(start, min(start + params['chunk_size'], params['points']))
+        indices = np.unravel_index(flat, [len(values) for values in grid])
+        values = np.stack([axis[index] for axis, index in zip(grid, indices)], axis=1)
+        arrays, spot = _repeat_parameters(params['model'], len(values))
+        for i, name in enumerate(params['grid']):
+            arrays[name] = values[:, i]
+        return arrays, spot, values
+
+    @staticmethod
+    def run_chunk(params, chunk, path):
+        arrays, spot, values = GridJob.sample(params, chunk)
+        columns = _indicator_columns(arrays, spot, params.get('dtype'))
+        _save_npz(path, **columns, **{'grid_' + name: values[:, i] for i, name in enumerate(params['grid'])})
+
+    @staticmethod
+    def finish(params, paths, directory):
+        columns = _load_columns(paths)
+        result_path = os.path.join(directory, 'result.npz')
+        _save_npz(result_path, **columns)
+        irr = np.where(np.isfinite(columns['equity_irr']), columns['equity_irr'], -np.inf)
+        best = int(np.argmax(irr))
+        return {'path': result_path, 'points': params['points'],
+                'best_equity_irr': {name: float(columns['grid_' + name][best]) for name in params['grid']}
+                | {'equity_irr': float(columns['equity_irr'][best])},
+                'indicators': {name: _distribution(columns[name]) for name in RESULT_INDICATORS}} | \
+            _precision(params, GridJob.sample)
+
+class ExcelJob:
+    """
+    多站点Excel批量生成：每个模型文件一个分块，生成写入其参数的工作簿
+    参数：files（saveModel() 导出的模型文件列表）
+    """
+
+    @staticmethod
+    def prepare(params):
+        params['files'] = [os.path.abspath(path) for path in params['files']]
+        return len(params['files'])
+
+    @staticmethod
+    def chunk_filename(params, chunk):
+        name = os.path.splitext(os.path.basename(params['files'][chunk]))[0]
+        return f'{chunk + 1:03d}_{name}.xlsx'
+
+    @staticmethod
+    def run_chunk(params, chunk, path):
+        from generate_excel import create_excel_file
+        with open(params['files'][chunk], encoding='utf-8') as f:
+            model_data = migrate(json.load(f))
+        temp = path + '.tmp.xlsx'
+        create_excel_file(temp, model_data)
+        os.replace(temp, path)
+
+    @staticmethod
+    def finish(params, paths, directory):
+        return {'files': paths}
+
+# 作业类型 -> 处理类（prepare 返回分块数，run_chunk 写出检查点文件，finish 汇总检查点为作业结果）
+JOB_KINDS = {
+    'montecarlo': MonteCarloJob,
+    'grid': GridJob,
+    'excel': ExcelJob,
+}
+
+# ==================== 队列 ====================
+
+def _worker_id():
+    return f'{socket.gethostname()}:{os.getpid()}'
+
+def _worker_alive(worker):
+    """本机工作进程是否仍在运行（其他主机的进程视为存活）"""
+    if not worker:
+        return False
+    host, _, pid = worker.rpartition(':')
+    if host != socket.gethostname():
+        return True
+    try:
+        os.kill(int(pid), 0)
+    except (OSError, ValueError):
+        return False
+    return True
+
+class JobQueue:
+    """SQLite 作业队列：jobs 表记录作业与进度，chunks 表记录各分块状态与检查点文件"""
+
+    def __init__(self, path=DEFAULT_DB, output_dir=DEFAULT_OUTPUT_DIR):
+        self.path = path
+        self.output_dir = output_dir
+        self.connection = sqlite3.connect(path, timeout=60, isolation_level=None)
+        self.connection.row_factory = sqlite3.Row
+        self.connection.execute('PRAGMA journal_mode=WAL')
+        self.connection.execute('PRAGMA synchronous=NORMAL')
+        self.connection.executescript(SCHEMA)
+
+    def close(self):
+        self.connection.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def _transaction(self):
+        """写事务：BEGIN IMMEDIATE 保证多个工作进程领取分块时互斥"""
+        queue = self
+
+        class Transaction:
+            def __enter__(self):
+                queue.connection.execute('BEGIN IMMEDIATE')
+                return queue.connection
+
+            def __exit__(self, exc_type, *exc):
+                queue.connection.execute('ROLLBACK' if exc_type else 'COMMIT')
+
+        return Transaction()
+
+    def job_dir(self, job_id):
+        return os.path.join(self.output_dir, f'job_{job_id}')
+
+    def submit(self, kind, params):
+        """提交作业，返回作业ID"""
+        if kind not in JOB_KINDS:
+            raise ValueError(f'不支持的作业类型: {kind}')
+        total = JOB_KINDS[kind].prepare(params)
+        with self._transaction() as db:
+            job_id = db.execute(
+                'INSERT INTO jobs (kind, params, status, total, created_at) VALUES (?, ?, ?, ?, ?)',
+                (kind, json.dumps(params, ensure_ascii=False), 'queued', total, _now())).lastrowid
+            db.executemany('INSERT INTO chunks (job_id, chunk, status) VALUES (?, ?, ?)',
+                           [(job_id, chunk, 'pending') for chunk in range(total)])
+        return job_id
+
+    def recover(self):
+        """把已退出的工作进程遗留的分块与收尾中的作业退回待领取状态，返回退回的分块数"""
+        with self._transaction() as db:
+            stale = [(row['job_id'], row['chunk']) for row in
+                     db.execute("SELECT job_id, chunk, worker FROM chunks WHERE status = 'running'")
+                     if not _worker_alive(row['worker'])]
+            db.executemany("UPDATE chunks SET status = 'pending', worker = NULL WHERE job_id = ? AND chunk = ?",
+                           stale)
+            for row in db.execute("SELECT id, worker FROM jobs WHERE status = 'finishing'").fetchall():
+                if not _worker_alive(row['worker']):
+                    db.execute("UPDATE jobs SET status = 'running', worker = NULL WHERE id = ?", (row['id'],))
+        return len(stale)
+
+    def claim(self, worker):
+        """领取下一个待计算的分块（先提交的作业优先），无可领取时返回None"""
+        with self._transaction() as db:
+            row = db.execute(
+                "SELECT c.job_id, c.chunk, j.kind, j.params FROM chunks c JOIN jobs j ON j.id = c.job_id "
+                "WHERE c.status = 'pending' AND j.status IN ('queued', 'running') AND j.cancel_requested = 0 "
+                "ORDER BY c.job_id, c.chunk LIMIT 1").fetchone()
+            if row is None:
+                return None
+            db.execute("UPDATE chunks SET status = 'running', worker = ? WHERE job_id = ? AND chunk = ?",
+                       (worker, row['job_id'], row['chunk']))
+            db.execute("UPDATE jobs SET status = 'running', started_at = COALESCE(started_at, ?) WHERE id = ?",
+                       (_now(), row['job_id']))
+        return row['job_id'], row['chunk'], row['kind'], json.loads(row['params'])
+
+    def claim_finish(self, worker):
+        """领取分块已全部完成、尚未收尾的作业（收尾进程退出或恢复失败作业后），无可领取时返回None"""
+        with self._transaction() as db:
+            row = db.execute("SELECT id, kind, params FROM jobs WHERE status = 'running' AND done = total "
+                             "ORDER BY id LIMIT 1").fetchone()
+            if row is None:
+                return None
+            db.execute("UPDATE jobs SET status = 'finishing', worker = ? WHERE id = ?", (worker, row['id']))
+        return row['id'], row['kind'], json.loads(row['params'])
+
+    def complete_chunk(self, job_id, chunk, path, seconds, worker):
+        """
+        记录分块完成（已取消的作业同样保留检查点）
+        @return: 该作业的全部分块均已完成且由本进程负责收尾时返回True
+        """
+        with self._transaction() as db:
+            db.execute("UPDATE chunks SET status = 'done', path = ?, seconds = ? WHERE job_id = ? AND chunk = ?",
+                       (path, seconds, job_id, chunk))
+            db.execute("UPDATE jobs SET done = (SELECT COUNT(*) FROM chunks WHERE job_id = ? AND status = 'done') "
+                       "WHERE id = ?", (job_id, job_id))
+            return db.execute("UPDATE jobs SET status = 'finishing', worker = ? "
+                              "WHERE id = ? AND status = 'running' AND done = total",
+                              (worker, job_id)).rowcount == 1
+
+    def finish(self, job_id, result=None, error=None):
+        """作业收尾：写入汇总结果或错误信息"""
+        with self._transaction() as db:
+            db.execute('UPDATE jobs SET status = ?, result = ?, error = ?, finished_at = ? WHERE id = ?',
+                       ('failed' if error else 'done', json.dumps(result, ensure_ascii=False) if result else None,
+                        error, _now(), job_id))
+
+    def fail_chunk(self, job_id, chunk, error):
+        """分块出错：作业标记为失败，其余分块不再领取（可用 resume 重试）"""
+        with self._transaction() as db:
+            db.execute("UPDATE chunks SET status = 'pending', worker = NULL WHERE job_id = ? AND chunk = ?",
+                       (job_id, chunk))
+            db.execute("UPDATE jobs SET status = 'failed', error = ?, finished_at = ? WHERE id = ?",
+                       (error, _now(), job_id))
+
+    def cancel(self, job_id):
+        """取消作业：不再领取新分块，正在计算的分块完成后停止；已完成的检查点保留，可用 resume 继续"""
+        with self._transaction() as db:
+            return db.execute("UPDATE jobs SET cancel_requested = 1, status = 'cancelled', finished_at = ? "
+                              "WHERE id = ? AND status IN ('queued', 'running')", (_now(), job_id)).rowcount == 1
+
+    def resume(self, job_id):
+        """恢复已取消或失败的作业：只补算未完成的分块"""
+        with self._transaction() as db:
+            return db.execute("UPDATE jobs SET cancel_requested = 0, status = 'running', error = NULL, "
+                              "finished_at = NULL WHERE id = ? AND status IN ('cancelled', 'failed')",
+                              (job_id,)).rowcount == 1
+
+    def jobs(self, job_id=None):
+        """作业列表（或单个作业）及进度"""
+        sql = 'SELECT * FROM jobs' + (' WHERE id = ?' if job_id is not None else '') + ' ORDER BY id'
+        rows = [dict(row) for row in self.connection.execute(sql, () if job_id is None else (job_id,))]
+        for row in rows:
+            row['params'] = json.loads(row['params'])
+            row['result'] = json.loads(row['result']) if row['result'] else None
+            row['progress'] = row['done'] / row['total'] if row['total'] else 1.0
+            elapsed = self.connection.execute(
+                "SELECT SUM(seconds) FROM chunks WHERE job_id = ? AND status = 'done'", (row['id'],)).fetchone()[0]
+            row['chunk_seconds'] = elapsed or 0.0
+        return rows
+
+    def chunk_paths(self, job_id):
+        return [row[0] for row in self.connection.execute(
+            "SELECT path FROM chunks WHERE job_id = ? ORDER BY chunk", (job_id,))]
+
+# ==================== 工作进程 ====================
+
+def run_claimed(queue, worker, job_id, chunk, kind, params):
+    """计算一个分块；作业全部完成时由最后完成分块的进程汇总结果"""
+    handler = JOB_KINDS[kind]
+    directory = queue.job_dir(job_id)
+    os.makedirs(directory, exist_ok=True)
+    path = os.path.join(directory, handler.chunk_filename(params, chunk))
+    start = time.perf_counter()
+    try:
+        handler.run_chunk(params, chunk, path)
+    except Exception:
+        queue.fail_chunk(job_id, chunk, traceback.format_exc())
+        return
+    if queue.complete_chunk(job_id, chunk, path, time.perf_counter() - start, worker):
+        finish_job(queue, job_id, kind, params)
+
+def finish_job(queue, job_id, kind, params):
+    """汇总各分块检查点，写入作业结果"""
+    try:
+        result = JOB_KINDS[kind].finish(params, queue.chunk_paths(job_id), queue.job_dir(job_id))
+    except Exception:
+        queue.finish(job_id, error=traceback.format_exc())
+    else:
+        queue.finish(job_id, result=result)
+
+def work(db=DEFAULT_DB, output_dir=DEFAULT_OUTPUT_DIR, wait=False):
+    """
+    工作进程主循环：逐个领取并计算分块
+    @param wait: 队列为空时继续等待新作业；否则没有可领取的分块即退出
+    @return: 本进程完成的分块数
+    """
+    worker = _worker_id()
+    count = 0
+    with JobQueue(db, output_dir) as queue:
+        queue.recover()
+        while True:
+            claimed = queue.claim(worker)
+            if claimed is None:
+                finishing = queue.claim_finish(worker)
+                if finishing is not None:
+                    finish_job(queue, *finishing)
+                    continue
+                if not wait:
+                    return count
+                time.sleep(POLL_INTERVAL)
+                continue
+            run_claimed(queue, worker, *claimed)
+            count += 1
+
+def run_pool(db=DEFAULT_DB, output_dir=DEFAULT_OUTPUT_DIR, workers=None, wait=False):
+    """启动多个工作进程并等待其退出（Ctrl+C 中断后，未完成的分块在下次启动时补算）"""
+    workers = workers or os.cpu_count() or 1
+    if workers == 1:
+        return work(db, output_dir, wait)
+    with JobQueue(db, output_dir) as queue:
+        queue.recover()
+    processes = [multiprocessing.Process(target=work, args=(db, output_dir, wait)) for _ in range(workers)]
+    for process in processes:
+        process.start()
+    try:
+        for process in processes:
+            process.join()
+    except KeyboardInterrupt:
+        for process in processes:
+            process.terminate()
+        raise
+
+# ==================== 命令行 ====================
+
+def load_model(path):
+    with open(path, encoding='utf-8') as f:
+        return migrate(json.load(f))
+
+def parse_grid(text):
+    """解析网格参数：名称=起:止:步长 或 名称=值1,值2,..."""
+    name, _, spec = text.partition('=')
+    if name not in model_engine.DEFAULT_PARAMETERS or name in model_engine.TEXT_PARAMETERS or not spec:
+        raise argparse.ArgumentTypeError(f'无法解析网格参数: {text}（格式如 tolling_price=80:120:5）')
+    if ':' in spec:
+        start, stop, step = (float(v) for v in spec.split(':'))
+        values = np.arange(start, stop + step / 2, step).tolist()
+    else:
+        values = [float(v) for v in spec.split(',')]
+    return name, values
+
+def print_jobs(jobs):
+    print(f"{'ID':>5}  {'类型':<12}{'状态':<12}{'进度':>16}  {'提交时间':<21}{'分块耗时':>10}")
+    for job in jobs:
+        bar = f"{job['done']}/{job['total']} {job['progress'] * 100:5.1f}%"
+        print(f"{job['id']:>5}  {job['kind']:<12}{job['status']:<12}{bar:>16}  {job['created_at']:<21}"
+              f"{job['chunk_seconds']:>9.1f}s")
+
+def main():
+    parser = argparse.ArgumentParser(description='本地作业队列：耗时的批量模拟与导出')
+    parser.add_argument('--db', default=DEFAULT_DB, help='队列数据库（默认脚本目录下 jobs.db）')
+    parser.add_argument('--output-dir', default=DEFAULT_OUTPUT_DIR, help='检查点与结果目录')
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    submit = commands.add_parser('submit', help='提交作业')
+    kinds = submit.add_subparsers(dest='kind', required=True)
+    montecarlo = kinds.add_parser('montecarlo', help='蒙特卡洛模拟')
+    montecarlo.add_argument('model', help='saveModel() 导出的模型文件')
+    montecarlo.add_argument('--paths', type=int, default=100000, help='模拟路径数')
+    montecarlo.add_argument('--chunk-size', type=int, default=5000, help='每个分块的路径数')
+    montecarlo.add_argument('--seed', type=int, default=1, help='随机种子')
+    montecarlo.add_argument('--spread', action='append', default=[], metavar='名称=相对标准差',
+                            help='不确定参数（可多次给出，默认 spot、电池单价等）')
+    montecarlo.add_argument('--price-process', metavar='JSON',
+                            help='price_paths.py calibrate 输出的价格过程：现货价格改用随机价格路径')
+    montecarlo.add_argument('--float32', action='store_true', help='以float32计算逐年表（内存减半，结果附精度报告）')
+    grid = kinds.add_parser('grid', help='敏感性网格')
+    grid.add_argument('model', help='saveModel() 导出的模型文件')
+    grid.add_argument('--grid', action='append', type=parse_grid, required=True,
+                      help='网格参数，如 tolling_price=80:120:5 或 equity_ratio=0.2,0.3')
+    grid.add_argument('--chunk-size', type=int, default=5000, help='每个分块的网格点数')
+    grid.add_argument('--float32', action='store_true', help='以float32计算逐年表（内存减半，结果附精度报告）')
+    excel = kinds.add_parser('excel', help='多站点Excel批量生成')
+    excel.add_argument('files', nargs='+', help='saveModel() 导出的模型文件')
+
+    worker = commands.add_parser('work', help='启动工作进程')
+    worker.add_argument('--workers', type=int, default=None, help='进程数（默认CPU核数）')
+    worker.add_argument('--wait', action='store_true', help='队列为空时继续等待新作业')
+
+    status = commands.add_parser('status', help='查看作业进度')
+    status.add_argument('id', type=int, nargs='?')
+    status.add_argument('--watch', action='store_true', help='每秒刷新，直到作业全部结束')
+
+    for name, text in (('cancel', '取消作业'), ('resume', '恢复已取消或失败的作业'), ('result', '输出作业结果（JSON）')):
+        commands.add_parser(name, help=text).add_argument('id', type=int)
+
+    args = parser.parse_args()
+    if args.command == 'work':
+        start = time.perf_counter()
+        run_pool(args.db, args.output_dir, args.workers, args.wait)
+        print(f'工作进程已退出（{time.perf_counter() - start:.2f} 秒）')
+        return 0
+
+    with JobQueue(args.db, args.output_dir) as queue:
+        if args.command == 'submit':
+            if args.kind == 'montecarlo':
+                spreads = dict(DEFAULT_SPREADS)
+                process = None
+                if args.price_process:
+                    # 价格水平的不确定性已由价格过程给出，除非显式指定否则不再抽样 spot 乘数
+                    process = price_paths.load_process(args.price_process)
+                    spreads.pop('spot')
+                for text in args.spread:
+                    name, _, value = text.partition('=')
+                    spreads[name] = float(value)
+                params = {'model': load_model(args.model), 'paths': args.paths, 'chunk_size': args.chunk_size,
+                          'seed': args.seed, 'spreads': spreads, 'price_process': process,
+                          'dtype': 'float32' if args.float32 else 'float64'}
+            elif args.kind == 'grid':
+                params = {'model': load_model(args.model), 'grid': dict(args.grid), 'chunk_size': args.chunk_size,
+                          'dtype': 'float32' if args.float32 else 'float64'}
+            else:
+                params = {'files': args.files}
+            try:
+                job_id = queue.submit(args.kind, params)
+            except ValueError as e:
+                print(f'提交失败: {e}')
+                return 1
+            print(f'已提交作业 {job_id}（{queue.jobs(job_id)[0]["total"]} 个分块），'
+                  f'运行 python job_queue.py work 开始计算')
+        elif args.command == 'status':
+            while True:
+                jobs = queue.jobs(args.id)
+                print_jobs(jobs)
+                if not args.watch or all(job['status'] in ('done', 'failed', 'cancelled') for job in jobs):
+                    break
+                time.sleep(1)
+                print()
+            for job in jobs:
+                if job['error']:
+                    print(f"\n作业 {job['id']} 出错:\n{job['error']}")
+        elif args.command == 'cancel':
+            print(f'作业 {args.id} 已取消' if queue.cancel(args.id) else f'作业 {args.id} 不在排队或运行中')
+        elif args.command == 'resume':
+            print(f'作业 {args.id} 已恢复' if queue.resume(args.id) else f'作业 {args.id} 未取消或失败')
+        elif args.command == 'result':
+            jobs = queue.jobs(args.id)
+            if not jobs:
+                print(f'作业 {args.id} 不存在')
+                return 1
+            json.dump(jobs[0]['result'], sys.stdout, ensure_ascii=False, indent=2)
+            print()
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
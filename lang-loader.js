@@ -0,0 +1,43 @@
+/**
+ * 德国独立储能电站投资测算系统 - 语言包按需加载
+ * @description 中、英、德翻译分别保存在 languages-<语言>.js，切换到某种语言时才加载对应文件（每种语言只加载一次），
+ *              首屏不再解析全部三种语言的词典
+ * @version 1.0
+ */
+
+/** @type {string[]} 可用语言 */
+const AVAILABLE_LANGUAGES = ['zh', 'en', 'de'];
+
+/** @type {Object} 语言 -> 加载中的 Promise */
+const languageLoads = {};
+
+/**
+ * 加载语言包
+ * @param {string} lang 语言代码
+ * @returns {Promise<Object>} 该语言的翻译字典；未知语言或加载失败时为空对象
+ */
+function loadLanguage(lang) {
+    window.languages = window.languages || {};
+    if (window.languages[lang]) {
+        return Promise.resolve(window.languages[lang]);
+    }
+    if (!languageLoads[lang]) {
+        languageLoads[lang] = new Promise(resolve => {
+            if (AVAILABLE_LANGUAGES.indexOf(lang) < 0) {
+                resolve({});
+                return;
+            }
+            const script = document.createElement('script');
+            script.src = `languages-${lang}.js`;
+            script.onload = () => resolve(window.languages[lang] || {});
+            script.onerror = () => {
+                // 允许下次切换时重试
+                delete languageLoads[lang];
+                console.warn('[语言] 语言包加载失败:', script.src);
+                resolve({});
+            };
+            document.head.appendChild(script);
+        });
+    }
+    return languageLoads[lang];
+}
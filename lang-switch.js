@@ -61,10 +61,19 @@
         });
     }
 
-    // 7. 核心：更新页面所有翻译文字
+    // 7. 核心：更新页面所有翻译文字（页面引入 lang-loader.js 时，当前语言的语言包按需加载）
     function updatePageLang() {
-        const langData = getLangData(currentLang);
-        
+        const lang = currentLang;
+        if (typeof loadLanguage === 'function' && Object.keys(getLangData(lang)).length === 0) {
+            loadLanguage(lang).then(() => {
+                if (lang === currentLang) applyLangData(getLangData(lang));
+            });
+            return;
+        }
+        applyLangData(getLangData(lang));
+    }
+
+    function applyLangData(langData) {
         // 遍历所有带data-i18n标记的元素
         const i18nElements = document.querySelectorAll('[data-i18n]');
         console.log('Found ' + i18nElements.length + ' elements with data-i18n attribute');
@@ -0,0 +1,795 @@
+// 语言文件 - 德文翻译（切换到该语言时由 lang-loader.js 按需加载）
+window.languages = window.languages || {};
+window.languages.de = {
+    // 导航栏
+    brandText: "Deutsches unabhängiges Energiespeicher-Kraftwerk-Investitionsberechnungssystem",
+    navParameters: "Grenzwerteinstellungen",
+    navOpex: "OPEX-Einstellungen",
+    navRevenue: "Einnahmenprognose",
+    navIndicators: "Finanzindikatoren",
+    navStatements: "Finanzberichte",
+    navSensitivity: "Sensitivitätsanalyse",
+    navBankReport: "Finanzierungsbericht",
+    btnHelp: "Hilfe",
+    btnImport: "Importieren",
+    btnSave: "Speichern",
+    btnExport: "Exportieren",
+    btnExcel: "Excel",
+    btnCalculate: "Berechnen",
+    btnLogout: "Abmelden",
+    
+    // 融资参数
+    labelLoanYears: "Darlehensfrist",
+    hintLoanYears: "Gängige Darlehensfrist für Energiespeicherprojekte in deutschen Banken",
+    labelLoanRate: "Darlehenszins",
+    hintLoanRate: "Europäischer Markt-Leitzinsstand 2025",
+    labelGracePeriod: "Grace Period",
+    labelRepaymentMethod: "Tilgungsart",
+    optionEqualPrincipal: "Gleicher Hauptbetrag",
+    optionEqualPayment: "Gleicher Gesamtbetrag",
+    hintEquityRatio: "Typisches Eigenkapitalverhältnis für deutsche Projektfinanzierungen: 25-30%",
+    
+    // 建设期与通胀参数
+    cardConstruction: "Bauzeit und Inflationsparameter",
+    labelConstructionPeriod: "Bauzeit",
+    hintConstructionPeriod: "Zeit von Projektbeginn bis Inbetriebnahme",
+    labelConstructionFundUsage: "Baubetriebskapitalauslastung",
+    hintConstructionFundUsage: "Durchschnittliche Kapitalauslastung während der Bauphase (für Berechnung der Bauzinsen)",
+    labelInflationRate: "Inflationsrate",
+    hintInflationRate: "Verwendet für die jährliche Steigerung der OPEX (deutsche Inflationsrate 2025 ca. 2%)",
+    
+    // 折旧参数
+    cardDepreciation: "Abschreibungs- und Amortisationsparameter",
+    labelDepreciationYears: "Abschreibungsjahre für feste Vermögenswerte",
+    labelSalvageRate: "Restwertquote",
+    labelDepreciationMethod: "Abschreibungsmethode",
+    optionStraightLine: "Lineare Abschreibung",
+    optionDoubleDeclining: "Doppelte declining balance Methode",
+    optionSumOfYears: "Jahreszahlen-Summenmethode",
+    labelAmortizationYears: "Amortisationsjahre für immaterielle Vermögenswerte",
+    
+    // 效率参数
+    cardEfficiency: "Effizienzparameter",
+    labelChargeEfficiency: "Ladeeffizienz",
+    labelDischargeEfficiency: "Entladeeffizienz",
+    labelRTE: "System Round-Trip Efficiency (RTE)",
+    
+    // 税费参数
+    cardTaxes: "Steuerparameter",
+    labelCorporateTaxRate: "Körperschaftsteuersatz",
+    hintCorporateTaxRate: "Deutsche gesetzlicher Körperschaftsteuersatz",
+    labelSolidarityTaxRate: "Solidaritätszuschlag",
+    hintSolidarityTaxRate: "Berechnet zu 5,5% des Körperschaftsteuerbetrags",
+    labelTradeTaxRate: "Gewerbesteuersatz",
+    hintTradeTaxRate: "Verschiedene Kommunalsteuersätze in Deutschland (7-17%)",
+    labelVATRate: "Mehrwertsteuersatz (MwSt/VAT)",
+    hintVATRate: "Deutscher Standard-Mehwertsteuersatz",
+    labelOtherTaxRate: "Sonstige Steuern",
+    labelTaxMethod: "Ertragsteuermethode",
+    optionTaxGerman: "Deutsches Steuerrecht (Verlustvortrag)",
+    optionTaxFlat: "Pauschaler Mischsatz",
+    hintTaxMethod: "Deutsches Steuerrecht: getrennte KSt- und GewSt-Bemessung, Verlustvortrag, Zinsschranke",
+    labelLossOffsetThreshold: "Sockelbetrag Verlustabzug (§10d EStG)",
+    labelMinTaxationRatio: "Abzugsquote über Sockelbetrag",
+    hintMinTaxationRatio: "Mindestbesteuerung",
+    labelInterestBarrierRatio: "Zinsschranke (% des EBITDA)",
+    labelInterestBarrierThreshold: "Freigrenze Zinsschranke",
+    labelTradeTaxAddbackRatio: "Hinzurechnungsquote Entgelte für Schulden",
+    labelTradeTaxAddbackAllowance: "Freibetrag Hinzurechnung",
+    
+    // Tolling参数
+    cardTolling: "Tolling-Betriebsparameter",
+    labelTollingYears: "Tolling-Vertragsjahre",
+    hintTollingYears: "Typische Laufzeit für Energiespeicher-Tolling-Verträge in Deutschland",
+    labelTollingRatio: "Tolling-Kapazitätsverhältnis",
+    hintTollingRatio: "Banken verlangen typischerweise 70-90%",
+    labelTollingPrice: "Tolling-Preis (Erstes Jahr)",
+    hintTollingPrice: "Deutscher Marktpreis 70-90€/kW im Jahr 2025",
+    labelTollingEscalation: "Jährliche Tolling-Preissteigerung",
+    hintTollingEscalation: "Inflationsanpassungsfaktor",
+    
+    // 设备配置
+    sectionEquipment: "🔌 Gerätekonfiguration",
+    descEquipment: "Konfigurieren Sie die Hauptgeräteparameter des Energiespeichersystems",
+    
+    // 电池系统
+    cardBatterySystem: "Batteriesystem",
+    labelBatteryModel: "Batteriekabinettenmodell",
+    hintBatteryModel: "Hauptlieferanten auf dem deutschen Markt 2025",
+    labelBatteryCapacity: "Einzelkabinettenkapazität",
+    labelBatteryCount: "Anzahl der Batteriekabinetten",
+    btnAutoCalc: "🔄Auto",
+    labelBatteryPrice: "Batteriesystem-Einzelpreis",
+    hintBatteryPrice: "Deutscher Markt Durchschnitt 2025: 80-95€/kWh",
+    
+    // 电池型号选项
+    labelCATL: "CATL (europäisch führend)",
+    optionCATLEnerOnePlus: "CATL EnerOne Plus 5MWh (314Ah) ★Empfohlen",
+    optionCATLEnerCPlus: "CATL EnerC Plus 6,25MWh (314Ah)",
+    optionCATLEnerD: "CATL EnerD 5MWh (530Ah)",
+    optionCATLTENER: "CATL TENER 6,25MWh (LFP)",
+    labelBYD: "BYD (hohe Anerkennung in Europa)",
+    optionBYD_MC_Cube: "BYD MC Cube 2,8MWh (280Ah)",
+    optionBYD_Cube_Pro: "BYD Cube Pro 3,7MWh (302Ah)",
+    optionBYD_BatteryBox: "BYD Battery-Box Premium 1,34MWh",
+    labelEVE: "EVE Energy",
+    optionEVE_LF560K: "EVE LF560K 5MWh (560Ah)",
+    optionEVE_LF280K: "EVE LF280K 3,35MWh (280Ah)",
+    optionEVE_LF314K: "EVE LF314K 3,76MWh (314Ah)",
+    labelREPT: "REPT",
+    optionREPT_320Ah: "REPT 320Ah 3,84MWh",
+    optionREPT_345Ah: "REPT 345Ah 4,14MWh",
+    labelHiTHIUM: "HiTHIUM",
+    optionHiTHIUM_314Ah: "HiTHIUM 314Ah 3,76MWh",
+    optionHiTHIUM_560Ah: "HiTHIUM 560Ah 5,02MWh",
+    labelGotion: "Gotion",
+    optionGotion_280Ah: "Gotion 280Ah 3,35MWh",
+    optionGotion_314Ah: "Gotion 314Ah 3,76MWh",
+    labelSamsung: "Samsung SDI (koreanisch)",
+    optionSamsung_E3: "Samsung SDI E3 3,92MWh",
+    labelLGES: "LG Energy Solution (koreanisch)",
+    optionLGES_RESU: "LG RESU Prime 3,5MWh",
+    labelOtherBattery: "Andere",
+    optionCustomBattery: "Benutzerdefiniert",
+    
+    // 电池容量选项
+    labelMainstreamCapacities: "Mainstream-Kapazitätsspezifikationen",
+    optionCapacity1_34: "1,34 MWh",
+    optionCapacity2_5: "2,5 MWh",
+    optionCapacity2_8: "2,8 MWh",
+    optionCapacity3_35: "3,35 MWh",
+    optionCapacity3_5: "3,5 MWh",
+    optionCapacity3_7: "3,7 MWh",
+    optionCapacity3_76: "3,76 MWh",
+    optionCapacity3_84: "3,84 MWh",
+    optionCapacity3_92: "3,92 MWh",
+    optionCapacity4_14: "4,14 MWh",
+    optionCapacity5_0: "5,0 MWh ★Mainstream",
+    optionCapacity5_02: "5,02 MWh",
+    optionCapacity6_25: "6,25 MWh",
+    labelOtherCapacities: "Andere",
+    optionCustomCapacity: "Manuelle Eingabe",
+    
+    // 边界设定界面
+    sectionParameters: "📊 Projektgrenzbedingungseinstellungen",
+    descParameters: "Stellen Sie die Grundparameter und die Gerätekonfiguration des Energiespeicher-Kraftwerks ein",
+    cardBasicParams: "Grundlegende Kraftwerksparameter",
+    labelPower: "Installierte Leistung",
+    hintPower: "Typische Größe für große Energiespeicherprojekte in Deutschland",
+    labelCapacity: "Energiespeicherkapazität",
+    hintCapacity: "2-Stunden-Speicher-Konfiguration",
+    labelDuration: "Speicherdauer",
+    labelOperationYears: "Betriebsjahre",
+    hintOperationYears: "Branchenstandardbetriebszyklus",
+    labelInitialCapacity: "Erstjährige verfügbare Batteriekapazität",
+    
+    cardDegradation: "Kapazitätsabbaueinstellungen",
+    labelDegradationMode: "Abbaumodus",
+    optionLinear: "Lineare Degradation (feste jährliche Rate)",
+    optionNonlinear: "Nichtlineare Degradation (zuerst schnell, später langsam)",
+    optionCycleBased: "Zyklusbasierte Degradation",
+    hintDegradationMode: "Wählen Sie den Abbaumodus basierend auf den Batterieeigenschaften",
+    labelDegradationRate: "Jährliche Batteriekapazitätsabbaurate",
+    hintDegradationRate: "Linearer Abbaumodus: feste jährliche Abbaurate",
+    labelFirstYearDegradation: "Erstjährige Abbaurate",
+    hintFirstYearDegradation: "Nichtlineare Degradation: Erstjährige Abbaurate (normalerweise höher)",
+    labelAnnualDecrease: "Jährliche Abnahme der Abbaurate",
+    hintAnnualDecrease: "Nichtlineare Degradation: jährliche Abnahme der Abbaurate",
+    labelCyclesPerDegradation: "Abbaurate pro 1000 Zyklen",
+    hintCyclesPerDegradation: "Zyklusbasierte Degradation: Kapazitätsverlust pro 1000 Zyklen",
+    labelAnnualCycles: "Jährliche Betriebszyklen",
+    hintAnnualCycles: "Verwendet für die zyklusbasierte Abbaumodusberechnung",
+    labelCapacityThreshold: "Kapazitätserhaltungsschwelle",
+    hintCapacityThreshold: "Batterieersatz empfohlen unterhalb dieser Schwelle",
+    
+    cardFinancing: "Finanzierungsparameter",
+    labelEquityRatio: "Eigenkapitalanteil",
+    
+    // Gerätekonfigurationssubmodul
+    pcsSystem: "PCS-System",
+    pcsModel: "PCS-Modell",
+    pcsHint: "2025 deutsche Markt-Hauptstrom-PCS-Lieferanten",
+    pcsPower: "Einzel-PCS-Leistung",
+    pcsCount: "PCS-Anzahl",
+    pcsPrice: "PCS-Einzelpreis",
+    pcsPriceHint: "2025 deutscher Markt Durchschnitt 25-35€/kW",
+    optgroupMainstreamPower: "Hauptstrom-Leistungsspezifikationen",
+    optgroupOtherPower: "Andere",
+    optionCustomPower: "Manuelle Eingabe",
+    
+    mvTransformer: "Mittelspannungstransformator",
+    mvTransformerModel: "MS-Transformator-Modell",
+    mvTransformerHint: "20kV-Spannungsstufe in Deutschland häufig verwendet",
+    voltageLevel: "Spannungsstufe",
+    transformerCapacity: "Transformatorleistung",
+    transformerCount: "Transformatoranzahl",
+    transformerPrice: "MS-Transformator-Einzelpreis",
+    transformerPriceHint: "Deutscher Markt Trockentransformatorpreis",
+    optgroupDryTransformer: "Trockentransformator (Innen/Container) - Deutsch üblich",
+    optgroupOilTransformer: "Öltransformator (Außen)",
+    optgroupEuropeanTransformer: "Europäische Marken (Deutsche Zertifizierung)",
+    optgroupChineseTransformer: "Chinesische Marken",
+    optgroupOtherTransformer: "Andere",
+    optgroupMainstreamCapacity: "Hauptstrom-Kapazitätsspezifikationen",
+    optgroupOtherCapacity: "Andere",
+    optionCustomCapacity: "Manuelle Eingabe",
+    
+    hvTransformer: "Hochspannungstransformator",
+    hvTransformerModel: "HT-Transformator-Modell",
+    hvTransformerHint: "100MW-Projekte in Deutschland werden normalerweise an 110kV-Netz angeschlossen",
+    hvTransformerCapacity: "HT-Transformatorleistung",
+    hvTransformerCount: "HT-Transformatoranzahl",
+    hvTransformerPrice: "HT-Transformator-Einzelpreis",
+    hvTransformerPriceHint: "110kV/120MVA deutscher Marktpreis",
+    optgroupHV110kV: "110kV-Niveau (Deutsch üblich)",
+    optgroupHV220kV: "220kV-Niveau (Große Projekte)",
+    optgroupHV380kV: "380kV-Niveau (Deutsches Hochspannungsnetz)",
+    optgroupEuropeanHVManufacturer: "Europäische Hersteller (Lokale Zertifizierung)",
+    optgroupOtherHVManufacturer: "Andere Hersteller",
+    optgroupOtherHV: "Andere",
+    optgroupHVCapacity110kV: "110kV-Niveau",
+    optgroupHVCapacity220kV: "220kV-Niveau",
+    optgroupHVCapacity380kV: "380kV-Niveau",
+    optgroupHVCapacityOther: "Andere",
+    optionCustomHVCapacity: "Manuelle Eingabe",
+    
+    controlEquipment: "Steuerungs- und Hilfsgeräte",
+    emsSystem: "EMS-Energiemanagementsystem",
+    emsHint: "100MW-Projekt EMS-Systemkosten",
+    scadaSystem: "SCADA-Überwachungssystem",
+    scadaHint: "Inklusive Fernüberwachung und Datenerfassung",
+    switchgear: "Schaltanlage (Mittelspannung)",
+    switchgearHint: "20kV-Mittelspannungsschaltanlage",
+    switchgearCount: "Schaltanlagenanzahl",
+    switchgearCountHint: "Bestimmt durch PCS-Anzahl und Konfiguration",
+    collectorLine: "Sammlerleitung",
+    collectorLineHint: "Mittelspannungskabel und Zubehör",
+    thermalSystem: "Thermisches Managementsystem",
+    thermalSystemHint: "Flüssigkeitskühlung/Klimaanlagen-System (deutsches Klima)",
+    fireSystem: "Brandbekämpfungssystem",
+    fireSystemHint: "Gaslöschung + Überwachungssystem",
+    
+    gridConnection: "Netzanbindung",
+    substation: "Substation Bau/Erweiterung",
+    substationHint: "110kV-Substation Abzweigfeld-Erweiterungskosten",
+    gridLine: "Anschlussleitung",
+    gridLineHint: "110kV-Freileitung/Kabelleitung",
+    gridStudy: "Netzanbindungsantrag und Studiengebühr",
+    gridStudyHint: "Netzverträglichkeitsprüfung",
+    metering: "Mess- und Schutzgeräte",
+    meteringHint: "Entspricht den Anforderungen der deutschen Netzkodex",
+    
+    // Infrastruktur & OPEX & Ertragsprognose Modul
+    landInfrastructure: "Land & Infrastruktur",
+    landAcquisition: "Bodenbeschaffungskosten",
+    landAcquisitionHint: "Deutsche Industriebodenkauf oder Langzeitpacht",
+    concreteFoundation: "Betonfundament",
+    concreteFoundationHint: "Gerätefundament und Kabelgräben",
+    fenceSecurity: "Zaun und Sicherheit",
+    fenceSecurityHint: "Inklusive Überwachung und Zugangskontrolle",
+    roadConstruction: "Straßenbau",
+    roadConstructionHint: "Bereichsstraßen und Einfahrten/Ausfahrten",
+    drainageSystem: "Entwässerungssystem",
+    drainageSystemHint: "Regenwasserentsorgungssystem",
+    
+    installationConstruction: "Installation & Bauleitung",
+    mechanicalInstallation: "Mechanische & Elektrische Installation",
+    mechanicalInstallationHint: "Deutsche lokale Installationsarbeitskosten sind hoch",
+    constructionManagement: "Bauleitungskosten",
+    constructionManagementHint: "Vor-Ort-Überwachung und Koordination",
+    commissioningCost: "Inbetriebnahmekosten",
+    commissioningCostHint: "Inklusive Netzanschlusstest und Leistungsannahme",
+    
+    constructionInsurance: "Bauzeitversicherung",
+    carInsurance: "Bauleistungsversicherung (CAR)",
+    carInsuranceHint: "Bauleistungsversicherung",
+    earInsurance: "Montageversicherung (EAR)",
+    earInsuranceHint: "Montageversicherung",
+    cargoInsurance: "Frachtversicherung",
+    cargoInsuranceHint: "Transportversicherung",
+    liabilityInsurance: "Haftpflichtversicherung",
+    liabilityInsuranceHint: "Haftpflichtversicherung",
+    
+    developmentOwnerCosts: "Entwicklungs- und Eigentümerkosten",
+    spvAcquisition: "SPV-Unternehmenskaufkosten",
+    spvAcquisitionHint: "Spezialzweckgesellschaftsaufkauf und damit verbundene Kosten",
+    permitPlanning: "Genehmigungs- und Planungskosten",
+    permitPlanningHint: "BImSchG-Genehmigungsantragskosten",
+    environmentalConsulting: "Umweltberatungskosten",
+    environmentalConsultingHint: "Umweltverträglichkeitsprüfung (UVP)",
+    projectManagement: "Projektmanagementkosten",
+    projectManagementHint: "Eigentümer-Ingenieurmanagementteam",
+    legalConsulting: "Rechtsberatungskosten",
+    legalConsultingHint: "Vertrags-, Genehmigungs- und Finanzierungsrechtsdienste",
+    engineeringDesign: "Ingenieurleistungen",
+    engineeringDesignHint: "Detaillierte Ingenieurplanung (FEED)",
+    contingency: "Pufferbetrag",
+    contingencyHint: "Banken verlangen normalerweise 5-10%",
+    
+    decommissioningReserve: "Stilllegungsreserve (jährliche Amortisierung)",
+    decommissioningTotal: "Gesamte Stilllegungsreserve",
+    decommissioningTotalHint: "Jährlich über Betriebsjahre in OPEX amortisiert",
+    
+    capexDetails: "CAPEX-Details",
+    capexItem: "Posten",
+    capexUnitPrice: "Einzelpreis",
+    capexQuantity: "Menge/Kapazität",
+    capexAmount: "Betrag (10.000 EUR)",
+    capexTotal: "Gesamteinvestition (statisch)",
+    
+    opexSectionTitle: "📋 Betriebskosten-Einstellungen (OPEX)",
+    opexSectionDesc: "Jährliche Betriebskosten einstellen",
+    opexBaseSettings: "Grundeinstellungen für Betriebskosten",
+    opexCategory: "Kostenkategorie",
+    opexBasis: "Berechnungsbasis",
+    opexFirstYearRate: "Erstjahresrate/Betrag",
+    opexAnnualGrowth: "Jährliche Wachstumsrate (%)",
+    opexDescription: "Beschreibung",
+    opexTechnical: "Technik & Instandhaltung (Technical O&M)",
+    opexTechnicalDesc: "Geräteüberwachung und vor Ort Instandhaltung (Deutschland 5-8€/kW/Jahr)",
+    opexInsurance: "Versicherungskosten (Insurance)",
+    opexInsuranceDesc: "Vollständige Vermögensversicherung (Sachversicherung 0,35-0,5%)",
+    opexGrid: "Netzbetriebskosten (Grid Fees)",
+    opexGridDesc: "Netzentgelte jährliche Übertragungs- und Verteilungsgebühren (10-15k€/MW)",
+    opexLand: "Bodenpacht (Land Lease)",
+    opexLandDesc: "Pachtgebühren jährliche Miete (hängt von Region ab)",
+    opexCommercial: "Kommerz & Management (Commercial O&M)",
+    opexCommercialDesc: "Finanzabwicklung, Steuerwesen und Vertragsmanagement (3-5k€/MW)",
+    opexOther: "Sonstige Betriebskosten",
+    opexOtherDesc: "Ersatzteile, Sonstiges usw. (1-2k€/MW)",
+    opexYearlyDetails: "OPEX-Jahresdetails",
+    year: "Jahr",
+    opexYearlyTechnical: "Technische Instandhaltung",
+    opexYearlyInsurance: "Versicherungskosten",
+    opexYearlyGrid: "Netzkosten",
+    opexYearlyLand: "Bodenpacht",
+    opexYearlyCommercial: "Kommerzielles Management",
+    opexYearlyOther: "Sonstiges",
+    opexYearlyDecommissioning: "Stilllegungsreserve",
+    opexYearlyTotal: "Gesamt",
+    
+    revenueSectionTitle: "💵 Ertragsprognose",
+    revenueSectionDesc: "Tolling-Ertrag und Spotmarkt-Handelsertragsprognose einstellen",
+    spotRevenueForecast: "Spotmarkt-Ertragsprognose (nicht-Tolling-Teil)",
+    spotRevenueHint: "Überschüssiger Strom nimmt am Spotmarkt teil, bitte geben Sie den erwarteten Ertrag pro MW pro Jahr ein",
+    spotPriceUnit: "Spot-Ertragseinzelpreis\n(EUR/MW/Jahr)",
+    quickFillBasePrice: "Schnellausfüllen: Erstjahrspreis",
+    annualGrowthRate: "Jährliche Wachstumsrate (%)",
+    applyButton: "Anwenden",
+    spotRevenueExpected: "Deutscher Spotmarkt-Arbitrageertrag: 30-45k€/MW/Jahr (2025-Prognose)",
+    revenueYearlyDetails: "Ertragsjahresdetails",
+    availableCapacity: "Verfügbare Kapazität (%)",
+    tollingRevenue: "Tolling-Ertrag\n(10.000 EUR)",
+    spotRevenue: "Spot-Ertrag\n(10.000 EUR)",
+    totalRevenue: "Gesamtertrag\n(10.000 EUR)",
+    
+    // Finanzcore Modul
+    indicatorsSectionTitle: "📊 Kernfinanzindikatoren",
+    indicatorsSectionDesc: "Schlüsselsindikatoren für Investitionsrendite und Risikobewertung",
+    indStaticInvestment: "Gesamteinvestition (statisch)",
+    indDynamicInvestment: "Gesamteinvestition (dynamisch)",
+    indTotalRevenue: "Kumulative Gesamtumsatz",
+    indAvgRevenue: "Durchschnittlicher jährlicher Umsatz",
+    indFirst3Revenue: "Erste drei Jahre Gesamtumsatz",
+    indTotalProfit: "Kumulatives Gesamtgewinn",
+    indAvgProfit: "Durchschnittlicher jährlicher Gewinn",
+    indFirst3Profit: "Erste drei Jahre Gesamtgewinn",
+    indTotalNetProfit: "Kumulatives Nettogewinn",
+    indAvgNetProfit: "Durchschnittlicher jährlicher Nettogewinn",
+    indFirst3NetProfit: "Erste drei Jahre Nettogewinn",
+    indProjectIRR: "Projekt-IRR (nach Steuern)",
+    indEquityIRR: "Eigenkapital-IRR (nach Steuern)",
+    indStaticPayback: "Statische Amortisationsdauer",
+    indEquityPayback: "Eigenkapital-Amortisationsdauer (statisch)",
+    indDynamicPayback: "Dynamische Amortisationsdauer (-8%)",
+    indEquityDynamicPayback: "Eigenkapital-Amortisationsdauer (dynamisch-8%)",
+    indROEYear3: "Jahr 3 Eigenkapitalrendite (ROE)",
+    indROI: "Rendite auf Investition (ROI)",
+    indEBITDAReturn: "EBITDA-Rendite",
+    indLCOE: "LCOE ( nivellierter Energiekosten)",
+    indDSCR: "Schuldendienstdeckungsgrad (DSCR)",
+    
+    statementsSectionTitle: "📑 Finanzberichte",
+    statementsSectionDesc: "Erfolgsrechnung, Bilanz, Cashflow-Abschluß",
+    statementIncome: "Erfolgsrechnung",
+    statementBalance: "Bilanz",
+    statementCashflow: "Cashflow-Abschluß",
+    statementLoan: "Darlehensrückzahlungsplan",
+    statementItem: "Posten",
+    loanYear: "Jahr",
+    loanOpeningBalance: "Anfangssaldo",
+    loanInterest: "Zinsen der laufenden Periode",
+    loanPrincipal: "Hauptsumme der laufenden Periode",
+    loanPayment: "Zahlung der laufenden Periode",
+    loanClosingBalance: "Endsaldo",
+    
+    sensitivitySectionTitle: "🔍 Sensitivitätsanalyse",
+    sensitivitySectionDesc: "Analysieren Sie die Auswirkungen von Schlüsselparameteränderungen auf die Investitionsrenditen",
+    sensitivityParams: "Analyseparametersettings",
+    sensitivityVar1: "Analysevariable 1",
+    sensitivityVar2: "Analysevariable 2 (optional)",
+    sensitivityTarget: "Analysezielindikator",
+    sensitivityCapex: "Investitionskosten (CAPEX)",
+    sensitivityTolling: "Tolling-Preis",
+    sensitivitySpot: "Spotpreis",
+    sensitivityOpex: "Betriebskosten (OPEX)",
+    sensitivityLoanRate: "Darlehenszinssatz",
+    sensitivityDegradation: "Batterieentwicklungsrate",
+    sensitivityRange: "Änderungsbereich",
+    sensitivityTo: "bis",
+    sensitivityStep: "Schrittgröße",
+    sensitivityRun: "Analyse ausführen",
+    sensitivityResults: "Analyseergebnisse",
+    sensitivityResultHint: "Bitte wählen Sie Analyseparameter und klicken Sie auf \"Analyse ausführen\"",
+    sensitivityMatrix: "Zwei-Variablen-Sensitivitätsmatrix",
+    
+    reportTitle: "Projektfinanzierungskeitsanalysebericht",
+    reportSubtitle: "Battery Energy Storage System (BESS) Project Financing Report",
+    reportDate: "Berichtsdatum",
+    reportVersion: "Berichtsversion",
+    reportVersionValue: "V1.0",
+    
+    // 融资报告完整模块
+    reportSummaryTitle: "I. Projektsübersicht (Executive Summary)",
+    projectBasicInfo: "Grundlegende Projektinformationen",
+    projectName: "Projektname",
+    projectLocation: "Projektstandort",
+    installedCapacity: "Installierte Kapazität",
+    storageDuration: "Speicherdauer",
+    operationYears: "Betriebszeitraum",
+    projectCompany: "Projektgesellschaft",
+    investmentStructure: "Investitions- und Finanzierungsstruktur",
+    totalInvestment: "Gesamte Projektinvestition",
+    equity: "Eigenkapital",
+    bankLoan: "Bankdarlehen",
+    equityRatio: "Eigenkapitalanteil",
+    loanTerm: "Darlehensfrist",
+    loanRate: "Darlehenszinssatz",
+    coreInvestmentIndicators: "Kerninvestitionsindikatoren",
+    projectIRR: "Projekt-IRR (nach Steuern)",
+    equityIRR: "Eigenkapital-IRR (nach Steuern)",
+    staticPayback: "Statische Amortisationsdauer",
+    dynamicPayback: "Dynamische Amortisationsdauer (8%)",
+    avgDSCR: "Durchschnittlicher DSCR",
+    lcoe: "LCOE (nivellierter Energiekosten)",
+    minDSCR: "Minimaler DSCR",
+    
+    revenueAnalysisTitle: "II. Ertragsstrukturanalyse",
+    revenueSourceComposition: "Ertragquellenzusammensetzung",
+    annualRevenueForecast: "Jährliche Ertragsprognose",
+    revenueStabilityAssessment: "Ertragsstabilitätsbewertung",
+    tollingCoverage: "Tolling-Vertragsabdeckung",
+    tollingRatio: "Tolling-Ertragsanteil",
+    revenueVolatility: "Ertragsschwankungskoeffizient",
+    
+    debtServiceAnalysisTitle: "III. Schuldendienstanalyse",
+    annualDSCRTrend: "Jährlicher DSCR-Trend",
+    cashFlowCoverageAnalysis: "Cashflow-Abdeckungsanalyse",
+    loanRepaymentSchedule: "Darlehensrückzahlungsplan",
+    year: "Jahr",
+    openingPrincipalBalance: "Anfangshauptsumme<br>(10.000 EUR)",
+    annualInterest: "Jährliche Zinsen<br>(10.000 EUR)",
+    annualPrincipal: "Jährliche Hauptsumme Tilgung<br>(10.000 EUR)",
+    annualPayment: "Jährliche Zahlung<br>(10.000 EUR)",
+    closingPrincipalBalance: "Endhauptsumme<br>(10.000 EUR)",
+    ebitda: "EBITDA<br>(10.000 EUR)",
+    dscr: "DSCR",
+    
+    profitabilityAnalysisTitle: "IV. Rentabilitätsanalyse",
+    annualProfitTrend: "Jährlicher Gewinn-Trend",
+    cumulativeCashFlow: "Kumulativer Cashflow",
+    avgEBITDA: "Durchschnittliches EBITDA<br>(10.000 EUR)",
+    avgNetProfit: "Durchschnittlicher Nettogewinn<br>(10.000 EUR)",
+    ebitdaMargin: "EBITDA-Marge<br>(%)",
+    netMargin: "Nettogewinnmarge<br>(%)",
+    
+    riskAnalysisTitle: "V. Risikoanalyse & Stress-Test",
+    sensitivityAnalysisTitle: "Schlüsselsindikator-Sensitivitätsanalyse",
+    stressTestScenarios: "Stress-Test-Szenarien",
+    scenario: "Szenario",
+    assumptions: "Annahmen",
+    riskAssessmentMatrix: "Risikobewertungsmatrix",
+    marketRisk: "Marktrisiko: Niedrig",
+    marketRiskNote: "Tolling-Vertrag gesperrt",
+    technicalRisk: "Technisches Risiko: Niedrig",
+    technicalRiskNote: "Reife Lithiumbatterietechnologie",
+    operationalRisk: "Betriebsrisiko: Mittel",
+    operationalRiskNote: "Batterieentwicklungsmanagement",
+    policyRisk: "Politikrisiko: Niedrig",
+    policyRiskNote: "Deutsche Energiewende-Unterstützung",
+    
+    financialStructureAnalysisTitle: "VI. Finanzstrukturanalyse",
+    leverageRatioTrend: "Verschuldungsgrad-Trend",
+    roeTrend: "Eigenkapitalrendite (ROE)-Trend",
+    
+    conclusionTitle: "VII. Fazit & Empfehlungen",
+    investmentRating: "Investitionsrating: <strong id='rpt_rating'>-</strong>",
+    projectStrengths: "Projektstärken:",
+    projectConcerns: "Wichtige Überlegungen:",
+    financingRecommendations: "Finanzierungsempfehlungen:",
+    
+    appendixTitle: "Anhang: Detaillierte Finanzprognosetabellen",
+    cashFlowForecast: "Cashflow-Prognose",
+    incomeForecast: "Einkommensprognose",
+    balanceSheetForecast: "Bilanzprognose",
+    
+    reportFooterZh: "Dieser Bericht wird automatisch vom Deutschen unabhängigen Energiespeicher-Kraftwerk-Investitionsberechnungssystem generiert und dient ausschließlich als Referenz für Finanzierungsentscheidungen.",
+    reportFooterEn: "This report is auto-generated for financing decision reference only.",
+    
+    // Hilfe-Modal
+    helpModalTitle: "📖 Hilfe",
+    helpTabQuickstart: "Schnellstart",
+    helpTabParameters: "Parameter-Einstellungen",
+    helpTabFeatures: "Funktionen",
+    helpTabFinance: "Finanzwissen",
+    helpTabTips: "Tipps",
+    
+    // Schnellstart-Bereich
+    quickstartTitle: "🚀 Schnellstart",
+    quickstartStep1: "<strong>Anmelden</strong>: Verwenden Sie Ihren Benutzernamen und Ihr Passwort, um sich anzumelden",
+    quickstartStep2: "<strong>Parameter einstellen</strong>: Legen Sie in der Registerkarte 'Grenzwerteinstellungen' die grundlegenden Projektparameter fest",
+    quickstartParam1: "Kraftwerkskapazität und Leistung",
+    quickstartParam2: "Batteriemodell (Preis und Abbauparameter werden nach der Auswahl automatisch ausgefüllt)",
+    quickstartParam3: "Gerätekonfiguration und Preise",
+    quickstartParam4: "Finanzierungsparameter",
+    quickstartStep3: "<strong>OPEX einstellen</strong>: Legen Sie in der Registerkarte 'OPEX-Einstellungen' die jährlichen Betriebskosten fest",
+    quickstartStep4: "<strong>Erträge einstellen</strong>: Legen Sie in der Registerkarte 'Einnahmenprognose' die Ertragsquellen und Preise fest",
+    quickstartStep5: "<strong>Ergebnisse anzeigen</strong>: Klicken Sie auf die Schaltfläche 'Berechnen' oder warten Sie auf die automatische Berechnung nach Parameteränderungen, um Finanzindikatoren und Berichte anzuzeigen",
+
+    quickstartTip: "💡 Tipp:",
+    quickstartTipContent: "Das System unterstützt die automatische Parameterberechnung. Die Ergebnisse werden 500 Millisekunden nach Parameteränderungen automatisch aktualisiert, Sie müssen nicht manuell auf die Berechnungsschaltfläche klicken.",
+    
+    // Parameter-Einstellungen-Bereich
+    parametersTitle: "⚙️ Parameter-Einstellungsanweisungen",
+    parametersBasicParams: "1. Grundlegende Kraftwerksparameter",
+    parametersPower: "<strong>Installierte Leistung</strong>: Nennleistung des Energiespeichersystems (MW)",
+    parametersCapacity: "<strong>Energiespeicherkapazität</strong>: Gesamte Kapazität des Energiespeichersystems (MWh)",
+    parametersDuration: "<strong>Speicherdauer</strong>: Automatisch berechnet (Kapazität/Leistung), normalerweise 2-4 Stunden",
+    parametersOperationYears: "<strong>Betriebsjahre</strong>: Projektbetriebszeitraum, normalerweise 15-20 Jahre",
+    parametersInitialCapacity: "<strong>Erstjährige verfügbare Batteriekapazität</strong>: Anfangsverfügbare Kapazitätsquote neuer Batterien",
+    parametersDegradation: "2. Kapazitätsabbaueinstellungen",
+    parametersDegradationMode: "<strong>Abbaumodus</strong>:",
+    parametersLinearDegradation: "Lineare Degradation: Feste jährliche Abbaurate, geeignet für die meisten LFP-Batterien",
+    parametersNonlinearDegradation: "Nichtlineare Degradation: Schnelle anfängliche Degradation, später langsam",
+    parametersCycleBasedDegradation: "Zyklusbasierte Degradation: Kapazitätsverlust basierend auf Zykluszahl berechnet",
+    parametersAutoFill: "<strong>Autofüllen</strong>: Nach der Auswahl eines Batteriemodells füllt das System automatisch die Standardabbauparameter für dieses Modell aus",
+    parametersBatterySystem: "3. Batteriesystem",
+    parametersBatteryModel: "<strong>Batteriekabinettenmodell</strong>: Wählen Sie Hersteller und Modell der Batterie, das System füllt automatisch Preis und Abbauparameter aus",
+    parametersBatteryPrice: "<strong>Batterieeinzelpreis</strong>: Preis pro MWh Batterie (10.000 EUR), wird basierend auf dem ausgewählten Modell automatisch ausgefüllt",
+    parametersBatteryCount: "<strong>Batteriekabinettenanzahl</strong>: Automatisch vom System basierend auf Gesamtkapazität und Einzelschrankkapazität berechnet",
+    parametersFinancing: "4. Finanzierungsparameter",
+    parametersEquityRatio: "<strong>Eigenkapitalanteil</strong>: Deutsche Projekte normalerweise 25-30%",
+    parametersLoanTerm: "<strong>Darlehensfrist</strong>: Normalerweise 10-15 Jahre",
+    parametersLoanRate: "<strong>Darlehenszinssatz</strong>: Europäischer Marktreferenzzinssatz um 4-5% im Jahr 2025",
+    parametersRepaymentMethod: "<strong>Rückzahlungsmethode</strong>: Gleicher Hauptbetrag oder gleicher Gesamtbetrag",
+    parametersCapex: "5. CAPEX-Einstellungen",
+    parametersCapexAuto: "Das System berechnet automatisch verschiedene CAPEX basierend auf der Gerätekonfiguration",
+    parametersCapexItems: "Einschließlich: Gerätekosten, Netzanbindung, Bodeninfrastruktur, Installations- und Baukosten, Versicherung, Entwicklungskosten usw.",
+    parametersCapexUpdate: "Alle Parameter geändert, CAPEX-Details werden automatisch aktualisiert",
+    
+    // Funktionen-Bereich
+    featuresTitle: "✨ Funktionen",
+    featuresAutoCalc: "1. Automatische Berechnung",
+    featuresAutoCalc1: "Nach Änderung eines beliebigen Parameters berechnet das System nach 500 Millisekunden automatisch neu",
+    featuresAutoCalc2: "Keine manuelle Klick auf die Schaltfläche \"Berechnen\" erforderlich",
+    featuresAutoCalc3: "Alle Tabellen und Diagramme werden automatisch aktualisiert",
+    featuresFormatting: "2. Datenformatierung",
+    featuresFormatting1: "Alle Werte werden im deutschen Tausenderformat angezeigt (1.234.567,89)",
+    featuresFormatting2: "Währungseinheit: 10.000 EUR",
+    featuresFormatting3: "Automatische Prozentformatierung",
+    featuresSaveImport: "3. Modell-Speicherung und -Import",
+    featuresSaveModel: "<strong>Modell speichern</strong>: Klicken Sie auf die Schaltfläche \"Speichern\", um alle aktuellen Parameter als JSON-Datei zu speichern",
+    featuresImportModel: "<strong>Modell importieren</strong>: Klicken Sie auf die Schaltfläche \"Importieren\", um zuvor gespeicherte Modellparameter zu laden",
+    featuresCompareScenarios: "Erleichtert den Parametervergleich und Szenariomanagement in verschiedenen Situationen",
+    featuresExport: "4. Berichtsexport",
+    featuresExportReport: "<strong>Bericht exportieren</strong>: Generieren Sie einen vollständigen Finanzanalysbericht (PDF-Format)",
+    featuresExportContent: "Einschließlich: Projektübersicht, CAPEX-Details, Finanzindikatoren, Finanzberichte usw.",
+    featuresExportPurpose: "Geeignet für Präsentationen an Investoren, Banken und andere Institutionen",
+    featuresSensitivity: "5. Sensitivitätsanalyse",
+    featuresSensitivity1: "Analysieren Sie die Auswirkungen von Schlüsselparameteränderungen auf Finanzindikatoren",
+    featuresSensitivity2: "Unterstützung der gleichzeitigen Änderungsanalyse mehrerer Parameter",
+    featuresSensitivity3: "Generieren von Sensitivitätsanalysediagrammen",
+    featuresFinancingReport: "6. Finanzierungsbericht",
+    featuresFinancingReport1: "Generieren Sie Finanzberichte, die für die Bankenfinanzierung erforderlich sind",
+    featuresFinancingReport2: "Einschließlich: Projektübersicht, Finanzindikatoren, Cashflow-Prognose, Schuldendienstfähigkeitsanalyse usw.",
+    
+    // Finanzwissen-Bereich
+    financeTitle: "📚 Finanzwissen-Spalte",
+    financeStatements: "I. Grundlagen der drei wichtigsten Finanzberichte",
+    financeIncomeStatement: "1. Erfolgsrechnung",
+    financeIncomeStatementDesc: "<strong>Einfaches Verständnis:</strong> Die Erfolgsrechnung ist wie eine \"Zeugnis\" des Unternehmens, das Ihnen sagt, wie viel Geld verdient wurde, wie viel ausgegeben wurde und wie viel am Ende des Jahres übrig bleibt.",
+    financeCoreFormula: "Kernformel:",
+    financeNetProfitFormula: "Nettogewinn = Betriebserlöse - Betriebskosten - Betriebsausgaben - Abschreibung und Amortisation - Zinsen - Einkommensteuer",
+    financeIncomeStatementStructure: "Erfolgsrechnungsstruktur:",
+    financeRevenue: "Betriebserlöse",
+    financeRevenueDesc: "(Oben, Summe aller Einnahmen)",
+    financeOperatingCost: "Betriebskosten",
+    financeOperatingCostDesc: "(Direkte Kosten, wie Gerätewartung)",
+    financeGrossProfit: "Bruttogewinn",
+    financeOperatingExpenses: "Betriebsausgaben",
+    financeOperatingExpensesDesc: "(OPEX: Arbeit, Versicherung, Bodenpacht usw.)",
+    financeDepreciation: "Abschreibung und Amortisation",
+    financeDepreciationDesc: "(Gerätewert nimmt von Jahr zu Jahr ab)",
+    financeEBITDA: "EBITDA",
+    financeEBITDADesc: "(Ergebnis vor Zinsen, Steuern, Abschreibungen und Amortisationen)",
+    financeInterest: "Zinsen",
+    financeInterestDesc: "(Bankdarlehenszinsen)",
+    financeEBIT: "Steuervorsteuerlicher Gewinn (EBT)",
+    financeTax: "Einkommensteuer",
+    financeNetProfit: "Nettogewinn",
+    financeNetProfitDesc: "(Endgeld verdient)",
+    financeKeyUnderstanding: "💡 Wichtiges Verständnis:",
+    financeEBITDAKeyPoint: "EBITDA ist ein wichtiger Indikator zur Messung der Betriebsfähigkeit eines Projekts, da es die Auswirkungen von Abschreibung, Zinsen und Steuern ausschließt und besser die wahre Rentabilität des Projekts widerspiegelt.",
+    financeCashFlowStatement: "2. Cashflow-Abschluß",
+    financeCashFlowStatementDesc: "<strong>Einfaches Verständnis:</strong> Der Cashflow-Abschluß ist wie ein \"Bankkontoauszug\" des Unternehmens, der Cash-Ein- und Ausflüsse aufzeichnet und Ihnen sagt, wie viel Geld tatsächlich erhalten und ausgegeben wurde.",
+    financeNetCashFlowFormula: "Netto-Cashflow = Betriebscashflow + Investitionscashflow + Finanzierungscashflow",
+    financeCashFlowActivities: "Drei Hauptaktivitäten des Cashflow-Abschlusses:",
+    financeOperatingCashFlow: "Betriebscashflow",
+    financeOperatingCashFlowSource: "Quelle: Betriebserlöse - Betriebskosten",
+    financeOperatingCashFlowDesc: "Beschreibung: Cash aus täglichen Projektbetrieben erzeugt",
+    financeInvestingCashFlow: "Investitionscashflow",
+    financeInvestingCashFlowSource: "Quelle: Bauzeitinvestition (negativ), Restwertgewinnung (positiv)",
+    financeInvestingCashFlowDesc: "Beschreibung: Einmalige große Ausgaben wie Gerätekauf, Kraftwerkbau",
+    financeFinancingCashFlow: "Finanzierungscashflow",
+    financeFinancingCashFlowSource: "Quelle: Aktionärsinvestition (positiv), Bankdarlehen (positiv), Haupt- und Zinsrückzahlung (negativ)",
+    financeFinancingCashFlowDesc: "Beschreibung: Wie Gelder zur Unterstützung des Projekts aufgebracht werden",
+    financeCashFlowKeyPoint: "Die Erfolgsrechnung zeigt \"wie viel Geld verdient wurde\", der Cashflow-Abschluß zeigt \"wie viel Geld tatsächlich erhalten wurde\". Sie können unterschiedlich sein, da Abschreibung keine Cash-Ausgabe ist, aber den Gewinn beeinflußt.",
+    financeBalanceSheet: "3. Bilanz",
+    financeBalanceSheetDesc: "<strong>Einfaches Verständnis:</strong> Die Bilanz ist wie eine \"Inventurliste\" des Unternehmens, die links das, was Sie besitzen (Vermögen), und rechts das, was Sie anderen schulden (Verbindlichkeiten) und Ihr eigenes Geld (Eigenkapital) auflistet.",
+    financeAccountingEquation: "Kernformel (Bilanzgleichung):",
+    financeBalanceSheetFormula: "Vermögen = Verbindlichkeiten + Eigenkapital",
+    financeBalanceSheetStructure: "Bilanzstruktur:",
+    financeAssetsSide: "Vermögen (linke Seite)",
+    financeCash: "Bargeld und Bargeldäquivalente",
+    financeCashDesc: "Bargeld auf Bankkonten",
+    financeFixedAssets: "Netto-Anlagevermögen",
+    financeFixedAssetsDesc: "Ursprünglicher Gerätewert - kumulierte Abschreibung",
+    financeIntangibleAssets: "Immaterielles Vermögen",
+    financeIntangibleAssetsDesc: "Land, Entwicklungskosten usw.",
+    financeTotalAssets: "Gesamtes Vermögen",
+    financeLiabilitiesEquitySide: "Verbindlichkeiten + Eigenkapital (rechte Seite)",
+    financeLongTermDebt: "Langfristige Darlehen",
+    financeLongTermDebtDesc: "Bankdarlehensrest",
+    financePaidInCapital: "Gezeichnetes Eigenkapital",
+    financePaidInCapitalDesc: "Von Aktionären investiertes Geld",
+    financeRetainedEarnings: "Übrig gebliebene Gewinne",
+    financeRetainedEarningsDesc: "Jährlicher kumulativer Nettogewinn",
+    financeTotalLiabilitiesEquity: "Verbindlichkeiten + Eigenkapital",
+    financeBalanceSheetKeyPoint: "Die Bilanz muss sich ausgleichen! Die linke Seite (Vermögen) entspricht immer der rechten Seite (Verbindlichkeiten + Eigenkapital). Wenn nicht, gibt es einen Berechnungsfehler.",
+    financeKeyMetrics: "II. Detaillierte Erklärung der Kernfinanzindikatoren",
+    financeIRR: "1. IRR - Interner Rate of Return",
+    financeIRRDesc: "<strong>Einfaches Verständnis:</strong> IRR ist \"Wenn dieses Projekt ein Bankkonto wäre, was wäre dann der jährliche Zinssatz?\" Es sagt Ihnen die annualisierte Rendite bei der Investition in dieses Projekt.",
+    financeCalculationFormula: "Berechnungsformel:",
+    financeIRRFormula: "NPV = Σ(Cashflow / (1 + IRR)^Jahr) = 0",
+    financeIRRSolution: "Lösen Sie IRR durch Probe und Fehler, indem Sie den Nettobarwert auf null setzen",
+    financeIRRDiagram: "IRR-Berechnungsdiagramm:",
+    financeIRRYear0: "Jahr 0: -10 Millionen (Investition)",
+    financeIRRYear1: "Jahr 1: +2 Millionen",
+    financeIRRYear2: "Jahr 2: +3 Millionen",
+    financeIRRYears: "... Weiter für 20 Jahre",
+    financeIRRDefinition: "IRR = Der Zinssatz, der die diskontierte Summe aller Cashflows auf null setzt",
+    financeHowToInterpret: "💡 Wie zu interpretieren:",
+    financeIRRGood: "IRR > 8% (Marktreferenzzinssatz): Projekt ist attraktiv",
+    financeIRRExcellent: "IRR > 12%: Sehr gutes Investitionsprojekt",
+    financeIRRBad: "IRR < 8%: Vielleicht nicht wert, zu investieren",
+    financeIRRTotal: "Gesamteinvestitions-IRR: Berücksichtigt die Rendite auf alle Gelder (Eigenkapital + Darlehen)",
+    financeIRREquity: "Eigenkapital-IRR: Berücksichtigt nur die Rendite auf eigene Gelder (normalerweise höher)",
+    financeNPV: "2. NPV - Net Present Value",
+    financeNPVDesc: "<strong>Einfaches Verständnis:</strong> NPV ist, um zukünftiges Geld basierend auf Zinssatz \"diskontiert\" zu heute zu machen, um zu sehen, wie viel es wert ist. Wenn NPV positiv ist, lohnt es sich, in das Projekt zu investieren.",
+    financeNPVFormula: "NPV = Σ(Cashflow / (1 + Diskontsatz)^Jahr)",
+    financeNPVDiscountRate: "Diskontsatz normalerweise 8% (Marktreferenzzinssatz)",
+    financeNPVExample: "NPV-Berechnungsbeispiel:",
+    financeYear: "Jahr",
+    financeCashFlow: "Cashflow",
+    financeDiscountFactor: "Diskontierungsfaktor (8%)",
+    financePresentValue: "Barwert",
+    financeNPVTotal: "NPV-Gesamt",
+    financeNPVPositive: "NPV > 0: Projekt lohnt sich zu investieren, schafft Wert",
+    financeNPVZero: "NPV = 0: Projekt gerade einmal rentabel (Diskontsatz = IRR zu diesem Zeitpunkt)",
+    financeNPVNegative: "NPV < 0: Projekt lohnt sich nicht zu investieren",
+    financeNPVGreater: "Je größer der NPV, desto attraktiver das Projekt",
+    financePaybackPeriod: "3. Amortisationsdauer",
+    financePaybackPeriodDesc: "<strong>Einfaches Verständnis:</strong> Amortisationsdauer ist \"Wie lange dauert es, das Kapital zurückzuerhalten?\" Es sagt Ihnen, wie viele Jahre benötigt werden, um die Anfangsinvestition zurückzuerhalten.",
+    financeStaticPayback: "Statische Amortisationsdauer:",
+    financeStaticPaybackFormula: "Das Jahr, in dem der kumulative Cashflow erstmals positiv wird",
+    financeDynamicPayback: "Dynamische Amortisationsdauer:",
+    financeDynamicPaybackFormula: "Das Jahr, in dem der kumulative diskontierte Cashflow erstmals positiv wird",
+    financePaybackDiagram: "Amortisationsdiagramm:",
+    financePaybackYear0: "Jahr 0",
+    financePaybackInvestment: "Investition -10 Millionen",
+    financePaybackYears17: "Jahre 1-7",
+    financePaybackRecovering: "Kapital zurückerhalten",
+    financePaybackYear8: "Jahr 8",
+    financePaybackCompleted: "✅ Vollständig zurückerhalten",
+    financePaybackResult: "Amortisationsdauer = 8 Jahre",
+    financePaybackIdeal: "Je kürzer die Amortisationsdauer, desto besser, normalerweise < 10 Jahre",
+    financeStaticPaybackNote: "Statische Amortisationsdauer: Berücksichtigt nicht den Zeitwert des Geldes (einfach aber nicht genau genug)",
+    financeDynamicPaybackNote: "Dynamische Amortisationsdauer: Berücksichtigt den Zeitwert des Geldes (genauer, normalerweise länger als statische Amortisationsdauer)",
+    financeTotalPayback: "Gesamteinvestitionsamortisationsdauer: Berücksichtigt alle Gelder (Eigenkapital + Darlehen)",
+    financeEquityPayback: "Eigenkapitalamortisationsdauer: Berücksichtigt nur eigene Gelder (normalerweise kürzer)",
+    financeROI: "4. ROI - Return on Investment",
+    financeROIDesc: "<strong>Einfaches Verständnis:</strong> ROI ist \"Wie viel Geld kann pro Jahr im Durchschnitt als Prozentsatz der Investition verdient werden?\"",
+    financeROIFormula: "ROI = (Durchschnittlicher jährlicher Nettogewinn / Gesamteinvestition) × 100%",
+    financeROIBasic: "ROI > 5%: Projekt hat grundlegende Rentabilität",
+    financeROIGood: "ROI > 8%: Projekt hat gute Rentabilität",
+    financeROIPoor: "ROI < 5%: Projekt hat schwache Rentabilität",
+    financeROILimit: "ROI ist ein einfacher und intuitiver Indikator, berücksichtigt aber nicht den Zeitwert des Geldes",
+    financeROE: "5. ROE - Return on Equity",
+    financeROEDesc: "<strong>Einfaches Verständnis:</strong> ROE ist \"Wie viel Geld können Aktionäre pro Jahr als Prozentsatz ihrer Investition zurückerhalten?\"",
+    financeROEFormula: "ROE = (Nettogewinn / Eigenkapital) × 100%",
+    financeROECalculation: "Normalerweise berechnen Sie ROE für das 3. Jahr, da das Projekt stabil betrieben wird",
+    financeROEExcellent: "ROE > 15%: Excellent Aktionärsrendite",
+    financeROELeverage: "ROE berücksichtigt die Auswirkung der finanziellen Hebelwirkung (Darlehen) und spiegelt die tatsächliche Aktionärsrendite besser wider als ROI",
+    financeDSCR: "6. DSCR - Debt Service Coverage Ratio",
+    financeDSCRDesc: "<strong>Einfaches Verständnis:</strong> DSCR ist \"Reicht das pro Jahr verdiente Geld aus, um das Darlehen zurückzuzahlen?\" Wenn DSCR=1,5 bedeutet das, dass das verdiente Geld das Darlehensrückzahlungsbetrag um das 1,5-fache übersteigt, was sehr sicher ist.",
+    financeDSCRFormula: "DSCR = EBITDA / Darlehens-Haupt- und Zinsrückzahlung",
+    financeDSCRCalculation: "Normalerweise berechnen Sie den Durchschnitt während des Betriebszeitraums",
+    financeDSCRDiagram: "DSCR-Diagramm:",
+    financeDebtService: "Haupt- und Zinsrückzahlung",
+    financeDSCRGood: "DSCR > 1,2: Ausreichende Schuldendienstfähigkeit, normalerweise von Banken gefordert",
+    financeDSCRBorderline: "DSCR = 1,0: Genau genug, um das Darlehen zurückzuzahlen, hohes Risiko",
+    financeDSCRBad: "DSCR < 1,0: Nicht genug, um das Darlehen zurückzuzahlen, Projekt hat Risiko",
+    financeDSCRBank: "DSCR ist ein wichtiger Indikator für Banken zur Bewertung des Darlehensrisikos eines Projekts",
+    financeImportantConcepts: "III. Wichtige Finanzkonzepte",
+    financeCapexVsOpex: "1. CAPEX vs OPEX",
+    financeCapex: "CAPEX (Kapitalaufwand)",
+    financeCapexPoint1: "Einmalige große Investition",
+    financeCapexPoint2: "Wie: Gerätekauf, Baukosten",
+    financeCapexPoint3: "Durch jährliche Abschreibung in Kosten eingeschlossen",
+    financeCapexPoint4: "Beeinflusst die Bilanz",
+    financeOpex: "OPEX (Betriebsaufwand)",
+    financeOpexPoint1: "Jährliche Betriebskosten",
+    financeOpexPoint2: "Wie: Arbeit, Versicherung, Wartung",
+    financeOpexPoint3: "Direkt in die Kosten des laufenden Jahres eingeschlossen",
+    financeOpexPoint4: "Beeinflusst die Erfolgsrechnung",
+    financeDepreciationDesc: "<strong>Einfaches Verständnis:</strong> Geräte altern und ihr Wert nimmt ab. Abschreibung dient dazu, Gerätekosten über ihre Nutzungsdauer zu verteilen und jedes Jahr einen Teil ihres Werts \"aufzubrauchen\".",
+    financeStraightLineDepreciation: "Lineare Abschreibungsformel:",
+    financeDepreciationFormula: "Jährliche Abschreibung = (Ursprünglicher Vermögenswert - Restwert) / Abschreibungsjahre",
+    financeDepreciationKeyPoint: "Abschreibung ist keine Cash-Ausgabe, reduziert aber den Gewinn. Es verteilt einmalige Investitionen (CAPEX) über mehrere Jahre, wodurch die Erfolgsrechnung vernünftiger wird.",
+    financeDiscounting: "3. Diskontierung",
+    financeDiscountingDesc: "<strong>Einfaches Verständnis:</strong> 100 Yuan heute sind mehr wert als 100 Yuan nächstes Jahr (weil Sie sie auf dem Bankkonto hinterlegen und Zinsen verdienen können). Diskontierung dient dazu, zukünftiges Geld in heutigen Wert umzuwandeln.",
+    financeDiscountFormula: "Diskontierungsformel:",
+    financePresentValueFormula: "Barwert = Zukunftswert / (1 + Diskontsatz)^Jahre",
+    financeDiscountRateNote: "Diskontsatz normalerweise 8% (Marktreferenzzinssatz)",
+    financeDiscountingExample: "Diskontierungsbeispiel:",
+    financeFutureValue: "1 Million in 10 Jahren",
+    financePresentValueExample: "463.000 heute",
+    financeDiscountRateCalculation: "(Berechnet mit 8% Diskontsatz)",
+    financeHowToInterpretMetrics: "IV. Wie man Finanzindikatoren interpretiert",
+    financeComprehensiveAssessment: "📊 Umfassende Projektbewertung:",
+    financeProfitability: "<strong>Rentabilität:</strong> Schauen Sie sich IRR, NPV, ROI, ROE an - je höher, desto besser",
+    financePaybackSpeed: "<strong>Rückzahlungsgeschwindigkeit:</strong> Schauen Sie sich die Amortisationsdauer an - je kürzer, desto besser (normalerweise < 10 Jahre)",
+    financeDebtServiceAbility: "<strong>Schuldendienstfähigkeit:</strong> Schauen Sie sich DSCR an - muss > 1,2 sein (Bankenanforderung)",
+    financeCashFlow: "<strong>Cashflow:</strong> Schauen Sie sich den Cashflow-Abschluß an - stellen Sie sicher, dass jedes Jahr positiver Cashflow vorhanden ist",
+    financeRiskControl: "<strong>Risikokontrolle:</strong> Verwenden Sie Sensitivitätsanalyse, um zu sehen, welche Parameteränderungen den größten Einfluss haben",
+    
+    // Tipps-Bereich
+    tipsTitle: "💡 Tipps",
+    tipsParameterSetting: "1. Parameter-Einstellungstipps",
+    tipsUseDefaults: "<strong>Standardwerte verwenden</strong>: Das System hat vorangefertigte deutsche Marktstandardparameter, die direkt verwendet werden können",
+    tipsBatterySelection: "<strong>Batteriemodellauswahl</strong>: Nach der Auswahl eines Batteriemodells werden Preis und Abbauparameter automatisch ausgefüllt, keine manuelle Eingabe erforderlich",
+    tipsParameterHints: "<strong>Parameterhinweise</strong>: Jede Eingabebox hat Hinweisinformationen, die den marktreferenziellen Bereich zeigen",
+    tipsFinancialAnalysis: "2. Finanzanalysetipps",
+    tipsKeyMetrics: "<strong>Fokus auf Schlüsselindikatoren</strong>: IRR, NPV, Amortisationsdauer, DSCR, ROI usw.",
+    tipsCompareScenarios: "<strong>Vergleichen Sie verschiedene Szenarien</strong>: Verwenden Sie Speicher/Import-Funktionen, um die Finanzleistung verschiedener Parameterkonfigurationen zu vergleichen",
+    tipsSensitivityAnalysis: "<strong>Sensitivitätsanalyse</strong>: Identifizieren Sie, welche Parameter den größten Einfluss auf die Projektprofitabilität haben",
+    tipsCommonQuestions: "3. Häufig gestellte Fragen",
+    tipsQuestionCapex: "<strong>F: Warum wurde die CAPEX-Detailtabelle nicht aktualisiert?</strong><br>                            A: Das System wird 500 Millisekunden nach Parameteränderungen automatisch aktualisiert, bitte warten Sie einen Moment. Wenn es immer noch nicht aktualisiert wurde, können Sie manuell auf die Schaltfläche \"Berechnen\" klicken.",
+    tipsQuestionReset: "<strong>F: Wie setze ich alle Parameter zurück?</strong><br>                            A: Aktualisieren Sie die Seite, um die Standardparameter wiederherzustellen, oder importieren Sie eine zuvor gespeicherte Modellätdatei.",
+    tipsQuestionDegradation: "<strong>F: Wie stelle ich Batterieabbauparameter ein?</strong><br>                            A: Nach der Auswahl eines Batteriemodells füllt das System automatisch die Standardabbauparameter für dieses Modell aus. Sie können sie auch manuell basierend auf den tatsächlichen Bedingungen anpassen.",
+    tipsQuestionExport: "<strong>F: Wie exportiere ich einen vollständigen Finanzbericht?</strong><br>                            A: Klicken Sie auf die Schaltfläche \"Exportieren\", und das System generiert einen PDF-Bericht mit allen Finanzdaten.",
+    tipsBestPractices: "4. Beste Praktiken",
+    tipsBestPractice1: "Verwenden Sie zunächst Standardparameter für eine vorläufige Berechnung, um die grundlegende Finanzleistung des Projekts zu verstehen",
+    tipsBestPractice2: "Passen Sie Schlüsselparameter schrittweise basierend auf den tatsächlichen Projektbedingungen an",
+    tipsBestPractice3: "Verwenden Sie Sensitivitätsanalyse, um Projektrisikopunkte zu identifizieren",
+    tipsBestPractice4: "Speichern Sie mehrere Szenarien für einfachen Vergleich und Entscheidungsfindung",
+    tipsBestPractice5: "Aktualisieren Sie regelmäßig Marktparameter (wie Strompreise, Gerätepreise usw.)",
+    tipsNotes: "5. Hinweise",
+    tipsNote1: "Finanzmodelle dienen nur als Referenz, tatsächliche Entscheidungen müssen Marktforschung und Expertinnenmeinungen kombinieren",
+    tipsNote2: "Deutsche Marktparameter ändern sich im Laufe der Zeit, regelmäßige Updates werden empfohlen",
+    tipsNote3: "Politiken, Strompreise usw. können je nach Region variieren, müssen basierend auf den tatsächlichen Bedingungen angepasst werden",
+    tipsNote4: "Batteryabbauparameter basieren auf Branchendurchschnitten, tatsächliche Degradation kann aufgrund der Nutzungbedingungen variieren",
+    
+    // Fußzeilenbereich
+    modalCloseButton: "Schließen"
+};
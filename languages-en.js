@@ -0,0 +1,798 @@
+// 语言文件 - 英文翻译（切换到该语言时由 lang-loader.js 按需加载）
+window.languages = window.languages || {};
+window.languages.en = {
+    // 导航栏
+    brandText: "German Independent Energy Storage Power Plant Investment Calculation System",
+    navParameters: "Boundary Settings",
+    navOpex: "OPEX Settings",
+    navRevenue: "Revenue Forecast",
+    navIndicators: "Financial Indicators",
+    navStatements: "Financial Statements",
+    navSensitivity: "Sensitivity Analysis",
+    navBankReport: "Financing Report",
+    btnHelp: "Help",
+    btnImport: "Import",
+    btnSave: "Save",
+    btnExport: "Export",
+    btnExcel: "Excel",
+    btnCalculate: "Calculate",
+    btnLogout: "Logout",
+    
+    // 融资参数
+    labelLoanYears: "Loan Term",
+    hintLoanYears: "Common loan term for energy storage projects in German banks",
+    labelLoanRate: "Loan Interest Rate",
+    hintLoanRate: "2025 European market benchmark interest rate level",
+    labelGracePeriod: "Grace Period",
+    labelRepaymentMethod: "Repayment Method",
+    optionEqualPrincipal: "Equal Principal",
+    optionEqualPayment: "Equal Payment",
+    hintEquityRatio: "Typical equity ratio for German project financing: 25-30%",
+    
+    // 建设期与通胀参数
+    cardConstruction: "Construction Period & Inflation Parameters",
+    labelConstructionPeriod: "Construction Period",
+    hintConstructionPeriod: "Time from project start to commissioning",
+    labelConstructionFundUsage: "Construction Fund Usage Ratio",
+    hintConstructionFundUsage: "Average fund usage ratio during construction period (for calculating construction period interest)",
+    labelInflationRate: "Inflation Rate",
+    hintInflationRate: "Used for OPEX annual growth calculation (German inflation rate around 2% in 2025)",
+    
+    // 折旧参数
+    cardDepreciation: "Depreciation & Amortization Parameters",
+    labelDepreciationYears: "Fixed Asset Depreciation Years",
+    labelSalvageRate: "Salvage Value Rate",
+    labelDepreciationMethod: "Depreciation Method",
+    optionStraightLine: "Straight Line Method",
+    optionDoubleDeclining: "Double Declining Balance Method",
+    optionSumOfYears: "Sum of Years' Digits Method",
+    labelAmortizationYears: "Intangible Asset Amortization Years",
+    
+    // 效率参数
+    cardEfficiency: "Efficiency Parameters",
+    labelChargeEfficiency: "Charge Efficiency",
+    labelDischargeEfficiency: "Discharge Efficiency",
+    labelRTE: "System Round-Trip Efficiency (RTE)",
+    
+    // 税费参数
+    cardTaxes: "Tax Parameters",
+    labelCorporateTaxRate: "Corporate Income Tax Rate (Körperschaftsteuer)",
+    hintCorporateTaxRate: "German statutory corporate income tax rate",
+    labelSolidarityTaxRate: "Solidarity Surcharge (Solidaritätszuschlag)",
+    hintSolidarityTaxRate: "Calculated at 5.5% of corporate income tax amount",
+    labelTradeTaxRate: "Trade Tax Rate (Gewerbesteuer)",
+    hintTradeTaxRate: "Different municipal tax rates across Germany (7-17%)",
+    labelVATRate: "VAT Rate (MwSt/VAT)",
+    hintVATRate: "German standard VAT rate",
+    labelOtherTaxRate: "Other Taxes",
+    labelTaxMethod: "Income Tax Method",
+    optionTaxGerman: "German tax law (loss carryforward)",
+    optionTaxFlat: "Blended rate",
+    hintTaxMethod: "German tax law: separate corporate and trade tax bases, loss carryforward, interest barrier",
+    labelLossOffsetThreshold: "Full Loss Offset Limit (§10d EStG)",
+    labelMinTaxationRatio: "Offset Ratio Above Limit",
+    hintMinTaxationRatio: "Minimum taxation (Mindestbesteuerung)",
+    labelInterestBarrierRatio: "Interest Barrier Ratio (Zinsschranke)",
+    labelInterestBarrierThreshold: "Interest Barrier Exemption Threshold",
+    labelTradeTaxAddbackRatio: "Trade Tax Interest Add-back Ratio",
+    labelTradeTaxAddbackAllowance: "Trade Tax Add-back Allowance",
+    
+    // Tolling参数
+    cardTolling: "Tolling Operation Parameters",
+    labelTollingYears: "Tolling Contract Years",
+    hintTollingYears: "Typical term for energy storage tolling contracts in Germany",
+    labelTollingRatio: "Tolling Capacity Ratio",
+    hintTollingRatio: "Banks typically require 70-90%",
+    labelTollingPrice: "Tolling Price (First Year)",
+    hintTollingPrice: "German market price 70-90€/kW in 2025",
+    labelTollingEscalation: "Tolling Price Annual Growth Rate",
+    hintTollingEscalation: "Inflation adjustment factor",
+    
+    // 设备配置
+    sectionEquipment: "🔌 Equipment Configuration",
+    descEquipment: "Configure main equipment parameters for the energy storage system",
+    
+    // 电池系统
+    cardBatterySystem: "Battery System",
+    labelBatteryModel: "Battery Cabinet Model",
+    hintBatteryModel: "2025 German market mainstream suppliers",
+    labelBatteryCapacity: "Single Cabinet Capacity",
+    labelBatteryCount: "Battery Cabinet Count",
+    btnAutoCalc: "🔄Auto",
+    labelBatteryPrice: "Battery System Unit Price",
+    hintBatteryPrice: "2025 German market average 80-95€/kWh",
+    
+    // 电池型号选项
+    labelCATL: "CATL (European Mainstream)",
+    optionCATLEnerOnePlus: "CATL EnerOne Plus 5MWh (314Ah) ★Recommended",
+    optionCATLEnerCPlus: "CATL EnerC Plus 6.25MWh (314Ah)",
+    optionCATLEnerD: "CATL EnerD 5MWh (530Ah)",
+    optionCATLTENER: "CATL TENER 6.25MWh (LFP)",
+    labelBYD: "BYD (High Recognition in Europe)",
+    optionBYD_MC_Cube: "BYD MC Cube 2.8MWh (280Ah)",
+    optionBYD_Cube_Pro: "BYD Cube Pro 3.7MWh (302Ah)",
+    optionBYD_BatteryBox: "BYD Battery-Box Premium 1.34MWh",
+    labelEVE: "EVE Energy",
+    optionEVE_LF560K: "EVE LF560K 5MWh (560Ah)",
+    optionEVE_LF280K: "EVE LF280K 3.35MWh (280Ah)",
+    optionEVE_LF314K: "EVE LF314K 3.76MWh (314Ah)",
+    labelREPT: "REPT",
+    optionREPT_320Ah: "REPT 320Ah 3.84MWh",
+    optionREPT_345Ah: "REPT 345Ah 4.14MWh",
+    labelHiTHIUM: "HiTHIUM",
+    optionHiTHIUM_314Ah: "HiTHIUM 314Ah 3.76MWh",
+    optionHiTHIUM_560Ah: "HiTHIUM 560Ah 5.02MWh",
+    labelGotion: "Gotion",
+    optionGotion_280Ah: "Gotion 280Ah 3.35MWh",
+    optionGotion_314Ah: "Gotion 314Ah 3.76MWh",
+    labelSamsung: "Samsung SDI (Korean)",
+    optionSamsung_E3: "Samsung SDI E3 3.92MWh",
+    labelLGES: "LG Energy Solution (Korean)",
+    optionLGES_RESU: "LG RESU Prime 3.5MWh",
+    labelOtherBattery: "Other",
+    optionCustomBattery: "Custom",
+    
+    // 电池容量选项
+    labelMainstreamCapacities: "Mainstream Capacity Specifications",
+    optionCapacity1_34: "1.34 MWh",
+    optionCapacity2_5: "2.5 MWh",
+    optionCapacity2_8: "2.8 MWh",
+    optionCapacity3_35: "3.35 MWh",
+    optionCapacity3_5: "3.5 MWh",
+    optionCapacity3_7: "3.7 MWh",
+    optionCapacity3_76: "3.76 MWh",
+    optionCapacity3_84: "3.84 MWh",
+    optionCapacity3_92: "3.92 MWh",
+    optionCapacity4_14: "4.14 MWh",
+    optionCapacity5_0: "5.0 MWh ★Mainstream",
+    optionCapacity5_02: "5.02 MWh",
+    optionCapacity6_25: "6.25 MWh",
+    labelOtherCapacities: "Other",
+    optionCustomCapacity: "Manual Input",
+    
+    // 边界设定界面
+    sectionParameters: "📊 Project Boundary Conditions",
+    descParameters: "Set basic parameters and equipment configuration for the energy storage power plant",
+    cardBasicParams: "Basic Power Plant Parameters",
+    labelPower: "Installed Power Capacity",
+    hintPower: "Typical scale for large energy storage projects in Germany",
+    labelCapacity: "Energy Storage Capacity",
+    hintCapacity: "2-hour storage configuration",
+    labelDuration: "Storage Duration",
+    labelOperationYears: "Operation Years",
+    hintOperationYears: "Industry standard operation cycle",
+    labelInitialCapacity: "Initial Battery Available Capacity",
+    
+    cardDegradation: "Capacity Degradation Settings",
+    labelDegradationMode: "Degradation Mode",
+    optionLinear: "Linear Degradation (Fixed Annual Rate)",
+    optionNonlinear: "Nonlinear Degradation (Fast at First, Slow Later)",
+    optionCycleBased: "Cycle-Based Degradation",
+    hintDegradationMode: "Select degradation mode based on battery characteristics",
+    labelDegradationRate: "Annual Battery Capacity Degradation Rate",
+    hintDegradationRate: "Linear degradation mode: fixed annual degradation rate",
+    labelFirstYearDegradation: "First Year Degradation Rate",
+    hintFirstYearDegradation: "Nonlinear degradation: first year degradation rate (usually higher)",
+    labelAnnualDecrease: "Annual Decrease in Degradation Rate",
+    hintAnnualDecrease: "Nonlinear degradation: annual decrease in degradation rate",
+    labelCyclesPerDegradation: "Degradation Rate per 1000 Cycles",
+    hintCyclesPerDegradation: "Cycle-based degradation: capacity loss per 1000 cycles",
+    labelAnnualCycles: "Annual Operation Cycles",
+    hintAnnualCycles: "Used for cycle-based degradation mode calculation",
+    labelCapacityThreshold: "Capacity Retention Threshold",
+    hintCapacityThreshold: "Battery replacement recommended below this threshold",
+    
+    cardFinancing: "Financing Parameters",
+    labelEquityRatio: "Equity Ratio",
+    
+    // Equipment Configuration Submodule
+    pcsSystem: "PCS System",
+    pcsModel: "PCS Model",
+    pcsHint: "2025 German market mainstream PCS suppliers",
+    pcsPower: "Single PCS Power",
+    pcsCount: "PCS Count",
+    pcsPrice: "PCS Unit Price",
+    pcsPriceHint: "2025 German market average 25-35€/kW",
+    optgroupMainstreamPower: "Mainstream Power Specifications",
+    optgroupOtherPower: "Other",
+    optionCustomPower: "Manual Input",
+    
+    mvTransformer: "Medium Voltage Transformer",
+    mvTransformerModel: "MV Transformer Model",
+    mvTransformerHint: "20kV voltage level commonly used in Germany",
+    voltageLevel: "Voltage Level",
+    transformerCapacity: "Transformer Capacity",
+    transformerCount: "Transformer Count",
+    transformerPrice: "MV Transformer Unit Price",
+    transformerPriceHint: "German market dry-type transformer price",
+    optgroupDryTransformer: "Dry-type Transformer (Indoor/Container) - German Common",
+    optgroupOilTransformer: "Oil-immersed Transformer (Outdoor)",
+    optgroupEuropeanTransformer: "European Brands (German Local Certification)",
+    optgroupChineseTransformer: "Chinese Brands",
+    optgroupOtherTransformer: "Other",
+    optgroupMainstreamCapacity: "Mainstream Capacity Specifications",
+    optgroupOtherCapacity: "Other",
+    optionCustomCapacity: "Manual Input",
+    
+    hvTransformer: "Step-up Transformer",
+    hvTransformerModel: "Step-up Transformer Model",
+    hvTransformerHint: "100MW projects in Germany usually connect to 110kV grid",
+    hvTransformerCapacity: "Step-up Transformer Capacity",
+    hvTransformerCount: "Step-up Transformer Count",
+    hvTransformerPrice: "Step-up Transformer Unit Price",
+    hvTransformerPriceHint: "110kV/120MVA German market price",
+    optgroupHV110kV: "110kV Level (German Common)",
+    optgroupHV220kV: "220kV Level (Large Projects)",
+    optgroupHV380kV: "380kV Level (German High Voltage Grid)",
+    optgroupEuropeanHVManufacturer: "European Manufacturers (Local Certification)",
+    optgroupOtherHVManufacturer: "Other Manufacturers",
+    optgroupOtherHV: "Other",
+    optgroupHVCapacity110kV: "110kV Level",
+    optgroupHVCapacity220kV: "220kV Level",
+    optgroupHVCapacity380kV: "380kV Level",
+    optgroupHVCapacityOther: "Other",
+    optionCustomHVCapacity: "Manual Input",
+    
+    controlEquipment: "Control & Auxiliary Equipment",
+    emsSystem: "EMS Energy Management System",
+    emsHint: "100MW project EMS system cost",
+    scadaSystem: "SCADA Monitoring System",
+    scadaHint: "Including remote monitoring and data collection",
+    switchgear: "Switchgear (Medium Voltage)",
+    switchgearHint: "20kV medium voltage switchgear",
+    switchgearCount: "Switchgear Count",
+    switchgearCountHint: "Determined by PCS count and configuration",
+    collectorLine: "Collector Line",
+    collectorLineHint: "Medium voltage cables and accessories",
+    thermalSystem: "Thermal Management System",
+    thermalSystemHint: "Liquid cooling/air conditioning system (German climate)",
+    fireSystem: "Fire Protection System",
+    fireSystemHint: "Gas extinguishing + monitoring system",
+    
+    gridConnection: "Grid Connection",
+    substation: "Substation Construction/Expansion",
+    substationHint: "110kV substation bay expansion cost",
+    gridLine: "Connection Line",
+    gridLineHint: "110kV overhead/cable line",
+    gridStudy: "Grid Connection Application & Study Fee",
+    gridStudyHint: "Netzverträglichkeitsprüfung",
+    metering: "Metering & Protection Equipment",
+    meteringHint: "Compliant with German grid code requirements",
+    
+    // Infrastructure & OPEX & Revenue Forecast Module
+    landInfrastructure: "Land & Infrastructure",
+    landAcquisition: "Land Acquisition Cost",
+    landAcquisitionHint: "German industrial land purchase or long-term lease",
+    concreteFoundation: "Concrete Foundation",
+    concreteFoundationHint: "Equipment foundation and cable trenches",
+    fenceSecurity: "Fencing & Security",
+    fenceSecurityHint: "Including monitoring and access control system",
+    roadConstruction: "Road Construction",
+    roadConstructionHint: "Site roads and entrances/exits",
+    drainageSystem: "Drainage System",
+    drainageSystemHint: "Rainwater collection and drainage system",
+    
+    installationConstruction: "Installation & Construction Management",
+    mechanicalInstallation: "Mechanical & Electrical Installation",
+    mechanicalInstallationHint: "German local installation labor costs are high",
+    constructionManagement: "Construction Management Fee",
+    constructionManagementHint: "On-site supervision and coordination",
+    commissioningCost: "Commissioning Cost",
+    commissioningCostHint: "Including grid connection testing and performance acceptance",
+    
+    constructionInsurance: "Construction Period Insurance",
+    carInsurance: "Construction All Risks (CAR)",
+    carInsuranceHint: "Bauleistungsversicherung",
+    earInsurance: "Erection All Risks (EAR)",
+    earInsuranceHint: "Montageversicherung",
+    cargoInsurance: "Cargo Transportation Insurance",
+    cargoInsuranceHint: "Transportversicherung",
+    liabilityInsurance: "Third Party Liability Insurance",
+    liabilityInsuranceHint: "Haftpflichtversicherung",
+    
+    developmentOwnerCosts: "Development & Owner Costs",
+    spvAcquisition: "SPV Company Acquisition Cost",
+    spvAcquisitionHint: "Special purpose vehicle acquisition and related costs",
+    permitPlanning: "Permit & Planning Fees",
+    permitPlanningHint: "BImSchG permit application fees",
+    environmentalConsulting: "Environmental Consulting Fees",
+    environmentalConsultingHint: "Environmental impact assessment (UVP)",
+    projectManagement: "Project Management Fee",
+    projectManagementHint: "Owner's engineering management team",
+    legalConsulting: "Legal Consulting Fees",
+    legalConsultingHint: "Contract, permit, financing legal services",
+    engineeringDesign: "Engineering Design Fee",
+    engineeringDesignHint: "Detailed engineering design (FEED)",
+    contingency: "Contingency",
+    contingencyHint: "Banks usually require 5-10%",
+    
+    decommissioningReserve: "Decommissioning Reserve (Annual Amortization)",
+    decommissioningTotal: "Total Decommissioning Reserve",
+    decommissioningTotalHint: "Amortized annually over operating years into OPEX",
+    
+    capexDetails: "CAPEX Details",
+    capexItem: "Item",
+    capexUnitPrice: "Unit Price",
+    capexQuantity: "Quantity/Capacity",
+    capexAmount: "Amount (10,000 EUR)",
+    capexTotal: "Total Investment (Static)",
+    
+    opexSectionTitle: "📋 Operating Cost Settings (OPEX)",
+    opexSectionDesc: "Set annual operating expenses",
+    opexBaseSettings: "Operating Expense Base Settings",
+    opexCategory: "Expense Category",
+    opexBasis: "Billing Basis",
+    opexFirstYearRate: "First Year Rate/Amount",
+    opexAnnualGrowth: "Annual Growth Rate (%)",
+    opexDescription: "Description",
+    opexTechnical: "Technical & Maintenance (Technical O&M)",
+    opexTechnicalDesc: "Equipment monitoring and on-site maintenance (Germany 5-8€/kW/year)",
+    opexInsurance: "Insurance Costs (Insurance)",
+    opexInsuranceDesc: "Comprehensive asset insurance (Sachversicherung 0.35-0.5%)",
+    opexGrid: "Grid Operating Fees (Grid Fees)",
+    opexGridDesc: "Netzentgelte annual transmission and distribution fees (10-15k€/MW)",
+    opexLand: "Land Lease (Land Lease)",
+    opexLandDesc: "Pachtgebühren annual rent (depends on region)",
+    opexCommercial: "Commercial & Management (Commercial O&M)",
+    opexCommercialDesc: "Financial settlement, taxation and contract management (3-5k€/MW)",
+    opexOther: "Other Operating Expenses",
+    opexOtherDesc: "Spare parts, miscellaneous expenses, etc. (1-2k€/MW)",
+    opexYearlyDetails: "OPEX Annual Details",
+    year: "Year",
+    opexYearlyTechnical: "Technical Maintenance",
+    opexYearlyInsurance: "Insurance Fees",
+    opexYearlyGrid: "Grid Fees",
+    opexYearlyLand: "Land Lease",
+    opexYearlyCommercial: "Commercial Management",
+    opexYearlyOther: "Other",
+    opexYearlyDecommissioning: "Decommissioning Reserve",
+    opexYearlyTotal: "Total",
+    
+    revenueSectionTitle: "💵 Revenue Forecast",
+    revenueSectionDesc: "Set Tolling revenue and spot market trading revenue forecast",
+    spotRevenueForecast: "Spot Market Revenue Forecast (Non-Tolling Part)",
+    spotRevenueHint: "Remaining electricity participates in spot market trading, please enter the expected revenue per MW per year",
+    spotPriceUnit: "Spot Revenue Unit Price\n(EUR/MW/year)",
+    quickFillBasePrice: "Quick Fill: First Year Price",
+    annualGrowthRate: "Annual Growth Rate (%)",
+    applyButton: "Apply",
+    spotRevenueExpected: "German spot market arbitrage revenue: 30-45k€/MW/year (2025 forecast)",
+    revenueYearlyDetails: "Revenue Annual Details",
+    availableCapacity: "Available Capacity (%)",
+    tollingRevenue: "Tolling Revenue\n(10,000 EUR)",
+    spotRevenue: "Spot Revenue\n(10,000 EUR)",
+    totalRevenue: "Total Revenue\n(10,000 EUR)",
+    
+    // Financial Core Module
+    indicatorsSectionTitle: "📊 Core Financial Indicators",
+    indicatorsSectionDesc: "Key indicators for investment return and risk assessment",
+    indStaticInvestment: "Total Investment (Static)",
+    indDynamicInvestment: "Total Investment (Dynamic)",
+    indTotalRevenue: "Cumulative Total Sales Revenue",
+    indAvgRevenue: "Average Annual Sales Revenue",
+    indFirst3Revenue: "First Three Years Total Sales Revenue",
+    indTotalProfit: "Cumulative Total Profit",
+    indAvgProfit: "Average Annual Profit",
+    indFirst3Profit: "First Three Years Total Profit",
+    indTotalNetProfit: "Cumulative Net Profit",
+    indAvgNetProfit: "Average Annual Net Profit",
+    indFirst3NetProfit: "First Three Years Net Profit",
+    indProjectIRR: "Project IRR (After Tax)",
+    indEquityIRR: "Equity IRR (After Tax)",
+    indStaticPayback: "Static Payback Period",
+    indEquityPayback: "Equity Payback Period (Static)",
+    indDynamicPayback: "Dynamic Payback Period (-8%)",
+    indEquityDynamicPayback: "Equity Payback Period (Dynamic-8%)",
+    indROEYear3: "Year 3 Return on Equity (ROE)",
+    indROI: "Return on Investment (ROI)",
+    indEBITDAReturn: "EBITDA Return",
+    indLCOE: "LCOE (Levelized Cost of Energy)",
+    indDSCR: "Debt Service Coverage Ratio (DSCR)",
+    
+    statementsSectionTitle: "📑 Financial Statements",
+    statementsSectionDesc: "Income Statement, Balance Sheet, Cash Flow Statement",
+    statementIncome: "Income Statement",
+    statementBalance: "Balance Sheet",
+    statementCashflow: "Cash Flow Statement",
+    statementLoan: "Loan Repayment Schedule",
+    statementItem: "Item",
+    loanYear: "Year",
+    loanOpeningBalance: "Opening Balance",
+    loanInterest: "Current Period Interest",
+    loanPrincipal: "Current Period Principal",
+    loanPayment: "Current Period Payment",
+    loanClosingBalance: "Closing Balance",
+    
+    sensitivitySectionTitle: "🔍 Sensitivity Analysis",
+    sensitivitySectionDesc: "Analyze the impact of key parameter changes on investment returns",
+    sensitivityParams: "Analysis Parameter Settings",
+    sensitivityVar1: "Analysis Variable 1",
+    sensitivityVar2: "Analysis Variable 2 (Optional)",
+    sensitivityTarget: "Analysis Target Indicator",
+    sensitivityCapex: "Investment Cost (CAPEX)",
+    sensitivityTolling: "Tolling Price",
+    sensitivitySpot: "Spot Price",
+    sensitivityOpex: "Operating Cost (OPEX)",
+    sensitivityLoanRate: "Loan Interest Rate",
+    sensitivityDegradation: "Battery Degradation Rate",
+    sensitivityRange: "Change Range",
+    sensitivityTo: "to",
+    sensitivityStep: "Step Size",
+    sensitivityRun: "Run Analysis",
+    sensitivityResults: "Analysis Results",
+    sensitivityResultHint: "Please select analysis parameters and click \"Run Analysis\"",
+    sensitivityMatrix: "Two-Variable Sensitivity Matrix",
+    
+    reportTitle: "Project Financing Feasibility Analysis Report",
+    reportSubtitle: "Battery Energy Storage System (BESS) Project Financing Report",
+    reportDate: "Report Date",
+    reportVersion: "Report Version",
+    reportVersionValue: "V1.0",
+    
+    // 融资报告完整模块
+    reportSummaryTitle: "I. Project Summary (Executive Summary)",
+    projectBasicInfo: "Basic Project Information",
+    projectName: "Project Name",
+    projectLocation: "Project Location",
+    installedCapacity: "Installed Capacity",
+    storageDuration: "Storage Duration",
+    operationYears: "Operation Period",
+    projectCompany: "Project Company",
+    investmentStructure: "Investment & Financing Structure",
+    totalInvestment: "Total Project Investment",
+    equity: "Equity Capital",
+    bankLoan: "Bank Loan",
+    equityRatio: "Equity Ratio",
+    loanTerm: "Loan Term",
+    loanRate: "Loan Interest Rate",
+    coreInvestmentIndicators: "Core Investment Indicators",
+    projectIRR: "Project IRR (After Tax)",
+    equityIRR: "Equity IRR (After Tax)",
+    staticPayback: "Static Payback Period",
+    dynamicPayback: "Dynamic Payback Period (8%)",
+    avgDSCR: "Average DSCR",
+    lcoe: "LCOE (Levelized Cost of Energy)",
+    minDSCR: "Minimum DSCR",
+    
+    revenueAnalysisTitle: "II. Revenue Structure Analysis (Revenue Analysis)",
+    revenueSourceComposition: "Revenue Source Composition",
+    annualRevenueForecast: "Annual Revenue Forecast",
+    revenueStabilityAssessment: "Revenue Stability Assessment",
+    tollingCoverage: "Tolling Contract Coverage",
+    tollingRatio: "Tolling Revenue Ratio",
+    revenueVolatility: "Revenue Volatility Coefficient",
+    
+    debtServiceAnalysisTitle: "III. Debt Service Analysis",
+    annualDSCRTrend: "Annual DSCR Trend",
+    cashFlowCoverageAnalysis: "Cash Flow Coverage Analysis",
+    loanRepaymentSchedule: "Loan Repayment Schedule",
+    year: "Year",
+    openingPrincipalBalance: "Opening Principal Balance<br>(10,000 EUR)",
+    annualInterest: "Annual Interest<br>(10,000 EUR)",
+    annualPrincipal: "Annual Principal Repayment<br>(10,000 EUR)",
+    annualPayment: "Annual Payment<br>(10,000 EUR)",
+    closingPrincipalBalance: "Closing Principal Balance<br>(10,000 EUR)",
+    ebitda: "EBITDA<br>(10,000 EUR)",
+    dscr: "DSCR",
+    
+    profitabilityAnalysisTitle: "IV. Profitability Analysis",
+    annualProfitTrend: "Annual Profit Trend",
+    cumulativeCashFlow: "Cumulative Cash Flow",
+    avgEBITDA: "Average EBITDA<br>(10,000 EUR)",
+    avgNetProfit: "Average Net Profit<br>(10,000 EUR)",
+    ebitdaMargin: "EBITDA Margin<br>(%)",
+    netMargin: "Net Profit Margin<br>(%)",
+    
+    riskAnalysisTitle: "V. Risk Analysis & Stress Test",
+    sensitivityAnalysisTitle: "Key Indicator Sensitivity Analysis",
+    stressTestScenarios: "Stress Test Scenarios",
+    scenario: "Scenario",
+    assumptions: "Assumptions",
+    riskAssessmentMatrix: "Risk Assessment Matrix",
+    marketRisk: "Market Risk: Low",
+    marketRiskNote: "Tolling Contract Locked",
+    technicalRisk: "Technical Risk: Low",
+    technicalRiskNote: "Mature Lithium Battery Technology",
+    operationalRisk: "Operational Risk: Medium",
+    operationalRiskNote: "Battery Degradation Management",
+    policyRisk: "Policy Risk: Low",
+    policyRiskNote: "German Energy Transition Support",
+    
+    financialStructureAnalysisTitle: "VI. Financial Structure Analysis",
+    leverageRatioTrend: "Debt-to-Equity Ratio Trend",
+    roeTrend: "Return on Equity (ROE) Trend",
+    
+    conclusionTitle: "VII. Conclusion & Recommendations",
+    investmentRating: "Investment Rating: <strong id='rpt_rating'>-</strong>",
+    projectStrengths: "Project Strengths:",
+    projectConcerns: "Key Considerations:",
+    financingRecommendations: "Financing Recommendations:",
+    
+    appendixTitle: "Appendix: Detailed Financial Forecast Tables",
+    cashFlowForecast: "Cash Flow Forecast",
+    incomeForecast: "Income Forecast",
+    balanceSheetForecast: "Balance Sheet Forecast",
+    
+    reportFooterZh: "This report is automatically generated by the German Independent Energy Storage Power Plant Investment Calculation System for financing decision reference only.",
+    reportFooterEn: "This report is auto-generated for financing decision reference only.",
+    
+    // Help Modal
+    helpModalTitle: "📖 Help",
+    helpTabQuickstart: "Quick Start",
+    helpTabParameters: "Parameter Settings",
+    helpTabFeatures: "Features",
+    helpTabFinance: "Financial Knowledge",
+    helpTabTips: "Tips",
+    
+    // Quick Start Section
+    quickstartTitle: "🚀 Quick Start",
+    quickstartStep1: "<strong>Login</strong>: Use your username and password to log in",
+    quickstartStep2: "<strong>Set Parameters</strong>: Set project basic parameters in the 'Boundary Settings' tab",
+    quickstartParam1: "Power plant capacity and power",
+    quickstartParam2: "Battery model (price and degradation parameters will be automatically filled after selection)",
+    quickstartParam3: "Equipment configuration and prices",
+    quickstartParam4: "Financing parameters",
+    quickstartStep3: "<strong>Set OPEX</strong>: Set annual operating costs in the 'OPEX Settings' tab",
+    quickstartStep4: "<strong>Set Revenue</strong>: Set revenue sources and prices in the 'Revenue Forecast' tab",
+    quickstartStep5: "<strong>View Results</strong>: Click the 'Calculate' button or wait for automatic calculation after parameter changes to view financial indicators and reports",
+    quickstartTip: "💡 Tip:",
+    quickstartTipContent: "The system supports automatic parameter calculation. Results will be automatically updated 500 milliseconds after parameter changes, no need to manually click the calculate button.",
+    
+    // Parameter Settings Section
+    parametersTitle: "⚙️ Parameter Settings Instructions",
+    parametersBasicParams: "1. Basic Power Plant Parameters",
+    parametersPower: "<strong>Installed Power Capacity</strong>: Rated power of the energy storage system (MW)",
+    parametersCapacity: "<strong>Energy Storage Capacity</strong>: Total capacity of the energy storage system (MWh)",
+    parametersDuration: "<strong>Storage Duration</strong>: Automatically calculated (capacity/power), usually 2-4 hours",
+    parametersOperationYears: "<strong>Operation Years</strong>: Project operation period, usually 15-20 years",
+    parametersInitialCapacity: "<strong>First Year Battery Available Capacity</strong>: Initial available capacity percentage of new batteries",
+    parametersDegradation: "2. Capacity Degradation Settings",
+    parametersDegradationMode: "<strong>Degradation Mode</strong>:",
+    parametersLinearDegradation: "Linear degradation: Fixed annual degradation rate, suitable for most LFP batteries",
+    parametersNonlinearDegradation: "Nonlinear degradation: Fast initial degradation, slow later",
+    parametersCycleBasedDegradation: "Cycle-based degradation: Capacity loss calculated based on cycle count",
+    parametersAutoFill: "<strong>Auto Fill</strong>: After selecting a battery model, the system will automatically fill in the default degradation parameters for that model",
+    parametersBatterySystem: "3. Battery System",
+    parametersBatteryModel: "<strong>Battery Cabinet Model</strong>: Select battery manufacturer and model, the system will automatically fill in price and degradation parameters",
+    parametersBatteryPrice: "<strong>Battery Unit Price</strong>: Price per MWh of battery (10,000 EUR), will be automatically filled based on the selected model",
+    parametersBatteryCount: "<strong>Battery Cabinet Count</strong>: Automatically calculated by the system based on total capacity and single cabinet capacity",
+    parametersFinancing: "4. Financing Parameters",
+    parametersEquityRatio: "<strong>Equity Ratio</strong>: German projects usually 25-30%",
+    parametersLoanTerm: "<strong>Loan Term</strong>: Usually 10-15 years",
+    parametersLoanRate: "<strong>Loan Interest Rate</strong>: European market benchmark rate around 4-5% in 2025",
+    parametersRepaymentMethod: "<strong>Repayment Method</strong>: Equal principal or equal principal and interest",
+    parametersCapex: "5. CAPEX Settings",
+    parametersCapexAuto: "The system will automatically calculate various CAPEX based on equipment configuration",
+    parametersCapexItems: "Including: equipment costs, grid connection, land infrastructure, installation and construction, insurance, development costs, etc.",
+    parametersCapexUpdate: "All parameters modified, CAPEX details will be automatically updated",
+    
+    // Features Section
+    featuresTitle: "✨ Features",
+    featuresAutoCalc: "1. Automatic Calculation",
+    featuresAutoCalc1: "After modifying any parameter, the system will automatically recalculate after 500 milliseconds",
+    featuresAutoCalc2: "No need to manually click the 'Calculate' button",
+    featuresAutoCalc3: "All tables and charts will be automatically updated",
+    featuresFormatting: "2. Data Formatting",
+    featuresFormatting1: "All values use German thousand separator format (1.234.567,89)",
+    featuresFormatting2: "Currency unit: 10,000 EUR",
+    featuresFormatting3: "Automatic percentage formatting",
+    featuresSaveImport: "3. Model Save and Import",
+    featuresSaveModel: "<strong>Save Model</strong>: Click the 'Save' button to save all current parameters as a JSON file",
+    featuresImportModel: "<strong>Import Model</strong>: Click the 'Import' button to load previously saved model parameters",
+    featuresCompareScenarios: "Convenient for parameter comparison and scenario management in different situations",
+    featuresExport: "4. Report Export",
+    featuresExportReport: "<strong>Export Report</strong>: Generate a complete financial analysis report (PDF format)",
+    featuresExportContent: "Including: project overview, CAPEX details, financial indicators, financial statements, etc.",
+    featuresExportPurpose: "Suitable for presentation to investors, banks and other institutions",
+    featuresSensitivity: "5. Sensitivity Analysis",
+    featuresSensitivity1: "Analyze the impact of key parameter changes on financial indicators",
+    featuresSensitivity2: "Support multi-parameter simultaneous change analysis",
+    featuresSensitivity3: "Generate sensitivity analysis charts",
+    featuresFinancingReport: "6. Financing Report",
+    featuresFinancingReport1: "Generate financial reports required for bank financing",
+    featuresFinancingReport2: "Including: project overview, financial indicators, cash flow forecast, debt service capacity analysis, etc.",
+    
+    // Financial Knowledge Section
+    financeTitle: "📚 Financial Knowledge Column",
+    financeStatements: "I. Basics of Three Major Financial Statements",
+    financeIncomeStatement: "1. Income Statement",
+    financeIncomeStatementDesc: "<strong>Simple understanding:</strong> The income statement is like a company's 'report card', telling you how much money was earned, how much was spent, and how much is left at the end of the year.",
+    financeCoreFormula: "Core formula:",
+    financeNetProfitFormula: "Net Profit = Operating Revenue - Operating Cost - Operating Expenses - Depreciation and Amortization - Interest - Income Tax",
+    financeIncomeStatementStructure: "Income Statement Structure:",
+    financeRevenue: "Operating Revenue",
+    financeRevenueDesc: "(Top, sum of all income)",
+    financeOperatingCost: "Operating Cost",
+    financeOperatingCostDesc: "(Direct costs, such as equipment maintenance)",
+    financeGrossProfit: "Gross Profit",
+    financeOperatingExpenses: "Operating Expenses",
+    financeOperatingExpensesDesc: "(OPEX: labor, insurance, land lease, etc.)",
+    financeDepreciation: "Depreciation and Amortization",
+    financeDepreciationDesc: "(Equipment value decreases year by year)",
+    financeEBITDA: "EBITDA",
+    financeEBITDADesc: "(Earnings Before Interest, Taxes, Depreciation and Amortization)",
+    financeInterest: "Interest",
+    financeInterestDesc: "(Bank loan interest)",
+    financeEBIT: "Pre-tax Profit (EBT)",
+    financeTax: "Income Tax",
+    financeNetProfit: "Net Profit",
+    financeNetProfitDesc: "(Final money earned)",
+    financeKeyUnderstanding: "💡 Key Understanding:",
+    financeEBITDAKeyPoint: "EBITDA is an important indicator to measure project operating capacity because it excludes the impact of depreciation, interest and taxes, and better reflects the project's true profitability.",
+    financeCashFlowStatement: "2. Cash Flow Statement",
+    financeCashFlowStatementDesc: "<strong>Simple understanding:</strong> The cash flow statement is like a company's 'bank statement', recording cash inflows and outflows, telling you how much money was actually received and spent.",
+    financeNetCashFlowFormula: "Net Cash Flow = Operating Cash Flow + Investing Cash Flow + Financing Cash Flow",
+    financeCashFlowActivities: "Three Major Activities of Cash Flow Statement:",
+    financeOperatingCashFlow: "Operating Cash Flow",
+    financeOperatingCashFlowSource: "Source: Operating Revenue - Operating Cost",
+    financeOperatingCashFlowDesc: "Description: Cash generated from daily project operations",
+    financeInvestingCashFlow: "Investing Cash Flow",
+    financeInvestingCashFlowSource: "Source: Construction period investment (negative), residual value recovery (positive)",
+    financeInvestingCashFlowDesc: "Description: One-time large expenditures such as equipment purchase, power plant construction",
+    financeFinancingCashFlow: "Financing Cash Flow",
+    financeFinancingCashFlowSource: "Source: Shareholder investment (positive), bank loan (positive), principal and interest repayment (negative)",
+    financeFinancingCashFlowDesc: "Description: How to raise funds to support the project",
+    financeCashFlowKeyPoint: "The income statement shows 'how much money was earned', the cash flow statement shows 'how much money was actually received'. They may be different because depreciation is not a cash expense but affects profit.",
+    financeBalanceSheet: "3. Balance Sheet",
+    financeBalanceSheetDesc: "<strong>Simple understanding:</strong> The balance sheet is like a company's 'inventory list', listing what you own (assets) on the left, and what you owe others (liabilities) and your own money (equity) on the right.",
+    financeAccountingEquation: "Core formula (Accounting Identity):",
+    financeBalanceSheetFormula: "Assets = Liabilities + Owner's Equity",
+    financeBalanceSheetStructure: "Balance Sheet Structure:",
+    financeAssetsSide: "Assets (Left Side)",
+    financeCash: "Cash and Cash Equivalents",
+    financeCashDesc: "Cash in bank accounts",
+    financeFixedAssets: "Net Fixed Assets",
+    financeFixedAssetsDesc: "Original equipment value - accumulated depreciation",
+    financeIntangibleAssets: "Intangible Assets",
+    financeIntangibleAssetsDesc: "Land, development costs, etc.",
+    financeTotalAssets: "Total Assets",
+    financeLiabilitiesEquitySide: "Liabilities + Equity (Right Side)",
+    financeLongTermDebt: "Long-term Loans",
+    financeLongTermDebtDesc: "Bank loan balance",
+    financePaidInCapital: "Paid-in Capital",
+    financePaidInCapitalDesc: "Money invested by shareholders",
+    financeRetainedEarnings: "Retained Earnings",
+    financeRetainedEarningsDesc: "Cumulative net profit over the years",
+    financeTotalLiabilitiesEquity: "Liabilities + Equity",
+    financeBalanceSheetKeyPoint: "The balance sheet must balance! The left side (assets) always equals the right side (liabilities + equity). If not, there is a calculation error.",
+    financeKeyMetrics: "II. Detailed Explanation of Core Financial Indicators",
+    financeIRR: "1. IRR - Internal Rate of Return",
+    financeIRRDesc: "<strong>Simple understanding:</strong> IRR is 'If this project were a bank account, what would the annual interest rate be?' It tells you the annualized rate of return on investing in this project.",
+    financeCalculationFormula: "Calculation formula:",
+    financeIRRFormula: "NPV = Σ(Cash Flow / (1 + IRR)^Year) = 0",
+    financeIRRSolution: "Solve for IRR through trial and error, making the net present value zero",
+    financeIRRDiagram: "IRR Calculation Diagram:",
+    financeIRRYear0: "Year 0: -10 million (Investment)",
+    financeIRRYear1: "Year 1: +2 million",
+    financeIRRYear2: "Year 2: +3 million",
+    financeIRRYears: "...Continuing for 20 years",
+    financeIRRDefinition: "IRR = The interest rate that makes the discounted sum of all cash flows zero",
+    financeHowToInterpret: "💡 How to Interpret:",
+    financeIRRGood: "IRR > 8% (market benchmark rate): Project is attractive",
+    financeIRRExcellent: "IRR > 12%: Very good investment project",
+    financeIRRBad: "IRR < 8%: May not be worth investing",
+    financeIRRTotal: "Total Investment IRR: Considers return on all funds (equity + loan)",
+    financeIRREquity: "Equity IRR: Only considers return on own funds (usually higher)",
+    financeNPV: "2. NPV - Net Present Value",
+    financeNPVDesc: "<strong>Simple understanding:</strong> NPV is to 'discount' all future money to today based on interest rate to see how much it's worth. If NPV is positive, the project is worth investing in.",
+    financeNPVFormula: "NPV = Σ(Cash Flow / (1 + Discount Rate)^Year)",
+    financeNPVDiscountRate: "Discount rate usually 8% (market benchmark rate)",
+    financeNPVExample: "NPV Calculation Example:",
+    financeYear: "Year",
+    financeCashFlow: "Cash Flow",
+    financeDiscountFactor: "Discount Factor (8%)",
+    financePresentValue: "Present Value",
+    financeNPVTotal: "NPV Total",
+    financeNPVPositive: "NPV > 0: Project is worth investing in, creates value",
+    financeNPVZero: "NPV = 0: Project just breaks even (discount rate = IRR at this point)",
+    financeNPVNegative: "NPV < 0: Project is not worth investing in",
+    financeNPVGreater: "The larger the NPV, the more attractive the project",
+    financePaybackPeriod: "3. Payback Period",
+    financePaybackPeriodDesc: "<strong>Simple understanding:</strong> Payback period is 'How long does it take to get back the principal?' It tells you how many years it takes to recover the initial investment.",
+    financeStaticPayback: "Static Payback Period:",
+    financeStaticPaybackFormula: "The year when cumulative cash flow first becomes positive",
+    financeDynamicPayback: "Dynamic Payback Period:",
+    financeDynamicPaybackFormula: "The year when cumulative discounted cash flow first becomes positive",
+    financePaybackDiagram: "Payback Period Diagram:",
+    financePaybackYear0: "Year 0",
+    financePaybackInvestment: "Investment -10 million",
+    financePaybackYears17: "Years 1-7",
+    financePaybackRecovering: "Recovering principal",
+    financePaybackYear8: "Year 8",
+    financePaybackCompleted: "✅ Fully recovered",
+    financePaybackResult: "Payback Period = 8 years",
+    financePaybackIdeal: "The shorter the payback period, the better, usually < 10 years",
+    financeStaticPaybackNote: "Static payback period: Does not consider time value of money (simple but not accurate enough)",
+    financeDynamicPaybackNote: "Dynamic payback period: Considers time value of money (more accurate, usually longer than static payback period)",
+    financeTotalPayback: "Total investment payback period: Considers all funds (equity + loan)",
+    financeEquityPayback: "Equity payback period: Only considers own funds (usually shorter)",
+    financeROI: "4. ROI - Return on Investment",
+    financeROIDesc: "<strong>Simple understanding:</strong> ROI is 'How much money can be earned on average each year, as a percentage of investment?',",
+    financeROIFormula: "ROI = (Average Annual Net Profit / Total Investment) × 100%",
+
+
+
+    financeROIBasic: "ROI > 5%: Project has basic profitability",
+    financeROIGood: "ROI > 8%: Project has good profitability",
+    financeROIPoor: "ROI < 5%: Project has weak profitability",
+    financeROILimit: "ROI is a simple and intuitive indicator, but does not consider time value of money",
+    financeROE: "5. ROE - Return on Equity",
+    financeROEDesc: "<strong>Simple understanding:</strong> ROE is 'How much money can shareholders earn back each year as a percentage of their investment?',",
+    financeROEFormula: "ROE = (Net Profit / Equity) × 100%",
+
+    financeROECalculation: "Usually calculate ROE for the 3rd year, as the project has stabilized operations",
+    financeROEExcellent: "ROE > 15%: Excellent shareholder return",
+    financeROELeverage: "ROE considers the impact of financial leverage (loans) and better reflects actual shareholder returns than ROI",
+    financeDSCR: "6. DSCR - Debt Service Coverage Ratio",
+    financeDSCRDesc: "<strong>Simple understanding:</strong> DSCR is 'Is the money earned each year enough to repay the loan?' If DSCR=1.5, it means the money earned is 1.5 times the loan repayment amount, which is very safe.",
+    financeDSCRFormula: "DSCR = EBITDA / Debt Principal and Interest Repayment",
+    financeDSCRCalculation: "Usually calculate the average during the operation period",
+    financeDSCRDiagram: "DSCR Diagram:",
+    financeDebtService: "Principal and Interest Repayment",
+    financeDSCRGood: "DSCR > 1.2: Sufficient debt service capacity, usually required by banks",
+    financeDSCRBorderline: "DSCR = 1.0: Just enough to repay the loan, high risk",
+    financeDSCRBad: "DSCR < 1.0: Not enough to repay the loan, project has risk",
+    financeDSCRBank: "DSCR is an important indicator for banks to assess project loan risk",
+    financeImportantConcepts: "III. Important Financial Concepts",
+    financeCapexVsOpex: "1. CAPEX vs OPEX",
+    financeCapex: "CAPEX (Capital Expenditure)",
+    financeCapexPoint1: "One-time large investment",
+    financeCapexPoint2: "Such as: equipment procurement, construction costs",
+    financeCapexPoint3: "Included in cost through annual depreciation",
+    financeCapexPoint4: "Affects balance sheet",
+    financeOpex: "OPEX (Operating Expenditure)",
+    financeOpexPoint1: "Annual operating costs",
+    financeOpexPoint2: "Such as: labor, insurance, maintenance",
+    financeOpexPoint3: "Directly included in current year cost",
+    financeOpexPoint4: "Affects income statement",
+    financeDepreciationDesc: "<strong>Simple understanding:</strong> Equipment ages and its value decreases. Depreciation is to allocate equipment costs over its useful life, 'consuming' a portion of its value each year.",
+    financeStraightLineDepreciation: "Straight-line depreciation formula:",
+    financeDepreciationFormula: "Annual Depreciation = (Original Asset Value - Residual Value) / Depreciation Years",
+    financeDepreciationKeyPoint: "Depreciation is not a cash expense but reduces profit. It spreads one-time investment (CAPEX) over multiple years, making the income statement more reasonable.",
+    financeDiscounting: "3. Discounting",
+    financeDiscountingDesc: "<strong>Simple understanding:</strong> 100 yuan today is worth more than 100 yuan next year (because you can deposit it in the bank to earn interest). Discounting is to convert future money into today's value.",
+    financeDiscountFormula: "Discount formula:",
+    financePresentValueFormula: "Present Value = Future Value / (1 + Discount Rate)^Years",
+    financeDiscountRateNote: "Discount rate usually 8% (market benchmark rate)",
+    financeDiscountingExample: "Discounting Example:",
+    financeFutureValue: "1 million in 10 years",
+    financePresentValueExample: "463,000 today",
+    financeDiscountRateCalculation: "(Calculated at 8% discount rate)",
+    financeHowToInterpretMetrics: "IV. How to Interpret Financial Indicators",
+    financeComprehensiveAssessment: "📊 Comprehensive Project Assessment:",
+    financeProfitability: "<strong>Profitability:</strong> Look at IRR, NPV, ROI, ROE - the higher the better",
+    financePaybackSpeed: "<strong>Payback Speed:</strong> Look at payback period - the shorter the better (usually < 10 years)",
+    financeDebtServiceAbility: "<strong>Debt Service Ability:</strong> Look at DSCR - must be > 1.2 (bank requirement)",
+    financeCashFlow: "<strong>Cash Flow:</strong> Look at cash flow statement - ensure positive cash flow every year",
+    financeRiskControl: "<strong>Risk Control:</strong> Use sensitivity analysis to see which parameter changes have the greatest impact",
+    
+    // Tips Section
+    tipsTitle: "💡 Tips",
+    tipsParameterSetting: "1. Parameter Setting Tips",
+    tipsUseDefaults: "<strong>Use Default Values</strong>: The system has preset mainstream German market parameters, which can be used directly",
+    tipsBatterySelection: "<strong>Battery Model Selection</strong>: After selecting a battery model, price and degradation parameters will be automatically filled, no need to manually input",
+    tipsParameterHints: "<strong>Parameter Hints</strong>: Each input box has hint information showing market reference range",
+    tipsFinancialAnalysis: "2. Financial Analysis Tips",
+    tipsKeyMetrics: "<strong>Focus on Key Indicators</strong>: IRR, NPV, payback period, DSCR, ROI, etc.",
+    tipsCompareScenarios: "<strong>Compare Different Scenarios</strong>: Use save/import functions to compare financial performance of different parameter configurations",
+    tipsSensitivityAnalysis: "<strong>Sensitivity Analysis</strong>: Identify which parameters have the greatest impact on project profitability",
+    tipsCommonQuestions: "3. Common Questions",
+    tipsQuestionCapex: "<strong>Q: Why hasn't the CAPEX details table been updated?</strong><br>                            A: The system will automatically update 500 milliseconds after parameter changes, please wait a moment. If it still hasn't updated, you can manually click the 'Calculate' button.",
+    tipsQuestionReset: "<strong>Q: How to reset all parameters?</strong><br>                            A: Refresh the page to restore default parameters, or import a previously saved model file.",
+    tipsQuestionDegradation: "<strong>Q: How to set battery degradation parameters?</strong><br>                            A: After selecting a battery model, the system will automatically fill in the default degradation parameters for that model. You can also manually adjust based on actual conditions.",
+    tipsQuestionExport: "<strong>Q: How to export a complete financial report?</strong><br>                            A: Click the 'Export' button, and the system will generate a PDF report containing all financial data.",
+    tipsBestPractices: "4. Best Practices",
+    tipsBestPractice1: "First use default parameters for preliminary calculation to understand the basic financial performance of the project",
+    tipsBestPractice2: "Gradually adjust key parameters based on actual project conditions",
+    tipsBestPractice3: "Use sensitivity analysis to identify project risk points",
+    tipsBestPractice4: "Save multiple scenarios for easy comparison and decision-making",
+    tipsBestPractice5: "Regularly update market parameters (such as electricity prices, equipment prices, etc.)",
+    tipsNotes: "5. Notes",
+    tipsNote1: "Financial models are for reference only, actual decisions need to combine market research and expert opinions",
+    tipsNote2: "German market parameters will change over time, regular updates are recommended",
+    tipsNote3: "Policies, electricity prices, etc. may vary by region, need to adjust based on actual conditions",
+    tipsNote4: "Battery degradation parameters are based on industry average levels, actual degradation may vary due to usage conditions",
+    
+    // Footer Section
+    modalCloseButton: "Close"
+};
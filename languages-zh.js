@@ -0,0 +1,518 @@
+// 语言文件 - 中文翻译（切换到该语言时由 lang-loader.js 按需加载）
+window.languages = window.languages || {};
+window.languages.zh = {
+    // 导航栏
+    brandText: "德国独立储能电站投资测算系统",
+    navParameters: "边界设定",
+    navOpex: "OPEX设定",
+    navRevenue: "收入预测",
+    navIndicators: "财务指标",
+    navStatements: "财务报表",
+    navSensitivity: "敏感性分析",
+    navBankReport: "融资报告",
+    btnHelp: "帮助",
+    btnImport: "导入",
+    btnSave: "保存",
+    btnExport: "导出",
+    btnExcel: "Excel",
+    btnCalculate: "计算",
+    btnLogout: "退出",
+    
+    // 融资参数
+    labelLoanYears: "贷款年限",
+    hintLoanYears: "德国银行储能项目常见贷款期限",
+    labelLoanRate: "贷款利率",
+    hintLoanRate: "2025年欧洲市场基准利率水平",
+    labelGracePeriod: "还款宽限期",
+    labelRepaymentMethod: "还款方式",
+    optionEqualPrincipal: "等额本金",
+    optionEqualPayment: "等额本息",
+    hintEquityRatio: "德国项目融资典型比例25-30%",
+    
+    // 建设期与通胀参数
+    cardConstruction: "建设期与通胀参数",
+    labelConstructionPeriod: "建设期",
+    hintConstructionPeriod: "项目从开工到投产的时间",
+    labelConstructionFundUsage: "建设期资金占用比例",
+    hintConstructionFundUsage: "建设期平均资金占用比例（用于计算建设期利息）",
+    labelInflationRate: "通货膨胀率",
+    hintInflationRate: "用于OPEX年度增长计算（德国2025年通胀率约2%）",
+    
+    // 折旧参数
+    cardDepreciation: "折旧摊销参数",
+    labelDepreciationYears: "固定资产折旧年限",
+    labelSalvageRate: "残值率",
+    labelDepreciationMethod: "折旧方法",
+    optionStraightLine: "直线法",
+    optionDoubleDeclining: "双倍余额递减法",
+    optionSumOfYears: "年数总和法",
+    labelAmortizationYears: "无形资产摊销年限",
+    
+    // 效率参数
+    cardEfficiency: "效率参数",
+    labelChargeEfficiency: "充电效率",
+    labelDischargeEfficiency: "放电效率",
+    labelRTE: "系统综合效率(RTE)",
+    
+    // 税费参数
+    cardTaxes: "税费参数",
+    labelCorporateTaxRate: "企业所得税率(Körperschaftsteuer)",
+    hintCorporateTaxRate: "德国法定企业所得税率",
+    labelSolidarityTaxRate: "团结附加税率(Solidaritätszuschlag)",
+    hintSolidarityTaxRate: "按企业所得税额的5.5%计算",
+    labelTradeTaxRate: "贸易税率(Gewerbesteuer)",
+    hintTradeTaxRate: "德国各地市政税率不同(7-17%)",
+    labelVATRate: "增值税率(MwSt/VAT)",
+    hintVATRate: "德国标准增值税率",
+    labelOtherTaxRate: "其他税费",
+    labelTaxMethod: "所得税计算方法",
+    optionTaxGerman: "德国税法（亏损结转）",
+    optionTaxFlat: "综合税率",
+    hintTaxMethod: "德国税法：企业所得税与贸易税分别计税，亏损结转、利息限制",
+    labelLossOffsetThreshold: "亏损全额抵扣限额(§10d EStG)",
+    labelMinTaxationRatio: "超限额部分可抵扣比例",
+    hintMinTaxationRatio: "最低课税(Mindestbesteuerung)",
+    labelInterestBarrierRatio: "利息限制比例(Zinsschranke)",
+    labelInterestBarrierThreshold: "利息限制免征额",
+    labelTradeTaxAddbackRatio: "贸易税利息加计比例",
+    labelTradeTaxAddbackAllowance: "贸易税利息加计免征额",
+    
+    // Tolling参数
+    cardTolling: "Tolling运营参数",
+    labelTollingYears: "Tolling合同年限",
+    hintTollingYears: "德国储能Tolling合约典型期限",
+    labelTollingRatio: "Tolling容量占比",
+    hintTollingRatio: "银行融资通常要求70-90%",
+    labelTollingPrice: "Tolling价格(首年)",
+    hintTollingPrice: "德国2025年市场价格70-90€/kW",
+    labelTollingEscalation: "Tolling价格年增长率",
+    hintTollingEscalation: "通胀调整系数",
+    
+    // 设备配置
+    sectionEquipment: "🔌 设备配置",
+    descEquipment: "配置储能系统主要设备参数",
+    
+    // 电池系统
+    cardBatterySystem: "电池系统",
+    labelBatteryModel: "电池柜型号",
+    hintBatteryModel: "2025年德国市场主流供应商",
+    labelBatteryCapacity: "单柜容量",
+    labelBatteryCount: "电池柜数量",
+    btnAutoCalc: "🔄自动",
+    labelBatteryPrice: "电池系统单价",
+    hintBatteryPrice: "2025年德国市场均价80-95€/kWh",
+    
+    // 电池型号选项
+    labelCATL: "宁德时代 CATL (欧洲主流)",
+    optionCATLEnerOnePlus: "CATL EnerOne Plus 5MWh (314Ah) ★推荐",
+    optionCATLEnerCPlus: "CATL EnerC Plus 6.25MWh (314Ah)",
+    optionCATLEnerD: "CATL EnerD 5MWh (530Ah)",
+    optionCATLTENER: "CATL TENER 6.25MWh (LFP)",
+    labelBYD: "比亚迪 BYD (欧洲认可度高)",
+    optionBYD_MC_Cube: "BYD MC Cube 2.8MWh (280Ah)",
+    optionBYD_Cube_Pro: "BYD Cube Pro 3.7MWh (302Ah)",
+    optionBYD_BatteryBox: "BYD Battery-Box Premium 1.34MWh",
+    labelEVE: "亿纬锂能 EVE",
+    optionEVE_LF560K: "EVE LF560K 5MWh (560Ah)",
+    optionEVE_LF280K: "EVE LF280K 3.35MWh (280Ah)",
+    optionEVE_LF314K: "EVE LF314K 3.76MWh (314Ah)",
+    labelREPT: "瑞浦兰钧 REPT",
+    optionREPT_320Ah: "REPT 320Ah 3.84MWh",
+    optionREPT_345Ah: "REPT 345Ah 4.14MWh",
+    labelHiTHIUM: "海辰储能 HiTHIUM",
+    optionHiTHIUM_314Ah: "海辰 314Ah 3.76MWh",
+    optionHiTHIUM_560Ah: "海辰 560Ah 5.02MWh",
+    labelGotion: "国轩高科 Gotion",
+    optionGotion_280Ah: "国轩 280Ah 3.35MWh",
+    optionGotion_314Ah: "国轩 314Ah 3.76MWh",
+    labelSamsung: "三星SDI Samsung (韩系)",
+    optionSamsung_E3: "Samsung SDI E3 3.92MWh",
+    labelLGES: "LG新能源 LGES (韩系)",
+    optionLGES_RESU: "LG RESU Prime 3.5MWh",
+    labelOtherBattery: "其他",
+    optionCustomBattery: "自定义",
+    
+    // 电池容量选项
+    labelMainstreamCapacities: "主流容量规格",
+    optionCapacity1_34: "1.34 MWh",
+    optionCapacity2_5: "2.5 MWh",
+    optionCapacity2_8: "2.8 MWh",
+    optionCapacity3_35: "3.35 MWh",
+    optionCapacity3_5: "3.5 MWh",
+    optionCapacity3_7: "3.7 MWh",
+    optionCapacity3_76: "3.76 MWh",
+    optionCapacity3_84: "3.84 MWh",
+    optionCapacity3_92: "3.92 MWh",
+    optionCapacity4_14: "4.14 MWh",
+    optionCapacity5_0: "5.0 MWh ★主流",
+    optionCapacity5_02: "5.02 MWh",
+    optionCapacity6_25: "6.25 MWh",
+    labelOtherCapacities: "其他",
+    optionCustomCapacity: "手动输入",
+    
+    // 边界设定界面
+    sectionParameters: "📊 项目边界条件设定",
+    descParameters: "设置储能电站的基础参数和设备配置",
+    cardBasicParams: "电站基础参数",
+    labelPower: "电站装机功率",
+    hintPower: "德国大型储能项目典型规模",
+    labelCapacity: "电站储能容量",
+    hintCapacity: "2小时储能配置",
+    labelDuration: "储能时长",
+    labelOperationYears: "电站运营年限",
+    hintOperationYears: "行业标准运营周期",
+    labelInitialCapacity: "首年电池可用容量",
+    
+    cardDegradation: "容量衰减设定",
+    labelDegradationMode: "衰减模式",
+    optionLinear: "线性衰减（固定年衰减率）",
+    optionNonlinear: "非线性衰减（前期快后期慢）",
+    optionCycleBased: "循环次数衰减",
+    hintDegradationMode: "根据电池特性选择衰减模式",
+    labelDegradationRate: "年电池容量衰减率",
+    hintDegradationRate: "线性衰减模式：固定年衰减率",
+    labelFirstYearDegradation: "首年衰减率",
+    hintFirstYearDegradation: "非线性衰减：首年衰减率（通常较高）",
+    labelAnnualDecrease: "年衰减率递减幅度",
+    hintAnnualDecrease: "非线性衰减：每年衰减率递减幅度",
+    labelCyclesPerDegradation: "每1000次循环衰减率",
+    hintCyclesPerDegradation: "循环次数衰减：每1000次循环的容量损失",
+    labelAnnualCycles: "年运行循环次数",
+    hintAnnualCycles: "用于循环次数衰减模式计算",
+    labelCapacityThreshold: "容量保持率阈值",
+    hintCapacityThreshold: "低于此阈值建议更换电池",
+    
+    cardFinancing: "融资参数",
+    labelEquityRatio: "资本金比例",
+    
+    // 设备配置子模块
+    pcsSystem: "PCS系统",
+    pcsModel: "PCS型号",
+    pcsHint: "2025年德国市场主流PCS供应商",
+    pcsPower: "单台PCS功率",
+    pcsCount: "PCS数量",
+    pcsPrice: "PCS单价",
+    pcsPriceHint: "2025年德国市场均价25-35€/kW",
+    optgroupMainstreamPower: "主流功率规格",
+    optgroupOtherPower: "其他",
+    optionCustomPower: "手动输入",
+    
+    mvTransformer: "中压变压器",
+    mvTransformerModel: "中压变型号",
+    mvTransformerHint: "德国常用20kV电压等级",
+    voltageLevel: "电压等级",
+    transformerCapacity: "变压器容量",
+    transformerCount: "变压器数量",
+    transformerPrice: "中压变单价",
+    transformerPriceHint: "德国市场干式变压器价格",
+    optgroupDryTransformer: "干式变压器 (室内/集装箱) - 德国常用",
+    optgroupOilTransformer: "油浸式变压器 (户外)",
+    optgroupEuropeanTransformer: "欧洲品牌 (德国本土认证)",
+    optgroupChineseTransformer: "国产品牌",
+    optgroupOtherTransformer: "其他",
+    optgroupMainstreamCapacity: "主流容量规格",
+    optgroupOtherCapacity: "其他",
+    optionCustomCapacity: "手动输入",
+    
+    hvTransformer: "升压变压器",
+    hvTransformerModel: "升压变型号",
+    hvTransformerHint: "德国100MW项目通常接入110kV电网",
+    hvTransformerCapacity: "升压变容量",
+    hvTransformerCount: "升压变数量",
+    hvTransformerPrice: "升压变单价",
+    hvTransformerPriceHint: "110kV/120MVA德国市场价格",
+    optgroupHV110kV: "110kV等级 (德国常用)",
+    optgroupHV220kV: "220kV等级 (大型项目)",
+    optgroupHV380kV: "380kV等级 (德国高压电网)",
+    optgroupEuropeanHVManufacturer: "欧洲制造商 (本土认证)",
+    optgroupOtherHVManufacturer: "其他制造商",
+    optgroupOtherHV: "其他",
+    optgroupHVCapacity110kV: "110kV等级",
+    optgroupHVCapacity220kV: "220kV等级",
+    optgroupHVCapacity380kV: "380kV等级",
+    optgroupHVCapacityOther: "其他",
+    optionCustomHVCapacity: "手动输入",
+    
+    controlEquipment: "控制与辅助设备",
+    emsSystem: "EMS能量管理系统",
+    emsHint: "100MW项目EMS系统费用",
+    scadaSystem: "SCADA监控系统",
+    scadaHint: "含远程监控与数据采集",
+    switchgear: "开关柜(中压)",
+    switchgearHint: "20kV中压开关柜",
+    switchgearCount: "开关柜数量",
+    switchgearCountHint: "根据PCS数量和配置确定",
+    collectorLine: "集电线路",
+    collectorLineHint: "中压电缆及附件",
+    thermalSystem: "热管理系统",
+    thermalSystemHint: "液冷/空调系统(德国气候)",
+    fireSystem: "消防系统",
+    fireSystemHint: "气体灭火+监测系统",
+    
+    gridConnection: "电网接入",
+    substation: "变电站建设/扩容",
+    substationHint: "110kV变电站间隔扩建费",
+    gridLine: "接入线路",
+    gridLineHint: "110kV架空/电缆线路",
+    gridStudy: "并网申请与研究费",
+    gridStudyHint: "Netzverträglichkeitsprüfung",
+    metering: "计量与保护设备",
+    meteringHint: "符合德国电网规范要求",
+    
+    // 基建 & OPEX & 收入预测模块
+    landInfrastructure: "土地与基础建设",
+    landAcquisition: "土地获取成本",
+    landAcquisitionHint: "德国工业用地购买或长期租赁",
+    concreteFoundation: "混凝土基础",
+    concreteFoundationHint: "设备基础及电缆沟",
+    fenceSecurity: "围栏与安防",
+    fenceSecurityHint: "含监控和门禁系统",
+    roadConstruction: "道路建设",
+    roadConstructionHint: "场内道路及出入口",
+    drainageSystem: "排水系统",
+    drainageSystemHint: "雨水收集及排放系统",
+    
+    installationConstruction: "安装与施工管理",
+    mechanicalInstallation: "机电安装",
+    mechanicalInstallationHint: "德国本地安装人工费用较高",
+    constructionManagement: "施工管理费",
+    constructionManagementHint: "现场监理与协调",
+    commissioningCost: "调试费用",
+    commissioningCostHint: "含并网测试和性能验收",
+    
+    constructionInsurance: "建设期保险",
+    carInsurance: "建设工程一切险(CAR)",
+    carInsuranceHint: "Bauleistungsversicherung",
+    earInsurance: "安装工程一切险(EAR)",
+    earInsuranceHint: "Montageversicherung",
+    cargoInsurance: "货物运输保险",
+    cargoInsuranceHint: "Transportversicherung",
+    liabilityInsurance: "第三方责任险",
+    liabilityInsuranceHint: "Haftpflichtversicherung",
+    
+    developmentOwnerCosts: "开发与业主费用",
+    spvAcquisition: "SPV公司收购成本",
+    spvAcquisitionHint: "特殊目的公司收购及相关费用",
+    permitPlanning: "许可与规划费",
+    permitPlanningHint: "BImSchG许可申请费用",
+    environmentalConsulting: "环境咨询费",
+    environmentalConsultingHint: "环境影响评估(UVP)",
+    projectManagement: "项目管理费",
+    projectManagementHint: "业主工程管理团队",
+    legalConsulting: "法律咨询费",
+    legalConsultingHint: "合同、许可、融资法律服务",
+    engineeringDesign: "工程设计费",
+    engineeringDesignHint: "详细工程设计(FEED)",
+    contingency: "不可预见费",
+    contingencyHint: "银行通常要求5-10%",
+    
+    decommissioningReserve: "拆除准备金（按年摊销）",
+    decommissioningTotal: "拆除准备金总额",
+    decommissioningTotalHint: "按运营年限平均摊销计入OPEX",
+    
+    capexDetails: "CAPEX明细",
+    capexItem: "项目",
+    capexUnitPrice: "单价",
+    capexQuantity: "数量/容量",
+    capexAmount: "金额(万EUR)",
+    capexTotal: "总投资(静态)",
+    
+    opexSectionTitle: "📋 运营成本设定 (OPEX)",
+    opexSectionDesc: "设置各项年度运营费用",
+    opexBaseSettings: "运营费用基准设定",
+    opexCategory: "费用类别",
+    opexBasis: "计费基准",
+    opexFirstYearRate: "首年费率/金额",
+    opexAnnualGrowth: "年增长率(%)",
+    opexDescription: "说明",
+    opexTechnical: "技术与运维 (Technical O&M)",
+    opexTechnicalDesc: "设备监控与现场维护 (德国5-8€/kW/年)",
+    opexInsurance: "保险费用 (Insurance)",
+    opexInsuranceDesc: "资产综合保险 (Sachversicherung 0.35-0.5%)",
+    opexGrid: "电网运营费 (Grid Fees)",
+    opexGridDesc: "Netzentgelte 年度输配电费 (10-15k€/MW)",
+    opexLand: "土地租赁 (Land Lease)",
+    opexLandDesc: "Pachtgebühren 年租金 (视地区而定)",
+    opexCommercial: "商务与管理 (Commercial O&M)",
+    opexCommercialDesc: "财务结算、税务及合同管理 (3-5k€/MW)",
+    opexOther: "其他运营费",
+    opexOtherDesc: "备品备件、杂费等 (1-2k€/MW)",
+    opexYearlyDetails: "OPEX年度明细表",
+    year: "年份",
+    opexYearlyTechnical: "技术运维",
+    opexYearlyInsurance: "保险费",
+    opexYearlyGrid: "电网费",
+    opexYearlyLand: "土地租赁",
+    opexYearlyCommercial: "商务管理",
+    opexYearlyOther: "其他",
+    opexYearlyDecommissioning: "拆除准备金",
+    opexYearlyTotal: "合计",
+    
+    revenueSectionTitle: "💵 收入预测",
+    revenueSectionDesc: "设置Tolling收入和现货交易收入预测",
+    spotRevenueForecast: "现货交易收入预测 (非Tolling部分)",
+    spotRevenueHint: "剩余电量参与现货市场交易，请输入每MW每年的预期收入",
+    spotPriceUnit: "现货收入单价\n(EUR/MW/年)",
+    quickFillBasePrice: "快速填充: 首年价格",
+    annualGrowthRate: "年增长率(%)",
+    applyButton: "应用",
+    spotRevenueExpected: "德国现货市场套利收入：30-45k€/MW/年 (2025年预期)",
+    revenueYearlyDetails: "收入年度明细表",
+    availableCapacity: "可用容量(%)",
+    tollingRevenue: "Tolling收入\n(万EUR)",
+    spotRevenue: "现货收入\n(万EUR)",
+    totalRevenue: "总收入\n(万EUR)",
+    
+    // 财务核心模块
+    indicatorsSectionTitle: "📊 核心财务指标",
+    indicatorsSectionDesc: "投资收益及风险评估关键指标",
+    indStaticInvestment: "投资总额（静态）",
+    indDynamicInvestment: "投资总额（动态）",
+    indTotalRevenue: "累计销售收入总额",
+    indAvgRevenue: "年均销售收入",
+    indFirst3Revenue: "前三年合计销售收入",
+    indTotalProfit: "累计利润总额",
+    indAvgProfit: "年均利润总额",
+    indFirst3Profit: "前三年合计利润总额",
+    indTotalNetProfit: "累计净利润",
+    indAvgNetProfit: "年均净利润",
+    indFirst3NetProfit: "前三年合计净利润",
+    indProjectIRR: "全投资内部收益率(税后)",
+    indEquityIRR: "资本金内部收益率(税后)",
+    indStaticPayback: "全投资回收期(静态)",
+    indEquityPayback: "资本金回收期(静态)",
+    indDynamicPayback: "全投资回收期(动态-8%)",
+    indEquityDynamicPayback: "资本金回收期(动态-8%)",
+    indROEYear3: "第三年净资产收益率(ROE)",
+    indROI: "总投资收益率(ROI)",
+    indEBITDAReturn: "EBITDA回报率",
+    indLCOE: "LCOE（平准化度电成本）",
+    indDSCR: "债务偿付覆盖率(DSCR)",
+    
+    statementsSectionTitle: "📑 财务报表",
+    statementsSectionDesc: "利润表、资产负债表、现金流量表",
+    statementIncome: "利润表",
+    statementBalance: "资产负债表",
+    statementCashflow: "现金流量表",
+    statementLoan: "贷款还款计划表",
+    statementItem: "项目",
+    loanYear: "年份",
+    loanOpeningBalance: "期初余额",
+    loanInterest: "本期利息",
+    loanPrincipal: "本期还本",
+    loanPayment: "本期还款额",
+    loanClosingBalance: "期末余额",
+    
+    sensitivitySectionTitle: "🔍 敏感性分析",
+    sensitivitySectionDesc: "分析关键参数变化对投资收益的影响",
+    sensitivityParams: "分析参数设置",
+    sensitivityVar1: "分析变量1",
+    sensitivityVar2: "分析变量2 (可选)",
+    sensitivityTarget: "分析目标指标",
+    sensitivityCapex: "投资成本(CAPEX)",
+    sensitivityTolling: "Tolling价格",
+    sensitivitySpot: "现货价格",
+    sensitivityOpex: "运营成本(OPEX)",
+    sensitivityLoanRate: "贷款利率",
+    sensitivityDegradation: "电池衰减率",
+    sensitivityRange: "变化范围",
+    sensitivityTo: "至",
+    sensitivityStep: "步长",
+    sensitivityRun: "运行分析",
+    sensitivityResults: "分析结果",
+    sensitivityResultHint: "请选择分析参数并点击\"运行分析\"",
+    sensitivityMatrix: "双变量敏感性矩阵",
+    
+    reportTitle: "项目融资可行性分析报告",
+    reportSubtitle: "Battery Energy Storage System (BESS) Project Financing Report",
+    reportDate: "报告日期",
+    reportVersion: "报告版本",
+    reportVersionValue: "V1.0",
+    
+    // 融资报告完整模块
+    reportSummaryTitle: "一、项目概要 (Executive Summary)",
+    projectBasicInfo: "项目基本信息",
+    projectName: "项目名称",
+    projectLocation: "项目地点",
+    installedCapacity: "装机规模",
+    storageDuration: "储能时长",
+    operationYears: "运营期限",
+    projectCompany: "项目公司",
+    investmentStructure: "投资与融资结构",
+    totalInvestment: "项目总投资",
+    equity: "资本金",
+    bankLoan: "银行贷款",
+    equityRatio: "资本金比例",
+    loanTerm: "贷款期限",
+    loanRate: "贷款利率",
+    coreInvestmentIndicators: "核心投资指标",
+    projectIRR: "全投资IRR (税后)",
+    equityIRR: "资本金IRR (税后)",
+    staticPayback: "静态投资回收期",
+    dynamicPayback: "动态投资回收期(8%)",
+    avgDSCR: "平均DSCR",
+    lcoe: "LCOE（平准化度电成本）",
+    minDSCR: "最低DSCR",
+    
+    revenueAnalysisTitle: "二、收入结构分析 (Revenue Analysis)",
+    revenueSourceComposition: "收入来源构成",
+    annualRevenueForecast: "年度收入预测",
+    revenueStabilityAssessment: "收入稳定性评估",
+    tollingCoverage: "Tolling合同覆盖",
+    tollingRatio: "Tolling收入占比",
+    revenueVolatility: "收入波动系数",
+    
+    debtServiceAnalysisTitle: "三、偿债能力分析 (Debt Service Analysis)",
+    annualDSCRTrend: "年度DSCR趋势",
+    cashFlowCoverageAnalysis: "现金流覆盖分析",
+    loanRepaymentSchedule: "贷款偿还计划表",
+    year: "年份",
+    openingPrincipalBalance: "期初本金余额<br>(万EUR)",
+    annualInterest: "年度利息<br>(万EUR)",
+    annualPrincipal: "年度还本<br>(万EUR)",
+    annualPayment: "年度还款额<br>(万EUR)",
+    closingPrincipalBalance: "期末本金余额<br>(万EUR)",
+    ebitda: "EBITDA<br>(万EUR)",
+    dscr: "DSCR",
+    
+    profitabilityAnalysisTitle: "四、盈利能力分析 (Profitability Analysis)",
+    annualProfitTrend: "年度利润趋势",
+    cumulativeCashFlow: "累计现金流",
+    avgEBITDA: "年均EBITDA<br>(万EUR)",
+    avgNetProfit: "年均净利润<br>(万EUR)",
+    ebitdaMargin: "EBITDA利润率<br>(%)",
+    netMargin: "净利润率<br>(%)",
+    
+    riskAnalysisTitle: "五、风险分析与压力测试 (Risk Analysis)",
+    sensitivityAnalysisTitle: "关键指标敏感性分析",
+    stressTestScenarios: "压力测试情景",
+    scenario: "情景",
+    assumptions: "假设条件",
+    riskAssessmentMatrix: "风险评估矩阵",
+    marketRisk: "市场风险: 低",
+    marketRiskNote: "Tolling合同锁定",
+    technicalRisk: "技术风险: 低",
+    technicalRiskNote: "成熟锂电技术",
+    operationalRisk: "运营风险: 中",
+    operationalRiskNote: "电池衰减管理",
+    policyRisk: "政策风险: 低",
+    policyRiskNote: "德国能源转型支持",
+    
+    financialStructureAnalysisTitle: "六、财务结构分析 (Financial Structure)",
+    leverageRatioTrend: "资产负债率趋势",
+    roeTrend: "净资产收益率(ROE)趋势",
+    
+    conclusionTitle: "七、结论与建议 (Conclusion)",
+    investmentRating: "投资评级: <strong id='rpt_rating'>-</strong>",
+    projectStrengths: "项目优势:",
+    projectConcerns: "关注事项:",
+    financingRecommendations: "融资建议:",
+    
+    appendixTitle: "附录：财务预测明细表 (Appendix)",
+    cashFlowForecast: "现金流预测",
+    incomeForecast: "损益预测",
+    balanceSheetForecast: "资产负债预测",
+    
+    reportFooterZh: "本报告由德国独立储能电站投资测算系统自动生成，仅供融资决策参考。",
+    reportFooterEn: "This report is auto-generated for financing decision reference only."
+};
@@ -1,2075 +0,0 @@
-// 语言文件 - 包含中文、英文和德文的翻译
-window.languages = {
-    zh: {
-        // 导航栏
-        brandText: "德国独立储能电站投资测算系统",
-        navParameters: "边界设定",
-        navOpex: "OPEX设定",
-        navRevenue: "收入预测",
-        navIndicators: "财务指标",
-        navStatements: "财务报表",
-        navSensitivity: "敏感性分析",
-        navBankReport: "融资报告",
-        btnHelp: "帮助",
-        btnImport: "导入",
-        btnSave: "保存",
-        btnExport: "导出",
-        btnExcel: "Excel",
-        btnCalculate: "计算",
-        btnLogout: "退出",
-        
-        // 融资参数
-        labelLoanYears: "贷款年限",
-        hintLoanYears: "德国银行储能项目常见贷款期限",
-        labelLoanRate: "贷款利率",
-        hintLoanRate: "2025年欧洲市场基准利率水平",
-        labelGracePeriod: "还款宽限期",
-        labelRepaymentMethod: "还款方式",
-        optionEqualPrincipal: "等额本金",
-        optionEqualPayment: "等额本息",
-        hintEquityRatio: "德国项目融资典型比例25-30%",
-        
-        // 建设期与通胀参数
-        cardConstruction: "建设期与通胀参数",
-        labelConstructionPeriod: "建设期",
-        hintConstructionPeriod: "项目从开工到投产的时间",
-        labelConstructionFundUsage: "建设期资金占用比例",
-        hintConstructionFundUsage: "建设期平均资金占用比例（用于计算建设期利息）",
-        labelInflationRate: "通货膨胀率",
-        hintInflationRate: "用于OPEX年度增长计算（德国2025年通胀率约2%）",
-        
-        // 折旧参数
-        cardDepreciation: "折旧摊销参数",
-        labelDepreciationYears: "固定资产折旧年限",
-        labelSalvageRate: "残值率",
-        labelDepreciationMethod: "折旧方法",
-        optionStraightLine: "直线法",
-        optionDoubleDeclining: "双倍余额递减法",
-        optionSumOfYears: "年数总和法",
-        labelAmortizationYears: "无形资产摊销年限",
-        
-        // 效率参数
-        cardEfficiency: "效率参数",
-        labelChargeEfficiency: "充电效率",
-        labelDischargeEfficiency: "放电效率",
-        labelRTE: "系统综合效率(RTE)",
-        
-        // 税费参数
-        cardTaxes: "税费参数",
-        labelCorporateTaxRate: "企业所得税率(Körperschaftsteuer)",
-        hintCorporateTaxRate: "德国法定企业所得税率",
-        labelSolidarityTaxRate: "团结附加税率(Solidaritätszuschlag)",
-        hintSolidarityTaxRate: "按企业所得税额的5.5%计算",
-        labelTradeTaxRate: "贸易税率(Gewerbesteuer)",
-        hintTradeTaxRate: "德国各地市政税率不同(7-17%)",
-        labelVATRate: "增值税率(MwSt/VAT)",
-        hintVATRate: "德国标准增值税率",
-        labelOtherTaxRate: "其他税费",
-        
-        // Tolling参数
-        cardTolling: "Tolling运营参数",
-        labelTollingYears: "Tolling合同年限",
-        hintTollingYears: "德国储能Tolling合约典型期限",
-        labelTollingRatio: "Tolling容量占比",
-        hintTollingRatio: "银行融资通常要求70-90%",
-        labelTollingPrice: "Tolling价格(首年)",
-        hintTollingPrice: "德国2025年市场价格70-90€/kW",
-        labelTollingEscalation: "Tolling价格年增长率",
-        hintTollingEscalation: "通胀调整系数",
-        
-        // 设备配置
-        sectionEquipment: "🔌 设备配置",
-        descEquipment: "配置储能系统主要设备参数",
-        
-        // 电池系统
-        cardBatterySystem: "电池系统",
-        labelBatteryModel: "电池柜型号",
-        hintBatteryModel: "2025年德国市场主流供应商",
-        labelBatteryCapacity: "单柜容量",
-        labelBatteryCount: "电池柜数量",
-        btnAutoCalc: "🔄自动",
-        labelBatteryPrice: "电池系统单价",
-        hintBatteryPrice: "2025年德国市场均价80-95€/kWh",
-        
-        // 电池型号选项
-        labelCATL: "宁德时代 CATL (欧洲主流)",
-        optionCATLEnerOnePlus: "CATL EnerOne Plus 5MWh (314Ah) ★推荐",
-        optionCATLEnerCPlus: "CATL EnerC Plus 6.25MWh (314Ah)",
-        optionCATLEnerD: "CATL EnerD 5MWh (530Ah)",
-        optionCATLTENER: "CATL TENER 6.25MWh (LFP)",
-        labelBYD: "比亚迪 BYD (欧洲认可度高)",
-        optionBYD_MC_Cube: "BYD MC Cube 2.8MWh (280Ah)",
-        optionBYD_Cube_Pro: "BYD Cube Pro 3.7MWh (302Ah)",
-        optionBYD_BatteryBox: "BYD Battery-Box Premium 1.34MWh",
-        labelEVE: "亿纬锂能 EVE",
-        optionEVE_LF560K: "EVE LF560K 5MWh (560Ah)",
-        optionEVE_LF280K: "EVE LF280K 3.35MWh (280Ah)",
-        optionEVE_LF314K: "EVE LF314K 3.76MWh (314Ah)",
-        labelREPT: "瑞浦兰钧 REPT",
-        optionREPT_320Ah: "REPT 320Ah 3.84MWh",
-        optionREPT_345Ah: "REPT 345Ah 4.14MWh",
-        labelHiTHIUM: "海辰储能 HiTHIUM",
-        optionHiTHIUM_314Ah: "海辰 314Ah 3.76MWh",
-        optionHiTHIUM_560Ah: "海辰 560Ah 5.02MWh",
-        labelGotion: "国轩高科 Gotion",
-        optionGotion_280Ah: "国轩 280Ah 3.35MWh",
-        optionGotion_314Ah: "国轩 314Ah 3.76MWh",
-        labelSamsung: "三星SDI Samsung (韩系)",
-        optionSamsung_E3: "Samsung SDI E3 3.92MWh",
-        labelLGES: "LG新能源 LGES (韩系)",
-        optionLGES_RESU: "LG RESU Prime 3.5MWh",
-        labelOtherBattery: "其他",
-        optionCustomBattery: "自定义",
-        
-        // 电池容量选项
-        labelMainstreamCapacities: "主流容量规格",
-        optionCapacity1_34: "1.34 MWh",
-        optionCapacity2_5: "2.5 MWh",
-        optionCapacity2_8: "2.8 MWh",
-        optionCapacity3_35: "3.35 MWh",
-        optionCapacity3_5: "3.5 MWh",
-        optionCapacity3_7: "3.7 MWh",
-        optionCapacity3_76: "3.76 MWh",
-        optionCapacity3_84: "3.84 MWh",
-        optionCapacity3_92: "3.92 MWh",
-        optionCapacity4_14: "4.14 MWh",
-        optionCapacity5_0: "5.0 MWh ★主流",
-        optionCapacity5_02: "5.02 MWh",
-        optionCapacity6_25: "6.25 MWh",
-        labelOtherCapacities: "其他",
-        optionCustomCapacity: "手动输入",
-        
-        // 边界设定界面
-        sectionParameters: "📊 项目边界条件设定",
-        descParameters: "设置储能电站的基础参数和设备配置",
-        cardBasicParams: "电站基础参数",
-        labelPower: "电站装机功率",
-        hintPower: "德国大型储能项目典型规模",
-        labelCapacity: "电站储能容量",
-        hintCapacity: "2小时储能配置",
-        labelDuration: "储能时长",
-        labelOperationYears: "电站运营年限",
-        hintOperationYears: "行业标准运营周期",
-        labelInitialCapacity: "首年电池可用容量",
-        
-        cardDegradation: "容量衰减设定",
-        labelDegradationMode: "衰减模式",
-        optionLinear: "线性衰减（固定年衰减率）",
-        optionNonlinear: "非线性衰减（前期快后期慢）",
-        optionCycleBased: "循环次数衰减",
-        hintDegradationMode: "根据电池特性选择衰减模式",
-        labelDegradationRate: "年电池容量衰减率",
-        hintDegradationRate: "线性衰减模式：固定年衰减率",
-        labelFirstYearDegradation: "首年衰减率",
-        hintFirstYearDegradation: "非线性衰减：首年衰减率（通常较高）",
-        labelAnnualDecrease: "年衰减率递减幅度",
-        hintAnnualDecrease: "非线性衰减：每年衰减率递减幅度",
-        labelCyclesPerDegradation: "每1000次循环衰减率",
-        hintCyclesPerDegradation: "循环次数衰减：每1000次循环的容量损失",
-        labelAnnualCycles: "年运行循环次数",
-        hintAnnualCycles: "用于循环次数衰减模式计算",
-        labelCapacityThreshold: "容量保持率阈值",
-        hintCapacityThreshold: "低于此阈值建议更换电池",
-        
-        cardFinancing: "融资参数",
-        labelEquityRatio: "资本金比例",
-        
-        // 设备配置子模块
-        pcsSystem: "PCS系统",
-        pcsModel: "PCS型号",
-        pcsHint: "2025年德国市场主流PCS供应商",
-        pcsPower: "单台PCS功率",
-        pcsCount: "PCS数量",
-        pcsPrice: "PCS单价",
-        pcsPriceHint: "2025年德国市场均价25-35€/kW",
-        optgroupMainstreamPower: "主流功率规格",
-        optgroupOtherPower: "其他",
-        optionCustomPower: "手动输入",
-        
-        mvTransformer: "中压变压器",
-        mvTransformerModel: "中压变型号",
-        mvTransformerHint: "德国常用20kV电压等级",
-        voltageLevel: "电压等级",
-        transformerCapacity: "变压器容量",
-        transformerCount: "变压器数量",
-        transformerPrice: "中压变单价",
-        transformerPriceHint: "德国市场干式变压器价格",
-        optgroupDryTransformer: "干式变压器 (室内/集装箱) - 德国常用",
-        optgroupOilTransformer: "油浸式变压器 (户外)",
-        optgroupEuropeanTransformer: "欧洲品牌 (德国本土认证)",
-        optgroupChineseTransformer: "国产品牌",
-        optgroupOtherTransformer: "其他",
-        optgroupMainstreamCapacity: "主流容量规格",
-        optgroupOtherCapacity: "其他",
-        optionCustomCapacity: "手动输入",
-        
-        hvTransformer: "升压变压器",
-        hvTransformerModel: "升压变型号",
-        hvTransformerHint: "德国100MW项目通常接入110kV电网",
-        hvTransformerCapacity: "升压变容量",
-        hvTransformerCount: "升压变数量",
-        hvTransformerPrice: "升压变单价",
-        hvTransformerPriceHint: "110kV/120MVA德国市场价格",
-        optgroupHV110kV: "110kV等级 (德国常用)",
-        optgroupHV220kV: "220kV等级 (大型项目)",
-        optgroupHV380kV: "380kV等级 (德国高压电网)",
-        optgroupEuropeanHVManufacturer: "欧洲制造商 (本土认证)",
-        optgroupOtherHVManufacturer: "其他制造商",
-        optgroupOtherHV: "其他",
-        optgroupHVCapacity110kV: "110kV等级",
-        optgroupHVCapacity220kV: "220kV等级",
-        optgroupHVCapacity380kV: "380kV等级",
-        optgroupHVCapacityOther: "其他",
-        optionCustomHVCapacity: "手动输入",
-        
-        controlEquipment: "控制与辅助设备",
-        emsSystem: "EMS能量管理系统",
-        emsHint: "100MW项目EMS系统费用",
-        scadaSystem: "SCADA监控系统",
-        scadaHint: "含远程监控与数据采集",
-        switchgear: "开关柜(中压)",
-        switchgearHint: "20kV中压开关柜",
-        switchgearCount: "开关柜数量",
-        switchgearCountHint: "根据PCS数量和配置确定",
-        collectorLine: "集电线路",
-        collectorLineHint: "中压电缆及附件",
-        thermalSystem: "热管理系统",
-        thermalSystemHint: "液冷/空调系统(德国气候)",
-        fireSystem: "消防系统",
-        fireSystemHint: "气体灭火+监测系统",
-        
-        gridConnection: "电网接入",
-        substation: "变电站建设/扩容",
-        substationHint: "110kV变电站间隔扩建费",
-        gridLine: "接入线路",
-        gridLineHint: "110kV架空/电缆线路",
-        gridStudy: "并网申请与研究费",
-        gridStudyHint: "Netzverträglichkeitsprüfung",
-        metering: "计量与保护设备",
-        meteringHint: "符合德国电网规范要求",
-        
-        // 基建 & OPEX & 收入预测模块
-        landInfrastructure: "土地与基础建设",
-        landAcquisition: "土地获取成本",
-        landAcquisitionHint: "德国工业用地购买或长期租赁",
-        concreteFoundation: "混凝土基础",
-        concreteFoundationHint: "设备基础及电缆沟",
-        fenceSecurity: "围栏与安防",
-        fenceSecurityHint: "含监控和门禁系统",
-        roadConstruction: "道路建设",
-        roadConstructionHint: "场内道路及出入口",
-        drainageSystem: "排水系统",
-        drainageSystemHint: "雨水收集及排放系统",
-        
-        installationConstruction: "安装与施工管理",
-        mechanicalInstallation: "机电安装",
-        mechanicalInstallationHint: "德国本地安装人工费用较高",
-        constructionManagement: "施工管理费",
-        constructionManagementHint: "现场监理与协调",
-        commissioningCost: "调试费用",
-        commissioningCostHint: "含并网测试和性能验收",
-        
-        constructionInsurance: "建设期保险",
-        carInsurance: "建设工程一切险(CAR)",
-        carInsuranceHint: "Bauleistungsversicherung",
-        earInsurance: "安装工程一切险(EAR)",
-        earInsuranceHint: "Montageversicherung",
-        cargoInsurance: "货物运输保险",
-        cargoInsuranceHint: "Transportversicherung",
-        liabilityInsurance: "第三方责任险",
-        liabilityInsuranceHint: "Haftpflichtversicherung",
-        
-        developmentOwnerCosts: "开发与业主费用",
-        spvAcquisition: "SPV公司收购成本",
-        spvAcquisitionHint: "特殊目的公司收购及相关费用",
-        permitPlanning: "许可与规划费",
-        permitPlanningHint: "BImSchG许可申请费用",
-        environmentalConsulting: "环境咨询费",
-        environmentalConsultingHint: "环境影响评估(UVP)",
-        projectManagement: "项目管理费",
-        projectManagementHint: "业主工程管理团队",
-        legalConsulting: "法律咨询费",
-        legalConsultingHint: "合同、许可、融资法律服务",
-        engineeringDesign: "工程设计费",
-        engineeringDesignHint: "详细工程设计(FEED)",
-        contingency: "不可预见费",
-        contingencyHint: "银行通常要求5-10%",
-        
-        decommissioningReserve: "拆除准备金（按年摊销）",
-        decommissioningTotal: "拆除准备金总额",
-        decommissioningTotalHint: "按运营年限平均摊销计入OPEX",
-        
-        capexDetails: "CAPEX明细",
-        capexItem: "项目",
-        capexUnitPrice: "单价",
-        capexQuantity: "数量/容量",
-        capexAmount: "金额(万EUR)",
-        capexTotal: "总投资(静态)",
-        
-        opexSectionTitle: "📋 运营成本设定 (OPEX)",
-        opexSectionDesc: "设置各项年度运营费用",
-        opexBaseSettings: "运营费用基准设定",
-        opexCategory: "费用类别",
-        opexBasis: "计费基准",
-        opexFirstYearRate: "首年费率/金额",
-        opexAnnualGrowth: "年增长率(%)",
-        opexDescription: "说明",
-        opexTechnical: "技术与运维 (Technical O&M)",
-        opexTechnicalDesc: "设备监控与现场维护 (德国5-8€/kW/年)",
-        opexInsurance: "保险费用 (Insurance)",
-        opexInsuranceDesc: "资产综合保险 (Sachversicherung 0.35-0.5%)",
-        opexGrid: "电网运营费 (Grid Fees)",
-        opexGridDesc: "Netzentgelte 年度输配电费 (10-15k€/MW)",
-        opexLand: "土地租赁 (Land Lease)",
-        opexLandDesc: "Pachtgebühren 年租金 (视地区而定)",
-        opexCommercial: "商务与管理 (Commercial O&M)",
-        opexCommercialDesc: "财务结算、税务及合同管理 (3-5k€/MW)",
-        opexOther: "其他运营费",
-        opexOtherDesc: "备品备件、杂费等 (1-2k€/MW)",
-        opexYearlyDetails: "OPEX年度明细表",
-        year: "年份",
-        opexYearlyTechnical: "技术运维",
-        opexYearlyInsurance: "保险费",
-        opexYearlyGrid: "电网费",
-        opexYearlyLand: "土地租赁",
-        opexYearlyCommercial: "商务管理",
-        opexYearlyOther: "其他",
-        opexYearlyDecommissioning: "拆除准备金",
-        opexYearlyTotal: "合计",
-        
-        revenueSectionTitle: "💵 收入预测",
-        revenueSectionDesc: "设置Tolling收入和现货交易收入预测",
-        spotRevenueForecast: "现货交易收入预测 (非Tolling部分)",
-        spotRevenueHint: "剩余电量参与现货市场交易，请输入每MW每年的预期收入",
-        spotPriceUnit: "现货收入单价\n(EUR/MW/年)",
-        quickFillBasePrice: "快速填充: 首年价格",
-        annualGrowthRate: "年增长率(%)",
-        applyButton: "应用",
-        spotRevenueExpected: "德国现货市场套利收入：30-45k€/MW/年 (2025年预期)",
-        revenueYearlyDetails: "收入年度明细表",
-        availableCapacity: "可用容量(%)",
-        tollingRevenue: "Tolling收入\n(万EUR)",
-        spotRevenue: "现货收入\n(万EUR)",
-        totalRevenue: "总收入\n(万EUR)",
-        
-        // 财务核心模块
-        indicatorsSectionTitle: "📊 核心财务指标",
-        indicatorsSectionDesc: "投资收益及风险评估关键指标",
-        indStaticInvestment: "投资总额（静态）",
-        indDynamicInvestment: "投资总额（动态）",
-        indTotalRevenue: "累计销售收入总额",
-        indAvgRevenue: "年均销售收入",
-        indFirst3Revenue: "前三年合计销售收入",
-        indTotalProfit: "累计利润总额",
-        indAvgProfit: "年均利润总额",
-        indFirst3Profit: "前三年合计利润总额",
-        indTotalNetProfit: "累计净利润",
-        indAvgNetProfit: "年均净利润",
-        indFirst3NetProfit: "前三年合计净利润",
-        indProjectIRR: "全投资内部收益率(税后)",
-        indEquityIRR: "资本金内部收益率(税后)",
-        indStaticPayback: "全投资回收期(静态)",
-        indEquityPayback: "资本金回收期(静态)",
-        indDynamicPayback: "全投资回收期(动态-8%)",
-        indEquityDynamicPayback: "资本金回收期(动态-8%)",
-        indROEYear3: "第三年净资产收益率(ROE)",
-        indROI: "总投资收益率(ROI)",
-        indEBITDAReturn: "EBITDA回报率",
-        indLCOE: "LCOE（平准化度电成本）",
-        indDSCR: "债务偿付覆盖率(DSCR)",
-        
-        statementsSectionTitle: "📑 财务报表",
-        statementsSectionDesc: "利润表、资产负债表、现金流量表",
-        statementIncome: "利润表",
-        statementBalance: "资产负债表",
-        statementCashflow: "现金流量表",
-        statementLoan: "贷款还款计划表",
-        statementItem: "项目",
-        loanYear: "年份",
-        loanOpeningBalance: "期初余额",
-        loanInterest: "本期利息",
-        loanPrincipal: "本期还本",
-        loanPayment: "本期还款额",
-        loanClosingBalance: "期末余额",
-        
-        sensitivitySectionTitle: "🔍 敏感性分析",
-        sensitivitySectionDesc: "分析关键参数变化对投资收益的影响",
-        sensitivityParams: "分析参数设置",
-        sensitivityVar1: "分析变量1",
-        sensitivityVar2: "分析变量2 (可选)",
-        sensitivityTarget: "分析目标指标",
-        sensitivityCapex: "投资成本(CAPEX)",
-        sensitivityTolling: "Tolling价格",
-        sensitivitySpot: "现货价格",
-        sensitivityOpex: "运营成本(OPEX)",
-        sensitivityLoanRate: "贷款利率",
-        sensitivityDegradation: "电池衰减率",
-        sensitivityRange: "变化范围",
-        sensitivityTo: "至",
-        sensitivityStep: "步长",
-        sensitivityRun: "运行分析",
-        sensitivityResults: "分析结果",
-        sensitivityResultHint: "请选择分析参数并点击\"运行分析\"",
-        sensitivityMatrix: "双变量敏感性矩阵",
-        
-        reportTitle: "项目融资可行性分析报告",
-        reportSubtitle: "Battery Energy Storage System (BESS) Project Financing Report",
-        reportDate: "报告日期",
-        reportVersion: "报告版本",
-        reportVersionValue: "V1.0",
-        
-        // 融资报告完整模块
-        reportSummaryTitle: "一、项目概要 (Executive Summary)",
-        projectBasicInfo: "项目基本信息",
-        projectName: "项目名称",
-        projectLocation: "项目地点",
-        installedCapacity: "装机规模",
-        storageDuration: "储能时长",
-        operationYears: "运营期限",
-        projectCompany: "项目公司",
-        investmentStructure: "投资与融资结构",
-        totalInvestment: "项目总投资",
-        equity: "资本金",
-        bankLoan: "银行贷款",
-        equityRatio: "资本金比例",
-        loanTerm: "贷款期限",
-        loanRate: "贷款利率",
-        coreInvestmentIndicators: "核心投资指标",
-        projectIRR: "全投资IRR (税后)",
-        equityIRR: "资本金IRR (税后)",
-        staticPayback: "静态投资回收期",
-        dynamicPayback: "动态投资回收期(8%)",
-        avgDSCR: "平均DSCR",
-        lcoe: "LCOE（平准化度电成本）",
-        minDSCR: "最低DSCR",
-        
-        revenueAnalysisTitle: "二、收入结构分析 (Revenue Analysis)",
-        revenueSourceComposition: "收入来源构成",
-        annualRevenueForecast: "年度收入预测",
-        revenueStabilityAssessment: "收入稳定性评估",
-        tollingCoverage: "Tolling合同覆盖",
-        tollingRatio: "Tolling收入占比",
-        revenueVolatility: "收入波动系数",
-        
-        debtServiceAnalysisTitle: "三、偿债能力分析 (Debt Service Analysis)",
-        annualDSCRTrend: "年度DSCR趋势",
-        cashFlowCoverageAnalysis: "现金流覆盖分析",
-        loanRepaymentSchedule: "贷款偿还计划表",
-        year: "年份",
-        openingPrincipalBalance: "期初本金余额<br>(万EUR)",
-        annualInterest: "年度利息<br>(万EUR)",
-        annualPrincipal: "年度还本<br>(万EUR)",
-        annualPayment: "年度还款额<br>(万EUR)",
-        closingPrincipalBalance: "期末本金余额<br>(万EUR)",
-        ebitda: "EBITDA<br>(万EUR)",
-        dscr: "DSCR",
-        
-        profitabilityAnalysisTitle: "四、盈利能力分析 (Profitability Analysis)",
-        annualProfitTrend: "年度利润趋势",
-        cumulativeCashFlow: "累计现金流",
-        avgEBITDA: "年均EBITDA<br>(万EUR)",
-        avgNetProfit: "年均净利润<br>(万EUR)",
-        ebitdaMargin: "EBITDA利润率<br>(%)",
-        netMargin: "净利润率<br>(%)",
-        
-        riskAnalysisTitle: "五、风险分析与压力测试 (Risk Analysis)",
-        sensitivityAnalysisTitle: "关键指标敏感性分析",
-        stressTestScenarios: "压力测试情景",
-        scenario: "情景",
-        assumptions: "假设条件",
-        riskAssessmentMatrix: "风险评估矩阵",
-        marketRisk: "市场风险: 低",
-        marketRiskNote: "Tolling合同锁定",
-        technicalRisk: "技术风险: 低",
-        technicalRiskNote: "成熟锂电技术",
-        operationalRisk: "运营风险: 中",
-        operationalRiskNote: "电池衰减管理",
-        policyRisk: "政策风险: 低",
-        policyRiskNote: "德国能源转型支持",
-        
-        financialStructureAnalysisTitle: "六、财务结构分析 (Financial Structure)",
-        leverageRatioTrend: "资产负债率趋势",
-        roeTrend: "净资产收益率(ROE)趋势",
-        
-        conclusionTitle: "七、结论与建议 (Conclusion)",
-        investmentRating: "投资评级: <strong id='rpt_rating'>-</strong>",
-        projectStrengths: "项目优势:",
-        projectConcerns: "关注事项:",
-        financingRecommendations: "融资建议:",
-        
-        appendixTitle: "附录：财务预测明细表 (Appendix)",
-        cashFlowForecast: "现金流预测",
-        incomeForecast: "损益预测",
-        balanceSheetForecast: "资产负债预测",
-        
-        reportFooterZh: "本报告由德国独立储能电站投资测算系统自动生成，仅供融资决策参考。",
-        reportFooterEn: "This report is auto-generated for financing decision reference only."
-    },
-    en: {
-        // 导航栏
-        brandText: "German Independent Energy Storage Power Plant Investment Calculation System",
-        navParameters: "Boundary Settings",
-        navOpex: "OPEX Settings",
-        navRevenue: "Revenue Forecast",
-        navIndicators: "Financial Indicators",
-        navStatements: "Financial Statements",
-        navSensitivity: "Sensitivity Analysis",
-        navBankReport: "Financing Report",
-        btnHelp: "Help",
-        btnImport: "Import",
-        btnSave: "Save",
-        btnExport: "Export",
-        btnExcel: "Excel",
-        btnCalculate: "Calculate",
-        btnLogout: "Logout",
-        
-        // 融资参数
-        labelLoanYears: "Loan Term",
-        hintLoanYears: "Common loan term for energy storage projects in German banks",
-        labelLoanRate: "Loan Interest Rate",
-        hintLoanRate: "2025 European market benchmark interest rate level",
-        labelGracePeriod: "Grace Period",
-        labelRepaymentMethod: "Repayment Method",
-        optionEqualPrincipal: "Equal Principal",
-        optionEqualPayment: "Equal Payment",
-        hintEquityRatio: "Typical equity ratio for German project financing: 25-30%",
-        
-        // 建设期与通胀参数
-        cardConstruction: "Construction Period & Inflation Parameters",
-        labelConstructionPeriod: "Construction Period",
-        hintConstructionPeriod: "Time from project start to commissioning",
-        labelConstructionFundUsage: "Construction Fund Usage Ratio",
-        hintConstructionFundUsage: "Average fund usage ratio during construction period (for calculating construction period interest)",
-        labelInflationRate: "Inflation Rate",
-        hintInflationRate: "Used for OPEX annual growth calculation (German inflation rate around 2% in 2025)",
-        
-        // 折旧参数
-        cardDepreciation: "Depreciation & Amortization Parameters",
-        labelDepreciationYears: "Fixed Asset Depreciation Years",
-        labelSalvageRate: "Salvage Value Rate",
-        labelDepreciationMethod: "Depreciation Method",
-        optionStraightLine: "Straight Line Method",
-        optionDoubleDeclining: "Double Declining Balance Method",
-        optionSumOfYears: "Sum of Years' Digits Method",
-        labelAmortizationYears: "Intangible Asset Amortization Years",
-        
-        // 效率参数
-        cardEfficiency: "Efficiency Parameters",
-        labelChargeEfficiency: "Charge Efficiency",
-        labelDischargeEfficiency: "Discharge Efficiency",
-        labelRTE: "System Round-Trip Efficiency (RTE)",
-        
-        // 税费参数
-        cardTaxes: "Tax Parameters",
-        labelCorporateTaxRate: "Corporate Income Tax Rate (Körperschaftsteuer)",
-        hintCorporateTaxRate: "German statutory corporate income tax rate",
-        labelSolidarityTaxRate: "Solidarity Surcharge (Solidaritätszuschlag)",
-        hintSolidarityTaxRate: "Calculated at 5.5% of corporate income tax amount",
-        labelTradeTaxRate: "Trade Tax Rate (Gewerbesteuer)",
-        hintTradeTaxRate: "Different municipal tax rates across Germany (7-17%)",
-        labelVATRate: "VAT Rate (MwSt/VAT)",
-        hintVATRate: "German standard VAT rate",
-        labelOtherTaxRate: "Other Taxes",
-        
-        // Tolling参数
-        cardTolling: "Tolling Operation Parameters",
-        labelTollingYears: "Tolling Contract Years",
-        hintTollingYears: "Typical term for energy storage tolling contracts in Germany",
-        labelTollingRatio: "Tolling Capacity Ratio",
-        hintTollingRatio: "Banks typically require 70-90%",
-        labelTollingPrice: "Tolling Price (First Year)",
-        hintTollingPrice: "German market price 70-90€/kW in 2025",
-        labelTollingEscalation: "Tolling Price Annual Growth Rate",
-        hintTollingEscalation: "Inflation adjustment factor",
-        
-        // 设备配置
-        sectionEquipment: "🔌 Equipment Configuration",
-        descEquipment: "Configure main equipment parameters for the energy storage system",
-        
-        // 电池系统
-        cardBatterySystem: "Battery System",
-        labelBatteryModel: "Battery Cabinet Model",
-        hintBatteryModel: "2025 German market mainstream suppliers",
-        labelBatteryCapacity: "Single Cabinet Capacity",
-        labelBatteryCount: "Battery Cabinet Count",
-        btnAutoCalc: "🔄Auto",
-        labelBatteryPrice: "Battery System Unit Price",
-        hintBatteryPrice: "2025 German market average 80-95€/kWh",
-        
-        // 电池型号选项
-        labelCATL: "CATL (European Mainstream)",
-        optionCATLEnerOnePlus: "CATL EnerOne Plus 5MWh (314Ah) ★Recommended",
-        optionCATLEnerCPlus: "CATL EnerC Plus 6.25MWh (314Ah)",
-        optionCATLEnerD: "CATL EnerD 5MWh (530Ah)",
-        optionCATLTENER: "CATL TENER 6.25MWh (LFP)",
-        labelBYD: "BYD (High Recognition in Europe)",
-        optionBYD_MC_Cube: "BYD MC Cube 2.8MWh (280Ah)",
-        optionBYD_Cube_Pro: "BYD Cube Pro 3.7MWh (302Ah)",
-        optionBYD_BatteryBox: "BYD Battery-Box Premium 1.34MWh",
-        labelEVE: "EVE Energy",
-        optionEVE_LF560K: "EVE LF560K 5MWh (560Ah)",
-        optionEVE_LF280K: "EVE LF280K 3.35MWh (280Ah)",
-        optionEVE_LF314K: "EVE LF314K 3.76MWh (314Ah)",
-        labelREPT: "REPT",
-        optionREPT_320Ah: "REPT 320Ah 3.84MWh",
-        optionREPT_345Ah: "REPT 345Ah 4.14MWh",
-        labelHiTHIUM: "HiTHIUM",
-        optionHiTHIUM_314Ah: "HiTHIUM 314Ah 3.76MWh",
-        optionHiTHIUM_560Ah: "HiTHIUM 560Ah 5.02MWh",
-        labelGotion: "Gotion",
-        optionGotion_280Ah: "Gotion 280Ah 3.35MWh",
-        optionGotion_314Ah: "Gotion 314Ah 3.76MWh",
-        labelSamsung: "Samsung SDI (Korean)",
-        optionSamsung_E3: "Samsung SDI E3 3.92MWh",
-        labelLGES: "LG Energy Solution (Korean)",
-        optionLGES_RESU: "LG RESU Prime 3.5MWh",
-        labelOtherBattery: "Other",
-        optionCustomBattery: "Custom",
-        
-        // 电池容量选项
-        labelMainstreamCapacities: "Mainstream Capacity Specifications",
-        optionCapacity1_34: "1.34 MWh",
-        optionCapacity2_5: "2.5 MWh",
-        optionCapacity2_8: "2.8 MWh",
-        optionCapacity3_35: "3.35 MWh",
-        optionCapacity3_5: "3.5 MWh",
-        optionCapacity3_7: "3.7 MWh",
-        optionCapacity3_76: "3.76 MWh",
-        optionCapacity3_84: "3.84 MWh",
-        optionCapacity3_92: "3.92 MWh",
-        optionCapacity4_14: "4.14 MWh",
-        optionCapacity5_0: "5.0 MWh ★Mainstream",
-        optionCapacity5_02: "5.02 MWh",
-        optionCapacity6_25: "6.25 MWh",
-        labelOtherCapacities: "Other",
-        optionCustomCapacity: "Manual Input",
-        
-        // 边界设定界面
-        sectionParameters: "📊 Project Boundary Conditions",
-        descParameters: "Set basic parameters and equipment configuration for the energy storage power plant",
-        cardBasicParams: "Basic Power Plant Parameters",
-        labelPower: "Installed Power Capacity",
-        hintPower: "Typical scale for large energy storage projects in Germany",
-        labelCapacity: "Energy Storage Capacity",
-        hintCapacity: "2-hour storage configuration",
-        labelDuration: "Storage Duration",
-        labelOperationYears: "Operation Years",
-        hintOperationYears: "Industry standard operation cycle",
-        labelInitialCapacity: "Initial Battery Available Capacity",
-        
-        cardDegradation: "Capacity Degradation Settings",
-        labelDegradationMode: "Degradation Mode",
-        optionLinear: "Linear Degradation (Fixed Annual Rate)",
-        optionNonlinear: "Nonlinear Degradation (Fast at First, Slow Later)",
-        optionCycleBased: "Cycle-Based Degradation",
-        hintDegradationMode: "Select degradation mode based on battery characteristics",
-        labelDegradationRate: "Annual Battery Capacity Degradation Rate",
-        hintDegradationRate: "Linear degradation mode: fixed annual degradation rate",
-        labelFirstYearDegradation: "First Year Degradation Rate",
-        hintFirstYearDegradation: "Nonlinear degradation: first year degradation rate (usually higher)",
-        labelAnnualDecrease: "Annual Decrease in Degradation Rate",
-        hintAnnualDecrease: "Nonlinear degradation: annual decrease in degradation rate",
-        labelCyclesPerDegradation: "Degradation Rate per 1000 Cycles",
-        hintCyclesPerDegradation: "Cycle-based degradation: capacity loss per 1000 cycles",
-        labelAnnualCycles: "Annual Operation Cycles",
-        hintAnnualCycles: "Used for cycle-based degradation mode calculation",
-        labelCapacityThreshold: "Capacity Retention Threshold",
-        hintCapacityThreshold: "Battery replacement recommended below this threshold",
-        
-        cardFinancing: "Financing Parameters",
-        labelEquityRatio: "Equity Ratio",
-        
-        // Equipment Configuration Submodule
-        pcsSystem: "PCS System",
-        pcsModel: "PCS Model",
-        pcsHint: "2025 German market mainstream PCS suppliers",
-        pcsPower: "Single PCS Power",
-        pcsCount: "PCS Count",
-        pcsPrice: "PCS Unit Price",
-        pcsPriceHint: "2025 German market average 25-35€/kW",
-        optgroupMainstreamPower: "Mainstream Power Specifications",
-        optgroupOtherPower: "Other",
-        optionCustomPower: "Manual Input",
-        
-        mvTransformer: "Medium Voltage Transformer",
-        mvTransformerModel: "MV Transformer Model",
-        mvTransformerHint: "20kV voltage level commonly used in Germany",
-        voltageLevel: "Voltage Level",
-        transformerCapacity: "Transformer Capacity",
-        transformerCount: "Transformer Count",
-        transformerPrice: "MV Transformer Unit Price",
-        transformerPriceHint: "German market dry-type transformer price",
-        optgroupDryTransformer: "Dry-type Transformer (Indoor/Container) - German Common",
-        optgroupOilTransformer: "Oil-immersed Transformer (Outdoor)",
-        optgroupEuropeanTransformer: "European Brands (German Local Certification)",
-        optgroupChineseTransformer: "Chinese Brands",
-        optgroupOtherTransformer: "Other",
-        optgroupMainstreamCapacity: "Mainstream Capacity Specifications",
-        optgroupOtherCapacity: "Other",
-        optionCustomCapacity: "Manual Input",
-        
-        hvTransformer: "Step-up Transformer",
-        hvTransformerModel: "Step-up Transformer Model",
-        hvTransformerHint: "100MW projects in Germany usually connect to 110kV grid",
-        hvTransformerCapacity: "Step-up Transformer Capacity",
-        hvTransformerCount: "Step-up Transformer Count",
-        hvTransformerPrice: "Step-up Transformer Unit Price",
-        hvTransformerPriceHint: "110kV/120MVA German market price",
-        optgroupHV110kV: "110kV Level (German Common)",
-        optgroupHV220kV: "220kV Level (Large Projects)",
-        optgroupHV380kV: "380kV Level (German High Voltage Grid)",
-        optgroupEuropeanHVManufacturer: "European Manufacturers (Local Certification)",
-        optgroupOtherHVManufacturer: "Other Manufacturers",
-        optgroupOtherHV: "Other",
-        optgroupHVCapacity110kV: "110kV Level",
-        optgroupHVCapacity220kV: "220kV Level",
-        optgroupHVCapacity380kV: "380kV Level",
-        optgroupHVCapacityOther: "Other",
-        optionCustomHVCapacity: "Manual Input",
-        
-        controlEquipment: "Control & Auxiliary Equipment",
-        emsSystem: "EMS Energy Management System",
-        emsHint: "100MW project EMS system cost",
-        scadaSystem: "SCADA Monitoring System",
-        scadaHint: "Including remote monitoring and data collection",
-        switchgear: "Switchgear (Medium Voltage)",
-        switchgearHint: "20kV medium voltage switchgear",
-        switchgearCount: "Switchgear Count",
-        switchgearCountHint: "Determined by PCS count and configuration",
-        collectorLine: "Collector Line",
-        collectorLineHint: "Medium voltage cables and accessories",
-        thermalSystem: "Thermal Management System",
-        thermalSystemHint: "Liquid cooling/air conditioning system (German climate)",
-        fireSystem: "Fire Protection System",
-        fireSystemHint: "Gas extinguishing + monitoring system",
-        
-        gridConnection: "Grid Connection",
-        substation: "Substation Construction/Expansion",
-        substationHint: "110kV substation bay expansion cost",
-        gridLine: "Connection Line",
-        gridLineHint: "110kV overhead/cable line",
-        gridStudy: "Grid Connection Application & Study Fee",
-        gridStudyHint: "Netzverträglichkeitsprüfung",
-        metering: "Metering & Protection Equipment",
-        meteringHint: "Compliant with German grid code requirements",
-        
-        // Infrastructure & OPEX & Revenue Forecast Module
-        landInfrastructure: "Land & Infrastructure",
-        landAcquisition: "Land Acquisition Cost",
-        landAcquisitionHint: "German industrial land purchase or long-term lease",
-        concreteFoundation: "Concrete Foundation",
-        concreteFoundationHint: "Equipment foundation and cable trenches",
-        fenceSecurity: "Fencing & Security",
-        fenceSecurityHint: "Including monitoring and access control system",
-        roadConstruction: "Road Construction",
-        roadConstructionHint: "Site roads and entrances/exits",
-        drainageSystem: "Drainage System",
-        drainageSystemHint: "Rainwater collection and drainage system",
-        
-        installationConstruction: "Installation & Construction Management",
-        mechanicalInstallation: "Mechanical & Electrical Installation",
-        mechanicalInstallationHint: "German local installation labor costs are high",
-        constructionManagement: "Construction Management Fee",
-        constructionManagementHint: "On-site supervision and coordination",
-        commissioningCost: "Commissioning Cost",
-        commissioningCostHint: "Including grid connection testing and performance acceptance",
-        
-        constructionInsurance: "Construction Period Insurance",
-        carInsurance: "Construction All Risks (CAR)",
-        carInsuranceHint: "Bauleistungsversicherung",
-        earInsurance: "Erection All Risks (EAR)",
-        earInsuranceHint: "Montageversicherung",
-        cargoInsurance: "Cargo Transportation Insurance",
-        cargoInsuranceHint: "Transportversicherung",
-        liabilityInsurance: "Third Party Liability Insurance",
-        liabilityInsuranceHint: "Haftpflichtversicherung",
-        
-        developmentOwnerCosts: "Development & Owner Costs",
-        spvAcquisition: "SPV Company Acquisition Cost",
-        spvAcquisitionHint: "Special purpose vehicle acquisition and related costs",
-        permitPlanning: "Permit & Planning Fees",
-        permitPlanningHint: "BImSchG permit application fees",
-        environmentalConsulting: "Environmental Consulting Fees",
-        environmentalConsultingHint: "Environmental impact assessment (UVP)",
-        projectManagement: "Project Management Fee",
-        projectManagementHint: "Owner's engineering management team",
-        legalConsulting: "Legal Consulting Fees",
-        legalConsultingHint: "Contract, permit, financing legal services",
-        engineeringDesign: "Engineering Design Fee",
-        engineeringDesignHint: "Detailed engineering design (FEED)",
-        contingency: "Contingency",
-        contingencyHint: "Banks usually require 5-10%",
-        
-        decommissioningReserve: "Decommissioning Reserve (Annual Amortization)",
-        decommissioningTotal: "Total Decommissioning Reserve",
-        decommissioningTotalHint: "Amortized annually over operating years into OPEX",
-        
-        capexDetails: "CAPEX Details",
-        capexItem: "Item",
-        capexUnitPrice: "Unit Price",
-        capexQuantity: "Quantity/Capacity",
-        capexAmount: "Amount (10,000 EUR)",
-        capexTotal: "Total Investment (Static)",
-        
-        opexSectionTitle: "📋 Operating Cost Settings (OPEX)",
-        opexSectionDesc: "Set annual operating expenses",
-        opexBaseSettings: "Operating Expense Base Settings",
-        opexCategory: "Expense Category",
-        opexBasis: "Billing Basis",
-        opexFirstYearRate: "First Year Rate/Amount",
-        opexAnnualGrowth: "Annual Growth Rate (%)",
-        opexDescription: "Description",
-        opexTechnical: "Technical & Maintenance (Technical O&M)",
-        opexTechnicalDesc: "Equipment monitoring and on-site maintenance (Germany 5-8€/kW/year)",
-        opexInsurance: "Insurance Costs (Insurance)",
-        opexInsuranceDesc: "Comprehensive asset insurance (Sachversicherung 0.35-0.5%)",
-        opexGrid: "Grid Operating Fees (Grid Fees)",
-        opexGridDesc: "Netzentgelte annual transmission and distribution fees (10-15k€/MW)",
-        opexLand: "Land Lease (Land Lease)",
-        opexLandDesc: "Pachtgebühren annual rent (depends on region)",
-        opexCommercial: "Commercial & Management (Commercial O&M)",
-        opexCommercialDesc: "Financial settlement, taxation and contract management (3-5k€/MW)",
-        opexOther: "Other Operating Expenses",
-        opexOtherDesc: "Spare parts, miscellaneous expenses, etc. (1-2k€/MW)",
-        opexYearlyDetails: "OPEX Annual Details",
-        year: "Year",
-        opexYearlyTechnical: "Technical Maintenance",
-        opexYearlyInsurance: "Insurance Fees",
-        opexYearlyGrid: "Grid Fees",
-        opexYearlyLand: "Land Lease",
-        opexYearlyCommercial: "Commercial Management",
-        opexYearlyOther: "Other",
-        opexYearlyDecommissioning: "Decommissioning Reserve",
-        opexYearlyTotal: "Total",
-        
-        revenueSectionTitle: "💵 Revenue Forecast",
-        revenueSectionDesc: "Set Tolling revenue and spot market trading revenue forecast",
-        spotRevenueForecast: "Spot Market Revenue Forecast (Non-Tolling Part)",
-        spotRevenueHint: "Remaining electricity participates in spot market trading, please enter the expected revenue per MW per year",
-        spotPriceUnit: "Spot Revenue Unit Price\n(EUR/MW/year)",
-        quickFillBasePrice: "Quick Fill: First Year Price",
-        annualGrowthRate: "Annual Growth Rate (%)",
-        applyButton: "Apply",
-        spotRevenueExpected: "German spot market arbitrage revenue: 30-45k€/MW/year (2025 forecast)",
-        revenueYearlyDetails: "Revenue Annual Details",
-        availableCapacity: "Available Capacity (%)",
-        tollingRevenue: "Tolling Revenue\n(10,000 EUR)",
-        spotRevenue: "Spot Revenue\n(10,000 EUR)",
-        totalRevenue: "Total Revenue\n(10,000 EUR)",
-        
-        // Financial Core Module
-        indicatorsSectionTitle: "📊 Core Financial Indicators",
-        indicatorsSectionDesc: "Key indicators for investment return and risk assessment",
-        indStaticInvestment: "Total Investment (Static)",
-        indDynamicInvestment: "Total Investment (Dynamic)",
-        indTotalRevenue: "Cumulative Total Sales Revenue",
-        indAvgRevenue: "Average Annual Sales Revenue",
-        indFirst3Revenue: "First Three Years Total Sales Revenue",
-        indTotalProfit: "Cumulative Total Profit",
-        indAvgProfit: "Average Annual Profit",
-        indFirst3Profit: "First Three Years Total Profit",
-        indTotalNetProfit: "Cumulative Net Profit",
-        indAvgNetProfit: "Average Annual Net Profit",
-        indFirst3NetProfit: "First Three Years Net Profit",
-        indProjectIRR: "Project IRR (After Tax)",
-        indEquityIRR: "Equity IRR (After Tax)",
-        indStaticPayback: "Static Payback Period",
-        indEquityPayback: "Equity Payback Period (Static)",
-        indDynamicPayback: "Dynamic Payback Period (-8%)",
-        indEquityDynamicPayback: "Equity Payback Period (Dynamic-8%)",
-        indROEYear3: "Year 3 Return on Equity (ROE)",
-        indROI: "Return on Investment (ROI)",
-        indEBITDAReturn: "EBITDA Return",
-        indLCOE: "LCOE (Levelized Cost of Energy)",
-        indDSCR: "Debt Service Coverage Ratio (DSCR)",
-        
-        statementsSectionTitle: "📑 Financial Statements",
-        statementsSectionDesc: "Income Statement, Balance Sheet, Cash Flow Statement",
-        statementIncome: "Income Statement",
-        statementBalance: "Balance Sheet",
-        statementCashflow: "Cash Flow Statement",
-        statementLoan: "Loan Repayment Schedule",
-        statementItem: "Item",
-        loanYear: "Year",
-        loanOpeningBalance: "Opening Balance",
-        loanInterest: "Current Period Interest",
-        loanPrincipal: "Current Period Principal",
-        loanPayment: "Current Period Payment",
-        loanClosingBalance: "Closing Balance",
-        
-        sensitivitySectionTitle: "🔍 Sensitivity Analysis",
-        sensitivitySectionDesc: "Analyze the impact of key parameter changes on investment returns",
-        sensitivityParams: "Analysis Parameter Settings",
-        sensitivityVar1: "Analysis Variable 1",
-        sensitivityVar2: "Analysis Variable 2 (Optional)",
-        sensitivityTarget: "Analysis Target Indicator",
-        sensitivityCapex: "Investment Cost (CAPEX)",
-        sensitivityTolling: "Tolling Price",
-        sensitivitySpot: "Spot Price",
-        sensitivityOpex: "Operating Cost (OPEX)",
-        sensitivityLoanRate: "Loan Interest Rate",
-        sensitivityDegradation: "Battery Degradation Rate",
-        sensitivityRange: "Change Range",
-        sensitivityTo: "to",
-        sensitivityStep: "Step Size",
-        sensitivityRun: "Run Analysis",
-        sensitivityResults: "Analysis Results",
-        sensitivityResultHint: "Please select analysis parameters and click \"Run Analysis\"",
-        sensitivityMatrix: "Two-Variable Sensitivity Matrix",
-        
-        reportTitle: "Project Financing Feasibility Analysis Report",
-        reportSubtitle: "Battery Energy Storage System (BESS) Project Financing Report",
-        reportDate: "Report Date",
-        reportVersion: "Report Version",
-        reportVersionValue: "V1.0",
-        
-        // 融资报告完整模块
-        reportSummaryTitle: "I. Project Summary (Executive Summary)",
-        projectBasicInfo: "Basic Project Information",
-        projectName: "Project Name",
-        projectLocation: "Project Location",
-        installedCapacity: "Installed Capacity",
-        storageDuration: "Storage Duration",
-        operationYears: "Operation Period",
-        projectCompany: "Project Company",
-        investmentStructure: "Investment & Financing Structure",
-        totalInvestment: "Total Project Investment",
-        equity: "Equity Capital",
-        bankLoan: "Bank Loan",
-        equityRatio: "Equity Ratio",
-        loanTerm: "Loan Term",
-        loanRate: "Loan Interest Rate",
-        coreInvestmentIndicators: "Core Investment Indicators",
-        projectIRR: "Project IRR (After Tax)",
-        equityIRR: "Equity IRR (After Tax)",
-        staticPayback: "Static Payback Period",
-        dynamicPayback: "Dynamic Payback Period (8%)",
-        avgDSCR: "Average DSCR",
-        lcoe: "LCOE (Levelized Cost of Energy)",
-        minDSCR: "Minimum DSCR",
-        
-        revenueAnalysisTitle: "II. Revenue Structure Analysis (Revenue Analysis)",
-        revenueSourceComposition: "Revenue Source Composition",
-        annualRevenueForecast: "Annual Revenue Forecast",
-        revenueStabilityAssessment: "Revenue Stability Assessment",
-        tollingCoverage: "Tolling Contract Coverage",
-        tollingRatio: "Tolling Revenue Ratio",
-        revenueVolatility: "Revenue Volatility Coefficient",
-        
-        debtServiceAnalysisTitle: "III. Debt Service Analysis",
-        annualDSCRTrend: "Annual DSCR Trend",
-        cashFlowCoverageAnalysis: "Cash Flow Coverage Analysis",
-        loanRepaymentSchedule: "Loan Repayment Schedule",
-        year: "Year",
-        openingPrincipalBalance: "Opening Principal Balance<br>(10,000 EUR)",
-        annualInterest: "Annual Interest<br>(10,000 EUR)",
-        annualPrincipal: "Annual Principal Repayment<br>(10,000 EUR)",
-        annualPayment: "Annual Payment<br>(10,000 EUR)",
-        closingPrincipalBalance: "Closing Principal Balance<br>(10,000 EUR)",
-        ebitda: "EBITDA<br>(10,000 EUR)",
-        dscr: "DSCR",
-        
-        profitabilityAnalysisTitle: "IV. Profitability Analysis",
-        annualProfitTrend: "Annual Profit Trend",
-        cumulativeCashFlow: "Cumulative Cash Flow",
-        avgEBITDA: "Average EBITDA<br>(10,000 EUR)",
-        avgNetProfit: "Average Net Profit<br>(10,000 EUR)",
-        ebitdaMargin: "EBITDA Margin<br>(%)",
-        netMargin: "Net Profit Margin<br>(%)",
-        
-        riskAnalysisTitle: "V. Risk Analysis & Stress Test",
-        sensitivityAnalysisTitle: "Key Indicator Sensitivity Analysis",
-        stressTestScenarios: "Stress Test Scenarios",
-        scenario: "Scenario",
-        assumptions: "Assumptions",
-        riskAssessmentMatrix: "Risk Assessment Matrix",
-        marketRisk: "Market Risk: Low",
-        marketRiskNote: "Tolling Contract Locked",
-        technicalRisk: "Technical Risk: Low",
-        technicalRiskNote: "Mature Lithium Battery Technology",
-        operationalRisk: "Operational Risk: Medium",
-        operationalRiskNote: "Battery Degradation Management",
-        policyRisk: "Policy Risk: Low",
-        policyRiskNote: "German Energy Transition Support",
-        
-        financialStructureAnalysisTitle: "VI. Financial Structure Analysis",
-        leverageRatioTrend: "Debt-to-Equity Ratio Trend",
-        roeTrend: "Return on Equity (ROE) Trend",
-        
-        conclusionTitle: "VII. Conclusion & Recommendations",
-        investmentRating: "Investment Rating: <strong id='rpt_rating'>-</strong>",
-        projectStrengths: "Project Strengths:",
-        projectConcerns: "Key Considerations:",
-        financingRecommendations: "Financing Recommendations:",
-        
-        appendixTitle: "Appendix: Detailed Financial Forecast Tables",
-        cashFlowForecast: "Cash Flow Forecast",
-        incomeForecast: "Income Forecast",
-        balanceSheetForecast: "Balance Sheet Forecast",
-        
-        reportFooterZh: "This report is automatically generated by the German Independent Energy Storage Power Plant Investment Calculation System for financing decision reference only.",
-        reportFooterEn: "This report is auto-generated for financing decision reference only.",
-        
-        // Help Modal
-        helpModalTitle: "📖 Help",
-        helpTabQuickstart: "Quick Start",
-        helpTabParameters: "Parameter Settings",
-        helpTabFeatures: "Features",
-        helpTabFinance: "Financial Knowledge",
-        helpTabTips: "Tips",
-        
-        // Quick Start Section
-        quickstartTitle: "🚀 Quick Start",
-        quickstartStep1: "<strong>Login</strong>: Use your username and password to log in",
-        quickstartStep2: "<strong>Set Parameters</strong>: Set project basic parameters in the 'Boundary Settings' tab",
-        quickstartParam1: "Power plant capacity and power",
-        quickstartParam2: "Battery model (price and degradation parameters will be automatically filled after selection)",
-        quickstartParam3: "Equipment configuration and prices",
-        quickstartParam4: "Financing parameters",
-        quickstartStep3: "<strong>Set OPEX</strong>: Set annual operating costs in the 'OPEX Settings' tab",
-        quickstartStep4: "<strong>Set Revenue</strong>: Set revenue sources and prices in the 'Revenue Forecast' tab",
-        quickstartStep5: "<strong>View Results</strong>: Click the 'Calculate' button or wait for automatic calculation after parameter changes to view financial indicators and reports",
-        quickstartTip: "💡 Tip:",
-        quickstartTipContent: "The system supports automatic parameter calculation. Results will be automatically updated 500 milliseconds after parameter changes, no need to manually click the calculate button.",
-        
-        // Parameter Settings Section
-        parametersTitle: "⚙️ Parameter Settings Instructions",
-        parametersBasicParams: "1. Basic Power Plant Parameters",
-        parametersPower: "<strong>Installed Power Capacity</strong>: Rated power of the energy storage system (MW)",
-        parametersCapacity: "<strong>Energy Storage Capacity</strong>: Total capacity of the energy storage system (MWh)",
-        parametersDuration: "<strong>Storage Duration</strong>: Automatically calculated (capacity/power), usually 2-4 hours",
-        parametersOperationYears: "<strong>Operation Years</strong>: Project operation period, usually 15-20 years",
-        parametersInitialCapacity: "<strong>First Year Battery Available Capacity</strong>: Initial available capacity percentage of new batteries",
-        parametersDegradation: "2. Capacity Degradation Settings",
-        parametersDegradationMode: "<strong>Degradation Mode</strong>:",
-        parametersLinearDegradation: "Linear degradation: Fixed annual degradation rate, suitable for most LFP batteries",
-        parametersNonlinearDegradation: "Nonlinear degradation: Fast initial degradation, slow later",
-        parametersCycleBasedDegradation: "Cycle-based degradation: Capacity loss calculated based on cycle count",
-        parametersAutoFill: "<strong>Auto Fill</strong>: After selecting a battery model, the system will automatically fill in the default degradation parameters for that model",
-        parametersBatterySystem: "3. Battery System",
-        parametersBatteryModel: "<strong>Battery Cabinet Model</strong>: Select battery manufacturer and model, the system will automatically fill in price and degradation parameters",
-        parametersBatteryPrice: "<strong>Battery Unit Price</strong>: Price per MWh of battery (10,000 EUR), will be automatically filled based on the selected model",
-        parametersBatteryCount: "<strong>Battery Cabinet Count</strong>: Automatically calculated by the system based on total capacity and single cabinet capacity",
-        parametersFinancing: "4. Financing Parameters",
-        parametersEquityRatio: "<strong>Equity Ratio</strong>: German projects usually 25-30%",
-        parametersLoanTerm: "<strong>Loan Term</strong>: Usually 10-15 years",
-        parametersLoanRate: "<strong>Loan Interest Rate</strong>: European market benchmark rate around 4-5% in 2025",
-        parametersRepaymentMethod: "<strong>Repayment Method</strong>: Equal principal or equal principal and interest",
-        parametersCapex: "5. CAPEX Settings",
-        parametersCapexAuto: "The system will automatically calculate various CAPEX based on equipment configuration",
-        parametersCapexItems: "Including: equipment costs, grid connection, land infrastructure, installation and construction, insurance, development costs, etc.",
-        parametersCapexUpdate: "All parameters modified, CAPEX details will be automatically updated",
-        
-        // Features Section
-        featuresTitle: "✨ Features",
-        featuresAutoCalc: "1. Automatic Calculation",
-        featuresAutoCalc1: "After modifying any parameter, the system will automatically recalculate after 500 milliseconds",
-        featuresAutoCalc2: "No need to manually click the 'Calculate' button",
-        featuresAutoCalc3: "All tables and charts will be automatically updated",
-        featuresFormatting: "2. Data Formatting",
-        featuresFormatting1: "All values use German thousand separator format (1.234.567,89)",
-        featuresFormatting2: "Currency unit: 10,000 EUR",
-        featuresFormatting3: "Automatic percentage formatting",
-        featuresSaveImport: "3. Model Save and Import",
-        featuresSaveModel: "<strong>Save Model</strong>: Click the 'Save' button to save all current parameters as a JSON file",
-        featuresImportModel: "<strong>Import Model</strong>: Click the 'Import' button to load previously saved model parameters",
-        featuresCompareScenarios: "Convenient for parameter comparison and scenario management in different situations",
-        featuresExport: "4. Report Export",
-        featuresExportReport: "<strong>Export Report</strong>: Generate a complete financial analysis report (PDF format)",
-        featuresExportContent: "Including: project overview, CAPEX details, financial indicators, financial statements, etc.",
-        featuresExportPurpose: "Suitable for presentation to investors, banks and other institutions",
-        featuresSensitivity: "5. Sensitivity Analysis",
-        featuresSensitivity1: "Analyze the impact of key parameter changes on financial indicators",
-        featuresSensitivity2: "Support multi-parameter simultaneous change analysis",
-        featuresSensitivity3: "Generate sensitivity analysis charts",
-        featuresFinancingReport: "6. Financing Report",
-        featuresFinancingReport1: "Generate financial reports required for bank financing",
-        featuresFinancingReport2: "Including: project overview, financial indicators, cash flow forecast, debt service capacity analysis, etc.",
-        
-        // Financial Knowledge Section
-        financeTitle: "📚 Financial Knowledge Column",
-        financeStatements: "I. Basics of Three Major Financial Statements",
-        financeIncomeStatement: "1. Income Statement",
-        financeIncomeStatementDesc: "<strong>Simple understanding:</strong> The income statement is like a company's 'report card', telling you how much money was earned, how much was spent, and how much is left at the end of the year.",
-        financeCoreFormula: "Core formula:",
-        financeNetProfitFormula: "Net Profit = Operating Revenue - Operating Cost - Operating Expenses - Depreciation and Amortization - Interest - Income Tax",
-        financeIncomeStatementStructure: "Income Statement Structure:",
-        financeRevenue: "Operating Revenue",
-        financeRevenueDesc: "(Top, sum of all income)",
-        financeOperatingCost: "Operating Cost",
-        financeOperatingCostDesc: "(Direct costs, such as equipment maintenance)",
-        financeGrossProfit: "Gross Profit",
-        financeOperatingExpenses: "Operating Expenses",
-        financeOperatingExpensesDesc: "(OPEX: labor, insurance, land lease, etc.)",
-        financeDepreciation: "Depreciation and Amortization",
-        financeDepreciationDesc: "(Equipment value decreases year by year)",
-        financeEBITDA: "EBITDA",
-        financeEBITDADesc: "(Earnings Before Interest, Taxes, Depreciation and Amortization)",
-        financeInterest: "Interest",
-        financeInterestDesc: "(Bank loan interest)",
-        financeEBIT: "Pre-tax Profit (EBT)",
-        financeTax: "Income Tax",
-        financeNetProfit: "Net Profit",
-        financeNetProfitDesc: "(Final money earned)",
-        financeKeyUnderstanding: "💡 Key Understanding:",
-        financeEBITDAKeyPoint: "EBITDA is an important indicator to measure project operating capacity because it excludes the impact of depreciation, interest and taxes, and better reflects the project's true profitability.",
-        financeCashFlowStatement: "2. Cash Flow Statement",
-        financeCashFlowStatementDesc: "<strong>Simple understanding:</strong> The cash flow statement is like a company's 'bank statement', recording cash inflows and outflows, telling you how much money was actually received and spent.",
-        financeNetCashFlowFormula: "Net Cash Flow = Operating Cash Flow + Investing Cash Flow + Financing Cash Flow",
-        financeCashFlowActivities: "Three Major Activities of Cash Flow Statement:",
-        financeOperatingCashFlow: "Operating Cash Flow",
-        financeOperatingCashFlowSource: "Source: Operating Revenue - Operating Cost",
-        financeOperatingCashFlowDesc: "Description: Cash generated from daily project operations",
-        financeInvestingCashFlow: "Investing Cash Flow",
-        financeInvestingCashFlowSource: "Source: Construction period investment (negative), residual value recovery (positive)",
-        financeInvestingCashFlowDesc: "Description: One-time large expenditures such as equipment purchase, power plant construction",
-        financeFinancingCashFlow: "Financing Cash Flow",
-        financeFinancingCashFlowSource: "Source: Shareholder investment (positive), bank loan (positive), principal and interest repayment (negative)",
-        financeFinancingCashFlowDesc: "Description: How to raise funds to support the project",
-        financeCashFlowKeyPoint: "The income statement shows 'how much money was earned', the cash flow statement shows 'how much money was actually received'. They may be different because depreciation is not a cash expense but affects profit.",
-        financeBalanceSheet: "3. Balance Sheet",
-        financeBalanceSheetDesc: "<strong>Simple understanding:</strong> The balance sheet is like a company's 'inventory list', listing what you own (assets) on the left, and what you owe others (liabilities) and your own money (equity) on the right.",
-        financeAccountingEquation: "Core formula (Accounting Identity):",
-        financeBalanceSheetFormula: "Assets = Liabilities + Owner's Equity",
-        financeBalanceSheetStructure: "Balance Sheet Structure:",
-        financeAssetsSide: "Assets (Left Side)",
-        financeCash: "Cash and Cash Equivalents",
-        financeCashDesc: "Cash in bank accounts",
-        financeFixedAssets: "Net Fixed Assets",
-        financeFixedAssetsDesc: "Original equipment value - accumulated depreciation",
-        financeIntangibleAssets: "Intangible Assets",
-        financeIntangibleAssetsDesc: "Land, development costs, etc.",
-        financeTotalAssets: "Total Assets",
-        financeLiabilitiesEquitySide: "Liabilities + Equity (Right Side)",
-        financeLongTermDebt: "Long-term Loans",
-        financeLongTermDebtDesc: "Bank loan balance",
-        financePaidInCapital: "Paid-in Capital",
-        financePaidInCapitalDesc: "Money invested by shareholders",
-        financeRetainedEarnings: "Retained Earnings",
-        financeRetainedEarningsDesc: "Cumulative net profit over the years",
-        financeTotalLiabilitiesEquity: "Liabilities + Equity",
-        financeBalanceSheetKeyPoint: "The balance sheet must balance! The left side (assets) always equals the right side (liabilities + equity). If not, there is a calculation error.",
-        financeKeyMetrics: "II. Detailed Explanation of Core Financial Indicators",
-        financeIRR: "1. IRR - Internal Rate of Return",
-        financeIRRDesc: "<strong>Simple understanding:</strong> IRR is 'If this project were a bank account, what would the annual interest rate be?' It tells you the annualized rate of return on investing in this project.",
-        financeCalculationFormula: "Calculation formula:",
-        financeIRRFormula: "NPV = Σ(Cash Flow / (1 + IRR)^Year) = 0",
-        financeIRRSolution: "Solve for IRR through trial and error, making the net present value zero",
-        financeIRRDiagram: "IRR Calculation Diagram:",
-        financeIRRYear0: "Year 0: -10 million (Investment)",
-        financeIRRYear1: "Year 1: +2 million",
-        financeIRRYear2: "Year 2: +3 million",
-        financeIRRYears: "...Continuing for 20 years",
-        financeIRRDefinition: "IRR = The interest rate that makes the discounted sum of all cash flows zero",
-        financeHowToInterpret: "💡 How to Interpret:",
-        financeIRRGood: "IRR > 8% (market benchmark rate): Project is attractive",
-        financeIRRExcellent: "IRR > 12%: Very good investment project",
-        financeIRRBad: "IRR < 8%: May not be worth investing",
-        financeIRRTotal: "Total Investment IRR: Considers return on all funds (equity + loan)",
-        financeIRREquity: "Equity IRR: Only considers return on own funds (usually higher)",
-        financeNPV: "2. NPV - Net Present Value",
-        financeNPVDesc: "<strong>Simple understanding:</strong> NPV is to 'discount' all future money to today based on interest rate to see how much it's worth. If NPV is positive, the project is worth investing in.",
-        financeNPVFormula: "NPV = Σ(Cash Flow / (1 + Discount Rate)^Year)",
-        financeNPVDiscountRate: "Discount rate usually 8% (market benchmark rate)",
-        financeNPVExample: "NPV Calculation Example:",
-        financeYear: "Year",
-        financeCashFlow: "Cash Flow",
-        financeDiscountFactor: "Discount Factor (8%)",
-        financePresentValue: "Present Value",
-        financeNPVTotal: "NPV Total",
-        financeNPVPositive: "NPV > 0: Project is worth investing in, creates value",
-        financeNPVZero: "NPV = 0: Project just breaks even (discount rate = IRR at this point)",
-        financeNPVNegative: "NPV < 0: Project is not worth investing in",
-        financeNPVGreater: "The larger the NPV, the more attractive the project",
-        financePaybackPeriod: "3. Payback Period",
-        financePaybackPeriodDesc: "<strong>Simple understanding:</strong> Payback period is 'How long does it take to get back the principal?' It tells you how many years it takes to recover the initial investment.",
-        financeStaticPayback: "Static Payback Period:",
-        financeStaticPaybackFormula: "The year when cumulative cash flow first becomes positive",
-        financeDynamicPayback: "Dynamic Payback Period:",
-        financeDynamicPaybackFormula: "The year when cumulative discounted cash flow first becomes positive",
-        financePaybackDiagram: "Payback Period Diagram:",
-        financePaybackYear0: "Year 0",
-        financePaybackInvestment: "Investment -10 million",
-        financePaybackYears17: "Years 1-7",
-        financePaybackRecovering: "Recovering principal",
-        financePaybackYear8: "Year 8",
-        financePaybackCompleted: "✅ Fully recovered",
-        financePaybackResult: "Payback Period = 8 years",
-        financePaybackIdeal: "The shorter the payback period, the better, usually < 10 years",
-        financeStaticPaybackNote: "Static payback period: Does not consider time value of money (simple but not accurate enough)",
-        financeDynamicPaybackNote: "Dynamic payback period: Considers time value of money (more accurate, usually longer than static payback period)",
-        financeTotalPayback: "Total investment payback period: Considers all funds (equity + loan)",
-        financeEquityPayback: "Equity payback period: Only considers own funds (usually shorter)",
-        financeROI: "4. ROI - Return on Investment",
-        financeROIDesc: "<strong>Simple understanding:</strong> ROI is 'How much money can be earned on average each year, as a percentage of investment?',",
-        financeROIFormula: "ROI = (Average Annual Net Profit / Total Investment) × 100%",
-
-
-
-        financeROIBasic: "ROI > 5%: Project has basic profitability",
-        financeROIGood: "ROI > 8%: Project has good profitability",
-        financeROIPoor: "ROI < 5%: Project has weak profitability",
-        financeROILimit: "ROI is a simple and intuitive indicator, but does not consider time value of money",
-        financeROE: "5. ROE - Return on Equity",
-        financeROEDesc: "<strong>Simple understanding:</strong> ROE is 'How much money can shareholders earn back each year as a percentage of their investment?',",
-        financeROEFormula: "ROE = (Net Profit / Equity) × 100%",
-
-        financeROECalculation: "Usually calculate ROE for the 3rd year, as the project has stabilized operations",
-        financeROEExcellent: "ROE > 15%: Excellent shareholder return",
-        financeROELeverage: "ROE considers the impact of financial leverage (loans) and better reflects actual shareholder returns than ROI",
-        financeDSCR: "6. DSCR - Debt Service Coverage Ratio",
-        financeDSCRDesc: "<strong>Simple understanding:</strong> DSCR is 'Is the money earned each year enough to repay the loan?' If DSCR=1.5, it means the money earned is 1.5 times the loan repayment amount, which is very safe.",
-        financeDSCRFormula: "DSCR = EBITDA / Debt Principal and Interest Repayment",
-        financeDSCRCalculation: "Usually calculate the average during the operation period",
-        financeDSCRDiagram: "DSCR Diagram:",
-        financeDebtService: "Principal and Interest Repayment",
-        financeDSCRGood: "DSCR > 1.2: Sufficient debt service capacity, usually required by banks",
-        financeDSCRBorderline: "DSCR = 1.0: Just enough to repay the loan, high risk",
-        financeDSCRBad: "DSCR < 1.0: Not enough to repay the loan, project has risk",
-        financeDSCRBank: "DSCR is an important indicator for banks to assess project loan risk",
-        financeImportantConcepts: "III. Important Financial Concepts",
-        financeCapexVsOpex: "1. CAPEX vs OPEX",
-        financeCapex: "CAPEX (Capital Expenditure)",
-        financeCapexPoint1: "One-time large investment",
-        financeCapexPoint2: "Such as: equipment procurement, construction costs",
-        financeCapexPoint3: "Included in cost through annual depreciation",
-        financeCapexPoint4: "Affects balance sheet",
-        financeOpex: "OPEX (Operating Expenditure)",
-        financeOpexPoint1: "Annual operating costs",
-        financeOpexPoint2: "Such as: labor, insurance, maintenance",
-        financeOpexPoint3: "Directly included in current year cost",
-        financeOpexPoint4: "Affects income statement",
-        financeDepreciationDesc: "<strong>Simple understanding:</strong> Equipment ages and its value decreases. Depreciation is to allocate equipment costs over its useful life, 'consuming' a portion of its value each year.",
-        financeStraightLineDepreciation: "Straight-line depreciation formula:",
-        financeDepreciationFormula: "Annual Depreciation = (Original Asset Value - Residual Value) / Depreciation Years",
-        financeDepreciationKeyPoint: "Depreciation is not a cash expense but reduces profit. It spreads one-time investment (CAPEX) over multiple years, making the income statement more reasonable.",
-        financeDiscounting: "3. Discounting",
-        financeDiscountingDesc: "<strong>Simple understanding:</strong> 100 yuan today is worth more than 100 yuan next year (because you can deposit it in the bank to earn interest). Discounting is to convert future money into today's value.",
-        financeDiscountFormula: "Discount formula:",
-        financePresentValueFormula: "Present Value = Future Value / (1 + Discount Rate)^Years",
-        financeDiscountRateNote: "Discount rate usually 8% (market benchmark rate)",
-        financeDiscountingExample: "Discounting Example:",
-        financeFutureValue: "1 million in 10 years",
-        financePresentValueExample: "463,000 today",
-        financeDiscountRateCalculation: "(Calculated at 8% discount rate)",
-        financeHowToInterpretMetrics: "IV. How to Interpret Financial Indicators",
-        financeComprehensiveAssessment: "📊 Comprehensive Project Assessment:",
-        financeProfitability: "<strong>Profitability:</strong> Look at IRR, NPV, ROI, ROE - the higher the better",
-        financePaybackSpeed: "<strong>Payback Speed:</strong> Look at payback period - the shorter the better (usually < 10 years)",
-        financeDebtServiceAbility: "<strong>Debt Service Ability:</strong> Look at DSCR - must be > 1.2 (bank requirement)",
-        financeCashFlow: "<strong>Cash Flow:</strong> Look at cash flow statement - ensure positive cash flow every year",
-        financeRiskControl: "<strong>Risk Control:</strong> Use sensitivity analysis to see which parameter changes have the greatest impact",
-        
-        // Tips Section
-        tipsTitle: "💡 Tips",
-        tipsParameterSetting: "1. Parameter Setting Tips",
-        tipsUseDefaults: "<strong>Use Default Values</strong>: The system has preset mainstream German market parameters, which can be used directly",
-        tipsBatterySelection: "<strong>Battery Model Selection</strong>: After selecting a battery model, price and degradation parameters will be automatically filled, no need to manually input",
-        tipsParameterHints: "<strong>Parameter Hints</strong>: Each input box has hint information showing market reference range",
-        tipsFinancialAnalysis: "2. Financial Analysis Tips",
-        tipsKeyMetrics: "<strong>Focus on Key Indicators</strong>: IRR, NPV, payback period, DSCR, ROI, etc.",
-        tipsCompareScenarios: "<strong>Compare Different Scenarios</strong>: Use save/import functions to compare financial performance of different parameter configurations",
-        tipsSensitivityAnalysis: "<strong>Sensitivity Analysis</strong>: Identify which parameters have the greatest impact on project profitability",
-        tipsCommonQuestions: "3. Common Questions",
-        tipsQuestionCapex: "<strong>Q: Why hasn't the CAPEX details table been updated?</strong><br>                            A: The system will automatically update 500 milliseconds after parameter changes, please wait a moment. If it still hasn't updated, you can manually click the 'Calculate' button.",
-        tipsQuestionReset: "<strong>Q: How to reset all parameters?</strong><br>                            A: Refresh the page to restore default parameters, or import a previously saved model file.",
-        tipsQuestionDegradation: "<strong>Q: How to set battery degradation parameters?</strong><br>                            A: After selecting a battery model, the system will automatically fill in the default degradation parameters for that model. You can also manually adjust based on actual conditions.",
-        tipsQuestionExport: "<strong>Q: How to export a complete financial report?</strong><br>                            A: Click the 'Export' button, and the system will generate a PDF report containing all financial data.",
-        tipsBestPractices: "4. Best Practices",
-        tipsBestPractice1: "First use default parameters for preliminary calculation to understand the basic financial performance of the project",
-        tipsBestPractice2: "Gradually adjust key parameters based on actual project conditions",
-        tipsBestPractice3: "Use sensitivity analysis to identify project risk points",
-        tipsBestPractice4: "Save multiple scenarios for easy comparison and decision-making",
-        tipsBestPractice5: "Regularly update market parameters (such as electricity prices, equipment prices, etc.)",
-        tipsNotes: "5. Notes",
-        tipsNote1: "Financial models are for reference only, actual decisions need to combine market research and expert opinions",
-        tipsNote2: "German market parameters will change over time, regular updates are recommended",
-        tipsNote3: "Policies, electricity prices, etc. may vary by region, need to adjust based on actual conditions",
-        tipsNote4: "Battery degradation parameters are based on industry average levels, actual degradation may vary due to usage conditions",
-        
-        // Footer Section
-        modalCloseButton: "Close"
-    },
-    de: {
-        // 导航栏
-        brandText: "Deutsches unabhängiges Energiespeicher-Kraftwerk-Investitionsberechnungssystem",
-        navParameters: "Grenzwerteinstellungen",
-        navOpex: "OPEX-Einstellungen",
-        navRevenue: "Einnahmenprognose",
-        navIndicators: "Finanzindikatoren",
-        navStatements: "Finanzberichte",
-        navSensitivity: "Sensitivitätsanalyse",
-        navBankReport: "Finanzierungsbericht",
-        btnHelp: "Hilfe",
-        btnImport: "Importieren",
-        btnSave: "Speichern",
-        btnExport: "Exportieren",
-        btnExcel: "Excel",
-        btnCalculate: "Berechnen",
-        btnLogout: "Abmelden",
-        
-        // 融资参数
-        labelLoanYears: "Darlehensfrist",
-        hintLoanYears: "Gängige Darlehensfrist für Energiespeicherprojekte in deutschen Banken",
-        labelLoanRate: "Darlehenszins",
-        hintLoanRate: "Europäischer Markt-Leitzinsstand 2025",
-        labelGracePeriod: "Grace Period",
-        labelRepaymentMethod: "Tilgungsart",
-        optionEqualPrincipal: "Gleicher Hauptbetrag",
-        optionEqualPayment: "Gleicher Gesamtbetrag",
-        hintEquityRatio: "Typisches Eigenkapitalverhältnis für deutsche Projektfinanzierungen: 25-30%",
-        
-        // 建设期与通胀参数
-        cardConstruction: "Bauzeit und Inflationsparameter",
-        labelConstructionPeriod: "Bauzeit",
-        hintConstructionPeriod: "Zeit von Projektbeginn bis Inbetriebnahme",
-        labelConstructionFundUsage: "Baubetriebskapitalauslastung",
-        hintConstructionFundUsage: "Durchschnittliche Kapitalauslastung während der Bauphase (für Berechnung der Bauzinsen)",
-        labelInflationRate: "Inflationsrate",
-        hintInflationRate: "Verwendet für die jährliche Steigerung der OPEX (deutsche Inflationsrate 2025 ca. 2%)",
-        
-        // 折旧参数
-        cardDepreciation: "Abschreibungs- und Amortisationsparameter",
-        labelDepreciationYears: "Abschreibungsjahre für feste Vermögenswerte",
-        labelSalvageRate: "Restwertquote",
-        labelDepreciationMethod: "Abschreibungsmethode",
-        optionStraightLine: "Lineare Abschreibung",
-        optionDoubleDeclining: "Doppelte declining balance Methode",
-        optionSumOfYears: "Jahreszahlen-Summenmethode",
-        labelAmortizationYears: "Amortisationsjahre für immaterielle Vermögenswerte",
-        
-        // 效率参数
-        cardEfficiency: "Effizienzparameter",
-        labelChargeEfficiency: "Ladeeffizienz",
-        labelDischargeEfficiency: "Entladeeffizienz",
-        labelRTE: "System Round-Trip Efficiency (RTE)",
-        
-        // 税费参数
-        cardTaxes: "Steuerparameter",
-        labelCorporateTaxRate: "Körperschaftsteuersatz",
-        hintCorporateTaxRate: "Deutsche gesetzlicher Körperschaftsteuersatz",
-        labelSolidarityTaxRate: "Solidaritätszuschlag",
-        hintSolidarityTaxRate: "Berechnet zu 5,5% des Körperschaftsteuerbetrags",
-        labelTradeTaxRate: "Gewerbesteuersatz",
-        hintTradeTaxRate: "Verschiedene Kommunalsteuersätze in Deutschland (7-17%)",
-        labelVATRate: "Mehrwertsteuersatz (MwSt/VAT)",
-        hintVATRate: "Deutscher Standard-Mehwertsteuersatz",
-        labelOtherTaxRate: "Sonstige Steuern",
-        
-        // Tolling参数
-        cardTolling: "Tolling-Betriebsparameter",
-        labelTollingYears: "Tolling-Vertragsjahre",
-        hintTollingYears: "Typische Laufzeit für Energiespeicher-Tolling-Verträge in Deutschland",
-        labelTollingRatio: "Tolling-Kapazitätsverhältnis",
-        hintTollingRatio: "Banken verlangen typischerweise 70-90%",
-        labelTollingPrice: "Tolling-Preis (Erstes Jahr)",
-        hintTollingPrice: "Deutscher Marktpreis 70-90€/kW im Jahr 2025",
-        labelTollingEscalation: "Jährliche Tolling-Preissteigerung",
-        hintTollingEscalation: "Inflationsanpassungsfaktor",
-        
-        // 设备配置
-        sectionEquipment: "🔌 Gerätekonfiguration",
-        descEquipment: "Konfigurieren Sie die Hauptgeräteparameter des Energiespeichersystems",
-        
-        // 电池系统
-        cardBatterySystem: "Batteriesystem",
-        labelBatteryModel: "Batteriekabinettenmodell",
-        hintBatteryModel: "Hauptlieferanten auf dem deutschen Markt 2025",
-        labelBatteryCapacity: "Einzelkabinettenkapazität",
-        labelBatteryCount: "Anzahl der Batteriekabinetten",
-        btnAutoCalc: "🔄Auto",
-        labelBatteryPrice: "Batteriesystem-Einzelpreis",
-        hintBatteryPrice: "Deutscher Markt Durchschnitt 2025: 80-95€/kWh",
-        
-        // 电池型号选项
-        labelCATL: "CATL (europäisch führend)",
-        optionCATLEnerOnePlus: "CATL EnerOne Plus 5MWh (314Ah) ★Empfohlen",
-        optionCATLEnerCPlus: "CATL EnerC Plus 6,25MWh (314Ah)",
-        optionCATLEnerD: "CATL EnerD 5MWh (530Ah)",
-        optionCATLTENER: "CATL TENER 6,25MWh (LFP)",
-        labelBYD: "BYD (hohe Anerkennung in Europa)",
-        optionBYD_MC_Cube: "BYD MC Cube 2,8MWh (280Ah)",
-        optionBYD_Cube_Pro: "BYD Cube Pro 3,7MWh (302Ah)",
-        optionBYD_BatteryBox: "BYD Battery-Box Premium 1,34MWh",
-        labelEVE: "EVE Energy",
-        optionEVE_LF560K: "EVE LF560K 5MWh (560Ah)",
-        optionEVE_LF280K: "EVE LF280K 3,35MWh (280Ah)",
-        optionEVE_LF314K: "EVE LF314K 3,76MWh (314Ah)",
-        labelREPT: "REPT",
-        optionREPT_320Ah: "REPT 320Ah 3,84MWh",
-        optionREPT_345Ah: "REPT 345Ah 4,14MWh",
-        labelHiTHIUM: "HiTHIUM",
-        optionHiTHIUM_314Ah: "HiTHIUM 314Ah 3,76MWh",
-        optionHiTHIUM_560Ah: "HiTHIUM 560Ah 5,02MWh",
-        labelGotion: "Gotion",
-        optionGotion_280Ah: "Gotion 280Ah 3,35MWh",
-        optionGotion_314Ah: "Gotion 314Ah 3,76MWh",
-        labelSamsung: "Samsung SDI (koreanisch)",
-        optionSamsung_E3: "Samsung SDI E3 3,92MWh",
-        labelLGES: "LG Energy Solution (koreanisch)",
-        optionLGES_RESU: "LG RESU Prime 3,5MWh",
-        labelOtherBattery: "Andere",
-        optionCustomBattery: "Benutzerdefiniert",
-        
-        // 电池容量选项
-        labelMainstreamCapacities: "Mainstream-Kapazitätsspezifikationen",
-        optionCapacity1_34: "1,34 MWh",
-        optionCapacity2_5: "2,5 MWh",
-        optionCapacity2_8: "2,8 MWh",
-        optionCapacity3_35: "3,35 MWh",
-        optionCapacity3_5: "3,5 MWh",
-        optionCapacity3_7: "3,7 MWh",
-        optionCapacity3_76: "3,76 MWh",
-        optionCapacity3_84: "3,84 MWh",
-        optionCapacity3_92: "3,92 MWh",
-        optionCapacity4_14: "4,14 MWh",
-        optionCapacity5_0: "5,0 MWh ★Mainstream",
-        optionCapacity5_02: "5,02 MWh",
-        optionCapacity6_25: "6,25 MWh",
-        labelOtherCapacities: "Andere",
-        optionCustomCapacity: "Manuelle Eingabe",
-        
-        // 边界设定界面
-        sectionParameters: "📊 Projektgrenzbedingungseinstellungen",
-        descParameters: "Stellen Sie die Grundparameter und die Gerätekonfiguration des Energiespeicher-Kraftwerks ein",
-        cardBasicParams: "Grundlegende Kraftwerksparameter",
-        labelPower: "Installierte Leistung",
-        hintPower: "Typische Größe für große Energiespeicherprojekte in Deutschland",
-        labelCapacity: "Energiespeicherkapazität",
-        hintCapacity: "2-Stunden-Speicher-Konfiguration",
-        labelDuration: "Speicherdauer",
-        labelOperationYears: "Betriebsjahre",
-        hintOperationYears: "Branchenstandardbetriebszyklus",
-        labelInitialCapacity: "Erstjährige verfügbare Batteriekapazität",
-        
-        cardDegradation: "Kapazitätsabbaueinstellungen",
-        labelDegradationMode: "Abbaumodus",
-        optionLinear: "Lineare Degradation (feste jährliche Rate)",
-        optionNonlinear: "Nichtlineare Degradation (zuerst schnell, später langsam)",
-        optionCycleBased: "Zyklusbasierte Degradation",
-        hintDegradationMode: "Wählen Sie den Abbaumodus basierend auf den Batterieeigenschaften",
-        labelDegradationRate: "Jährliche Batteriekapazitätsabbaurate",
-        hintDegradationRate: "Linearer Abbaumodus: feste jährliche Abbaurate",
-        labelFirstYearDegradation: "Erstjährige Abbaurate",
-        hintFirstYearDegradation: "Nichtlineare Degradation: Erstjährige Abbaurate (normalerweise höher)",
-        labelAnnualDecrease: "Jährliche Abnahme der Abbaurate",
-        hintAnnualDecrease: "Nichtlineare Degradation: jährliche Abnahme der Abbaurate",
-        labelCyclesPerDegradation: "Abbaurate pro 1000 Zyklen",
-        hintCyclesPerDegradation: "Zyklusbasierte Degradation: Kapazitätsverlust pro 1000 Zyklen",
-        labelAnnualCycles: "Jährliche Betriebszyklen",
-        hintAnnualCycles: "Verwendet für die zyklusbasierte Abbaumodusberechnung",
-        labelCapacityThreshold: "Kapazitätserhaltungsschwelle",
-        hintCapacityThreshold: "Batterieersatz empfohlen unterhalb dieser Schwelle",
-        
-        cardFinancing: "Finanzierungsparameter",
-        labelEquityRatio: "Eigenkapitalanteil",
-        
-        // Gerätekonfigurationssubmodul
-        pcsSystem: "PCS-System",
-        pcsModel: "PCS-Modell",
-        pcsHint: "2025 deutsche Markt-Hauptstrom-PCS-Lieferanten",
-        pcsPower: "Einzel-PCS-Leistung",
-        pcsCount: "PCS-Anzahl",
-        pcsPrice: "PCS-Einzelpreis",
-        pcsPriceHint: "2025 deutscher Markt Durchschnitt 25-35€/kW",
-        optgroupMainstreamPower: "Hauptstrom-Leistungsspezifikationen",
-        optgroupOtherPower: "Andere",
-        optionCustomPower: "Manuelle Eingabe",
-        
-        mvTransformer: "Mittelspannungstransformator",
-        mvTransformerModel: "MS-Transformator-Modell",
-        mvTransformerHint: "20kV-Spannungsstufe in Deutschland häufig verwendet",
-        voltageLevel: "Spannungsstufe",
-        transformerCapacity: "Transformatorleistung",
-        transformerCount: "Transformatoranzahl",
-        transformerPrice: "MS-Transformator-Einzelpreis",
-        transformerPriceHint: "Deutscher Markt Trockentransformatorpreis",
-        optgroupDryTransformer: "Trockentransformator (Innen/Container) - Deutsch üblich",
-        optgroupOilTransformer: "Öltransformator (Außen)",
-        optgroupEuropeanTransformer: "Europäische Marken (Deutsche Zertifizierung)",
-        optgroupChineseTransformer: "Chinesische Marken",
-        optgroupOtherTransformer: "Andere",
-        optgroupMainstreamCapacity: "Hauptstrom-Kapazitätsspezifikationen",
-        optgroupOtherCapacity: "Andere",
-        optionCustomCapacity: "Manuelle Eingabe",
-        
-        hvTransformer: "Hochspannungstransformator",
-        hvTransformerModel: "HT-Transformator-Modell",
-        hvTransformerHint: "100MW-Projekte in Deutschland werden normalerweise an 110kV-Netz angeschlossen",
-        hvTransformerCapacity: "HT-Transformatorleistung",
-        hvTransformerCount: "HT-Transformatoranzahl",
-        hvTransformerPrice: "HT-Transformator-Einzelpreis",
-        hvTransformerPriceHint: "110kV/120MVA deutscher Marktpreis",
-        optgroupHV110kV: "110kV-Niveau (Deutsch üblich)",
-        optgroupHV220kV: "220kV-Niveau (Große Projekte)",
-        optgroupHV380kV: "380kV-Niveau (Deutsches Hochspannungsnetz)",
-        optgroupEuropeanHVManufacturer: "Europäische Hersteller (Lokale Zertifizierung)",
-        optgroupOtherHVManufacturer: "Andere Hersteller",
-        optgroupOtherHV: "Andere",
-        optgroupHVCapacity110kV: "110kV-Niveau",
-        optgroupHVCapacity220kV: "220kV-Niveau",
-        optgroupHVCapacity380kV: "380kV-Niveau",
-        optgroupHVCapacityOther: "Andere",
-        optionCustomHVCapacity: "Manuelle Eingabe",
-        
-        controlEquipment: "Steuerungs- und Hilfsgeräte",
-        emsSystem: "EMS-Energiemanagementsystem",
-        emsHint: "100MW-Projekt EMS-Systemkosten",
-        scadaSystem: "SCADA-Überwachungssystem",
-        scadaHint: "Inklusive Fernüberwachung und Datenerfassung",
-        switchgear: "Schaltanlage (Mittelspannung)",
-        switchgearHint: "20kV-Mittelspannungsschaltanlage",
-        switchgearCount: "Schaltanlagenanzahl",
-        switchgearCountHint: "Bestimmt durch PCS-Anzahl und Konfiguration",
-        collectorLine: "Sammlerleitung",
-        collectorLineHint: "Mittelspannungskabel und Zubehör",
-        thermalSystem: "Thermisches Managementsystem",
-        thermalSystemHint: "Flüssigkeitskühlung/Klimaanlagen-System (deutsches Klima)",
-        fireSystem: "Brandbekämpfungssystem",
-        fireSystemHint: "Gaslöschung + Überwachungssystem",
-        
-        gridConnection: "Netzanbindung",
-        substation: "Substation Bau/Erweiterung",
-        substationHint: "110kV-Substation Abzweigfeld-Erweiterungskosten",
-        gridLine: "Anschlussleitung",
-        gridLineHint: "110kV-Freileitung/Kabelleitung",
-        gridStudy: "Netzanbindungsantrag und Studiengebühr",
-        gridStudyHint: "Netzverträglichkeitsprüfung",
-        metering: "Mess- und Schutzgeräte",
-        meteringHint: "Entspricht den Anforderungen der deutschen Netzkodex",
-        
-        // Infrastruktur & OPEX & Ertragsprognose Modul
-        landInfrastructure: "Land & Infrastruktur",
-        landAcquisition: "Bodenbeschaffungskosten",
-        landAcquisitionHint: "Deutsche Industriebodenkauf oder Langzeitpacht",
-        concreteFoundation: "Betonfundament",
-        concreteFoundationHint: "Gerätefundament und Kabelgräben",
-        fenceSecurity: "Zaun und Sicherheit",
-        fenceSecurityHint: "Inklusive Überwachung und Zugangskontrolle",
-        roadConstruction: "Straßenbau",
-        roadConstructionHint: "Bereichsstraßen und Einfahrten/Ausfahrten",
-        drainageSystem: "Entwässerungssystem",
-        drainageSystemHint: "Regenwasserentsorgungssystem",
-        
-        installationConstruction: "Installation & Bauleitung",
-        mechanicalInstallation: "Mechanische & Elektrische Installation",
-        mechanicalInstallationHint: "Deutsche lokale Installationsarbeitskosten sind hoch",
-        constructionManagement: "Bauleitungskosten",
-        constructionManagementHint: "Vor-Ort-Überwachung und Koordination",
-        commissioningCost: "Inbetriebnahmekosten",
-        commissioningCostHint: "Inklusive Netzanschlusstest und Leistungsannahme",
-        
-        constructionInsurance: "Bauzeitversicherung",
-        carInsurance: "Bauleistungsversicherung (CAR)",
-        carInsuranceHint: "Bauleistungsversicherung",
-        earInsurance: "Montageversicherung (EAR)",
-        earInsuranceHint: "Montageversicherung",
-        cargoInsurance: "Frachtversicherung",
-        cargoInsuranceHint: "Transportversicherung",
-        liabilityInsurance: "Haftpflichtversicherung",
-        liabilityInsuranceHint: "Haftpflichtversicherung",
-        
-        developmentOwnerCosts: "Entwicklungs- und Eigentümerkosten",
-        spvAcquisition: "SPV-Unternehmenskaufkosten",
-        spvAcquisitionHint: "Spezialzweckgesellschaftsaufkauf und damit verbundene Kosten",
-        permitPlanning: "Genehmigungs- und Planungskosten",
-        permitPlanningHint: "BImSchG-Genehmigungsantragskosten",
-        environmentalConsulting: "Umweltberatungskosten",
-        environmentalConsultingHint: "Umweltverträglichkeitsprüfung (UVP)",
-        projectManagement: "Projektmanagementkosten",
-        projectManagementHint: "Eigentümer-Ingenieurmanagementteam",
-        legalConsulting: "Rechtsberatungskosten",
-        legalConsultingHint: "Vertrags-, Genehmigungs- und Finanzierungsrechtsdienste",
-        engineeringDesign: "Ingenieurleistungen",
-        engineeringDesignHint: "Detaillierte Ingenieurplanung (FEED)",
-        contingency: "Pufferbetrag",
-        contingencyHint: "Banken verlangen normalerweise 5-10%",
-        
-        decommissioningReserve: "Stilllegungsreserve (jährliche Amortisierung)",
-        decommissioningTotal: "Gesamte Stilllegungsreserve",
-        decommissioningTotalHint: "Jährlich über Betriebsjahre in OPEX amortisiert",
-        
-        capexDetails: "CAPEX-Details",
-        capexItem: "Posten",
-        capexUnitPrice: "Einzelpreis",
-        capexQuantity: "Menge/Kapazität",
-        capexAmount: "Betrag (10.000 EUR)",
-        capexTotal: "Gesamteinvestition (statisch)",
-        
-        opexSectionTitle: "📋 Betriebskosten-Einstellungen (OPEX)",
-        opexSectionDesc: "Jährliche Betriebskosten einstellen",
-        opexBaseSettings: "Grundeinstellungen für Betriebskosten",
-        opexCategory: "Kostenkategorie",
-        opexBasis: "Berechnungsbasis",
-        opexFirstYearRate: "Erstjahresrate/Betrag",
-        opexAnnualGrowth: "Jährliche Wachstumsrate (%)",
-        opexDescription: "Beschreibung",
-        opexTechnical: "Technik & Instandhaltung (Technical O&M)",
-        opexTechnicalDesc: "Geräteüberwachung und vor Ort Instandhaltung (Deutschland 5-8€/kW/Jahr)",
-        opexInsurance: "Versicherungskosten (Insurance)",
-        opexInsuranceDesc: "Vollständige Vermögensversicherung (Sachversicherung 0,35-0,5%)",
-        opexGrid: "Netzbetriebskosten (Grid Fees)",
-        opexGridDesc: "Netzentgelte jährliche Übertragungs- und Verteilungsgebühren (10-15k€/MW)",
-        opexLand: "Bodenpacht (Land Lease)",
-        opexLandDesc: "Pachtgebühren jährliche Miete (hängt von Region ab)",
-        opexCommercial: "Kommerz & Management (Commercial O&M)",
-        opexCommercialDesc: "Finanzabwicklung, Steuerwesen und Vertragsmanagement (3-5k€/MW)",
-        opexOther: "Sonstige Betriebskosten",
-        opexOtherDesc: "Ersatzteile, Sonstiges usw. (1-2k€/MW)",
-        opexYearlyDetails: "OPEX-Jahresdetails",
-        year: "Jahr",
-        opexYearlyTechnical: "Technische Instandhaltung",
-        opexYearlyInsurance: "Versicherungskosten",
-        opexYearlyGrid: "Netzkosten",
-        opexYearlyLand: "Bodenpacht",
-        opexYearlyCommercial: "Kommerzielles Management",
-        opexYearlyOther: "Sonstiges",
-        opexYearlyDecommissioning: "Stilllegungsreserve",
-        opexYearlyTotal: "Gesamt",
-        
-        revenueSectionTitle: "💵 Ertragsprognose",
-        revenueSectionDesc: "Tolling-Ertrag und Spotmarkt-Handelsertragsprognose einstellen",
-        spotRevenueForecast: "Spotmarkt-Ertragsprognose (nicht-Tolling-Teil)",
-        spotRevenueHint: "Überschüssiger Strom nimmt am Spotmarkt teil, bitte geben Sie den erwarteten Ertrag pro MW pro Jahr ein",
-        spotPriceUnit: "Spot-Ertragseinzelpreis\n(EUR/MW/Jahr)",
-        quickFillBasePrice: "Schnellausfüllen: Erstjahrspreis",
-        annualGrowthRate: "Jährliche Wachstumsrate (%)",
-        applyButton: "Anwenden",
-        spotRevenueExpected: "Deutscher Spotmarkt-Arbitrageertrag: 30-45k€/MW/Jahr (2025-Prognose)",
-        revenueYearlyDetails: "Ertragsjahresdetails",
-        availableCapacity: "Verfügbare Kapazität (%)",
-        tollingRevenue: "Tolling-Ertrag\n(10.000 EUR)",
-        spotRevenue: "Spot-Ertrag\n(10.000 EUR)",
-        totalRevenue: "Gesamtertrag\n(10.000 EUR)",
-        
-        // Finanzcore Modul
-        indicatorsSectionTitle: "📊 Kernfinanzindikatoren",
-        indicatorsSectionDesc: "Schlüsselsindikatoren für Investitionsrendite und Risikobewertung",
-        indStaticInvestment: "Gesamteinvestition (statisch)",
-        indDynamicInvestment: "Gesamteinvestition (dynamisch)",
-        indTotalRevenue: "Kumulative Gesamtumsatz",
-        indAvgRevenue: "Durchschnittlicher jährlicher Umsatz",
-        indFirst3Revenue: "Erste drei Jahre Gesamtumsatz",
-        indTotalProfit: "Kumulatives Gesamtgewinn",
-        indAvgProfit: "Durchschnittlicher jährlicher Gewinn",
-        indFirst3Profit: "Erste drei Jahre Gesamtgewinn",
-        indTotalNetProfit: "Kumulatives Nettogewinn",
-        indAvgNetProfit: "Durchschnittlicher jährlicher Nettogewinn",
-        indFirst3NetProfit: "Erste drei Jahre Nettogewinn",
-        indProjectIRR: "Projekt-IRR (nach Steuern)",
-        indEquityIRR: "Eigenkapital-IRR (nach Steuern)",
-        indStaticPayback: "Statische Amortisationsdauer",
-        indEquityPayback: "Eigenkapital-Amortisationsdauer (statisch)",
-        indDynamicPayback: "Dynamische Amortisationsdauer (-8%)",
-        indEquityDynamicPayback: "Eigenkapital-Amortisationsdauer (dynamisch-8%)",
-        indROEYear3: "Jahr 3 Eigenkapitalrendite (ROE)",
-        indROI: "Rendite auf Investition (ROI)",
-        indEBITDAReturn: "EBITDA-Rendite",
-        indLCOE: "LCOE ( nivellierter Energiekosten)",
-        indDSCR: "Schuldendienstdeckungsgrad (DSCR)",
-        
-        statementsSectionTitle: "📑 Finanzberichte",
-        statementsSectionDesc: "Erfolgsrechnung, Bilanz, Cashflow-Abschluß",
-        statementIncome: "Erfolgsrechnung",
-        statementBalance: "Bilanz",
-        statementCashflow: "Cashflow-Abschluß",
-        statementLoan: "Darlehensrückzahlungsplan",
-        statementItem: "Posten",
-        loanYear: "Jahr",
-        loanOpeningBalance: "Anfangssaldo",
-        loanInterest: "Zinsen der laufenden Periode",
-        loanPrincipal: "Hauptsumme der laufenden Periode",
-        loanPayment: "Zahlung der laufenden Periode",
-        loanClosingBalance: "Endsaldo",
-        
-        sensitivitySectionTitle: "🔍 Sensitivitätsanalyse",
-        sensitivitySectionDesc: "Analysieren Sie die Auswirkungen von Schlüsselparameteränderungen auf die Investitionsrenditen",
-        sensitivityParams: "Analyseparametersettings",
-        sensitivityVar1: "Analysevariable 1",
-        sensitivityVar2: "Analysevariable 2 (optional)",
-        sensitivityTarget: "Analysezielindikator",
-        sensitivityCapex: "Investitionskosten (CAPEX)",
-        sensitivityTolling: "Tolling-Preis",
-        sensitivitySpot: "Spotpreis",
-        sensitivityOpex: "Betriebskosten (OPEX)",
-        sensitivityLoanRate: "Darlehenszinssatz",
-        sensitivityDegradation: "Batterieentwicklungsrate",
-        sensitivityRange: "Änderungsbereich",
-        sensitivityTo: "bis",
-        sensitivityStep: "Schrittgröße",
-        sensitivityRun: "Analyse ausführen",
-        sensitivityResults: "Analyseergebnisse",
-        sensitivityResultHint: "Bitte wählen Sie Analyseparameter und klicken Sie auf \"Analyse ausführen\"",
-        sensitivityMatrix: "Zwei-Variablen-Sensitivitätsmatrix",
-        
-        reportTitle: "Projektfinanzierungskeitsanalysebericht",
-        reportSubtitle: "Battery Energy Storage System (BESS) Project Financing Report",
-        reportDate: "Berichtsdatum",
-        reportVersion: "Berichtsversion",
-        reportVersionValue: "V1.0",
-        
-        // 融资报告完整模块
-        reportSummaryTitle: "I. Projektsübersicht (Executive Summary)",
-        projectBasicInfo: "Grundlegende Projektinformationen",
-        projectName: "Projektname",
-        projectLocation: "Projektstandort",
-        installedCapacity: "Installierte Kapazität",
-        storageDuration: "Speicherdauer",
-        operationYears: "Betriebszeitraum",
-        projectCompany: "Projektgesellschaft",
-        investmentStructure: "Investitions- und Finanzierungsstruktur",
-        totalInvestment: "Gesamte Projektinvestition",
-        equity: "Eigenkapital",
-        bankLoan: "Bankdarlehen",
-        equityRatio: "Eigenkapitalanteil",
-        loanTerm: "Darlehensfrist",
-        loanRate: "Darlehenszinssatz",
-        coreInvestmentIndicators: "Kerninvestitionsindikatoren",
-        projectIRR: "Projekt-IRR (nach Steuern)",
-        equityIRR: "Eigenkapital-IRR (nach Steuern)",
-        staticPayback: "Statische Amortisationsdauer",
-        dynamicPayback: "Dynamische Amortisationsdauer (8%)",
-        avgDSCR: "Durchschnittlicher DSCR",
-        lcoe: "LCOE (nivellierter Energiekosten)",
-        minDSCR: "Minimaler DSCR",
-        
-        revenueAnalysisTitle: "II. Ertragsstrukturanalyse",
-        revenueSourceComposition: "Ertragquellenzusammensetzung",
-        annualRevenueForecast: "Jährliche Ertragsprognose",
-        revenueStabilityAssessment: "Ertragsstabilitätsbewertung",
-        tollingCoverage: "Tolling-Vertragsabdeckung",
-        tollingRatio: "Tolling-Ertragsanteil",
-        revenueVolatility: "Ertragsschwankungskoeffizient",
-        
-        debtServiceAnalysisTitle: "III. Schuldendienstanalyse",
-        annualDSCRTrend: "Jährlicher DSCR-Trend",
-        cashFlowCoverageAnalysis: "Cashflow-Abdeckungsanalyse",
-        loanRepaymentSchedule: "Darlehensrückzahlungsplan",
-        year: "Jahr",
-        openingPrincipalBalance: "Anfangshauptsumme<br>(10.000 EUR)",
-        annualInterest: "Jährliche Zinsen<br>(10.000 EUR)",
-        annualPrincipal: "Jährliche Hauptsumme Tilgung<br>(10.000 EUR)",
-        annualPayment: "Jährliche Zahlung<br>(10.000 EUR)",
-        closingPrincipalBalance: "Endhauptsumme<br>(10.000 EUR)",
-        ebitda: "EBITDA<br>(10.000 EUR)",
-        dscr: "DSCR",
-        
-        profitabilityAnalysisTitle: "IV. Rentabilitätsanalyse",
-        annualProfitTrend: "Jährlicher Gewinn-Trend",
-        cumulativeCashFlow: "Kumulativer Cashflow",
-        avgEBITDA: "Durchschnittliches EBITDA<br>(10.000 EUR)",
-        avgNetProfit: "Durchschnittlicher Nettogewinn<br>(10.000 EUR)",
-        ebitdaMargin: "EBITDA-Marge<br>(%)",
-        netMargin: "Nettogewinnmarge<br>(%)",
-        
-        riskAnalysisTitle: "V. Risikoanalyse & Stress-Test",
-        sensitivityAnalysisTitle: "Schlüsselsindikator-Sensitivitätsanalyse",
-        stressTestScenarios: "Stress-Test-Szenarien",
-        scenario: "Szenario",
-        assumptions: "Annahmen",
-        riskAssessmentMatrix: "Risikobewertungsmatrix",
-        marketRisk: "Marktrisiko: Niedrig",
-        marketRiskNote: "Tolling-Vertrag gesperrt",
-        technicalRisk: "Technisches Risiko: Niedrig",
-        technicalRiskNote: "Reife Lithiumbatterietechnologie",
-        operationalRisk: "Betriebsrisiko: Mittel",
-        operationalRiskNote: "Batterieentwicklungsmanagement",
-        policyRisk: "Politikrisiko: Niedrig",
-        policyRiskNote: "Deutsche Energiewende-Unterstützung",
-        
-        financialStructureAnalysisTitle: "VI. Finanzstrukturanalyse",
-        leverageRatioTrend: "Verschuldungsgrad-Trend",
-        roeTrend: "Eigenkapitalrendite (ROE)-Trend",
-        
-        conclusionTitle: "VII. Fazit & Empfehlungen",
-        investmentRating: "Investitionsrating: <strong id='rpt_rating'>-</strong>",
-        projectStrengths: "Projektstärken:",
-        projectConcerns: "Wichtige Überlegungen:",
-        financingRecommendations: "Finanzierungsempfehlungen:",
-        
-        appendixTitle: "Anhang: Detaillierte Finanzprognosetabellen",
-        cashFlowForecast: "Cashflow-Prognose",
-        incomeForecast: "Einkommensprognose",
-        balanceSheetForecast: "Bilanzprognose",
-        
-        reportFooterZh: "Dieser Bericht wird automatisch vom Deutschen unabhängigen Energiespeicher-Kraftwerk-Investitionsberechnungssystem generiert und dient ausschließlich als Referenz für Finanzierungsentscheidungen.",
-        reportFooterEn: "This report is auto-generated for financing decision reference only.",
-        
-        // Hilfe-Modal
-        helpModalTitle: "📖 Hilfe",
-        helpTabQuickstart: "Schnellstart",
-        helpTabParameters: "Parameter-Einstellungen",
-        helpTabFeatures: "Funktionen",
-        helpTabFinance: "Finanzwissen",
-        helpTabTips: "Tipps",
-        
-        // Schnellstart-Bereich
-        quickstartTitle: "🚀 Schnellstart",
-        quickstartStep1: "<strong>Anmelden</strong>: Verwenden Sie Ihren Benutzernamen und Ihr Passwort, um sich anzumelden",
-        quickstartStep2: "<strong>Parameter einstellen</strong>: Legen Sie in der Registerkarte 'Grenzwerteinstellungen' die grundlegenden Projektparameter fest",
-        quickstartParam1: "Kraftwerkskapazität und Leistung",
-        quickstartParam2: "Batteriemodell (Preis und Abbauparameter werden nach der Auswahl automatisch ausgefüllt)",
-        quickstartParam3: "Gerätekonfiguration und Preise",
-        quickstartParam4: "Finanzierungsparameter",
-        quickstartStep3: "<strong>OPEX einstellen</strong>: Legen Sie in der Registerkarte 'OPEX-Einstellungen' die jährlichen Betriebskosten fest",
-        quickstartStep4: "<strong>Erträge einstellen</strong>: Legen Sie in der Registerkarte 'Einnahmenprognose' die Ertragsquellen und Preise fest",
-        quickstartStep5: "<strong>Ergebnisse anzeigen</strong>: Klicken Sie auf die Schaltfläche 'Berechnen' oder warten Sie auf die automatische Berechnung nach Parameteränderungen, um Finanzindikatoren und Berichte anzuzeigen",
-
-        quickstartTip: "💡 Tipp:",
-        quickstartTipContent: "Das System unterstützt die automatische Parameterberechnung. Die Ergebnisse werden 500 Millisekunden nach Parameteränderungen automatisch aktualisiert, Sie müssen nicht manuell auf die Berechnungsschaltfläche klicken.",
-        
-        // Parameter-Einstellungen-Bereich
-        parametersTitle: "⚙️ Parameter-Einstellungsanweisungen",
-        parametersBasicParams: "1. Grundlegende Kraftwerksparameter",
-        parametersPower: "<strong>Installierte Leistung</strong>: Nennleistung des Energiespeichersystems (MW)",
-        parametersCapacity: "<strong>Energiespeicherkapazität</strong>: Gesamte Kapazität des Energiespeichersystems (MWh)",
-        parametersDuration: "<strong>Speicherdauer</strong>: Automatisch berechnet (Kapazität/Leistung), normalerweise 2-4 Stunden",
-        parametersOperationYears: "<strong>Betriebsjahre</strong>: Projektbetriebszeitraum, normalerweise 15-20 Jahre",
-        parametersInitialCapacity: "<strong>Erstjährige verfügbare Batteriekapazität</strong>: Anfangsverfügbare Kapazitätsquote neuer Batterien",
-        parametersDegradation: "2. Kapazitätsabbaueinstellungen",
-        parametersDegradationMode: "<strong>Abbaumodus</strong>:",
-        parametersLinearDegradation: "Lineare Degradation: Feste jährliche Abbaurate, geeignet für die meisten LFP-Batterien",
-        parametersNonlinearDegradation: "Nichtlineare Degradation: Schnelle anfängliche Degradation, später langsam",
-        parametersCycleBasedDegradation: "Zyklusbasierte Degradation: Kapazitätsverlust basierend auf Zykluszahl berechnet",
-        parametersAutoFill: "<strong>Autofüllen</strong>: Nach der Auswahl eines Batteriemodells füllt das System automatisch die Standardabbauparameter für dieses Modell aus",
-        parametersBatterySystem: "3. Batteriesystem",
-        parametersBatteryModel: "<strong>Batteriekabinettenmodell</strong>: Wählen Sie Hersteller und Modell der Batterie, das System füllt automatisch Preis und Abbauparameter aus",
-        parametersBatteryPrice: "<strong>Batterieeinzelpreis</strong>: Preis pro MWh Batterie (10.000 EUR), wird basierend auf dem ausgewählten Modell automatisch ausgefüllt",
-        parametersBatteryCount: "<strong>Batteriekabinettenanzahl</strong>: Automatisch vom System basierend auf Gesamtkapazität und Einzelschrankkapazität berechnet",
-        parametersFinancing: "4. Finanzierungsparameter",
-        parametersEquityRatio: "<strong>Eigenkapitalanteil</strong>: Deutsche Projekte normalerweise 25-30%",
-        parametersLoanTerm: "<strong>Darlehensfrist</strong>: Normalerweise 10-15 Jahre",
-        parametersLoanRate: "<strong>Darlehenszinssatz</strong>: Europäischer Marktreferenzzinssatz um 4-5% im Jahr 2025",
-        parametersRepaymentMethod: "<strong>Rückzahlungsmethode</strong>: Gleicher Hauptbetrag oder gleicher Gesamtbetrag",
-        parametersCapex: "5. CAPEX-Einstellungen",
-        parametersCapexAuto: "Das System berechnet automatisch verschiedene CAPEX basierend auf der Gerätekonfiguration",
-        parametersCapexItems: "Einschließlich: Gerätekosten, Netzanbindung, Bodeninfrastruktur, Installations- und Baukosten, Versicherung, Entwicklungskosten usw.",
-        parametersCapexUpdate: "Alle Parameter geändert, CAPEX-Details werden automatisch aktualisiert",
-        
-        // Funktionen-Bereich
-        featuresTitle: "✨ Funktionen",
-        featuresAutoCalc: "1. Automatische Berechnung",
-        featuresAutoCalc1: "Nach Änderung eines beliebigen Parameters berechnet das System nach 500 Millisekunden automatisch neu",
-        featuresAutoCalc2: "Keine manuelle Klick auf die Schaltfläche \"Berechnen\" erforderlich",
-        featuresAutoCalc3: "Alle Tabellen und Diagramme werden automatisch aktualisiert",
-        featuresFormatting: "2. Datenformatierung",
-        featuresFormatting1: "Alle Werte werden im deutschen Tausenderformat angezeigt (1.234.567,89)",
-        featuresFormatting2: "Währungseinheit: 10.000 EUR",
-        featuresFormatting3: "Automatische Prozentformatierung",
-        featuresSaveImport: "3. Modell-Speicherung und -Import",
-        featuresSaveModel: "<strong>Modell speichern</strong>: Klicken Sie auf die Schaltfläche \"Speichern\", um alle aktuellen Parameter als JSON-Datei zu speichern",
-        featuresImportModel: "<strong>Modell importieren</strong>: Klicken Sie auf die Schaltfläche \"Importieren\", um zuvor gespeicherte Modellparameter zu laden",
-        featuresCompareScenarios: "Erleichtert den Parametervergleich und Szenariomanagement in verschiedenen Situationen",
-        featuresExport: "4. Berichtsexport",
-        featuresExportReport: "<strong>Bericht exportieren</strong>: Generieren Sie einen vollständigen Finanzanalysbericht (PDF-Format)",
-        featuresExportContent: "Einschließlich: Projektübersicht, CAPEX-Details, Finanzindikatoren, Finanzberichte usw.",
-        featuresExportPurpose: "Geeignet für Präsentationen an Investoren, Banken und andere Institutionen",
-        featuresSensitivity: "5. Sensitivitätsanalyse",
-        featuresSensitivity1: "Analysieren Sie die Auswirkungen von Schlüsselparameteränderungen auf Finanzindikatoren",
-        featuresSensitivity2: "Unterstützung der gleichzeitigen Änderungsanalyse mehrerer Parameter",
-        featuresSensitivity3: "Generieren von Sensitivitätsanalysediagrammen",
-        featuresFinancingReport: "6. Finanzierungsbericht",
-        featuresFinancingReport1: "Generieren Sie Finanzberichte, die für die Bankenfinanzierung erforderlich sind",
-        featuresFinancingReport2: "Einschließlich: Projektübersicht, Finanzindikatoren, Cashflow-Prognose, Schuldendienstfähigkeitsanalyse usw.",
-        
-        // Finanzwissen-Bereich
-        financeTitle: "📚 Finanzwissen-Spalte",
-        financeStatements: "I. Grundlagen der drei wichtigsten Finanzberichte",
-        financeIncomeStatement: "1. Erfolgsrechnung",
-        financeIncomeStatementDesc: "<strong>Einfaches Verständnis:</strong> Die Erfolgsrechnung ist wie eine \"Zeugnis\" des Unternehmens, das Ihnen sagt, wie viel Geld verdient wurde, wie viel ausgegeben wurde und wie viel am Ende des Jahres übrig bleibt.",
-        financeCoreFormula: "Kernformel:",
-        financeNetProfitFormula: "Nettogewinn = Betriebserlöse - Betriebskosten - Betriebsausgaben - Abschreibung und Amortisation - Zinsen - Einkommensteuer",
-        financeIncomeStatementStructure: "Erfolgsrechnungsstruktur:",
-        financeRevenue: "Betriebserlöse",
-        financeRevenueDesc: "(Oben, Summe aller Einnahmen)",
-        financeOperatingCost: "Betriebskosten",
-        financeOperatingCostDesc: "(Direkte Kosten, wie Gerätewartung)",
-        financeGrossProfit: "Bruttogewinn",
-        financeOperatingExpenses: "Betriebsausgaben",
-        financeOperatingExpensesDesc: "(OPEX: Arbeit, Versicherung, Bodenpacht usw.)",
-        financeDepreciation: "Abschreibung und Amortisation",
-        financeDepreciationDesc: "(Gerätewert nimmt von Jahr zu Jahr ab)",
-        financeEBITDA: "EBITDA",
-        financeEBITDADesc: "(Ergebnis vor Zinsen, Steuern, Abschreibungen und Amortisationen)",
-        financeInterest: "Zinsen",
-        financeInterestDesc: "(Bankdarlehenszinsen)",
-        financeEBIT: "Steuervorsteuerlicher Gewinn (EBT)",
-        financeTax: "Einkommensteuer",
-        financeNetProfit: "Nettogewinn",
-        financeNetProfitDesc: "(Endgeld verdient)",
-        financeKeyUnderstanding: "💡 Wichtiges Verständnis:",
-        financeEBITDAKeyPoint: "EBITDA ist ein wichtiger Indikator zur Messung der Betriebsfähigkeit eines Projekts, da es die Auswirkungen von Abschreibung, Zinsen und Steuern ausschließt und besser die wahre Rentabilität des Projekts widerspiegelt.",
-        financeCashFlowStatement: "2. Cashflow-Abschluß",
-        financeCashFlowStatementDesc: "<strong>Einfaches Verständnis:</strong> Der Cashflow-Abschluß ist wie ein \"Bankkontoauszug\" des Unternehmens, der Cash-Ein- und Ausflüsse aufzeichnet und Ihnen sagt, wie viel Geld tatsächlich erhalten und ausgegeben wurde.",
-        financeNetCashFlowFormula: "Netto-Cashflow = Betriebscashflow + Investitionscashflow + Finanzierungscashflow",
-        financeCashFlowActivities: "Drei Hauptaktivitäten des Cashflow-Abschlusses:",
-        financeOperatingCashFlow: "Betriebscashflow",
-        financeOperatingCashFlowSource: "Quelle: Betriebserlöse - Betriebskosten",
-        financeOperatingCashFlowDesc: "Beschreibung: Cash aus täglichen Projektbetrieben erzeugt",
-        financeInvestingCashFlow: "Investitionscashflow",
-        financeInvestingCashFlowSource: "Quelle: Bauzeitinvestition (negativ), Restwertgewinnung (positiv)",
-        financeInvestingCashFlowDesc: "Beschreibung: Einmalige große Ausgaben wie Gerätekauf, Kraftwerkbau",
-        financeFinancingCashFlow: "Finanzierungscashflow",
-        financeFinancingCashFlowSource: "Quelle: Aktionärsinvestition (positiv), Bankdarlehen (positiv), Haupt- und Zinsrückzahlung (negativ)",
-        financeFinancingCashFlowDesc: "Beschreibung: Wie Gelder zur Unterstützung des Projekts aufgebracht werden",
-        financeCashFlowKeyPoint: "Die Erfolgsrechnung zeigt \"wie viel Geld verdient wurde\", der Cashflow-Abschluß zeigt \"wie viel Geld tatsächlich erhalten wurde\". Sie können unterschiedlich sein, da Abschreibung keine Cash-Ausgabe ist, aber den Gewinn beeinflußt.",
-        financeBalanceSheet: "3. Bilanz",
-        financeBalanceSheetDesc: "<strong>Einfaches Verständnis:</strong> Die Bilanz ist wie eine \"Inventurliste\" des Unternehmens, die links das, was Sie besitzen (Vermögen), und rechts das, was Sie anderen schulden (Verbindlichkeiten) und Ihr eigenes Geld (Eigenkapital) auflistet.",
-        financeAccountingEquation: "Kernformel (Bilanzgleichung):",
-        financeBalanceSheetFormula: "Vermögen = Verbindlichkeiten + Eigenkapital",
-        financeBalanceSheetStructure: "Bilanzstruktur:",
-        financeAssetsSide: "Vermögen (linke Seite)",
-        financeCash: "Bargeld und Bargeldäquivalente",
-        financeCashDesc: "Bargeld auf Bankkonten",
-        financeFixedAssets: "Netto-Anlagevermögen",
-        financeFixedAssetsDesc: "Ursprünglicher Gerätewert - kumulierte Abschreibung",
-        financeIntangibleAssets: "Immaterielles Vermögen",
-        financeIntangibleAssetsDesc: "Land, Entwicklungskosten usw.",
-        financeTotalAssets: "Gesamtes Vermögen",
-        financeLiabilitiesEquitySide: "Verbindlichkeiten + Eigenkapital (rechte Seite)",
-        financeLongTermDebt: "Langfristige Darlehen",
-        financeLongTermDebtDesc: "Bankdarlehensrest",
-        financePaidInCapital: "Gezeichnetes Eigenkapital",
-        financePaidInCapitalDesc: "Von Aktionären investiertes Geld",
-        financeRetainedEarnings: "Übrig gebliebene Gewinne",
-        financeRetainedEarningsDesc: "Jährlicher kumulativer Nettogewinn",
-        financeTotalLiabilitiesEquity: "Verbindlichkeiten + Eigenkapital",
-        financeBalanceSheetKeyPoint: "Die Bilanz muss sich ausgleichen! Die linke Seite (Vermögen) entspricht immer der rechten Seite (Verbindlichkeiten + Eigenkapital). Wenn nicht, gibt es einen Berechnungsfehler.",
-        financeKeyMetrics: "II. Detaillierte Erklärung der Kernfinanzindikatoren",
-        financeIRR: "1. IRR - Interner Rate of Return",
-        financeIRRDesc: "<strong>Einfaches Verständnis:</strong> IRR ist \"Wenn dieses Projekt ein Bankkonto wäre, was wäre dann der jährliche Zinssatz?\" Es sagt Ihnen die annualisierte Rendite bei der Investition in dieses Projekt.",
-        financeCalculationFormula: "Berechnungsformel:",
-        financeIRRFormula: "NPV = Σ(Cashflow / (1 + IRR)^Jahr) = 0",
-        financeIRRSolution: "Lösen Sie IRR durch Probe und Fehler, indem Sie den Nettobarwert auf null setzen",
-        financeIRRDiagram: "IRR-Berechnungsdiagramm:",
-        financeIRRYear0: "Jahr 0: -10 Millionen (Investition)",
-        financeIRRYear1: "Jahr 1: +2 Millionen",
-        financeIRRYear2: "Jahr 2: +3 Millionen",
-        financeIRRYears: "... Weiter für 20 Jahre",
-        financeIRRDefinition: "IRR = Der Zinssatz, der die diskontierte Summe aller Cashflows auf null setzt",
-        financeHowToInterpret: "💡 Wie zu interpretieren:",
-        financeIRRGood: "IRR > 8% (Marktreferenzzinssatz): Projekt ist attraktiv",
-        financeIRRExcellent: "IRR > 12%: Sehr gutes Investitionsprojekt",
-        financeIRRBad: "IRR < 8%: Vielleicht nicht wert, zu investieren",
-        financeIRRTotal: "Gesamteinvestitions-IRR: Berücksichtigt die Rendite auf alle Gelder (Eigenkapital + Darlehen)",
-        financeIRREquity: "Eigenkapital-IRR: Berücksichtigt nur die Rendite auf eigene Gelder (normalerweise höher)",
-        financeNPV: "2. NPV - Net Present Value",
-        financeNPVDesc: "<strong>Einfaches Verständnis:</strong> NPV ist, um zukünftiges Geld basierend auf Zinssatz \"diskontiert\" zu heute zu machen, um zu sehen, wie viel es wert ist. Wenn NPV positiv ist, lohnt es sich, in das Projekt zu investieren.",
-        financeNPVFormula: "NPV = Σ(Cashflow / (1 + Diskontsatz)^Jahr)",
-        financeNPVDiscountRate: "Diskontsatz normalerweise 8% (Marktreferenzzinssatz)",
-        financeNPVExample: "NPV-Berechnungsbeispiel:",
-        financeYear: "Jahr",
-        financeCashFlow: "Cashflow",
-        financeDiscountFactor: "Diskontierungsfaktor (8%)",
-        financePresentValue: "Barwert",
-        financeNPVTotal: "NPV-Gesamt",
-        financeNPVPositive: "NPV > 0: Projekt lohnt sich zu investieren, schafft Wert",
-        financeNPVZero: "NPV = 0: Projekt gerade einmal rentabel (Diskontsatz = IRR zu diesem Zeitpunkt)",
-        financeNPVNegative: "NPV < 0: Projekt lohnt sich nicht zu investieren",
-        financeNPVGreater: "Je größer der NPV, desto attraktiver das Projekt",
-        financePaybackPeriod: "3. Amortisationsdauer",
-        financePaybackPeriodDesc: "<strong>Einfaches Verständnis:</strong> Amortisationsdauer ist \"Wie lange dauert es, das Kapital zurückzuerhalten?\" Es sagt Ihnen, wie viele Jahre benötigt werden, um die Anfangsinvestition zurückzuerhalten.",
-        financeStaticPayback: "Statische Amortisationsdauer:",
-        financeStaticPaybackFormula: "Das Jahr, in dem der kumulative Cashflow erstmals positiv wird",
-        financeDynamicPayback: "Dynamische Amortisationsdauer:",
-        financeDynamicPaybackFormula: "Das Jahr, in dem der kumulative diskontierte Cashflow erstmals positiv wird",
-        financePaybackDiagram: "Amortisationsdiagramm:",
-        financePaybackYear0: "Jahr 0",
-        financePaybackInvestment: "Investition -10 Millionen",
-        financePaybackYears17: "Jahre 1-7",
-        financePaybackRecovering: "Kapital zurückerhalten",
-        financePaybackYear8: "Jahr 8",
-        financePaybackCompleted: "✅ Vollständig zurückerhalten",
-        financePaybackResult: "Amortisationsdauer = 8 Jahre",
-        financePaybackIdeal: "Je kürzer die Amortisationsdauer, desto besser, normalerweise < 10 Jahre",
-        financeStaticPaybackNote: "Statische Amortisationsdauer: Berücksichtigt nicht den Zeitwert des Geldes (einfach aber nicht genau genug)",
-        financeDynamicPaybackNote: "Dynamische Amortisationsdauer: Berücksichtigt den Zeitwert des Geldes (genauer, normalerweise länger als statische Amortisationsdauer)",
-        financeTotalPayback: "Gesamteinvestitionsamortisationsdauer: Berücksichtigt alle Gelder (Eigenkapital + Darlehen)",
-        financeEquityPayback: "Eigenkapitalamortisationsdauer: Berücksichtigt nur eigene Gelder (normalerweise kürzer)",
-        financeROI: "4. ROI - Return on Investment",
-        financeROIDesc: "<strong>Einfaches Verständnis:</strong> ROI ist \"Wie viel Geld kann pro Jahr im Durchschnitt als Prozentsatz der Investition verdient werden?\",
-        financeROIFormula: "ROI = (Durchschnittlicher jährlicher Nettogewinn / Gesamteinvestition) × 100%",
-        financeROIBasic: "ROI > 5%: Projekt hat grundlegende Rentabilität",
-        financeROIGood: "ROI > 8%: Projekt hat gute Rentabilität",
-        financeROIPoor: "ROI < 5%: Projekt hat schwache Rentabilität",
-        financeROILimit: "ROI ist ein einfacher und intuitiver Indikator, berücksichtigt aber nicht den Zeitwert des Geldes",
-        financeROE: "5. ROE - Return on Equity",
-        financeROEDesc: "<strong>Einfaches Verständnis:</strong> ROE ist \"Wie viel Geld können Aktionäre pro Jahr als Prozentsatz ihrer Investition zurückerhalten?\",
-        financeROEFormula: "ROE = (Nettogewinn / Eigenkapital) × 100%",
-        financeROECalculation: "Normalerweise berechnen Sie ROE für das 3. Jahr, da das Projekt stabil betrieben wird",
-        financeROEExcellent: "ROE > 15%: Excellent Aktionärsrendite",
-        financeROELeverage: "ROE berücksichtigt die Auswirkung der finanziellen Hebelwirkung (Darlehen) und spiegelt die tatsächliche Aktionärsrendite besser wider als ROI",
-        financeDSCR: "6. DSCR - Debt Service Coverage Ratio",
-        financeDSCRDesc: "<strong>Einfaches Verständnis:</strong> DSCR ist \"Reicht das pro Jahr verdiente Geld aus, um das Darlehen zurückzuzahlen?\" Wenn DSCR=1,5 bedeutet das, dass das verdiente Geld das Darlehensrückzahlungsbetrag um das 1,5-fache übersteigt, was sehr sicher ist.",
-        financeDSCRFormula: "DSCR = EBITDA / Darlehens-Haupt- und Zinsrückzahlung",
-        financeDSCRCalculation: "Normalerweise berechnen Sie den Durchschnitt während des Betriebszeitraums",
-        financeDSCRDiagram: "DSCR-Diagramm:",
-        financeDebtService: "Haupt- und Zinsrückzahlung",
-        financeDSCRGood: "DSCR > 1,2: Ausreichende Schuldendienstfähigkeit, normalerweise von Banken gefordert",
-        financeDSCRBorderline: "DSCR = 1,0: Genau genug, um das Darlehen zurückzuzahlen, hohes Risiko",
-        financeDSCRBad: "DSCR < 1,0: Nicht genug, um das Darlehen zurückzuzahlen, Projekt hat Risiko",
-        financeDSCRBank: "DSCR ist ein wichtiger Indikator für Banken zur Bewertung des Darlehensrisikos eines Projekts",
-        financeImportantConcepts: "III. Wichtige Finanzkonzepte",
-        financeCapexVsOpex: "1. CAPEX vs OPEX",
-        financeCapex: "CAPEX (Kapitalaufwand)",
-        financeCapexPoint1: "Einmalige große Investition",
-        financeCapexPoint2: "Wie: Gerätekauf, Baukosten",
-        financeCapexPoint3: "Durch jährliche Abschreibung in Kosten eingeschlossen",
-        financeCapexPoint4: "Beeinflusst die Bilanz",
-        financeOpex: "OPEX (Betriebsaufwand)",
-        financeOpexPoint1: "Jährliche Betriebskosten",
-        financeOpexPoint2: "Wie: Arbeit, Versicherung, Wartung",
-        financeOpexPoint3: "Direkt in die Kosten des laufenden Jahres eingeschlossen",
-        financeOpexPoint4: "Beeinflusst die Erfolgsrechnung",
-        financeDepreciationDesc: "<strong>Einfaches Verständnis:</strong> Geräte altern und ihr Wert nimmt ab. Abschreibung dient dazu, Gerätekosten über ihre Nutzungsdauer zu verteilen und jedes Jahr einen Teil ihres Werts \"aufzubrauchen\".",
-        financeStraightLineDepreciation: "Lineare Abschreibungsformel:",
-        financeDepreciationFormula: "Jährliche Abschreibung = (Ursprünglicher Vermögenswert - Restwert) / Abschreibungsjahre",
-        financeDepreciationKeyPoint: "Abschreibung ist keine Cash-Ausgabe, reduziert aber den Gewinn. Es verteilt einmalige Investitionen (CAPEX) über mehrere Jahre, wodurch die Erfolgsrechnung vernünftiger wird.",
-        financeDiscounting: "3. Diskontierung",
-        financeDiscountingDesc: "<strong>Einfaches Verständnis:</strong> 100 Yuan heute sind mehr wert als 100 Yuan nächstes Jahr (weil Sie sie auf dem Bankkonto hinterlegen und Zinsen verdienen können). Diskontierung dient dazu, zukünftiges Geld in heutigen Wert umzuwandeln.",
-        financeDiscountFormula: "Diskontierungsformel:",
-        financePresentValueFormula: "Barwert = Zukunftswert / (1 + Diskontsatz)^Jahre",
-        financeDiscountRateNote: "Diskontsatz normalerweise 8% (Marktreferenzzinssatz)",
-        financeDiscountingExample: "Diskontierungsbeispiel:",
-        financeFutureValue: "1 Million in 10 Jahren",
-        financePresentValueExample: "463.000 heute",
-        financeDiscountRateCalculation: "(Berechnet mit 8% Diskontsatz)",
-        financeHowToInterpretMetrics: "IV. Wie man Finanzindikatoren interpretiert",
-        financeComprehensiveAssessment: "📊 Umfassende Projektbewertung:",
-        financeProfitability: "<strong>Rentabilität:</strong> Schauen Sie sich IRR, NPV, ROI, ROE an - je höher, desto besser",
-        financePaybackSpeed: "<strong>Rückzahlungsgeschwindigkeit:</strong> Schauen Sie sich die Amortisationsdauer an - je kürzer, desto besser (normalerweise < 10 Jahre)",
-        financeDebtServiceAbility: "<strong>Schuldendienstfähigkeit:</strong> Schauen Sie sich DSCR an - muss > 1,2 sein (Bankenanforderung)",
-        financeCashFlow: "<strong>Cashflow:</strong> Schauen Sie sich den Cashflow-Abschluß an - stellen Sie sicher, dass jedes Jahr positiver Cashflow vorhanden ist",
-        financeRiskControl: "<strong>Risikokontrolle:</strong> Verwenden Sie Sensitivitätsanalyse, um zu sehen, welche Parameteränderungen den größten Einfluss haben",
-        
-        // Tipps-Bereich
-        tipsTitle: "💡 Tipps",
-        tipsParameterSetting: "1. Parameter-Einstellungstipps",
-        tipsUseDefaults: "<strong>Standardwerte verwenden</strong>: Das System hat vorangefertigte deutsche Marktstandardparameter, die direkt verwendet werden können",
-        tipsBatterySelection: "<strong>Batteriemodellauswahl</strong>: Nach der Auswahl eines Batteriemodells werden Preis und Abbauparameter automatisch ausgefüllt, keine manuelle Eingabe erforderlich",
-        tipsParameterHints: "<strong>Parameterhinweise</strong>: Jede Eingabebox hat Hinweisinformationen, die den marktreferenziellen Bereich zeigen",
-        tipsFinancialAnalysis: "2. Finanzanalysetipps",
-        tipsKeyMetrics: "<strong>Fokus auf Schlüsselindikatoren</strong>: IRR, NPV, Amortisationsdauer, DSCR, ROI usw.",
-        tipsCompareScenarios: "<strong>Vergleichen Sie verschiedene Szenarien</strong>: Verwenden Sie Speicher/Import-Funktionen, um die Finanzleistung verschiedener Parameterkonfigurationen zu vergleichen",
-        tipsSensitivityAnalysis: "<strong>Sensitivitätsanalyse</strong>: Identifizieren Sie, welche Parameter den größten Einfluss auf die Projektprofitabilität haben",
-        tipsCommonQuestions: "3. Häufig gestellte Fragen",
-        tipsQuestionCapex: "<strong>F: Warum wurde die CAPEX-Detailtabelle nicht aktualisiert?</strong><br>                            A: Das System wird 500 Millisekunden nach Parameteränderungen automatisch aktualisiert, bitte warten Sie einen Moment. Wenn es immer noch nicht aktualisiert wurde, können Sie manuell auf die Schaltfläche \"Berechnen\" klicken.",
-        tipsQuestionReset: "<strong>F: Wie setze ich alle Parameter zurück?</strong><br>                            A: Aktualisieren Sie die Seite, um die Standardparameter wiederherzustellen, oder importieren Sie eine zuvor gespeicherte Modellätdatei.",
-        tipsQuestionDegradation: "<strong>F: Wie stelle ich Batterieabbauparameter ein?</strong><br>                            A: Nach der Auswahl eines Batteriemodells füllt das System automatisch die Standardabbauparameter für dieses Modell aus. Sie können sie auch manuell basierend auf den tatsächlichen Bedingungen anpassen.",
-        tipsQuestionExport: "<strong>F: Wie exportiere ich einen vollständigen Finanzbericht?</strong><br>                            A: Klicken Sie auf die Schaltfläche \"Exportieren\", und das System generiert einen PDF-Bericht mit allen Finanzdaten.",
-        tipsBestPractices: "4. Beste Praktiken",
-        tipsBestPractice1: "Verwenden Sie zunächst Standardparameter für eine vorläufige Berechnung, um die grundlegende Finanzleistung des Projekts zu verstehen",
-        tipsBestPractice2: "Passen Sie Schlüsselparameter schrittweise basierend auf den tatsächlichen Projektbedingungen an",
-        tipsBestPractice3: "Verwenden Sie Sensitivitätsanalyse, um Projektrisikopunkte zu identifizieren",
-        tipsBestPractice4: "Speichern Sie mehrere Szenarien für einfachen Vergleich und Entscheidungsfindung",
-        tipsBestPractice5: "Aktualisieren Sie regelmäßig Marktparameter (wie Strompreise, Gerätepreise usw.)",
-        tipsNotes: "5. Hinweise",
-        tipsNote1: "Finanzmodelle dienen nur als Referenz, tatsächliche Entscheidungen müssen Marktforschung und Expertinnenmeinungen kombinieren",
-        tipsNote2: "Deutsche Marktparameter ändern sich im Laufe der Zeit, regelmäßige Updates werden empfohlen",
-        tipsNote3: "Politiken, Strompreise usw. können je nach Region variieren, müssen basierend auf den tatsächlichen Bedingungen angepasst werden",
-        tipsNote4: "Batteryabbauparameter basieren auf Branchendurchschnitten, tatsächliche Degradation kann aufgrund der Nutzungbedingungen variieren",
-        
-        // Fußzeilenbereich
-        modalCloseButton: "Schließen"
-    }
-};
@@ -0,0 +1,428 @@
+/**
+ * 德国独立储能电站投资测算系统 - 模型结果缓存
+ * @description 以参数内容哈希为键的两级缓存：内存LRU层 + 可选localStorage持久层（容量上限+淘汰），
+ *              供主计算、敏感性分析、目标求解等重复计算相同参数组时复用结果
+ * @version 1.0
+ */
+
+// ==================== 缓存配置 ====================
+
+/** @type {string} 缓存格式版本，模型算法变化时递增以使旧的持久化结果失效 */
+const MODEL_CACHE_VERSION = '4';
+
+/** @type {number} 浮点数规范化的有效数字位数（吸收0.1+0.2类的尾差） */
+const CACHE_FLOAT_PRECISION = 12;
+
+/** @type {Object} 默认缓存配置 */
+const MODEL_CACHE_DEFAULTS = {
+    maxEntries: 500,              // 内存层最多缓存的结果数
+    persistent: false,            // 是否启用localStorage持久层
+    storagePrefix: 'bess_model_cache:',
+    storage: null,                // 持久层存储对象，缺省使用localStorage
+    maxBytes: 2 * 1024 * 1024     // 持久层容量上限（按字符数估算）
+};
+
+/** @type {string} 持久层中非有限数值（NaN、±Infinity）的标记键，JSON本身无法表示这些值 */
+const NON_FINITE_TAG = '$nonFinite';
+
+// ==================== 规范化与哈希 ====================
+
+/**
+ * 规范化数字：统一有效位数，-0 与 0 视为同一值
+ * @param {number} value 数字
+ * @returns {string} 规范化后的文本
+ */
+function canonicalNumber(value) {
+    if (Number.isInteger(value)) {
+        return value === 0 ? '0' : String(value);
+    }
+    if (!isFinite(value)) {
+        return String(value);
+    }
+    return String(Number(value.toPrecision(CACHE_FLOAT_PRECISION)));
+}
+
+/**
+ * 规范化序列化：数字统一有效位数、对象键排序，保证等价参数得到相同的文本
+ * @param {*} value 任意参数值
+ * @returns {string} 规范化后的文本
+ */
+function canonicalizeValue(value) {
+    if (typeof value === 'number') {
+        return canonicalNumber(value);
+    }
+    if (Array.isArray(value) || ArrayBuffer.isView(value)) {
+        let text = '[';
+        for (let i = 0; i < value.length; i++) {
+            text += (i > 0 ? ',' : '') + canonicalizeValue(value[i]);
+        }
+        return text + ']';
+    }
+    if (value && typeof value === 'object') {
+        const keys = Object.keys(value).sort();
+        let text = '{';
+        for (let i = 0; i < keys.length; i++) {
+            if (value[keys[i]] === undefined) continue;
+            text += (text.length > 1 ? ',' : '') + JSON.stringify(keys[i]) + ':' + canonicalizeValue(value[keys[i]]);
+        }
+        return text + '}';
+    }
+    return value === undefined ? 'null' : JSON.stringify(value);
+}
+
+/**
+ * 计算字符串的64位哈希（两路32位FNV-1a变体拼接）
+ * @param {string} str 输入字符串
+ * @returns {string} 16位十六进制哈希
+ */
+function hashString(str) {
+    let h1 = 0x811c9dc5;
+    let h2 = 0x01000193 ^ str.length;
+    for (let i = 0; i < str.length; i++) {
+        const c = str.charCodeAt(i);
+        h1 = Math.imul(h1 ^ c, 0x01000193);
+        h2 = Math.imul(h2 ^ c, 0x5bd1e995);
+        h2 ^= h2 >>> 15;
+    }
+    h1 ^= h1 >>> 13;
+    h1 = Math.imul(h1, 0xc2b2ae35);
+    h1 ^= h1 >>> 16;
+    return (h1 >>> 0).toString(16).padStart(8, '0') + (h2 >>> 0).toString(16).padStart(8, '0');
+}
+
+/**
+ * 生成模型运行的内容寻址键
+ * @param {string} namespace 计算类型（如 'model'）
+ * @param {Object} params 参数对象
+ * @param {*} [extra] 参与计算的附加输入（如现货价格数组）
+ * @returns {string} 缓存键
+ */
+function computeParamsHash(namespace, params, extra) {
+    const canonical = MODEL_CACHE_VERSION + '|' + namespace + '|' + canonicalizeValue(params) + '|' + canonicalizeValue(extra);
+    return namespace + ':' + hashString(canonical);
+}
+
+// ==================== 内存LRU层 ====================
+
+/**
+ * 基于Map插入顺序实现的LRU缓存
+ */
+class LRUCache {
+    /**
+     * @param {number} maxEntries 最大条目数
+     */
+    constructor(maxEntries) {
+        this.maxEntries = maxEntries;
+        this.map = new Map();
+        this.evictions = 0;
+    }
+
+    get(key) {
+        if (!this.map.has(key)) {
+            return undefined;
+        }
+        // 重新插入，标记为最近使用
+        const value = this.map.get(key);
+        this.map.delete(key);
+        this.map.set(key, value);
+        return value;
+    }
+
+    set(key, value) {
+        if (this.map.has(key)) {
+            this.map.delete(key);
+        }
+        this.map.set(key, value);
+        while (this.map.size > this.maxEntries) {
+            this.map.delete(this.map.keys().next().value);
+            this.evictions++;
+        }
+    }
+
+    clear() {
+        this.map.clear();
+    }
+
+    get size() {
+        return this.map.size;
+    }
+}
+
+// ==================== localStorage持久层 ====================
+
+/**
+ * 序列化缓存值：NaN、±Infinity 写为标记对象（JSON.stringify 会把它们变成null）
+ * @param {*} value 缓存值
+ * @returns {string} JSON文本
+ */
+function encodeCacheValue(value) {
+    return JSON.stringify(value, (key, v) =>
+        (typeof v === 'number' && !isFinite(v)) ? { [NON_FINITE_TAG]: String(v) } : v);
+}
+
+/**
+ * 反序列化缓存值，还原 encodeCacheValue 写出的非有限数值
+ * @param {string} raw JSON文本
+ * @returns {*} 缓存值
+ */
+function decodeCacheValue(raw) {
+    return JSON.parse(raw, (key, v) =>
+        (v !== null && typeof v === 'object' && NON_FINITE_TAG in v) ? Number(v[NON_FINITE_TAG]) : v);
+}
+
+/**
+ * localStorage持久缓存层，维护条目索引并按最近使用时间淘汰以满足容量上限
+ * @description 命中时只在内存中更新最近使用时间，索引在下次写入、flush() 或页面隐藏时再写回存储
+ */
+class PersistentCacheTier {
+    /**
+     * @param {string} prefix 存储键前缀
+     * @param {number} maxBytes 容量上限
+     * @param {Storage} [storage] 存储对象，缺省为可用的localStorage
+     */
+    constructor(prefix, maxBytes, storage) {
+        this.prefix = prefix;
+        this.maxBytes = maxBytes;
+        this.indexKey = prefix + '__index';
+        this.evictions = 0;
+        this.indexDirty = false;
+        this.storage = storage || PersistentCacheTier.getStorage();
+        this.index = this.loadIndex();
+    }
+
+    /**
+     * 获取可用的localStorage（隐私模式或非浏览器环境下返回null）
+     * @returns {Storage|null}
+     */
+    static getStorage() {
+        try {
+            if (typeof localStorage === 'undefined') return null;
+            const probe = '__bess_cache_probe__';
+            localStorage.setItem(probe, '1');
+            localStorage.removeItem(probe);
+            return localStorage;
+        } catch (e) {
+            return null;
+        }
+    }
+
+    get available() {
+        return this.storage !== null;
+    }
+
+    loadIndex() {
+        if (!this.storage) return {};
+        try {
+            return JSON.parse(this.storage.getItem(this.indexKey)) || {};
+        } catch (e) {
+            return {};
+        }
+    }
+
+    saveIndex() {
+        this.indexDirty = false;
+        try {
+            this.storage.setItem(this.indexKey, JSON.stringify(this.index));
+        } catch (e) {
+            console.warn('[模型缓存] 索引写入失败:', e);
+        }
+    }
+
+    /**
+     * 把命中时更新的最近使用时间写回存储
+     */
+    flush() {
+        if (this.storage && this.indexDirty) {
+            this.saveIndex();
+        }
+    }
+
+    totalBytes() {
+        return Object.values(this.index).reduce((sum, entry) => sum + entry.size, 0);
+    }
+
+    get(key) {
+        if (!this.storage || !this.index[key]) return undefined;
+        const raw = this.storage.getItem(this.prefix + key);
+        if (raw === null) {
+            delete this.index[key];
+            this.indexDirty = true;
+            return undefined;
+        }
+        this.index[key].lastUsed = Date.now();
+        this.indexDirty = true;
+        return decodeCacheValue(raw);
+    }
+
+    set(key, value) {
+        if (!this.storage) return;
+        const raw = encodeCacheValue(value);
+        if (raw.length > this.maxBytes) return;
+        this.delete(key);
+        this.evictUntil(this.maxBytes - raw.length);
+        try {
+            this.storage.setItem(this.prefix + key, raw);
+        } catch (e) {
+            // 浏览器配额已满：清空本层后放弃写入
+            this.clear();
+            return;
+        }
+        this.index[key] = { size: raw.length, lastUsed: Date.now() };
+        this.saveIndex();
+    }
+
+    /**
+     * 按最近最少使用顺序淘汰条目，直到占用不超过budget
+     * @param {number} budget 目标占用
+     */
+    evictUntil(budget) {
+        const keys = Object.keys(this.index).sort((a, b) => this.index[a].lastUsed - this.index[b].lastUsed);
+        let total = this.totalBytes();
+        for (const key of keys) {
+            if (total <= budget) break;
+            total -= this.index[key].size;
+            this.delete(key);
+            this.evictions++;
+        }
+    }
+
+    delete(key) {
+        if (!this.index[key]) return;
+        this.storage.removeItem(this.prefix + key);
+        delete this.index[key];
+    }
+
+    clear() {
+        if (!this.storage) return;
+        Object.keys(this.index).forEach(key => this.storage.removeItem(this.prefix + key));
+        this.index = {};
+        this.saveIndex();
+    }
+
+    get size() {
+        return Object.keys(this.index).length;
+    }
+}
+
+// ==================== 两级缓存 ====================
+
+/**
+ * 模型结果缓存：先查内存LRU，再查持久层，均未命中时计算并回填
+ * @description 缓存的结果对象在各调用方之间共享，调用方不得修改
+ */
+class ModelResultCache {
+    /**
+     * @param {Object} [options] 配置，见 MODEL_CACHE_DEFAULTS
+     */
+    constructor(options = {}) {
+        this.options = Object.assign({}, MODEL_CACHE_DEFAULTS, options);
+        this.memory = new LRUCache(this.options.maxEntries);
+        this.disk = null;
+        if (this.options.persistent) {
+            this.enablePersistence(this.options.maxBytes);
+        }
+        this.resetStats();
+    }
+
+    /**
+     * 启用持久层
+     * @param {number} [maxBytes] 容量上限
+     * @returns {boolean} 是否启用成功
+     */
+    enablePersistence(maxBytes = this.options.maxBytes) {
+        this.disk = new PersistentCacheTier(this.options.storagePrefix, maxBytes, this.options.storage);
+        if (!this.disk.available) {
+            this.disk = null;
+        } else if (!this.flushOnHide && typeof window !== 'undefined' && window.addEventListener) {
+            // 页面隐藏或关闭前写回命中更新的索引
+            this.flushOnHide = () => this.disk && this.disk.flush();
+            window.addEventListener('pagehide', this.flushOnHide);
+        }
+        return this.disk !== null;
+    }
+
+    disablePersistence() {
+        this.disk = null;
+    }
+
+    resetStats() {
+        this.stats = { hits: 0, misses: 0, memoryHits: 0, diskHits: 0 };
+    }
+
+    /**
+     * 按键读取
+     * @param {string} key 缓存键
+     * @returns {*} 缓存值，未命中返回undefined
+     */
+    get(key) {
+        let value = this.memory.get(key);
+        if (value !== undefined) {
+            this.stats.hits++;
+            this.stats.memoryHits++;
+            return value;
+        }
+        if (this.disk) {
+            value = this.disk.get(key);
+            if (value !== undefined) {
+                this.stats.hits++;
+                this.stats.diskHits++;
+                this.memory.set(key, value);
+                return value;
+            }
+        }
+        this.stats.misses++;
+        return undefined;
+    }
+
+    set(key, value) {
+        this.memory.set(key, value);
+        if (this.disk) {
+            this.disk.set(key, value);
+        }
+    }
+
+    /**
+     * 带缓存的计算
+     * @param {string} namespace 计算类型
+     * @param {Object} params 参数对象
+     * @param {*} extra 附加输入
+     * @param {Function} compute 未命中时执行的计算函数
+     * @returns {*} 计算结果
+     */
+    memoize(namespace, params, extra, compute) {
+        const key = computeParamsHash(namespace, params, extra);
+        let value = this.get(key);
+        if (value === undefined) {
+            value = compute();
+            this.set(key, value);
+        }
+        return value;
+    }
+
+    /**
+     * 获取命中统计
+     * @returns {Object} 统计数据
+     */
+    getStats() {
+        const lookups = this.stats.hits + this.stats.misses;
+        return Object.assign({}, this.stats, {
+            hitRate: lookups > 0 ? this.stats.hits / lookups : 0,
+            memoryEntries: this.memory.size,
+            memoryEvictions: this.memory.evictions,
+            diskEntries: this.disk ? this.disk.size : 0,
+            diskBytes: this.disk ? this.disk.totalBytes() : 0,
+            diskEvictions: this.disk ? this.disk.evictions : 0
+        });
+    }
+
+    clear() {
+        this.memory.clear();
+        if (this.disk) {
+            this.disk.clear();
+        }
+        this.resetStats();
+    }
+}
+
+/** @type {ModelResultCache} 全局模型结果缓存实例 */
+const modelCache = new ModelResultCache();
@@ -0,0 +1,1026 @@
+/**
+ * 德国独立储能电站投资测算系统 - 财务模型核心计算
+ * @description CAPEX、OPEX、收入、折旧、贷款、利润表、现金流量表、资产负债表与财务指标的纯计算函数（不访问DOM），
+ *              页面（financial-model.js）与敏感性分析Web Worker（sensitivity-worker.js）共用
+ * @version 1.0
+ */
+
+// ==================== CAPEX计算 ====================
+
+/**
+ * 计算CAPEX明细
+ * @param {Object} params 参数
+ * @returns {Object} CAPEX明细
+ */
+function calculateCapex(params) {
+    const capex = {};
+    
+    // ========== 一、主设备费用 ==========
+    // 电池系统
+    capex.battery = params.capacity_mwh * 1000 * params.battery_unit_price / 10000; // 万EUR
+    // PCS系统
+    capex.pcs = params.power_mw * 1000 * params.pcs_unit_price / 10000;
+    // 中压变压器
+    capex.mv_transformer = params.mv_transformer_count * params.mv_transformer_price / 10000;
+    // 升压变压器
+    capex.hv_transformer = params.hv_transformer_count * params.hv_transformer_price / 10000;
+    
+    // ========== 二、辅助设备费用 ==========
+    // EMS能量管理系统
+    capex.ems = params.ems_cost / 10000;
+    // SCADA监控系统
+    capex.scada = params.scada_cost / 10000;
+    // 开关柜
+    capex.switchgear = params.switchgear_count * params.switchgear_price / 10000;
+    // 集电线路
+    capex.collector_line = params.collector_line_cost / 10000;
+    // 热管理系统
+    capex.thermal = params.capacity_mwh * 1000 * params.thermal_cost / 10000;
+    // 消防系统
+    capex.fire_protection = params.capacity_mwh * 1000 * params.fire_protection_cost / 10000;
+    
+    // 主设备小计
+    const equipmentSubtotal = capex.battery + capex.pcs + capex.mv_transformer + capex.hv_transformer +
+                              capex.ems + capex.scada + capex.switchgear + capex.collector_line +
+                              capex.thermal + capex.fire_protection;
+    
+    // ========== 三、电网接入费用 ==========
+    // 变电站建设/扩容
+    capex.substation = params.substation_cost / 10000;
+    // 接入线路
+    capex.grid_line = params.grid_line_cost / 10000;
+    // 并网申请与研究费
+    capex.grid_study = params.grid_study_cost / 10000;
+    // 计量与保护设备
+    capex.metering = params.metering_cost / 10000;
+    
+    // 电网接入小计
+    capex.grid_connection_subtotal = capex.substation + capex.grid_line + capex.grid_study + capex.metering;
+    
+    // ========== 四、土地与基础建设 ==========
+    // 土地获取成本
+    capex.land_acquisition = params.power_mw * 1000 * params.land_acquisition_cost / 10000;
+    // 混凝土基础
+    capex.concrete = params.power_mw * 1000 * params.concrete_cost / 10000;
+    // 围栏与安防
+    capex.fence = params.fence_cost / 10000;
+    // 道路建设
+    capex.road = params.road_cost / 10000;
+    // 排水系统
+    capex.drainage = params.drainage_cost / 10000;
+    
+    // 土地与基建小计
+    capex.civil_subtotal = capex.land_acquisition + capex.concrete + capex.fence + capex.road + capex.drainage;
+    
+    // ========== 五、安装与施工费用 ==========
+    // 机电安装
+    capex.installation = equipmentSubtotal * params.installation_cost_pct;
+    // 施工管理费
+    capex.construction_mgmt = equipmentSubtotal * params.construction_mgmt_pct;
+    // 调试费用
+    capex.commissioning = params.commissioning_cost / 10000;
+    
+    // 安装施工小计
+    capex.installation_subtotal = capex.installation + capex.construction_mgmt + capex.commissioning;
+    
+    // ========== 六、建设期保险费用 ==========
+    // 建设工程一切险(CAR)
+    capex.car_insurance = equipmentSubtotal * params.car_insurance_pct;
+    // 安装工程一切险(EAR)
+    capex.ear_insurance = equipmentSubtotal * params.ear_insurance_pct;
+    // 货物运输保险
+    capex.cargo_insurance = equipmentSubtotal * params.cargo_insurance_pct;
+    // 第三方责任险
+    capex.liability_insurance = params.liability_insurance / 10000;
+    
+    // 保险费小计
+    capex.insurance_subtotal = capex.car_insurance + capex.ear_insurance + capex.cargo_insurance + capex.liability_insurance;
+    
+    // ========== 七、开发与业主费用 ==========
+    // SPV公司收购成本
+    capex.spv_acquisition = params.spv_acquisition_cost / 10000;
+    // 许可与规划费
+    capex.permit = params.permit_cost / 10000;
+    // 环境咨询费
+    capex.environmental = params.environmental_cost / 10000;
+    // 法律咨询费
+    capex.legal = params.legal_cost / 10000;
+    // 工程设计费
+    capex.engineering = equipmentSubtotal * params.engineering_pct;
+    
+    // 小计（用于计算项目管理费和不可预见费）
+    const subtotalBeforeMgmt = equipmentSubtotal + capex.grid_connection_subtotal + 
+                               capex.civil_subtotal + capex.installation_subtotal +
+                               capex.insurance_subtotal +
+                               capex.spv_acquisition + capex.permit + capex.environmental + capex.legal + capex.engineering;
+    
+    // 项目管理费（按总投资比例）
+    capex.project_mgmt = subtotalBeforeMgmt * params.project_mgmt_pct;
+    
+    // 开发费用小计
+    capex.dev_subtotal = capex.spv_acquisition + capex.permit + capex.environmental + capex.legal + capex.engineering + capex.project_mgmt;
+    
+    // ========== 八、不可预见费 ==========
+    const subtotalBeforeContingency = subtotalBeforeMgmt + capex.project_mgmt;
+    capex.contingency = subtotalBeforeContingency * params.contingency_pct;
+    
+    // ========== 总计 ==========
+    // 拆除准备金改为逐年摊销，不计入CAPEX
+    capex.total = subtotalBeforeContingency + capex.contingency;
+    
+    // 建设期利息计算
+    // 建设期利息 = 贷款金额 × 贷款利率 × 建设期 × 资金占用比例
+    const loanAmount = capex.total * (1 - params.equity_ratio);
+    capex.construction_interest = loanAmount * params.loan_rate * params.construction_period * params.construction_fund_usage;
+    
+    // 动态投资总额
+    capex.dynamic_total = capex.total + capex.construction_interest;
+    
+    // 保存各类小计用于显示
+    capex.equipment_subtotal = equipmentSubtotal;
+    
+    // 添加别名字段，用于折旧、现金流、资产负债表计算
+    // dev_cost 对应开发费用小计，land 对应土地获取成本
+    capex.dev_cost = capex.dev_subtotal;
+    capex.land = capex.land_acquisition;
+    
+    return capex;
+}
+
+// ==================== OPEX计算 ====================
+
+/**
+ * 计算年度OPEX
+ * @param {Object} params 参数
+ * @param {Object} capex CAPEX数据
+ * @returns {Object[]} 年度OPEX数组
+ */
+function calculateOpex(params, capex) {
+    const opexData = [];
+    
+    // 如果选择逐年计提，计算每年应计提的拆除准备金
+    const annualDecommissioning = params.decommissioning_total
+        ? (params.decommissioning_total / params.operation_years / 10000)
+        : 0;
+    
+    // 各项逐年系数取自共享指数曲线（支持逐年通胀/增长率曲线，如 inflation_rate_curve）
+    const years = params.operation_years;
+    const inflationIndex = escalationIndex(params, 'inflation_rate', years);
+    const technicalIndex = escalationIndex(params, 'opex_technical_esc', years);
+    const insuranceIndex = escalationIndex(params, 'opex_insurance_esc', years);
+    const gridIndex = escalationIndex(params, 'opex_grid_esc', years);
+    const landIndex = escalationIndex(params, 'opex_land_esc', years);
+    const commercialIndex = escalationIndex(params, 'opex_commercial_esc', years);
+    const otherIndex = escalationIndex(params, 'opex_other_esc', years);
+    
+    for (let year = 1; year <= years; year++) {
+        const i = year - 1;
+        // 通胀因子：第1年为1，此后按通胀率（曲线）逐年累乘
+        const inflationFactor = inflationIndex[i];
+        
+        // 各项OPEX = 基础值 × 各自增长指数 × 通胀因子
+        const yearData = {
+            year: year,
+            technical: params.opex_technical * params.power_mw * 1000 * 
+                      technicalIndex[i] * inflationFactor / 10000,
+            insurance: capex.total * params.opex_insurance * 
+                      insuranceIndex[i] * inflationFactor,
+            grid: params.opex_grid * params.power_mw * 
+                  gridIndex[i] * inflationFactor / 10000,
+            land: params.opex_land * landIndex[i] * inflationFactor / 10000,
+            commercial: params.opex_commercial * params.power_mw * 
+                       commercialIndex[i] * inflationFactor / 10000,
+            other: params.opex_other * params.power_mw * 
+                  otherIndex[i] * inflationFactor / 10000,
+            decommissioning: annualDecommissioning * inflationFactor  // 拆除准备金也受通胀影响
+        };
+        yearData.total = yearData.technical + yearData.insurance + yearData.grid + 
+                         yearData.land + yearData.commercial + yearData.other + yearData.decommissioning;
+        opexData.push(yearData);
+    }
+    
+    return opexData;
+}
+
+// ==================== 收入计算 ====================
+
+/**
+ * 使用指定价格计算收入
+ */
+function calculateRevenueWithPrices(params, spotPrices) {
+    const revenueData = [];
+    // 容量衰减与Tolling调价的逐年系数取自共享指数曲线
+    const degradationIndex = escalationIndex(params, 'degradation_rate', params.operation_years, -1);
+    const tollingIndex = escalationIndex(params, 'tolling_escalation', params.operation_years);
+    
+    for (let year = 1; year <= params.operation_years; year++) {
+        const capacityFactor = params.initial_capacity_pct / 100 * degradationIndex[year - 1];
+        
+        let tollingRevenue = 0;
+        if (year <= params.tolling_years) {
+            const tollingPrice = params.tolling_price * tollingIndex[year - 1];
+            tollingRevenue = tollingPrice * params.power_mw * 1000 * params.tolling_ratio / 10000;
+        }
+        
+        const spotRatio = year <= params.tolling_years ? (1 - params.tolling_ratio) : 1;
+        const spotRevenue = spotPrices[year - 1] * params.power_mw * spotRatio * capacityFactor / 10000;
+        
+        revenueData.push({
+            year: year,
+            capacityFactor: capacityFactor * 100,
+            tollingRevenue: tollingRevenue,
+            spotRevenue: spotRevenue,
+            totalRevenue: tollingRevenue + spotRevenue
+        });
+    }
+    
+    return revenueData;
+}
+
+// ==================== 折旧计算 ====================
+
+/**
+ * 计算年度折旧
+ * @param {Object} params 参数
+ * @param {Object} capex CAPEX数据
+ * @returns {Object[]} 年度折旧数组
+ */
+function calculateDepreciation(params, capex) {
+    const depreciationData = [];
+    
+    // 无形资产（开发费用+土地）
+    const intangibleAssets = (capex.dev_cost || 0) + (capex.land || 0);
+    
+    // 固定资产原值 = 动态总投资 - 无形资产（建设期利息已资本化）
+    const fixedAssetOriginal = capex.dynamic_total - intangibleAssets;
+    const depreciableAmount = fixedAssetOriginal * (1 - params.salvage_rate);
+    
+    for (let year = 1; year <= params.operation_years; year++) {
+        let depreciation = 0;
+        
+        if (year <= params.depreciation_years) {
+            switch (params.depreciation_method) {
+                case 'straight_line':
+                    depreciation = depreciableAmount / params.depreciation_years;
+                    break;
+                case 'double_declining':
+                    const rate = 2 / params.depreciation_years;
+                    let bookValue = fixedAssetOriginal;
+                    for (let i = 1; i < year; i++) {
+                        bookValue -= bookValue * rate;
+                    }
+                    depreciation = Math.min(bookValue * rate, bookValue - fixedAssetOriginal * params.salvage_rate);
+                    break;
+                case 'sum_of_years':
+                    const sumYears = params.depreciation_years * (params.depreciation_years + 1) / 2;
+                    depreciation = depreciableAmount * (params.depreciation_years - year + 1) / sumYears;
+                    break;
+            }
+        }
+        
+        // 无形资产摊销
+        const amortization = year <= params.amortization_years ? 
+                            intangibleAssets / params.amortization_years : 0;
+        
+        depreciationData.push({
+            year: year,
+            depreciation: depreciation,
+            amortization: amortization,
+            total: depreciation + amortization
+        });
+    }
+    
+    return depreciationData;
+}
+
+// ==================== 贷款计算 ====================
+
+/**
+ * 计算贷款还款计划
+ * @param {Object} params 参数
+ * @param {Object} capex CAPEX数据
+ * @returns {Object[]} 贷款还款计划
+ */
+function calculateLoan(params, capex) {
+    const loanData = [];
+    const loanAmount = capex.dynamic_total * (1 - params.equity_ratio);
+    let balance = loanAmount;
+    const repaymentYears = Math.max(params.loan_years - params.grace_period, 0);
+    
+    for (let year = 1; year <= params.loan_years; year++) {
+        const interest = balance * params.loan_rate;
+        let principal = 0;
+        
+        if (year > params.grace_period && repaymentYears > 0) {
+            if (params.repayment_method === 'equal_principal') {
+                // 等额本金
+                principal = loanAmount / repaymentYears;
+            } else {
+                // 等额本息
+                const n = repaymentYears;
+                const r = params.loan_rate;
+                const payment = r === 0
+                    ? loanAmount / n
+                    : loanAmount * r * Math.pow(1 + r, n) / (Math.pow(1 + r, n) - 1);
+                principal = payment - interest;
+            }
+        }
+        
+        const payment = interest + principal;
+        const endBalance = balance - principal;
+        
+        loanData.push({
+            year: year,
+            beginBalance: balance,
+            interest: interest,
+            principal: principal,
+            payment: payment,
+            endBalance: Math.max(0, endBalance)
+        });
+        
+        balance = Math.max(0, endBalance);
+    }
+    
+    // 补充剩余年份(贷款已还清)
+    for (let year = params.loan_years + 1; year <= params.operation_years; year++) {
+        loanData.push({
+            year: year,
+            beginBalance: 0,
+            interest: 0,
+            principal: 0,
+            payment: 0,
+            endBalance: 0
+        });
+    }
+    
+    return loanData;
+}
+
+// ==================== 利润表计算 ====================
+
+/**
+ * 计算利润表
+ * @param {Object} params 参数
+ * @param {Object[]} revenueData 收入数据
+ * @param {Object[]} opexData OPEX数据
+ * @param {Object[]} depreciationData 折旧数据
+ * @param {Object[]} loanData 贷款数据
+ * @returns {Object[]} 利润表数据
+ */
+function calculateIncomeStatement(params, revenueData, opexData, depreciationData, loanData) {
+    const incomeData = [];
+    
+    for (let year = 0; year < params.operation_years; year++) {
+        const revenue = revenueData[year].totalRevenue;
+        const opex = opexData[year].total;
+        const depreciation = depreciationData[year].total;
+        const interest = loanData[year].interest;
+        
+        const grossProfit = revenue - opex;
+        const ebitda = grossProfit;
+        const ebit = ebitda - depreciation;
+        const ebt = ebit - interest;
+        
+        incomeData.push({
+            year: year + 1,
+            revenue: revenue,
+            opex: opex,
+            grossProfit: grossProfit,
+            ebitda: ebitda,
+            depreciation: depreciation,
+            ebit: ebit,
+            interest: interest,
+            ebt: ebt
+        });
+    }
+    
+    // 所得税按德国税制逐年扫描（亏损结转、利息限制），见 tax-model.js
+    const taxSchedule = calculateTaxSchedule(params, incomeData);
+    incomeData.forEach((data, i) => {
+        Object.assign(data, taxSchedule[i]);
+        data.netProfit = data.ebt - data.tax;
+    });
+    
+    return incomeData;
+}
+
+// ==================== 现金流量表计算 ====================
+
+/**
+ * 计算现金流量表
+ * @param {Object} params 参数
+ * @param {Object} capex CAPEX数据
+ * @param {Object[]} incomeData 利润表数据
+ * @param {Object[]} depreciationData 折旧数据
+ * @param {Object[]} loanData 贷款数据
+ * @returns {Object[]} 现金流量表数据
+ */
+function calculateCashFlow(params, capex, incomeData, depreciationData, loanData) {
+    const cashFlowData = [];
+    
+    // 第0年 - 建设期
+    const equity = capex.dynamic_total * params.equity_ratio;
+    const loan = capex.dynamic_total * (1 - params.equity_ratio);
+    
+    cashFlowData.push({
+        year: 0,
+        // 经营活动
+        netProfit: 0,
+        depreciation: 0,
+        workingCapital: 0,
+        operatingCashFlow: 0,
+        // 投资活动
+        capex: -capex.dynamic_total,
+        investingCashFlow: -capex.dynamic_total,
+        // 筹资活动
+        equityInflow: equity,
+        loanInflow: loan,
+        loanRepayment: 0,
+        financingCashFlow: equity + loan,
+        // 现金净增加
+        netCashFlow: 0,
+        // 全投资现金流
+        projectCashFlow: -capex.dynamic_total,
+        // 资本金现金流
+        equityCashFlow: -equity
+    });
+    
+    // 运营期
+    for (let i = 0; i < params.operation_years; i++) {
+        const income = incomeData[i];
+        const depreciation = depreciationData[i].total;
+        const loanInfo = loanData[i];
+        
+        const operatingCashFlow = income.netProfit + depreciation;
+        const investingCashFlow = 0;
+        const financingCashFlow = -loanInfo.principal;
+        const netCashFlow = operatingCashFlow + investingCashFlow + financingCashFlow;
+        
+        // 全投资现金流 = 经营现金流 (不考虑融资)
+        const projectCashFlow = income.ebitda - income.tax;
+        
+        // 资本金现金流 = 净现金流
+        const equityCashFlow = netCashFlow;
+        
+        cashFlowData.push({
+            year: i + 1,
+            netProfit: income.netProfit,
+            depreciation: depreciation,
+            workingCapital: 0,
+            operatingCashFlow: operatingCashFlow,
+            capex: 0,
+            investingCashFlow: investingCashFlow,
+            equityInflow: 0,
+            loanInflow: 0,
+            loanRepayment: -loanInfo.principal,
+            financingCashFlow: financingCashFlow,
+            netCashFlow: netCashFlow,
+            projectCashFlow: projectCashFlow,
+            equityCashFlow: equityCashFlow
+        });
+    }
+    
+    // 添加残值回收（基于固定资产原值，即动态投资减去无形资产）
+    const intangibleAssets = (capex.dev_cost || 0) + (capex.land || 0);
+    const fixedAssetOriginal = capex.dynamic_total - intangibleAssets;
+    const salvageValue = fixedAssetOriginal * params.salvage_rate;
+    
+    if (cashFlowData.length > params.operation_years) {
+        const lastYearIndex = params.operation_years;
+        cashFlowData[lastYearIndex].investingCashFlow += salvageValue;
+        cashFlowData[lastYearIndex].netCashFlow += salvageValue;
+        cashFlowData[lastYearIndex].projectCashFlow += salvageValue;
+        cashFlowData[lastYearIndex].equityCashFlow += salvageValue;
+    }
+    
+    return cashFlowData;
+}
+
+// ==================== 资产负债表计算 ====================
+
+/**
+ * 计算逐年字段的前缀和（按年份顺序累加）
+ * @param {Object[]} rows 逐年数据
+ * @param {string} field 字段名
+ * @param {number} count 累加的年数
+ * @returns {Float64Array} 第i项为前 i+1 年之和
+ */
+function prefixSum(rows, field, count) {
+    const sums = new Float64Array(count);
+    let running = 0;
+    for (let i = 0; i < count; i++) {
+        running += rows[i][field];
+        sums[i] = running;
+    }
+    return sums;
+}
+
+/**
+ * 计算资产负债表
+ * @description 累计折旧、累计摊销、未分配利润与货币资金均由前缀和一次求得（线性复杂度）；
+ *              每年附带 residual = 资产总计 - 负债和权益总计，非零即表示不平衡
+ * @param {Object} params 参数
+ * @param {Object} capex CAPEX数据
+ * @param {Object[]} incomeData 利润表数据
+ * @param {Object[]} depreciationData 折旧数据
+ * @param {Object[]} loanData 贷款数据
+ * @param {Object[]} cashFlowData 现金流数据
+ * @returns {Object[]} 资产负债表数据
+ */
+function calculateBalanceSheet(params, capex, incomeData, depreciationData, loanData, cashFlowData) {
+    const years = params.operation_years;
+    const balanceData = [];
+    
+    const equity = capex.dynamic_total * params.equity_ratio;
+    const loanAmount = capex.dynamic_total * (1 - params.equity_ratio);
+    
+    // 固定资产原值 = 总投资 - 无形资产（开发费用+土地）
+    // 建设期利息已资本化计入固定资产
+    const intangibleAssetsOriginal = capex.dev_cost + capex.land;
+    const fixedAssetOriginal = capex.dynamic_total - intangibleAssetsOriginal;
+    
+    // 前缀和：累计折旧、累计摊销、未分配利润、累计现金流（从运营期第1年开始）
+    const accumulatedDepreciation = prefixSum(depreciationData, 'depreciation', years);
+    const accumulatedAmortization = prefixSum(depreciationData, 'amortization', years);
+    const retainedEarnings = prefixSum(incomeData, 'netProfit', years);
+    const cash = prefixSum(cashFlowData.slice(1), 'netCashFlow', years);
+    
+    // 初始资产负债表 (建设完成时点)
+    balanceData.push({
+        year: 0,
+        // 资产
+        cash: 0,
+        fixedAssetOriginal: fixedAssetOriginal,
+        accumulatedDepreciation: 0,
+        fixedAssetNet: fixedAssetOriginal,
+        intangibleAssets: intangibleAssetsOriginal,
+        totalAssets: capex.dynamic_total,
+        // 负债
+        longTermLoan: loanAmount,
+        totalLiabilities: loanAmount,
+        // 所有者权益
+        paidInCapital: equity,
+        retainedEarnings: 0,
+        totalEquity: equity,
+        // 验证
+        totalLiabilitiesAndEquity: loanAmount + equity,
+        residual: capex.dynamic_total - (loanAmount + equity)
+    });
+    
+    for (let i = 0; i < years; i++) {
+        // 最后一年：固定资产处置（残值已通过现金流回收），固定资产净值与无形资产清零
+        const isLastYear = i === years - 1;
+        const fixedAssetNet = isLastYear ? 0 : fixedAssetOriginal - accumulatedDepreciation[i];
+        const intangibleAssets = isLastYear ? 0 : Math.max(0, intangibleAssetsOriginal - accumulatedAmortization[i]);
+        const longTermLoan = i < loanData.length ? loanData[i].endBalance : 0;
+        
+        // 总资产 = 货币资金 + 固定资产净值 + 无形资产
+        const totalAssets = cash[i] + fixedAssetNet + intangibleAssets;
+        const totalEquity = equity + retainedEarnings[i];
+        const totalLiabilitiesAndEquity = longTermLoan + totalEquity;
+        
+        balanceData.push({
+            year: i + 1,
+            cash: cash[i],
+            fixedAssetOriginal: fixedAssetOriginal,
+            accumulatedDepreciation: accumulatedDepreciation[i],
+            fixedAssetNet: fixedAssetNet,
+            intangibleAssets: intangibleAssets,
+            totalAssets: totalAssets,
+            longTermLoan: longTermLoan,
+            totalLiabilities: longTermLoan,
+            paidInCapital: equity,
+            retainedEarnings: retainedEarnings[i],
+            totalEquity: totalEquity,
+            totalLiabilitiesAndEquity: totalLiabilitiesAndEquity,
+            residual: totalAssets - totalLiabilitiesAndEquity
+        });
+    }
+    
+    return balanceData;
+}
+
+/**
+ * 查找资产负债表不平衡的年份
+ * @param {Object[]} balanceData 资产负债表数据
+ * @param {number} [tolerance=0.01] 允许的残差（万EUR）
+ * @returns {Object[]} 不平衡年份 [{ year, residual }]，平衡时为空数组
+ */
+function findBalanceImbalances(balanceData, tolerance = 0.01) {
+    return balanceData
+        .filter(row => Math.abs(row.residual) > tolerance)
+        .map(row => ({ year: row.year, residual: row.residual }));
+}
+
+// ==================== 财务指标计算 ====================
+
+/**
+ * 计算IRR (内部收益率)
+ * @param {number[]} cashFlows 现金流数组
+ * @returns {number} IRR百分比
+ */
+function calculateIRR(cashFlows) {
+    const maxIterations = 1000;
+    const tolerance = 0.00001;
+    let rate = 0.1;
+    
+    for (let i = 0; i < maxIterations; i++) {
+        let npv = 0;
+        let dnpv = 0;
+        
+        for (let j = 0; j < cashFlows.length; j++) {
+            npv += cashFlows[j] / Math.pow(1 + rate, j);
+            dnpv -= j * cashFlows[j] / Math.pow(1 + rate, j + 1);
+        }
+        
+        const newRate = rate - npv / dnpv;
+        
+        if (Math.abs(newRate - rate) < tolerance) {
+            return newRate * 100;
+        }
+        
+        rate = newRate;
+        
+        // 防止发散
+        if (rate < -0.99 || rate > 10 || isNaN(rate)) {
+            return NaN;
+        }
+    }
+    
+    return rate * 100;
+}
+
+/**
+ * 计算NPV (净现值)
+ * @param {number[]} cashFlows 现金流数组
+ * @param {number} discountRate 折现率
+ * @returns {number} NPV
+ */
+function calculateNPV(cashFlows, discountRate) {
+    let npv = 0;
+    for (let i = 0; i < cashFlows.length; i++) {
+        npv += cashFlows[i] / Math.pow(1 + discountRate, i);
+    }
+    return npv;
+}
+
+/**
+ * 计算静态回收期
+ * @param {number[]} cashFlows 现金流数组
+ * @returns {number} 回收期（年）
+ */
+function calculateStaticPayback(cashFlows) {
+    let cumulative = 0;
+    for (let i = 0; i < cashFlows.length; i++) {
+        cumulative += cashFlows[i];
+        if (cumulative >= 0) {
+            // 插值计算精确年份
+            const prevCumulative = cumulative - cashFlows[i];
+            return i - 1 + Math.abs(prevCumulative) / cashFlows[i];
+        }
+    }
+    return cashFlows.length; // 未回收
+}
+
+/**
+ * 计算动态回收期
+ * @param {number[]} cashFlows 现金流数组
+ * @param {number} discountRate 折现率
+ * @returns {number} 动态回收期（年）
+ */
+function calculateDynamicPayback(cashFlows, discountRate) {
+    let cumulative = 0;
+    for (let i = 0; i < cashFlows.length; i++) {
+        const discountedCF = cashFlows[i] / Math.pow(1 + discountRate, i);
+        cumulative += discountedCF;
+        if (cumulative >= 0) {
+            const prevCumulative = cumulative - discountedCF;
+            return i - 1 + Math.abs(prevCumulative) / discountedCF;
+        }
+    }
+    return cashFlows.length;
+}
+
+/**
+ * 计算所有财务指标
+ * @param {Object} params 参数
+ * @param {Object} capex CAPEX数据
+ * @param {Object[]} revenueData 收入数据
+ * @param {Object[]} incomeData 利润表数据
+ * @param {Object[]} cashFlowData 现金流数据
+ * @param {Object[]} balanceData 资产负债表数据
+ * @param {Object[]} loanData 贷款数据
+ * @returns {Object} 财务指标
+ */
+function calculateIndicators(params, capex, revenueData, incomeData, cashFlowData, balanceData, loanData) {
+    // 提取全投资现金流
+    const projectCashFlows = cashFlowData.map(d => d.projectCashFlow);
+    
+    // 提取资本金现金流
+    const equityCashFlows = cashFlowData.map(d => d.equityCashFlow);
+    
+    // 计算各项指标
+    const totalRevenue = revenueData.reduce((a, b) => a + b.totalRevenue, 0);
+    const avgRevenue = totalRevenue / params.operation_years;
+    const first3Revenue = revenueData.slice(0, 3).reduce((a, b) => a + b.totalRevenue, 0);
+    
+    const totalProfit = incomeData.reduce((a, b) => a + b.ebt, 0);
+    const avgProfit = totalProfit / params.operation_years;
+    const first3Profit = incomeData.slice(0, 3).reduce((a, b) => a + b.ebt, 0);
+    
+    const totalNetProfit = incomeData.reduce((a, b) => a + b.netProfit, 0);
+    const avgNetProfit = totalNetProfit / params.operation_years;
+    const first3NetProfit = incomeData.slice(0, 3).reduce((a, b) => a + b.netProfit, 0);
+    
+    // IRR计算
+    const projectIRR = calculateIRR(projectCashFlows);
+    const equityIRR = calculateIRR(equityCashFlows);
+    
+    // 回收期计算
+    const staticPayback = calculateStaticPayback(projectCashFlows);
+    const equityStaticPayback = calculateStaticPayback(equityCashFlows);
+    const dynamicPayback = calculateDynamicPayback(projectCashFlows, 0.08);
+    const equityDynamicPayback = calculateDynamicPayback(equityCashFlows, 0.08);
+    
+    // ROE (第三年净资产收益率)
+    const year3NetProfit = incomeData.length >= 3 ? incomeData[2].netProfit : 0;
+    const year3Equity = balanceData.length >= 4 ? balanceData[3].totalEquity : capex.dynamic_total * params.equity_ratio;
+    const roe3 = year3Equity > 0 ? (year3NetProfit / year3Equity) * 100 : 0;
+    
+    // ROI (总投资收益率)
+    const roi = (avgNetProfit / capex.dynamic_total) * 100;
+    
+    // EBITDA回报率
+    const avgEBITDA = incomeData.reduce((a, b) => a + b.ebitda, 0) / params.operation_years;
+    const ebitdaReturn = (avgEBITDA / capex.dynamic_total) * 100;
+    
+    // DSCR (债务偿付覆盖率) - 使用运营期平均值
+    let totalDebtService = 0;
+    let totalEBITDA = 0;
+    let debtServiceYears = 0;
+    
+    for (let i = 0; i < params.loan_years && i < incomeData.length; i++) {
+        if (loanData[i].payment > 0) {
+            totalDebtService += loanData[i].payment;
+            totalEBITDA += incomeData[i].ebitda;
+            debtServiceYears++;
+        }
+    }
+    
+    const dscr = debtServiceYears > 0 && totalDebtService > 0 ? 
+                 totalEBITDA / totalDebtService : 0;
+
+    // LCOE (平准化度电成本，EUR/MWh)
+    /** @type {number} */
+    const totalOpex = incomeData.reduce((a, b) => a + b.opex, 0);
+    /** @type {number} */
+    const totalCostEur = (capex.dynamic_total + totalOpex) * 10000;
+    /** @type {number} */
+    const degradationIndex = escalationIndex(params, 'degradation_rate', incomeData.length, -1);
+    const totalEnergyMwh = incomeData.reduce((sum, _, index) => {
+        const capacityFactor = params.initial_capacity_pct / 100 * degradationIndex[index];
+        const annualEnergy = params.capacity_mwh * capacityFactor * params.annual_cycles *
+            params.charge_efficiency * params.discharge_efficiency;
+        return sum + annualEnergy;
+    }, 0);
+    const lcoe = totalEnergyMwh > 0 ? totalCostEur / totalEnergyMwh : 0;
+    
+    return {
+        static_investment: capex.total,
+        dynamic_investment: capex.dynamic_total,
+        total_revenue: totalRevenue,
+        avg_revenue: avgRevenue,
+        first3_revenue: first3Revenue,
+        total_profit: totalProfit,
+        avg_profit: avgProfit,
+        first3_profit: first3Profit,
+        total_net_profit: totalNetProfit,
+        avg_net_profit: avgNetProfit,
+        first3_net_profit: first3NetProfit,
+        project_irr: projectIRR,
+        equity_irr: equityIRR,
+        static_payback: staticPayback,
+        equity_payback: equityStaticPayback,
+        dynamic_payback: dynamicPayback,
+        equity_dynamic_payback: equityDynamicPayback,
+        roe_year3: roe3,
+        roi: roi,
+        ebitda_return: ebitdaReturn,
+        dscr: dscr,
+        lcoe: lcoe
+    };
+}
+
+/**
+ * 计算最低DSCR
+ */
+function calculateMinDSCR(incomeData, loanData, params) {
+    let minDSCR = Infinity;
+    for (let i = 0; i < Math.min(params.loan_years, incomeData.length); i++) {
+        if (loanData[i].payment > 0) {
+            const dscr = incomeData[i].ebitda / loanData[i].payment;
+            if (dscr < minDSCR) {
+                minDSCR = dscr;
+            }
+        }
+    }
+    return minDSCR === Infinity ? 0 : minDSCR;
+}
+
+// ==================== 敏感性分析 ====================
+
+/**
+ * 应用变量变化
+ */
+function applyVariableChange(params, variable, change) {
+    switch (variable) {
+        case 'capex':
+            params.battery_unit_price *= (1 + change);
+            params.pcs_unit_price *= (1 + change);
+            params.mv_transformer_price *= (1 + change);
+            params.hv_transformer_price *= (1 + change);
+            break;
+        case 'tolling_price':
+            params.tolling_price *= (1 + change);
+            break;
+        case 'spot_price':
+            // 这里需要特殊处理现货价格
+            params.spot_price_change = change;
+            break;
+        case 'opex':
+            params.opex_technical *= (1 + change);
+            params.opex_insurance *= (1 + change);
+            params.opex_grid *= (1 + change);
+            params.opex_land *= (1 + change);
+            params.opex_commercial *= (1 + change);
+            params.opex_other *= (1 + change);
+            break;
+        case 'loan_rate':
+            params.loan_rate *= (1 + change);
+            break;
+        case 'degradation':
+            params.degradation_rate *= (1 + change);
+            break;
+    }
+}
+
+/**
+ * 带缓存运行含现货价格变化的情景
+ * @param {Object} params 参数（可含 spot_price_change：现货价格相对变化）
+ * @param {number[]} spotPrices 基准现货价格
+ * @returns {Object} 全部计算结果（共享的缓存对象，不得修改）
+ */
+function runAdjustedModelCached(params, spotPrices) {
+    const { spot_price_change: spotPriceChange = 0, ...modelParams } = params;
+    const adjustedSpotPrices = spotPriceChange
+        ? spotPrices.map(p => p * (1 + spotPriceChange))
+        : spotPrices;
+    return runModelCached(modelParams, adjustedSpotPrices);
+}
+
+/**
+ * 计算目标指标（纯计算）
+ * @param {Object} params 参数（可含 spot_price_change：现货价格相对变化）
+ * @param {string} target 目标指标
+ * @param {number[]} spotPrices 基准现货价格
+ * @returns {number} 指标值
+ */
+function evaluateTarget(params, target, spotPrices) {
+    // 相同参数组（如各行0%变化处的基准情形）直接命中缓存
+    const results = runAdjustedModelCached(params, spotPrices);
+    const indicators = results.indicators;
+    
+    switch (target) {
+        case 'project_irr': return indicators.project_irr;
+        case 'equity_irr': return indicators.equity_irr;
+        case 'npv': 
+            const projectCashFlows = results.cashFlowData.map(d => d.projectCashFlow);
+            return calculateNPV(projectCashFlows, 0.08);
+        case 'payback': return indicators.static_payback;
+        default: return 0;
+    }
+}
+
+/**
+ * 创建敏感性网格定义（可结构化克隆，传给Worker）
+ * @param {Object} baseParams 基准参数
+ * @param {string} var1 行变量
+ * @param {string} [var2] 列变量，单变量分析时为空
+ * @param {string} target 目标指标
+ * @param {number[]} changes 各档变化率（小数）
+ * @param {number[]} spotPrices 基准现货价格
+ * @returns {Object} 网格定义，cells 为格点总数（行优先：序号 = 行 × 列数 + 列）
+ */
+function createSensitivityJob(baseParams, var1, var2, target, changes, spotPrices) {
+    const columns = var2 ? changes.length : 1;
+    return {
+        baseParams, var1, var2: var2 || null, target, changes, spotPrices,
+        columns, cells: changes.length * columns
+    };
+}
+
+/**
+ * 计算网格中一段连续格点的指标值
+ * @param {Object} job 网格定义（createSensitivityJob）
+ * @param {number} start 起始格点序号
+ * @param {number} end 结束格点序号（不含）
+ * @returns {Float64Array} 各格点的指标值
+ */
+function calculateSensitivityCells(job, start, end) {
+    const values = new Float64Array(end - start);
+    for (let k = start; k < end; k++) {
+        const params = JSON.parse(JSON.stringify(job.baseParams));
+        applyVariableChange(params, job.var1, job.changes[Math.floor(k / job.columns)]);
+        if (job.var2) {
+            applyVariableChange(params, job.var2, job.changes[k % job.columns]);
+        }
+        values[k - start] = evaluateTarget(params, job.target, job.spotPrices);
+    }
+    return values;
+}
+
+/**
+ * 把格点值整理为显示函数使用的结构
+ * @param {Object} job 网格定义
+ * @param {Float64Array} values 全部格点值（未算出的为NaN）
+ * @returns {Object[]|number[][]} 单变量为 [{change, value}]（change为百分数），双变量为行优先的二维数组
+ */
+function sensitivityResults(job, values) {
+    if (!job.var2) {
+        return job.changes.map((change, i) => ({ change: change * 100, value: values[i] }));
+    }
+    return job.changes.map((_, i) => Array.from(values.subarray(i * job.columns, (i + 1) * job.columns)));
+}
+
+/**
+ * 单变量敏感性分析（同步计算）
+ */
+function runSingleVariableSensitivity(baseParams, variable, target, changes, spotPrices) {
+    const job = createSensitivityJob(baseParams, variable, null, target, changes, spotPrices);
+    return sensitivityResults(job, calculateSensitivityCells(job, 0, job.cells));
+}
+
+/**
+ * 双变量敏感性分析（同步计算）
+ */
+function runDoubleVariableSensitivity(baseParams, var1, var2, target, changes, spotPrices) {
+    const job = createSensitivityJob(baseParams, var1, var2, target, changes, spotPrices);
+    return sensitivityResults(job, calculateSensitivityCells(job, 0, job.cells));
+}
+
+// ==================== 主计算函数 ====================
+
+/**
+ * 运行完整财务模型（纯计算，不访问DOM）
+ * @param {Object} params 参数
+ * @param {number[]} spotPrices 各年现货价格
+ * @returns {Object} 全部计算结果
+ */
+function runModel(params, spotPrices) {
+    const capex = profileStage('model.capex', () => calculateCapex(params));
+    const opexData = profileStage('model.opex', () => calculateOpex(params, capex));
+    const revenueData = profileStage('model.revenue', () => calculateRevenueWithPrices(params, spotPrices));
+    const depreciationData = profileStage('model.depreciation', () => calculateDepreciation(params, capex));
+    const loanData = profileStage('model.loan', () => calculateLoan(params, capex));
+    const incomeData = profileStage('model.income', () =>
+        calculateIncomeStatement(params, revenueData, opexData, depreciationData, loanData));
+    const cashFlowData = profileStage('model.cashFlow', () =>
+        calculateCashFlow(params, capex, incomeData, depreciationData, loanData));
+    const balanceData = profileStage('model.balance', () =>
+        calculateBalanceSheet(params, capex, incomeData, depreciationData, loanData, cashFlowData));
+    const indicators = profileStage('model.indicators', () =>
+        calculateIndicators(params, capex, revenueData, incomeData, cashFlowData, balanceData, loanData));
+    
+    return {
+        params,
+        capex,
+        opexData,
+        revenueData,
+        depreciationData,
+        loanData,
+        incomeData,
+        cashFlowData,
+        balanceData,
+        indicators
+    };
+}
+
+/**
+ * 带缓存的模型运行
+ * @description 以参数和现货价格的规范化内容哈希为键，结果对象在调用方之间共享，不得修改
+ * @param {Object} params 参数
+ * @param {number[]} spotPrices 各年现货价格
+ * @returns {Object} 全部计算结果
+ */
+function runModelCached(params, spotPrices) {
+    return profileStage('model.run', () =>
+        modelCache.memoize('model', params, spotPrices, () => runModel(params, spotPrices)));
+}
+
+/**
+ * 获取模型缓存命中统计
+ * @returns {Object} 命中/未命中次数、各层条目数与淘汰数
+ */
+function getModelCacheStats() {
+    return modelCache.getStats();
+}
@@ -0,0 +1,170 @@
+/**
+ * 德国独立储能电站投资测算系统 - 分阶段性能剖析
+ * @description 可选开启的计时工具：记录计算与渲染各阶段的耗时、调用次数与堆内存变化，
+ *              导出Chrome Trace JSON（chrome://tracing / Perfetto可直接打开）与汇总表；关闭时仅多一次布尔判断
+ * @version 1.0
+ */
+
+// ==================== 剖析器 ====================
+
+/**
+ * 阶段剖析器
+ */
+class StageProfiler {
+    constructor() {
+        this.enabled = false;
+        this.reset();
+    }
+
+    /**
+     * 开启剖析（同时清空已有记录）
+     */
+    enable() {
+        this.reset();
+        this.enabled = true;
+    }
+
+    disable() {
+        this.enabled = false;
+    }
+
+    reset() {
+        this.events = [];
+        this.stats = {};
+        this.depth = 0;
+    }
+
+    /**
+     * 读取当前JS堆占用（仅Chromium提供 performance.memory，其他浏览器返回0）
+     * @returns {number} 字节数
+     */
+    static heapUsed() {
+        return (typeof performance !== 'undefined' && performance.memory)
+            ? performance.memory.usedJSHeapSize
+            : 0;
+    }
+
+    /**
+     * 在剖析范围内执行函数
+     * @param {string} name 阶段名称
+     * @param {Function} fn 阶段函数
+     * @returns {*} 阶段函数的返回值
+     */
+    stage(name, fn) {
+        if (!this.enabled) {
+            return fn();
+        }
+        const heapBefore = StageProfiler.heapUsed();
+        const start = performance.now();
+        this.depth++;
+        try {
+            return fn();
+        } finally {
+            this.depth--;
+            this.record(name, start, performance.now() - start, StageProfiler.heapUsed() - heapBefore);
+        }
+    }
+
+    /**
+     * 记录一次阶段执行
+     * @param {string} name 阶段名称
+     * @param {number} start 开始时间（毫秒）
+     * @param {number} duration 耗时（毫秒）
+     * @param {number} memoryDelta 堆内存变化（字节，可能因GC为负）
+     */
+    record(name, start, duration, memoryDelta) {
+        this.events.push({
+            name: name,
+            cat: name.split('.')[0],
+            ph: 'X',
+            ts: Math.round(start * 1000),
+            dur: Math.round(duration * 1000),
+            pid: 1,
+            tid: 1,
+            args: { memoryDelta: memoryDelta, depth: this.depth }
+        });
+        const stat = this.stats[name] || (this.stats[name] = { calls: 0, totalMs: 0, maxMs: 0, memoryBytes: 0 });
+        stat.calls++;
+        stat.totalMs += duration;
+        stat.maxMs = Math.max(stat.maxMs, duration);
+        stat.memoryBytes += memoryDelta;
+    }
+
+    /**
+     * 生成汇总表（按总耗时降序）
+     * @returns {Object[]} 各阶段汇总
+     */
+    summary() {
+        return Object.keys(this.stats)
+            .map(name => {
+                const stat = this.stats[name];
+                return {
+                    stage: name,
+                    calls: stat.calls,
+                    totalMs: Number(stat.totalMs.toFixed(3)),
+                    avgMs: Number((stat.totalMs / stat.calls).toFixed(3)),
+                    maxMs: Number(stat.maxMs.toFixed(3)),
+                    memoryKB: Number((stat.memoryBytes / 1024).toFixed(1))
+                };
+            })
+            .sort((a, b) => b.totalMs - a.totalMs);
+    }
+
+    /**
+     * 在控制台打印汇总表
+     */
+    printSummary() {
+        console.table(this.summary());
+    }
+
+    /**
+     * 导出Chrome Trace格式
+     * @returns {Object} trace对象
+     */
+    toChromeTrace() {
+        return { traceEvents: this.events, displayTimeUnit: 'ms' };
+    }
+
+    /**
+     * 下载Chrome Trace JSON文件
+     * @param {string} [filename] 文件名
+     */
+    downloadTrace(filename = `bess_profile_${new Date().toISOString().slice(0, 19).replace(/[:T]/g, '')}.json`) {
+        const blob = new Blob([JSON.stringify(this.toChromeTrace())], { type: 'application/json' });
+        const url = URL.createObjectURL(blob);
+        const a = document.createElement('a');
+        a.href = url;
+        a.download = filename;
+        document.body.appendChild(a);
+        a.click();
+        document.body.removeChild(a);
+        URL.revokeObjectURL(url);
+    }
+}
+
+/** @type {StageProfiler} 全局剖析器实例 */
+const modelProfiler = new StageProfiler();
+
+/**
+ * 在剖析范围内执行函数（未开启剖析时直接调用）
+ * @param {string} name 阶段名称
+ * @param {Function} fn 阶段函数
+ * @returns {*} 阶段函数的返回值
+ */
+function profileStage(name, fn) {
+    return modelProfiler.stage(name, fn);
+}
+
+// 通过URL参数 ?profile=1 或 localStorage.bess_profile = '1' 开启
+(function() {
+    try {
+        const fromUrl = typeof location !== 'undefined' && /[?&]profile=1\b/.test(location.search);
+        const fromStorage = typeof localStorage !== 'undefined' && localStorage.getItem('bess_profile') === '1';
+        if (fromUrl || fromStorage) {
+            modelProfiler.enable();
+            console.log('[性能剖析] 已开启，计算后可调用 modelProfiler.printSummary() / modelProfiler.downloadTrace()');
+        }
+    } catch (e) {
+        // 非浏览器环境或存储不可用时保持关闭
+    }
+})();
@@ -0,0 +1,734 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+德国独立储能电站财务测算系统 - Python 批量计算引擎
+@description 网页版 financial-model.js 计算逻辑的 NumPy 移植：一次调用计算一批情景，
+             所有输入为 (情景数,) 数组，逐年数据为 (情景数, 年数) 数组；不同运营年限按最长年限补零对齐
+@version 1.0
+"""
+
+import numpy as np
+
+# ==================== 默认参数（与 getParameters() 默认值一致） ====================
+
+DEFAULT_PARAMETERS = {
+    # 基础参数
+    'power_mw': 100, 'capacity_mwh': 200, 'operation_years': 20, 'initial_capacity_pct': 100,
+    # 融资参数
+    'equity_ratio': 0.25, 'loan_years': 12, 'loan_rate': 0.045, 'grace_period': 1,
+    'repayment_method': 'equal_principal',
+    # 建设期与通胀参数
+    'construction_period': 1, 'construction_fund_usage': 0.5, 'inflation_rate': 0.02,
+    # 折旧参数
+    'depreciation_years': 15, 'salvage_rate': 0.05, 'depreciation_method': 'straight_line',
+    'amortization_years': 20,
+    # 效率参数
+    'charge_efficiency': 0.95, 'discharge_efficiency': 0.95, 'degradation_rate': 0.025, 'annual_cycles': 365,
+    # 税费参数
+    'corporate_tax_rate': 0.15, 'solidarity_tax_rate': 0.055, 'trade_tax_rate': 0.14,
+    'vat_rate': 0.19, 'other_tax_rate': 0,
+    'tax_method': 'german', 'loss_offset_threshold': 1000000, 'min_taxation_ratio': 0.6,
+    'interest_barrier_ratio': 0.3, 'interest_barrier_threshold': 3000000,
+    'trade_tax_addback_ratio': 0.25, 'trade_tax_addback_allowance': 200000,
+    # Tolling参数
+    'tolling_years': 10, 'tolling_ratio': 0.8, 'tolling_price': 95, 'tolling_escalation': 0.02,
+    # 主设备参数
+    'battery_cabinet_capacity': 5.0, 'battery_cabinet_count': 40, 'battery_unit_price': 75,
+    'pcs_power': 5.5, 'pcs_count': 19, 'pcs_unit_price': 28,
+    'mv_transformer_capacity': 6300, 'mv_transformer_count': 19, 'mv_transformer_price': 35000,
+    'hv_transformer_capacity': 120, 'hv_transformer_count': 1, 'hv_transformer_price': 750000,
+    # 辅助设备参数
+    'ems_cost': 200000, 'scada_cost': 120000, 'switchgear_price': 18000, 'switchgear_count': 25,
+    'collector_line_cost': 250000, 'thermal_cost': 20, 'fire_protection_cost': 12,
+    # 电网接入参数
+    'substation_cost': 800000, 'grid_line_cost': 500000, 'grid_study_cost': 80000, 'metering_cost': 100000,
+    # 土地与基建参数
+    'land_acquisition_cost': 50, 'concrete_cost': 25, 'fence_cost': 80000, 'road_cost': 120000,
+    'drainage_cost': 50000,
+    # 安装与施工参数
+    'installation_cost_pct': 0.06, 'construction_mgmt_pct': 0.025, 'commissioning_cost': 150000,
+    # 建设期保险参数
+    'car_insurance_pct': 0.003, 'ear_insurance_pct': 0.002, 'cargo_insurance_pct': 0.0015,
+    'liability_insurance': 50000,
+    # 开发与业主费用参数
+    'spv_acquisition_cost': 50000, 'permit_cost': 180000, 'environmental_cost': 60000,
+    'project_mgmt_pct': 0.02, 'legal_cost': 100000, 'engineering_pct': 0.025, 'contingency_pct': 0.05,
+    # 拆除准备金
+    'decommissioning_total': 500000,
+    # OPEX参数
+    'opex_technical': 6, 'opex_technical_esc': 0.02, 'opex_insurance': 0.004, 'opex_insurance_esc': 0.015,
+    'opex_grid': 12000, 'opex_grid_esc': 0.02, 'opex_land': 60000, 'opex_land_esc': 0.02,
+    'opex_commercial': 4000, 'opex_commercial_esc': 0.02, 'opex_other': 1500, 'opex_other_esc': 0.02,
+}
+
+# 文本型参数（其余参数均为数值）
+TEXT_PARAMETERS = ('repayment_method', 'depreciation_method', 'tax_method')
+
+# 整数型参数（网页版用 parseInt 读取）
+INTEGER_PARAMETERS = (
+    'operation_years', 'loan_years', 'grace_period', 'depreciation_years', 'amortization_years',
+    'annual_cycles', 'tolling_years', 'battery_cabinet_count', 'pcs_count', 'mv_transformer_count',
+    'hv_transformer_count', 'switchgear_count',
+)
+
+# 支持逐年曲线的变化率参数：参数 '{名称}_curve' 为逐年变化率列表（第k项为第k+2年相对第k+1年，长度不足时沿用最后一项）
+CURVE_PARAMETERS = (
+    'inflation_rate', 'opex_technical_esc', 'opex_insurance_esc', 'opex_grid_esc', 'opex_land_esc',
+    'opex_commercial_esc', 'opex_other_esc', 'tolling_escalation', 'degradation_rate',
+)
+
+# 德国2025年现货市场套利预期基准: 35k€/MW/年，年增长1.5%（与 initSpotPriceTable 一致）
+DEFAULT_SPOT_BASE_PRICE = 35000
+DEFAULT_SPOT_ESCALATION = 0.015
+
+# 财务指标使用的折现率（与网页版动态回收期、敏感性NPV一致）
+DISCOUNT_RATE = 0.08
+
+# 批量计算精度：float32 时逐年表内存减半，IRR、NPV与回收期仍按 float64 累加
+COMPUTE_DTYPES = {'float64': np.float64, 'float32': np.float32}
+
+# 低精度模式的IRR容差（百分点，即1个基点）
+IRR_TOLERANCE_BP = 0.01
+
+# ==================== 输入整理 ====================
+
+def default_spot_prices(years):
+    """默认现货价格（与 initSpotPriceTable 一致）"""
+    return [round(DEFAULT_SPOT_BASE_PRICE * (1 + DEFAULT_SPOT_ESCALATION) ** i) for i in range(years)]
+
+def stack_parameters(scenarios):
+    """将参数字典列表合并为 {参数名: (情景数,) 数组}，缺失参数取默认值"""
+    columns = {}
+    for name, default in DEFAULT_PARAMETERS.items():
+        values = [scenario.get(name, default) for scenario in scenarios]
+        columns[name] = np.array(values, dtype=object if name in TEXT_PARAMETERS else float)
+    stack_curves(columns, {name: [scenario.get(name + '_curve') for scenario in scenarios]
+                           for name in CURVE_PARAMETERS})
+    return columns
+
+def stack_curves(columns, curves):
+    """
+    把逐年变化率曲线整理为 columns['{名称}_curve'] 的 (情景数, 最长曲线长度) 数组
+    @param curves: {参数名: 各情景的曲线列表（无曲线为None或空）}；全部情景均无曲线的参数不生成
+    """
+    for name, rows in curves.items():
+        rows = [curve or () for curve in rows]
+        width = max((len(curve) for curve in rows), default=0)
+        if width == 0:
+            continue
+        # 未给曲线的情景按固定变化率填充，较短曲线沿用最后一项补齐
+        matrix = np.repeat(_column(columns[name]), width, axis=1)
+        for s, curve in enumerate(rows):
+            if curve:
+                matrix[s, :len(curve)] = curve
+                matrix[s, len(curve):] = curve[-1]
+        columns[name + '_curve'] = matrix
+
+def stack_spot_prices(spot_prices, years):
+    """将各情景的现货价格序列补零对齐为 (情景数, 最长年限) 数组"""
+    width = int(years.max())
+    matrix = np.zeros((len(spot_prices), width))
+    for s, prices in enumerate(spot_prices):
+        n = min(len(prices), int(years[s]))
+        matrix[s, :n] = prices[:n]
+    return matrix
+
+def cast_inputs(params, spot, dtype):
+    """把数值参数、逐年曲线与现货价格转为指定精度（文本参数不变），其后各逐年表均按该精度计算"""
+    dtype = np.dtype(COMPUTE_DTYPES.get(dtype, dtype))
+    cast = {name: values if name in TEXT_PARAMETERS else np.asarray(values).astype(dtype, copy=False)
+            for name, values in params.items()}
+    return cast, np.asarray(spot).astype(dtype, copy=False)
+
+def _column(values):
+    """把 (情景数,) 数组转为可与逐年数组广播的列向量"""
+    return np.asarray(values)[:, None]
+
+# ==================== 指数曲线 ====================
+
+def escalation_index(rates, width, sign=1):
+    """
+    累乘构建指数曲线（对应 buildEscalationIndex）
+    @param rates: (情景数, k) 逐年变化率，第k项之后沿用最后一项
+    @return: (情景数, width) 数组，第0列为1，第t列 = 第t-1列 × (1 + sign × 变化率)
+    """
+    steps = np.minimum(np.arange(width - 1), rates.shape[1] - 1)
+    factors = np.concatenate([np.ones((rates.shape[0], 1), dtype=rates.dtype), 1 + sign * rates[:, steps]], axis=1)
+    return np.cumprod(factors, axis=1)
+
+def _index(p, name, width, sign=1):
+    """参数对应的指数曲线：有 '{名称}_curve' 时按逐年曲线，否则按固定变化率"""
+    rates = p.get(name + '_curve')
+    if rates is None:
+        rates = _column(p[name])
+    return escalation_index(np.asarray(rates) * 1.0, width, sign)
+
+# ==================== 分项计算 ====================
+
+def calculate_capex(p):
+    """CAPEX明细（对应 calculateCapex）"""
+    c = {}
+    # 一、主设备
+    c['battery'] = p['capacity_mwh'] * 1000 * p['battery_unit_price'] / 10000
+    c['pcs'] = p['power_mw'] * 1000 * p['pcs_unit_price'] / 10000
+    c['mv_transformer'] = p['mv_transformer_count'] * p['mv_transformer_price'] / 10000
+    c['hv_transformer'] = p['hv_transformer_count'] * p['hv_transformer_price'] / 10000
+    # 二、辅助设备
+    c['ems'] = p['ems_cost'] / 10000
+    c['scada'] = p['scada_cost'] / 10000
+    c['switchgear'] = p['switchgear_count'] * p['switchgear_price'] / 10000
+    c['collector_line'] = p['collector_line_cost'] / 10000
+    c['thermal'] = p['capacity_mwh'] * 1000 * p['thermal_cost'] / 10000
+    c['fire_protection'] = p['capacity_mwh'] * 1000 * p['fire_protection_cost'] / 10000
+    equipment = (c['battery'] + c['pcs'] + c['mv_transformer'] + c['hv_transformer'] +
+                 c['ems'] + c['scada'] + c['switchgear'] + c['collector_line'] +
+                 c['thermal'] + c['fire_protection'])
+    # 三、电网接入
+    c['substation'] = p['substation_cost'] / 10000
+    c['grid_line'] = p['grid_line_cost'] / 10000
+    c['grid_study'] = p['grid_study_cost'] / 10000
+    c['metering'] = p['metering_cost'] / 10000
+    c['grid_connection_subtotal'] = c['substation'] + c['grid_line'] + c['grid_study'] + c['metering']
+    # 四、土地与基建
+    c['land_acquisition'] = p['power_mw'] * 1000 * p['land_acquisition_cost'] / 10000
+    c['concrete'] = p['power_mw'] * 1000 * p['concrete_cost'] / 10000
+    c['fence'] = p['fence_cost'] / 10000
+    c['road'] = p['road_cost'] / 10000
+    c['drainage'] = p['drainage_cost'] / 10000
+    c['civil_subtotal'] = c['land_acquisition'] + c['concrete'] + c['fence'] + c['road'] + c['drainage']
+    # 五、安装与施工
+    c['installation'] = equipment * p['installation_cost_pct']
+    c['construction_mgmt'] = equipment * p['construction_mgmt_pct']
+    c['commissioning'] = p['commissioning_cost'] / 10000
+    c['installation_subtotal'] = c['installation'] + c['construction_mgmt'] + c['commissioning']
+    # 六、建设期保险
+    c['car_insurance'] = equipment * p['car_insurance_pct']
+    c['ear_insurance'] = equipment * p['ear_insurance_pct']
+    c['cargo_insurance'] = equipment * p['cargo_insurance_pct']
+    c['liability_insurance'] = p['liability_insurance'] / 10000
+    c['insurance_subtotal'] = (c['car_insurance'] + c['ear_insurance'] + c['cargo_insurance'] +
+                               c['liability_insurance'])
+    # 七、开发与业主费用
+    c['spv_acquisition'] = p['spv_acquisition_cost'] / 10000
+    c['permit'] = p['permit_cost'] / 10000
+    c['environmental'] = p['environmental_cost'] / 10000
+    c['legal'] = p['legal_cost'] / 10000
+    c['engineering'] = equipment * p['engineering_pct']
+    subtotal_before_mgmt = (equipment + c['grid_connection_subtotal'] + c['civil_subtotal'] +
+                            c['installation_subtotal'] + c['insurance_subtotal'] +
+                            c['spv_acquisition'] + c['permit'] + c['environmental'] + c['legal'] +
+                            c['engineering'])
+    c['project_mgmt'] = subtotal_before_mgmt * p['project_mgmt_pct']
+    c['dev_subtotal'] = (c['spv_acquisition'] + c['permit'] + c['environmental'] + c['legal'] +
+                         c['engineering'] + c['project_mgmt'])
+    # 八、不可预见费
+    subtotal_before_contingency = subtotal_before_mgmt + c['project_mgmt']
+    c['contingency'] = subtotal_before_contingency * p['contingency_pct']
+    # 总计（拆除准备金逐年计提，不计入CAPEX）
+    c['total'] = subtotal_before_contingency + c['contingency']
+    loan_amount = c['total'] * (1 - p['equity_ratio'])
+    c['construction_interest'] = (loan_amount * p['loan_rate'] * p['construction_period'] *
+                                  p['construction_fund_usage'])
+    c['dynamic_total'] = c['total'] + c['construction_interest']
+    c['equipment_subtotal'] = equipment
+    c['dev_cost'] = c['dev_subtotal']
+    c['land'] = c['land_acquisition']
+    return c
+
+def calculate_opex(p, capex, t, active):
+    """年度OPEX（对应 calculateOpex）"""
+    width = len(t)
+    inflation = _index(p, 'inflation_rate', width)
+
+    def line(base, esc):
+        return base * _index(p, esc, width) * inflation * active
+
+    power = _column(p['power_mw'])
+    decommissioning = np.where(p['decommissioning_total'] != 0,
+                               p['decommissioning_total'] / p['operation_years'] / 10000, 0)
+    o = {
+        'technical': line(_column(p['opex_technical']) * power * 1000, 'opex_technical_esc') / 10000,
+        'insurance': line(_column(capex['total'] * p['opex_insurance']), 'opex_insurance_esc'),
+        'grid': line(_column(p['opex_grid']) * power, 'opex_grid_esc') / 10000,
+        'land': line(_column(p['opex_land']), 'opex_land_esc') / 10000,
+        'commercial': line(_column(p['opex_commercial']) * power, 'opex_commercial_esc') / 10000,
+        'other': line(_column(p['opex_other']) * power, 'opex_other_esc') / 10000,
+        'decommissioning': _column(decommissioning) * inflation * active,
+    }
+    o['total'] = (o['technical'] + o['insurance'] + o['grid'] + o['land'] +
+                  o['commercial'] + o['other'] + o['decommissioning'])
+    return o
+
+def calculate_revenue(p, spot, t, active):
+    """年度收入（对应 calculateRevenueWithPrices）"""
+    capacity_factor = _column(p['initial_capacity_pct']) / 100 * _index(p, 'degradation_rate', len(t), -1)
+    in_tolling = (t + 1) <= _column(p['tolling_years'])
+    tolling_price = _column(p['tolling_price']) * _index(p, 'tolling_escalation', len(t))
+    tolling = np.where(in_tolling,
+                       tolling_price * _column(p['power_mw']) * 1000 * _column(p['tolling_ratio']) / 10000,
+                       0) * active
+    spot_ratio = np.where(in_tolling, 1 - _column(p['tolling_ratio']), 1)
+    spot_revenue = spot * _column(p['power_mw']) * spot_ratio * capacity_factor / 10000 * active
+    return {
+        'capacityFactor': capacity_factor * 100 * active,
+        'tollingRevenue': tolling,
+        'spotRevenue': spot_revenue,
+        'totalRevenue': tolling + spot_revenue,
+    }
+
+def calculate_depreciation(p, capex, t, active):
+    """年度折旧摊销（对应 calculateDepreciation）"""
+    intangible = capex['dev_cost'] + capex['land']
+    fixed_original = _column(capex['dynamic_total'] - intangible)
+    salvage = _column(p['salvage_rate'])
+    years = _column(p['depreciation_years'])
+    depreciable = fixed_original * (1 - salvage)
+    method = _column(p['depreciation_method'])
+    # 年序号转为与金额相同的实数精度，避免 float32 输入被整数数组提升为 float64
+    t = t.astype(np.asarray(fixed_original).real.dtype)
+
+    straight = depreciable / years
+    rate = 2 / years
+    book_value = fixed_original * np.power(1 - rate, t)
+    declining = np.minimum(book_value * rate, book_value - fixed_original * salvage)
+    sum_years = years * (years + 1) / 2
+    sum_of_years = depreciable * (years - t) / sum_years
+
+    depreciation = np.where(method == 'straight_line', straight,
+                   np.where(method == 'double_declining', declining,
+                   np.where(method == 'sum_of_years', sum_of_years, 0)))
+    depreciation = np.where((t + 1) <= years, depreciation, 0) * active
+    amortization = np.where((t + 1) <= _column(p['amortization_years']),
+                            _column(intangible / p['amortization_years']), 0) * active
+    return {
+        'depreciation': depreciation,
+        'amortization': amortization,
+        'total': depreciation + amortization,
+    }
+
+def calculate_loan(p, capex, width):
+    """贷款还款计划（对应 calculateLoan），按年递推、各情景并行"""
+    loan_amount = capex['dynamic_total'] * (1 - p['equity_ratio'])
+    rate = p['loan_rate']
+    grace = p['grace_period']
+    loan_years = p['loan_years']
+    repayment_years = np.maximum(loan_years - grace, 0)
+    equal_principal = p['repayment_method'] == 'equal_principal'
+    growth = np.power(1 + rate, repayment_years)
+    annuity = np.where(rate == 0, loan_amount / repayment_years,
+                       loan_amount * rate * growth / (growth - 1))
+
+    rows = {'beginBalance': [], 'interest': [], 'principal': [], 'payment': [], 'endBalance': []}
+    balance = loan_amount
+    for year in range(1, width + 1):
+        in_term = year <= loan_years
+        interest = balance * rate
+        repaying = (year > grace) & (repayment_years > 0)
+        principal = np.where(repaying,
+                             np.where(equal_principal, loan_amount / repayment_years, annuity - interest),
+                             0)
+        end_balance = np.maximum(0, balance - principal)
+        rows['beginBalance'].append(np.where(in_term, balance, 0))
+        rows['interest'].append(np.where(in_term, interest, 0))
+        rows['principal'].append(np.where(in_term, principal, 0))
+        rows['payment'].append(np.where(in_term, interest + principal, 0))
+        rows['endBalance'].append(np.where(in_term, end_balance, 0))
+        balance = end_balance
+    return {name: np.stack(values, axis=1) for name, values in rows.items()}
+
+def _loss_offset(income, pool, threshold, ratio):
+    """以结转亏损抵扣当年所得（最低课税，对应 lossOffset）"""
+    limit = np.minimum(income, threshold) + ratio * np.maximum(0, income - threshold)
+    return np.where(income > 0, np.minimum(pool, limit), 0)
+
+def calculate_taxes(p, ebitda, ebit, interest, ebt):
+    """
+    逐年税费（对应 calculateTaxSchedule）：按年扫描，每年对全部情景一次向量运算
+    @return: {'tax', 'corporateTax', 'solidarityTax', 'tradeTax', 'otherTax', 'deductibleInterest',
+              'interestCarryforward', 'lossCarryforward', 'tradeLossCarryforward'}，各为 (情景数, 年数) 数组
+    """
+    scenarios, width = ebt.shape
+    corporate_rate = p['corporate_tax_rate']
+    solidarity_rate = p['solidarity_tax_rate']
+    trade_rate = p['trade_tax_rate']
+    other_rate = p['other_tax_rate']
+    loss_threshold = p['loss_offset_threshold'] / 10000
+    ratio = p['min_taxation_ratio']
+    barrier_ratio = p['interest_barrier_ratio']
+    barrier_threshold = p['interest_barrier_threshold'] / 10000
+    addback_ratio = p['trade_tax_addback_ratio']
+    addback_allowance = p['trade_tax_addback_allowance'] / 10000
+
+    names = ('tax', 'corporateTax', 'solidarityTax', 'tradeTax', 'otherTax', 'deductibleInterest',
+             'interestCarryforward', 'lossCarryforward', 'tradeLossCarryforward')
+    t = {name: np.zeros((scenarios, width), dtype=ebt.dtype) for name in names}
+    interest_cf = np.zeros(scenarios, dtype=ebt.dtype)
+    loss_pool = np.zeros(scenarios, dtype=ebt.dtype)
+    trade_loss_pool = np.zeros(scenarios, dtype=ebt.dtype)
+    for y in range(width):
+        # 利息限制：当年利息加上期结转，低于免征额时全额扣除，否则以EBITDA的一定比例为上限
+        claim = interest[:, y] + interest_cf
+        deductible = np.where(claim < barrier_threshold, claim,
+                              np.minimum(claim, barrier_ratio * np.maximum(0, ebitda[:, y])))
+        interest_cf = claim - deductible
+        # 企业所得税（含团结附加税）
+        income = ebit[:, y] - deductible
+        offset = _loss_offset(income, loss_pool, loss_threshold, ratio)
+        loss_pool = loss_pool - offset + np.maximum(0, -income)
+        taxable = np.maximum(0, income - offset)
+        # 贸易税：所得加计部分利息后单独结转亏损
+        trade_income = income + addback_ratio * np.maximum(0, deductible - addback_allowance)
+        trade_offset = _loss_offset(trade_income, trade_loss_pool, loss_threshold, ratio)
+        trade_loss_pool = trade_loss_pool - trade_offset + np.maximum(0, -trade_income)
+        trade_taxable = np.maximum(0, trade_income - trade_offset)
+
+        corporate = taxable * corporate_rate
+        t['corporateTax'][:, y] = corporate
+        t['solidarityTax'][:, y] = corporate * solidarity_rate
+        t['tradeTax'][:, y] = trade_taxable * trade_rate
+        t['otherTax'][:, y] = np.maximum(0, ebt[:, y]) * other_rate
+        t['deductibleInterest'][:, y] = deductible
+        t['interestCarryforward'][:, y] = interest_cf
+        t['lossCarryforward'][:, y] = loss_pool
+        t['tradeLossCarryforward'][:, y] = trade_loss_pool
+    t['tax'] = t['corporateTax'] + t['solidarityTax'] + t['tradeTax'] + t['otherTax']
+
+    # 综合税率模式：按当年利润计税，亏损不结转
+    flat = _column(p['tax_method'] == 'flat')
+    if flat.any():
+        effective_tax_rate = corporate_rate * (1 + solidarity_rate) + trade_rate + other_rate
+        flat_tax = np.maximum(0, ebt * _column(effective_tax_rate))
+        for name in names:
+            t[name] = np.where(flat, interest if name == 'deductibleInterest' else 0, t[name])
+        t['tax'] = np.where(flat, flat_tax, t['tax'])
+    return t
+
+def calculate_income_statement(p, revenue, opex, depreciation, loan, active):
+    """利润表（对应 calculateIncomeStatement）"""
+    gross_profit = revenue['totalRevenue'] - opex['total']
+    ebit = gross_profit - depreciation['total']
+    interest = loan['interest'] * active
+    ebt = ebit - interest
+    taxes = calculate_taxes(p, gross_profit, ebit, interest, ebt)
+    income = {
+        'revenue': revenue['totalRevenue'],
+        'opex': opex['total'],
+        'grossProfit': gross_profit,
+        'ebitda': gross_profit,
+        'depreciation': depreciation['total'],
+        'ebit': ebit,
+        'interest': interest,
+        'ebt': ebt,
+    }
+    income.update({name: values * active for name, values in taxes.items()})
+    income['netProfit'] = ebt - income['tax']
+    return income
+
+def calculate_cash_flow(p, capex, income, depreciation, loan, active, last_year):
+    """现金流量表（对应 calculateCashFlow），第0列为建设期"""
+    scenarios = active.shape[0]
+    dynamic_total = _column(capex['dynamic_total'])
+    zero = np.zeros((scenarios, 1), dtype=dynamic_total.dtype)
+    equity = dynamic_total * _column(p['equity_ratio'])
+    loan_inflow = dynamic_total * (1 - _column(p['equity_ratio']))
+
+    def with_construction(first, operating):
+        return np.concatenate([first, operating], axis=1)
+
+    principal = loan['principal'] * active
+    operating = income['netProfit'] + depreciation['total']
+    intangible = capex['dev_cost'] + capex['land']
+    salvage = _column((capex['dynamic_total'] - intangible) * p['salvage_rate']) * last_year
+
+    cf = {
+        'netProfit': with_construction(zero, income['netProfit']),
+        'depreciation': with_construction(zero, depreciation['total']),
+        'workingCapital': with_construction(zero, np.zeros_like(operating)),
+        'operatingCashFlow': with_construction(zero, operating),
+        'capex': with_construction(-dynamic_total, np.zeros_like(operating)),
+        'equityInflow': with_construction(equity, np.zeros_like(operating)),
+        'loanInflow': with_construction(loan_inflow, np.zeros_like(operating)),
+        'loanRepayment': with_construction(zero, -principal),
+        'financingCashFlow': with_construction(equity + loan_inflow, -principal),
+    }
+    cf['investingCashFlow'] = with_construction(-dynamic_total, np.zeros_like(operating)) + salvage
+    cf['netCashFlow'] = with_construction(zero, operating - principal) + salvage
+    cf['projectCashFlow'] = with_construction(-dynamic_total, income['ebitda'] - income['tax']) + salvage
+    cf['equityCashFlow'] = with_construction(-equity, operating - principal) + salvage
+    return cf
+
+def calculate_balance_sheet(p, capex, income, depreciation, loan, cash_flow, active):
+    """资产负债表（对应 calculateBalanceSheet），第0列为建设完成时点"""
+    dynamic_total = _column(capex['dynamic_total'])
+    equity = dynamic_total * _column(p['equity_ratio'])
+    loan_amount = dynamic_total * (1 - _column(p['equity_ratio']))
+    intangible_original = _column(capex['dev_cost'] + capex['land'])
+    fixed_original = dynamic_total - intangible_original
+    is_last = active & ~np.concatenate([active[:, 1:], np.zeros_like(active[:, :1])], axis=1)
+
+    accumulated_depreciation = np.cumsum(depreciation['depreciation'], axis=1) * active
+    retained = np.cumsum(income['netProfit'], axis=1) * active
+    cash = np.cumsum(cash_flow['netCashFlow'][:, 1:], axis=1) * active
+    accumulated_amortization = np.cumsum(depreciation['amortization'], axis=1)
+    fixed_net = np.where(is_last, 0, fixed_original - accumulated_depreciation) * active
+    intangible = np.where(is_last, 0, np.maximum(0, intangible_original - accumulated_amortization)) * active
+    long_term_loan = loan['endBalance'] * active
+    total_equity = (equity + retained) * active
+
+    def with_initial(first, operating):
+        return np.concatenate([first, operating], axis=1)
+
+    zero = np.zeros_like(dynamic_total)
+    total_assets = cash + fixed_net + intangible
+    total_liabilities_and_equity = long_term_loan + total_equity
+    return {
+        'cash': with_initial(zero, cash),
+        'fixedAssetOriginal': with_initial(fixed_original, fixed_original * active),
+        'accumulatedDepreciation': with_initial(zero, accumulated_depreciation),
+        'fixedAssetNet': with_initial(fixed_original, fixed_net),
+        'intangibleAssets': with_initial(intangible_original, intangible),
+        'totalAssets': with_initial(dynamic_total, total_assets),
+        'longTermLoan': with_initial(loan_amount, long_term_loan),
+        'totalLiabilities': with_initial(loan_amount, long_term_loan),
+        'paidInCapital': with_initial(equity, equity * active),
+        'retainedEarnings': with_initial(zero, retained),
+        'totalEquity': with_initial(equity, total_equity),
+        'totalLiabilitiesAndEquity': with_initial(loan_amount + equity, total_liabilities_and_equity),
+        'residual': with_initial(dynamic_total - (loan_amount + equity), total_assets - total_liabilities_and_equity),
+    }
+
+def find_balance_imbalances(balance, tolerance=0.01):
+    """
+    批量检查资产负债表平衡（对应 findBalanceImbalances）
+    @return: {'max_abs': 各情景最大残差绝对值, 'first_year': 首个不平衡年份（平衡时为-1）}
+    """
+    residual = np.abs(np.nan_to_num(balance['residual']))
+    imbalanced = residual > tolerance
+    return {
+        'max_abs': residual.max(axis=1),
+        'first_year': np.where(imbalanced.any(axis=1), np.argmax(imbalanced, axis=1), -1),
+    }
+
+# ==================== 财务指标 ====================
+
+def calculate_irr(cash_flows, lengths=None, max_iterations=1000, tolerance=0.00001):
+    """批量IRR（百分比），逐情景复现 calculateIRR 的牛顿迭代：初值10%、同样的收敛与发散判据"""
+    cash_flows = np.asarray(cash_flows, dtype=float)
+    scenarios, width = cash_flows.shape
+    if lengths is not None:
+        cash_flows = np.where(np.arange(width) < _column(lengths), cash_flows, 0)
+    rate = np.full(scenarios, 0.1)
+    result = np.full(scenarios, np.nan)
+    pending = np.arange(scenarios)
+    with np.errstate(divide='ignore', invalid='ignore', over='ignore'):
+        for _ in range(max_iterations):
+            if not len(pending):
+                break
+            # 只迭代未收敛的情景；按年份顺序累加，与JS的求和顺序一致（不收敛时结果对舍入误差敏感）
+            flows, current = cash_flows[pending], rate[pending]
+            npv = np.zeros(len(pending))
+            dnpv = np.zeros(len(pending))
+            for j in range(width):
+                npv += flows[:, j] / np.power(1 + current, j)
+                dnpv -= j * flows[:, j] / np.power(1 + current, j + 1)
+            new_rate = current - npv / dnpv
+            converged = np.abs(new_rate - current) < tolerance
+            result[pending[converged]] = new_rate[converged] * 100
+            rate[pending] = new_rate
+            diverged = ~converged & ((new_rate < -0.99) | (new_rate > 10) | np.isnan(new_rate))
+            pending = pending[~converged & ~diverged]
+    result[pending] = rate[pending] * 100
+    return result
+
+def calculate_npv(cash_flows, discount_rate):
+    """批量NPV（第0期不折现，对应 calculateNPV）"""
+    cash_flows = np.asarray(cash_flows, dtype=float)
+    return np.sum(cash_flows / np.power(1 + discount_rate, np.arange(cash_flows.shape[1])), axis=1)
+
+def calculate_payback(cash_flows, lengths, discount_rate=None):
+    """批量回收期（对应 calculateStaticPayback / calculateDynamicPayback），未回收时返回现金流期数"""
+    cash_flows = np.asarray(cash_flows, dtype=float)
+    index = np.arange(cash_flows.shape[1])
+    if discount_rate is not None:
+        cash_flows = cash_flows / np.power(1 + discount_rate, index)
+    valid = index < _column(lengths)
+    cumulative = np.cumsum(np.where(valid, cash_flows, 0), axis=1)
+    previous = cumulative - cash_flows
+    hit = (cumulative >= 0) & valid
+    first = np.argmax(hit, axis=1)
+    rows = np.arange(cash_flows.shape[0])
+    with np.errstate(divide='ignore', invalid='ignore'):
+        interpolated = first - 1 + np.abs(previous[rows, first]) / cash_flows[rows, first]
+    return np.where(hit.any(axis=1), interpolated, lengths)
+
+def debt_service_years(p, loan, active):
+    """参与DSCR计算的还款年份：贷款期内且当年还本付息大于0"""
+    t = np.arange(active.shape[1])
+    return (t < _column(p['loan_years'])) & active & (loan['payment'] > 0)
+
+def calculate_indicators(p, capex, revenue, income, cash_flow, balance, loan, years, active):
+    """财务指标（对应 calculateIndicators，另含敏感性分析用的NPV与融资报告用的最低DSCR）"""
+    project_cf = cash_flow['projectCashFlow']
+    equity_cf = cash_flow['equityCashFlow']
+    lengths = years + 1
+    scenarios = active.shape[0]
+    rows = np.arange(scenarios)
+
+    total_revenue = revenue['totalRevenue'].sum(axis=1)
+    first3_revenue = revenue['totalRevenue'][:, :3].sum(axis=1)
+    total_profit = income['ebt'].sum(axis=1)
+    first3_profit = income['ebt'][:, :3].sum(axis=1)
+    total_net_profit = income['netProfit'].sum(axis=1)
+    first3_net_profit = income['netProfit'][:, :3].sum(axis=1)
+    avg_net_profit = total_net_profit / years
+
+    # ROE（第三年净资产收益率）
+    has_year3 = years >= 3
+    year3_net_profit = np.where(has_year3, income['netProfit'][:, min(2, active.shape[1] - 1)], 0)
+    year3_equity = np.where(has_year3, balance['totalEquity'][:, min(3, active.shape[1])],
+                            capex['dynamic_total'] * p['equity_ratio'])
+    with np.errstate(divide='ignore', invalid='ignore'):
+        roe3 = np.where(year3_equity > 0, year3_net_profit / year3_equity * 100, 0)
+
+    # DSCR（还款年份EBITDA合计 / 还本付息合计）与最低DSCR
+    t = np.arange(active.shape[1])
+    servicing = debt_service_years(p, loan, active)
+    total_debt_service = np.where(servicing, loan['payment'], 0).sum(axis=1)
+    total_ebitda = np.where(servicing, income['ebitda'], 0).sum(axis=1)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        dscr = np.where(total_debt_service > 0, total_ebitda / total_debt_service, 0)
+        yearly_dscr = np.where(servicing, income['ebitda'] / loan['payment'], np.inf)
+    min_dscr = yearly_dscr.min(axis=1)
+    min_dscr = np.where(np.isinf(min_dscr), 0, min_dscr)
+
+    # LCOE（EUR/MWh）
+    total_opex = income['opex'].sum(axis=1)
+    capacity_factor = _column(p['initial_capacity_pct']) / 100 * _index(p, 'degradation_rate', len(t), -1)
+    annual_energy = (_column(p['capacity_mwh']) * capacity_factor * _column(p['annual_cycles']) *
+                     _column(p['charge_efficiency']) * _column(p['discharge_efficiency'])) * active
+    total_energy = annual_energy.sum(axis=1)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        lcoe = np.where(total_energy > 0, (capex['dynamic_total'] + total_opex) * 10000 / total_energy, 0)
+
+    return {
+        'static_investment': capex['total'],
+        'dynamic_investment': capex['dynamic_total'],
+        'total_revenue': total_revenue,
+        'avg_revenue': total_revenue / years,
+        'first3_revenue': first3_revenue,
+        'total_profit': total_profit,
+        'avg_profit': total_profit / years,
+        'first3_profit': first3_profit,
+        'total_net_profit': total_net_profit,
+        'avg_net_profit': avg_net_profit,
+        'first3_net_profit': first3_net_profit,
+        'project_irr': calculate_irr(project_cf, lengths),
+        'equity_irr': calculate_irr(equity_cf, lengths),
+        'static_payback': calculate_payback(project_cf, lengths),
+        'equity_payback': calculate_payback(equity_cf, lengths),
+        'dynamic_payback': calculate_payback(project_cf, lengths, DISCOUNT_RATE),
+        'equity_dynamic_payback': calculate_payback(equity_cf, lengths, DISCOUNT_RATE),
+        'roe_year3': roe3,
+        'roi': avg_net_profit / capex['dynamic_total'] * 100,
+        'ebitda_return': income['ebitda'].sum(axis=1) / years / capex['dynamic_total'] * 100,
+        'dscr': dscr,
+        'lcoe': lcoe,
+        'npv': calculate_npv(project_cf, DISCOUNT_RATE),
+        'min_dscr': min_dscr,
+    }
+
+# ==================== 主入口 ====================
+
+def run_batch(scenarios, dtype=None):
+    """
+    批量运行模型
+    @param scenarios: [{'parameters': 参数字典, 'spotPrices': 现货价格列表}, ...]（即 saveModel() 的 modelData 结构）
+    @param dtype: 计算精度（'float32' 或 'float64'），缺省 float64
+    @return: 与 runModel() 同名的分节结果 {'capex': {...}, 'revenueData': {...}, ...}，各字段为批量数组；
+             逐年字段形状为 (情景数, 最长年限)，现金流量表与资产负债表多出第0列
+    """
+    params = stack_parameters([scenario['parameters'] for scenario in scenarios])
+    years = params['operation_years'].astype(int)
+    spot = stack_spot_prices([scenario.get('spotPrices') or default_spot_prices(int(y))
+                              for scenario, y in zip(scenarios, years)], years)
+    return run_arrays(params, spot, dtype)
+
+def run_arrays(params, spot, dtype=None):
+    """
+    批量运行模型（输入已整理为数组，见 stack_parameters / stack_spot_prices）
+    @param dtype: 计算精度，缺省沿用输入数组的类型；误差见 precision_report
+    """
+    if dtype is not None:
+        params, spot = cast_inputs(params, spot, dtype)
+    results = run_schedules(params, spot)
+    years = results['years']
+    active = np.arange(int(years.max())) < years[:, None]
+    results['indicators'] = calculate_indicators(
+        params, results['capex'], results['revenueData'], results['incomeData'], results['cashFlowData'],
+        results['balanceData'], results['loanData'], years, active)
+    return results
+
+def run_schedules(params, spot):
+    """
+    计算CAPEX与各逐年表（不含财务指标）；数值参数可为复数数组，供 sensitivity.py 的复步长求导使用
+    @return: 与 run_arrays 相同的分节结果，缺少 'indicators'
+    """
+    years = np.asarray(params['operation_years']).real.astype(int)
+    width = int(years.max())
+    t = np.arange(width)
+    active = t < years[:, None]
+    last_year = np.concatenate([np.zeros((len(years), 1), dtype=bool), t == (years[:, None] - 1)], axis=1)
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        capex = calculate_capex(params)
+        opex = calculate_opex(params, capex, t, active)
+        revenue = calculate_revenue(params, spot, t, active)
+        depreciation = calculate_depreciation(params, capex, t, active)
+        loan = calculate_loan(params, capex, width)
+        income = calculate_income_statement(params, revenue, opex, depreciation, loan, active)
+        cash_flow = calculate_cash_flow(params, capex, income, depreciation, loan, active, last_year)
+        balance = calculate_balance_sheet(params, capex, income, depreciation, loan, cash_flow, active)
+    return {
+        'years': years,
+        'capex': capex,
+        'opexData': opex,
+        'revenueData': revenue,
+        'depreciationData': depreciation,
+        'loanData': {name: values * active for name, values in loan.items()},
+        'incomeData': income,
+        'cashFlowData': cash_flow,
+        'balanceData': balance,
+    }
+
+def precision_report(params, spot, dtype='float32', sample=256,
+                     indicators=('project_irr', 'equity_irr', 'npv', 'min_dscr', 'lcoe')):
+    """
+    低精度模式误差：在均匀抽取的 sample 个情景上分别以 float64 与 dtype 计算，报告各指标最大绝对偏差
+    @return: {'sample': 抽样数, 'indicators': {指标名: 最大偏差},
+              'nan_mismatch': 任一指标一方为NaN另一方不是的情景数, 'nan_mismatch_by_indicator': {指标名: 情景数},
+              'irr_within_tolerance': IRR偏差是否在 IRR_TOLERANCE_BP 以内；有情景的IRR是否有解两种精度判断不一致时为假}
+    """
+    count = len(spot)
+    rows = np.unique(np.linspace(0, count - 1, min(sample, count)).astype(int))
+    subset = {name: np.asarray(values)[rows] for name, values in params.items()}
+    reference = run_arrays(subset, np.asarray(spot)[rows], 'float64')['indicators']
+    reduced = run_arrays(subset, np.asarray(spot)[rows], dtype)['indicators']
+    deviations, by_indicator = {}, {}
+    mismatched = np.zeros(len(rows), dtype=bool)
+    irr_mismatched = np.zeros(len(rows), dtype=bool)
+    for name in indicators:
+        expected = np.asarray(reference[name], dtype=float)
+        actual = np.asarray(reduced[name], dtype=float)
+        both = np.isfinite(expected) & np.isfinite(actual)
+        differs = np.isfinite(expected) != np.isfinite(actual)
+        by_indicator[name] = int(differs.sum())
+        mismatched |= differs
+        if name in ('project_irr', 'equity_irr'):
+            irr_mismatched |= differs
+        deviations[name] = float(np.abs(expected[both] - actual[both]).max()) if both.any() else 0.0
+    irr = max(deviations.get('project_irr', 0.0), deviations.get('equity_irr', 0.0))
+    mismatch = int(mismatched.sum())
+    return {'sample': int(len(rows)), 'dtype': np.dtype(COMPUTE_DTYPES.get(dtype, dtype)).name,
+            'indicators': deviations, 'nan_mismatch': mismatch,
+            'nan_mismatch_by_indicator': by_indicator,
+            'irr_within_tolerance': not irr_mismatched.any() and irr <= IRR_TOLERANCE_BP}
@@ -0,0 +1,291 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+德国独立储能电站财务测算系统 - 模型文件批量导入
+@description 并行读取目录中 saveModel() 导出的模型JSON（储能电站模型_*MW_*.json），逐个校验、按 modelVersion 迁移到
+             当前格式，整理为 (项目数 × 参数数) 的稠密参数矩阵与 (项目数 × 最长年限) 的现货价格矩阵，可直接交给
+             model_engine.run_arrays 批量计算；文件逐个解析、结果逐行汇入，不会把整个目录的内容同时读入内存
+@usage python model_loader.py 共享盘/模型目录 --out models.npz --evaluate
+@version 1.0
+"""
+
+import argparse
+import json
+import math
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+import model_engine
+
+# 当前模型文件格式版本（与 saveModel() 写入的 modelVersion 一致）
+CURRENT_MODEL_VERSION = '1.1'
+
+# 文本参数的取值，矩阵中按序号存放
+TEXT_OPTIONS = {
+    'repayment_method': ('equal_principal', 'equal_payment'),
+    'depreciation_method': ('straight_line', 'double_declining', 'sum_of_years'),
+    'tax_method': ('german', 'flat'),
+}
+
+# 矩阵的参数列（顺序与 model_engine.DEFAULT_PARAMETERS 一致）
+MATRIX_PARAMETERS = tuple(model_engine.DEFAULT_PARAMETERS)
+
+# 取值范围校验：参数名 -> (下限, 上限)，闭区间
+PARAMETER_RANGES = {
+    'operation_years': (1, 50),
+    'power_mw': (0, 10000),
+    'capacity_mwh': (0, 40000),
+    'equity_ratio': (0, 1),
+    'loan_years': (0, 50),
+    'loan_rate': (0, 1),
+    'construction_period': (0, 10),
+    'depreciation_years': (1, 50),
+    'amortization_years': (1, 50),
+    'salvage_rate': (0, 1),
+    'charge_efficiency': (0, 1),
+    'discharge_efficiency': (0, 1),
+    'degradation_rate': (0, 1),
+    'tolling_ratio': (0, 1),
+    'min_taxation_ratio': (0, 1),
+    'interest_barrier_ratio': (0, 1),
+}
+
+# ==================== 格式迁移 ====================
+
+def _migrate_unversioned(model):
+    """早期文件只有参数字典本身：包装为 modelData 结构"""
+    return {'modelVersion': '1.0', 'parameters': model, 'spotPrices': None}
+
+def _migrate_1_0(model):
+    """1.0 -> 1.1：引入德国税制计算；旧文件按保存时的综合税率口径计税"""
+    model['parameters'].setdefault('tax_method', 'flat')
+    model['modelVersion'] = '1.1'
+    return model
+
+# 版本 -> 迁移到下一版本的函数；None 表示无版本号的早期文件
+MIGRATIONS = {
+    None: _migrate_unversioned,
+    '1.0': _migrate_1_0,
+}
+
+def migrate(model):
+    """
+    把任意已知版本的模型数据迁移到 CURRENT_MODEL_VERSION
+    无版本号时：不含 parameters 的按早期参数字典包装；已含 parameters 的按 1.0 结构处理
+    @raises ValueError: 版本未知或 parameters 不是对象
+    """
+    if model.get('modelVersion') is None:
+        model = MIGRATIONS[None](model) if 'parameters' not in model else dict(model, modelVersion='1.0')
+    if not isinstance(model.get('parameters'), dict):
+        raise ValueError('parameters 缺失或不是对象')
+    version = model.get('modelVersion')
+    while version != CURRENT_MODEL_VERSION:
+        if version not in MIGRATIONS:
+            raise ValueError(f'不支持的模型版本: {version}')
+        model = MIGRATIONS[version](model)
+        version = model['modelVersion']
+    return model
+
+# ==================== 单文件解析与校验 ====================
+
+def _number(name, value, errors):
+    """参数值转为有限浮点数，失败时记录错误并返回NaN"""
+    try:
+        number = float(value)
+    except (TypeError, ValueError):
+        errors.append(f'{name} 不是数值: {value!r}')
+        return math.nan
+    if not math.isfinite(number):
+        errors.append(f'{name} 不是有限数值: {value!r}')
+        return math.nan
+    return number
+
+def load_model_file(path):
+    """
+    读取并规范化单个模型文件（在工作进程中执行）
+    @return: (路径, 参数行, 现货价格, {参数名: 曲线}, 错误列表)；有错误时参数行为None
+    """
+    errors = []
+    try:
+        with open(path, encoding='utf-8') as f:
+            model = json.load(f)
+        if not isinstance(model, dict):
+            raise ValueError('文件内容不是对象')
+        model = migrate(model)
+    except (OSError, ValueError) as e:
+        return path, None, None, None, [str(e)]
+    except (KeyError, TypeError, AttributeError) as e:
+        # 结构异常的文件只记为该文件的错误，不中断整个目录的导入
+        return path, None, None, None, [f'文件结构无效: {type(e).__name__}: {e}']
+
+    parameters = model.get('parameters')
+    if not isinstance(parameters, dict):
+        return path, None, None, None, ['缺少 parameters']
+
+    row = np.empty(len(MATRIX_PARAMETERS))
+    for i, name in enumerate(MATRIX_PARAMETERS):
+        value = parameters.get(name, model_engine.DEFAULT_PARAMETERS[name])
+        if name in TEXT_OPTIONS:
+            if value not in TEXT_OPTIONS[name]:
+                errors.append(f'{name} 取值无效: {value!r}')
+                row[i] = math.nan
+            else:
+                row[i] = TEXT_OPTIONS[name].index(value)
+            continue
+        row[i] = _number(name, value, errors)
+        if name in model_engine.INTEGER_PARAMETERS and row[i] == row[i]:
+            row[i] = int(row[i])
+        bounds = PARAMETER_RANGES.get(name)
+        # 无法转换的值已记录错误（NaN），不再重复报告超出范围
+        if bounds and row[i] == row[i] and not bounds[0] <= row[i] <= bounds[1]:
+            errors.append(f'{name}={value} 超出范围 [{bounds[0]}, {bounds[1]}]')
+
+    years = int(row[MATRIX_PARAMETERS.index('operation_years')]) if not errors else 0
+    spot = model.get('spotPrices')
+    if spot is None:
+        spot = model_engine.default_spot_prices(years)
+    elif not isinstance(spot, list) or len(spot) < years:
+        errors.append(f'现货价格不足 {years} 年')
+        spot = []
+    spot = np.array([_number('spotPrices', v, errors) for v in spot[:years]])
+
+    curves = {}
+    for name in model_engine.CURVE_PARAMETERS:
+        curve = parameters.get(name + '_curve')
+        if curve:
+            curves[name] = [_number(name + '_curve', v, errors) for v in curve]
+
+    if errors:
+        return path, None, None, None, errors
+    return path, row, spot, curves, []
+
+# ==================== 批量导入 ====================
+
+class ParameterMatrix:
+    """批量导入结果：参数矩阵、现货价格矩阵与逐年变化率曲线"""
+
+    def __init__(self, files, values, spot, curves, errors):
+        self.files = files              # 成功导入的文件路径（矩阵行顺序）
+        self.values = values            # (项目数, 参数数)，文本参数按 TEXT_OPTIONS 序号存放
+        self.spot = spot                # (项目数, 最长年限)，超出运营年限的部分为0
+        self.curves = curves            # {参数名: 各项目的曲线或None}
+        self.errors = errors            # {文件路径: 错误列表}
+
+    @property
+    def names(self):
+        return MATRIX_PARAMETERS
+
+    def column(self, name):
+        return self.values[:, MATRIX_PARAMETERS.index(name)]
+
+    def to_params(self):
+        """转为 model_engine.run_arrays 的参数数组字典"""
+        params = {}
+        for name in MATRIX_PARAMETERS:
+            column = self.column(name)
+            if name in TEXT_OPTIONS:
+                params[name] = np.array(TEXT_OPTIONS[name], dtype=object)[column.astype(int)]
+            else:
+                params[name] = column
+        model_engine.stack_curves(params, self.curves)
+        return params
+
+    def evaluate(self):
+        """批量计算全部项目"""
+        return model_engine.run_arrays(self.to_params(), self.spot)
+
+    def save(self, path):
+        """保存为 .npz（曲线与文件列表以JSON文本存放）"""
+        np.savez_compressed(path, names=np.array(MATRIX_PARAMETERS), values=self.values, spot=self.spot,
+                            files=np.array(self.files), curves=json.dumps(self.curves))
+
+def iter_model_files(directory, pattern_suffix='.json'):
+    """逐个列出目录（含子目录）中的模型文件"""
+    for root, _, names in os.walk(directory):
+        for name in sorted(names):
+            if name.endswith(pattern_suffix):
+                yield os.path.join(root, name)
+
+def _grow(matrix, rows):
+    """按倍数扩充预分配的矩阵"""
+    grown = np.zeros((max(rows, 2 * matrix.shape[0]),) + matrix.shape[1:])
+    grown[:matrix.shape[0]] = matrix
+    return grown
+
+def load_directory(directory, workers=None, chunksize=16):
+    """
+    并行导入目录中的模型文件
+    @param workers: 进程数，缺省为CPU核数；1时在当前进程顺序解析
+    @return: ParameterMatrix；校验失败的文件记入 errors，不中断导入
+    """
+    files, errors = [], {}
+    curves = {name: [] for name in model_engine.CURVE_PARAMETERS}
+    values = np.zeros((64, len(MATRIX_PARAMETERS)))
+    spot = np.zeros((64, 1))
+    count = 0
+
+    paths = iter_model_files(directory)
+    if workers == 1:
+        results = map(load_model_file, paths)
+        executor = None
+    else:
+        executor = ProcessPoolExecutor(max_workers=workers)
+        results = executor.map(load_model_file, paths, chunksize=chunksize)
+    try:
+        for path, row, prices, row_curves, row_errors in results:
+            if row_errors:
+                errors[path] = row_errors
+                continue
+            if count == values.shape[0]:
+                values = _grow(values, count + 1)
+                spot = _grow(spot, count + 1)
+            if len(prices) > spot.shape[1]:
+                spot = np.concatenate([spot, np.zeros((spot.shape[0], len(prices) - spot.shape[1]))], axis=1)
+            values[count] = row
+            spot[count, :len(prices)] = prices
+            for name in curves:
+                curves[name].append(row_curves.get(name))
+            files.append(path)
+            count += 1
+    finally:
+        if executor is not None:
+            executor.shutdown()
+
+    curves = {name: rows for name, rows in curves.items() if any(rows)}
+    return ParameterMatrix(files, values[:count], spot[:count], curves, errors)
+
+# ==================== 命令行 ====================
+
+def main():
+    parser = argparse.ArgumentParser(description='批量导入 saveModel() 模型文件为参数矩阵')
+    parser.add_argument('directory', help='模型文件目录（含子目录）')
+    parser.add_argument('--out', metavar='NPZ', help='保存参数矩阵与现货价格矩阵')
+    parser.add_argument('--workers', type=int, default=None, help='并行进程数（默认CPU核数）')
+    parser.add_argument('--evaluate', action='store_true', help='导入后批量计算并输出指标摘要')
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    matrix = load_directory(args.directory, workers=args.workers)
+    print(f'导入 {len(matrix.files)} 个模型，{len(matrix.errors)} 个文件未通过校验'
+          f'（{time.perf_counter() - start:.2f} 秒）')
+    for path, file_errors in list(matrix.errors.items())[:20]:
+        print(f'  ✗ {path}: {"; ".join(file_errors)}')
+    if args.out:
+        matrix.save(args.out)
+        print(f'参数矩阵 {matrix.values.shape}、现货价格矩阵 {matrix.spot.shape} 已保存: {args.out}')
+    if args.evaluate and matrix.files:
+        start = time.perf_counter()
+        indicators = matrix.evaluate()['indicators']
+        print(f'批量计算完成（{time.perf_counter() - start:.2f} 秒）')
+        for name in ('project_irr', 'equity_irr', 'npv', 'min_dscr'):
+            values = indicators[name][np.isfinite(indicators[name])]
+            if len(values):
+                print(f'  {name:<12} 中位数 {np.median(values):10.2f}  范围 [{values.min():.2f}, {values.max():.2f}]')
+    return 1 if matrix.errors and not matrix.files else 0
+
+if __name__ == '__main__':
+    sys.exit(main())
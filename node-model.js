@@ -0,0 +1,84 @@
+/**
+ * 德国独立储能电站投资测算系统 - Node.js 模型加载器
+ * @description 在Node.js沙箱中加载网页版财务模型（提供最小DOM桩），供基准测试等命令行工具调用
+ * @version 1.0
+ */
+
+const fs = require('fs');
+const path = require('path');
+const vm = require('vm');
+
+/** @type {string[]} 按页面顺序加载的模型脚本 */
+const MODEL_SCRIPTS = ['model-cache.js', 'model-profiler.js', 'escalation-index.js', 'tax-model.js', 'model-core.js', 'sensitivity-pool.js', 'statement-renderer.js', 'financial-model.js'];
+
+/**
+ * 创建最小DOM桩：所有输入框读取为空值，使 getParameters() 回落到默认参数
+ * @returns {Object} document 桩对象
+ */
+function createDocumentStub() {
+    const element = () => ({
+        value: '',
+        style: {},
+        classList: { add() {}, remove() {}, contains() { return false; } },
+        addEventListener() {},
+        appendChild() {},
+        querySelector() { return null; },
+        querySelectorAll() { return []; }
+    });
+    return {
+        readyState: 'complete',
+        addEventListener() {},
+        getElementById: element,
+        querySelector() { return null; },
+        querySelectorAll() { return []; },
+        createElement: element
+    };
+}
+
+/**
+ * 加载财务模型
+ * @description 脚本在当前全局上下文中执行（与浏览器<script>语义一致）；
+ *              独立vm上下文的全局属性查找（如Math）会经过拦截器，计时严重失真
+ * @returns {Object} 全局对象，模型全局函数（runModel、calculateIRR等）均可直接访问
+ */
+function loadModel() {
+    if (globalThis.runModel) {
+        return globalThis;
+    }
+    globalThis.document = createDocumentStub();
+    globalThis.window = globalThis;
+    MODEL_SCRIPTS.forEach(file => {
+        const code = fs.readFileSync(path.join(__dirname, file), 'utf8');
+        vm.runInThisContext(code, { filename: file });
+    });
+    // class/const 声明不会挂到全局对象上，显式导出
+    vm.runInThisContext('globalThis.modelCache = modelCache; globalThis.ModelResultCache = ModelResultCache; globalThis.escalationIndexCache = escalationIndexCache; globalThis.EscalationIndexCache = EscalationIndexCache;');
+    return globalThis;
+}
+
+/**
+ * 获取默认参数（与网页版输入框默认值一致）
+ * @param {Object} model 模型沙箱
+ * @returns {Object} 参数对象
+ */
+function defaultParameters(model) {
+    const params = model.getParameters();
+    params.repayment_method = 'equal_principal';
+    params.depreciation_method = 'straight_line';
+    return params;
+}
+
+/**
+ * 默认现货价格（与 initSpotPriceTable 一致：35k€/MW/年，年增长1.5%）
+ * @param {number} years 年数
+ * @returns {number[]} 现货价格数组
+ */
+function defaultSpotPrices(years) {
+    const prices = [];
+    for (let i = 0; i < years; i++) {
+        prices.push(Math.round(35000 * Math.pow(1.015, i)));
+    }
+    return prices;
+}
+
+module.exports = { loadModel, defaultParameters, defaultSpotPrices };
@@ -0,0 +1,426 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+德国独立储能电站财务测算系统 - 三方数值一致性校验
+@description 随机生成参数情景，分别由网页版JS模型（Node.js运行 batch-model.js）、Python批量引擎（model_engine）
+             与Excel工作簿公式（workbook_evaluator 本地求值）计算，按分项逐年比较并报告最大偏差；
+             受控的引擎对超出容差时返回非零退出码，可作为性能优化前后的回归门禁
+@usage python parity_check.py --scenarios 1000 --seed 7 --report parity.json
+@version 1.0
+"""
+
+import argparse
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+
+import numpy as np
+import openpyxl
+
+import model_engine
+from generate_excel import (CURVE_CELLS, MODEL_YEARS, PARAMETER_CELLS, PARAMETER_OPTIONS, SHEET_BUILDERS,
+                            flow_row, year_row)
+from workbook_evaluator import WorkbookEvaluator
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+ENGINES = ('js', 'python', 'excel')
+DEFAULT_GATE = ('js:python', 'js:excel')
+
+# ==================== 随机情景 ====================
+
+# 参数抽样范围：('uniform', 下限, 上限) / ('int', 下限, 上限) / ('choice', 选项)；
+# 未列出的数值参数在默认值的 ±30% 内均匀抽样
+SAMPLING_RANGES = {
+    'operation_years': ('int', 10, 30),
+    'initial_capacity_pct': ('uniform', 90, 100),
+    'equity_ratio': ('uniform', 0.15, 0.5),
+    'loan_years': ('int', 5, 18),
+    'loan_rate': ('uniform', 0.02, 0.08),
+    'grace_period': ('int', 0, 3),
+    'repayment_method': ('choice', ('equal_principal', 'equal_payment')),
+    'construction_period': ('int', 1, 3),
+    'construction_fund_usage': ('uniform', 0.3, 0.8),
+    'inflation_rate': ('uniform', 0, 0.04),
+    'depreciation_years': ('int', 8, 20),
+    'salvage_rate': ('uniform', 0, 0.1),
+    'depreciation_method': ('choice', ('straight_line', 'double_declining', 'sum_of_years')),
+    'amortization_years': ('int', 10, 25),
+    'degradation_rate': ('uniform', 0.01, 0.04),
+    'annual_cycles': ('int', 200, 730),
+    'charge_efficiency': ('uniform', 0.9, 0.98),
+    'discharge_efficiency': ('uniform', 0.9, 0.98),
+    'other_tax_rate': ('uniform', 0, 0.02),
+    'tax_method': ('choice', ('german', 'flat')),
+    'loss_offset_threshold': ('uniform', 0, 3000000),
+    'interest_barrier_threshold': ('uniform', 0, 5000000),
+    'trade_tax_addback_allowance': ('uniform', 0, 500000),
+    'tolling_years': ('int', 0, 15),
+    'tolling_ratio': ('uniform', 0.5, 1.0),
+    'tolling_escalation': ('uniform', 0, 0.04),
+}
+
+# 工作簿固定为 MODEL_YEARS 年，约一半情景取该年限以便三方比较
+WORKBOOK_YEARS_SHARE = 0.5
+
+# 各变化率参数改用逐年曲线的情景比例（曲线长度随机，不足运营期时沿用最后一项）
+CURVE_SHARE = 0.25
+
+def sample_scenarios(count, seed):
+    """生成随机情景（saveModel() 的 modelData 结构），同一种子结果可复现"""
+    rng = np.random.default_rng(seed)
+    scenarios = []
+    for _ in range(count):
+        params = {}
+        for name, default in model_engine.DEFAULT_PARAMETERS.items():
+            kind, *spec = SAMPLING_RANGES.get(name, ('scale', 0.7, 1.3))
+            if kind == 'choice':
+                params[name] = str(rng.choice(spec[0]))
+            elif kind == 'int':
+                params[name] = int(rng.integers(spec[0], spec[1] + 1))
+            elif kind == 'uniform':
+                params[name] = float(rng.uniform(*spec))
+            elif name in model_engine.INTEGER_PARAMETERS:
+                params[name] = max(1, int(round(default * rng.uniform(*spec))))
+            else:
+                params[name] = float(default * rng.uniform(*spec))
+        if rng.random() < WORKBOOK_YEARS_SHARE:
+            params['operation_years'] = MODEL_YEARS
+        if rng.random() < 0.1:
+            params['decommissioning_total'] = 0
+        years = params['operation_years']
+        for name in model_engine.CURVE_PARAMETERS:
+            if rng.random() < CURVE_SHARE:
+                length = int(rng.integers(1, max(years, 2)))
+                params[name + '_curve'] = [float(params[name] * x) for x in rng.uniform(0, 2, length)]
+        base = rng.uniform(20000, 60000)
+        escalation = rng.uniform(-0.01, 0.03)
+        noise = rng.uniform(0.9, 1.1, years)
+        spot = [round(base * (1 + escalation) ** i * noise[i]) for i in range(years)]
+        scenarios.append({'parameters': params, 'spotPrices': spot})
+    return scenarios
+
+# ==================== 各引擎运行 ====================
+
+# 逐年分节及其是否含第0年（建设期）列
+YEARLY_SECTIONS = {
+    'opexData': False, 'revenueData': False, 'depreciationData': False, 'loanData': False,
+    'incomeData': False, 'cashFlowData': True, 'balanceData': True,
+}
+
+def _pad(rows, width):
+    """将各情景长度不一的逐年列表补NaN对齐为 (情景数, width) 数组"""
+    matrix = np.full((len(rows), width), np.nan)
+    for s, values in enumerate(rows):
+        values = [np.nan if v is None else v for v in values[:width]]
+        matrix[s, :len(values)] = values
+    return matrix
+
+def run_js(scenarios):
+    """用Node.js运行网页版模型，返回 {'分节.字段': 数组}"""
+    node = shutil.which('node')
+    if node is None:
+        raise RuntimeError('未找到 node，无法运行网页版模型')
+    with tempfile.NamedTemporaryFile('w', suffix='.json', delete=False, encoding='utf-8') as f:
+        json.dump(scenarios, f)
+        path = f.name
+    try:
+        output = subprocess.run([node, os.path.join(BASE_DIR, 'batch-model.js'), path],
+                                check=True, capture_output=True, cwd=BASE_DIR).stdout
+    finally:
+        os.unlink(path)
+    columns = json.loads(output)['columns']
+    width = max(s['parameters']['operation_years'] for s in scenarios)
+    results = {}
+    for key, values in columns.items():
+        section = key.split('.')[0]
+        if section in YEARLY_SECTIONS:
+            results[key] = _pad(values, width + YEARLY_SECTIONS[section])
+        else:
+            results[key] = np.array([np.nan if v is None else v for v in values], dtype=float)
+    return results
+
+def run_python(scenarios):
+    """用 model_engine 批量计算，返回 {'分节.字段': 数组}"""
+    batch = model_engine.run_batch(scenarios)
+    results = {}
+    for section, fields in batch.items():
+        if isinstance(fields, dict):
+            for name, values in fields.items():
+                results[f'{section}.{name}'] = np.asarray(values, dtype=float)
+    return results
+
+# 工作簿结果位置：字段 -> (工作表, 列, 是否含第0年行)；CAPEX与指标按A列名称定位
+WORKBOOK_COLUMNS = {
+    'opexData': ('OPEX设定', ['technical', 'insurance', 'grid', 'land', 'commercial', 'other',
+                             'decommissioning', 'total']),
+    'revenueData': ('收入预测', ['capacityFactor', 'tollingRevenue', 'spotRevenue', 'totalRevenue']),
+    'depreciationData': ('折旧计算', ['depreciation', 'amortization', 'total']),
+    'loanData': ('贷款计算', ['beginBalance', 'interest', 'principal', 'payment', 'endBalance']),
+    'incomeData': ('利润表', ['revenue', 'opex', 'grossProfit', 'ebitda', 'depreciation', 'ebit',
+                           'interest', 'ebt', 'tax', 'netProfit']),
+    'cashFlowData': ('现金流量表', ['operatingCashFlow', 'investingCashFlow', 'financingCashFlow',
+                               'projectCashFlow', 'equityCashFlow']),
+    'balanceData': ('资产负债表', ['cash', 'fixedAssetNet', 'intangibleAssets', 'totalAssets',
+                              'longTermLoan', 'paidInCapital', 'retainedEarnings',
+                              'totalLiabilitiesAndEquity', 'residual']),
+}
+
+WORKBOOK_CAPEX = {
+    'battery': '电池系统', 'pcs': 'PCS系统', 'mv_transformer': '中压变压器', 'hv_transformer': '升压变压器',
+    'ems': 'EMS系统', 'scada': 'SCADA系统', 'switchgear': '开关柜', 'collector_line': '集电线路',
+    'thermal': '热管理系统', 'fire_protection': '消防系统',
+    'substation': '变电站建设', 'grid_line': '接入线路', 'grid_study': '并网申请与研究', 'metering': '计量与保护设备',
+    'grid_connection_subtotal': '电网接入小计',
+    'land_acquisition': '土地获取成本', 'concrete': '混凝土基础', 'fence': '围栏与安防', 'road': '道路建设',
+    'drainage': '排水系统', 'civil_subtotal': '土地与基建小计',
+    'installation': '机电安装', 'construction_mgmt': '施工管理费', 'commissioning': '调试费用',
+    'installation_subtotal': '安装施工小计',
+    'car_insurance': 'CAR保险', 'ear_insurance': 'EAR保险', 'cargo_insurance': '货物运输保险',
+    'liability_insurance': '第三方责任险', 'insurance_subtotal': '保险费小计',
+    'spv_acquisition': 'SPV公司收购成本', 'permit': '许可与规划费', 'environmental': '环境咨询费',
+    'legal': '法律咨询费', 'engineering': '工程设计费', 'project_mgmt': '项目管理费', 'dev_subtotal': '开发费用小计',
+    'contingency': '不可预见费', 'total': 'CAPEX总计（不含建设期利息）',
+    'construction_interest': '建设期利息', 'dynamic_total': 'CAPEX总计（含建设期利息）',
+}
+
+# 指标 -> (工作表中的名称, 换算系数)；工作簿以小数表示的百分比指标乘100与网页版对齐
+WORKBOOK_INDICATORS = {
+    'project_irr': ('全投资IRR', 100), 'equity_irr': ('资本金IRR', 100), 'npv': ('全投资NPV（8%）', 1),
+    'roi': ('ROI', 100), 'roe_year3': ('ROE（第3年）', 100), 'dscr': ('DSCR（平均）', 1),
+}
+
+def build_workbook():
+    """在内存中构建一份工作簿（不保存文件）"""
+    workbook = openpyxl.Workbook()
+    for builder in SHEET_BUILDERS:
+        builder(workbook)
+    return workbook
+
+def _rows_by_label(sheet):
+    return {sheet.cell(row, 1).value: row for row in range(1, sheet.max_row + 1) if sheet.cell(row, 1).value}
+
+def workbook_inputs(scenarios):
+    """把情景参数换算为工作表输入单元格的 (情景数,) 数组"""
+    inputs = {}
+    for name, (sheet, coordinate, scale) in PARAMETER_CELLS.items():
+        values = [s['parameters'][name] for s in scenarios]
+        if scale is None:
+            inputs[(sheet, coordinate)] = np.array([PARAMETER_OPTIONS[name][v] for v in values], dtype=object)
+        else:
+            inputs[(sheet, coordinate)] = np.array(values, dtype=float) * scale
+    # 逐年变化率（第t年相对第t-1年），未给曲线时即固定变化率
+    for name, (rate_col, _) in CURVE_CELLS.items():
+        for year in range(2, MODEL_YEARS + 1):
+            rates = []
+            for s in scenarios:
+                curve = s['parameters'].get(name + '_curve') or [s['parameters'][name]]
+                rates.append(curve[min(year - 2, len(curve) - 1)])
+            inputs[('指数曲线', f'{rate_col}{year_row(year)}')] = np.array(rates, dtype=float) * 100
+    for year in range(1, MODEL_YEARS + 1):
+        inputs[('现货价格', f'B{year_row(year)}')] = np.array([s['spotPrices'][year - 1] for s in scenarios],
+                                                           dtype=float)
+    return inputs
+
+def run_excel(scenarios, workbook=None):
+    """用工作簿公式对一批 MODEL_YEARS 年情景求值，返回 ({'分节.字段': 数组}, 公式错误)"""
+    workbook = workbook or build_workbook()
+    evaluator = WorkbookEvaluator(workbook, workbook_inputs(scenarios), strict=False)
+    count = len(scenarios)
+
+    def read(sheet, col, row):
+        return np.broadcast_to(np.asarray(evaluator.cell(sheet, col, row), dtype=float), (count,))
+
+    results = {}
+    capex_rows = _rows_by_label(workbook['CAPEX明细'])
+    for name, label in WORKBOOK_CAPEX.items():
+        results[f'capex.{name}'] = read('CAPEX明细', 4, capex_rows[label])
+    for section, (sheet, fields) in WORKBOOK_COLUMNS.items():
+        rows = [flow_row(y) for y in range(0, MODEL_YEARS + 1)] if YEARLY_SECTIONS[section] \
+            else [year_row(y) for y in range(1, MODEL_YEARS + 1)]
+        for col, name in enumerate(fields, 2):
+            results[f'{section}.{name}'] = np.stack([read(sheet, col, row) for row in rows], axis=1)
+    indicator_rows = _rows_by_label(workbook['财务指标'])
+    for name, (label, scale) in WORKBOOK_INDICATORS.items():
+        results[f'indicators.{name}'] = read('财务指标', 2, indicator_rows[label]) * scale
+    return results, dict(evaluator.errors)
+
+# ==================== 比较 ====================
+
+# 迭代求解的指标及其现金流：任一方结果不是现金流的根（未收敛或NaN）时记为收敛差异而非超差
+# （网页版牛顿法迭代至多1000次后返回末次迭代值，Excel的IRR至多20次，现金流难以回本时各方可能停在不同位置）
+CONVERGENCE_SENSITIVE = {
+    'indicators.project_irr': 'cashFlowData.projectCashFlow',
+    'indicators.equity_irr': 'cashFlowData.equityCashFlow',
+}
+
+def _is_irr_root(rate_pct, cash_flows, years, tolerance=1e-6):
+    """IRR（%）代入现金流后NPV相对现金流规模足够小，才视为真正求得的解"""
+    index = np.arange(cash_flows.shape[1])
+    flows = np.where(index <= years[:, None], np.nan_to_num(cash_flows), 0.0)
+    with np.errstate(divide='ignore', invalid='ignore', over='ignore'):
+        npv = np.sum(flows / np.power(1 + rate_pct[:, None] / 100, index), axis=1)
+        return np.abs(npv) <= tolerance * np.abs(flows).sum(axis=1)
+
+def _valid_mask(key, values, years):
+    """逐年数据只比较各情景运营期内的年份（现金流量表、资产负债表含第0年）"""
+    section = key.split('.')[0]
+    if values.ndim == 1:
+        return np.ones(values.shape, dtype=bool)
+    offset = 1 if YEARLY_SECTIONS.get(section) else 0
+    return np.arange(values.shape[1]) < (years[:, None] + offset)
+
+# 资产负债表残差容差（万EUR）
+BALANCE_TOLERANCE = 0.01
+
+def compare(left, right, years, rtol, atol):
+    """逐项比较两组结果，返回 [{'item', 'max_abs', 'max_rel', 'failures', 'worst': {...}}]（按偏差降序）"""
+    rows = []
+    for key in sorted(set(left) & set(right)):
+        a, b = left[key], right[key]
+        width = min(a.shape[1], b.shape[1]) if a.ndim == 2 else None
+        if width is not None:
+            a, b = a[:, :width], b[:, :width]
+        mask = _valid_mask(key, a, years)
+        both_nan = np.isnan(a) & np.isnan(b)
+        with np.errstate(invalid='ignore'):
+            diff = np.where(both_nan, 0.0, np.abs(a - b))
+            diff = np.where(np.isnan(diff), np.inf, diff)
+            scale = np.nan_to_num(np.fmax(np.abs(a), np.abs(b)))
+        unsolved = np.zeros_like(mask)
+        if key in CONVERGENCE_SENSITIVE:
+            flows = left[CONVERGENCE_SENSITIVE[key]]
+            unsolved = mask & ~both_nan & ~(_is_irr_root(a, flows, years) & _is_irr_root(b, flows, years))
+        diff = np.where(mask & ~unsolved, diff, 0.0)
+        bad = diff > atol + rtol * scale
+        # 相对差只在数值大于绝对容差时有意义（接近0的值看绝对差）
+        with np.errstate(invalid='ignore', divide='ignore'):
+            rel = np.where(scale > atol, diff / scale, 0.0)
+        worst = np.unravel_index(np.argmax(diff), diff.shape)
+        rows.append({
+            'item': key,
+            'max_abs': float(diff.max()),
+            'max_rel': float(rel.max()),
+            'failures': int(bad.any(axis=1).sum() if bad.ndim == 2 else bad.sum()),
+            'unconverged': int(unsolved.sum()) if key in CONVERGENCE_SENSITIVE else 0,
+            'worst': {
+                'scenario': int(worst[0]),
+                'year': int(worst[1]) + (0 if YEARLY_SECTIONS.get(key.split('.')[0]) else 1)
+                        if len(worst) == 2 else None,
+                'left': float(a[worst]),
+                'right': float(b[worst]),
+            },
+        })
+    return sorted(rows, key=lambda r: (-r['failures'], -r['max_rel'], -r['max_abs']))
+
+# ==================== 报告 ====================
+
+def print_pair(pair, rows, count, max_rows):
+    failing = [r for r in rows if r['failures']]
+    print(f"\n[{pair}] {count} 个情景，{len(rows)} 个分项，超差分项 {len(failing)} 个")
+    shown = (failing or rows)[:max_rows]
+    if not shown:
+        return
+    print(f"  {'分项':<38}{'最大绝对差':>14}{'最大相对差':>14}{'超差情景':>10}  最差位置")
+    for r in shown:
+        w = r['worst']
+        where = f"情景{w['scenario']}" + (f" 第{w['year']}年" if w['year'] is not None else '')
+        print(f"  {r['item']:<38}{r['max_abs']:>14.3e}{r['max_rel']:>14.3e}{r['failures']:>10}  "
+              f"{where} ({w['left']:.6g} vs {w['right']:.6g})")
+    for r in rows:
+        if r['unconverged']:
+            print(f"  注: {r['item']} 有 {r['unconverged']} 个情景至少一方未收敛到解（迭代收敛差异，不计入超差）")
+
+def main():
+    parser = argparse.ArgumentParser(description='网页版JS模型 / Python引擎 / Excel公式 三方数值一致性校验')
+    parser.add_argument('--scenarios', type=int, default=500, help='随机情景数（默认500）')
+    parser.add_argument('--seed', type=int, default=2025, help='随机种子')
+    parser.add_argument('--load', metavar='JSON', help='从文件读取情景列表（代替随机生成）')
+    parser.add_argument('--save', metavar='JSON', help='保存本次使用的情景列表，便于复现')
+    parser.add_argument('--engines', default=','.join(ENGINES), help='参与比较的引擎，默认 js,python,excel')
+    parser.add_argument('--gate', default=','.join(DEFAULT_GATE),
+                        help='超差即失败的引擎对，默认 js:python,js:excel；传空字符串则只报告')
+    parser.add_argument('--rtol', type=float, default=1e-9, help='相对容差')
+    parser.add_argument('--atol', type=float, default=1e-6, help='绝对容差（万EUR / %）')
+    parser.add_argument('--rows', type=int, default=15, help='每个引擎对最多显示的分项数')
+    parser.add_argument('--report', metavar='JSON', help='写出完整的JSON报告')
+    args = parser.parse_args()
+
+    if args.load:
+        with open(args.load, encoding='utf-8') as f:
+            scenarios = json.load(f)
+    else:
+        scenarios = sample_scenarios(args.scenarios, args.seed)
+    if args.save:
+        with open(args.save, 'w', encoding='utf-8') as f:
+            json.dump(scenarios, f, ensure_ascii=False)
+    engines = [e for e in args.engines.split(',') if e]
+    years = np.array([s['parameters']['operation_years'] for s in scenarios])
+
+    results, timings, workbook_errors = {}, {}, {}
+    for engine in engines:
+        start = time.perf_counter()
+        if engine == 'js':
+            results[engine] = run_js(scenarios)
+        elif engine == 'python':
+            results[engine] = run_python(scenarios)
+        elif engine == 'excel':
+            subset = [s for s in scenarios if s['parameters']['operation_years'] == MODEL_YEARS]
+            results[engine], workbook_errors = run_excel(subset) if subset else ({}, {})
+        else:
+            parser.error(f'未知引擎: {engine}')
+        timings[engine] = time.perf_counter() - start
+    print(f"情景数 {len(scenarios)}（其中 {MODEL_YEARS} 年情景 {int((years == MODEL_YEARS).sum())} 个，参与工作簿比较）")
+    print('耗时: ' + '，'.join(f'{e} {t:.2f}s' for e, t in timings.items()))
+    if workbook_errors:
+        print(f"\n工作簿公式错误 {len(workbook_errors)} 处：")
+        for coordinate, message in list(workbook_errors.items())[:args.rows]:
+            print(f"  {coordinate}: {message}")
+
+    # 资产负债表残差随每个情景一并算出，顺带统计不平衡情景（仅报告，不参与判定）
+    workbook_subset = years == MODEL_YEARS
+    imbalances = {}
+    for engine, data in results.items():
+        if 'balanceData.residual' in data:
+            engine_years = years[workbook_subset] if engine == 'excel' else years
+            residual = np.where(_valid_mask('balanceData.residual', data['balanceData.residual'], engine_years),
+                                np.abs(np.nan_to_num(data['balanceData.residual'])), 0.0)
+            imbalances[engine] = {'scenarios': int((residual > BALANCE_TOLERANCE).any(axis=1).sum()),
+                                  'max_abs': float(residual.max())}
+    if imbalances:
+        print(f'资产负债表不平衡情景（|残差|>{BALANCE_TOLERANCE}万EUR）: ' +
+              '，'.join(f"{e} {v['scenarios']} 个（最大残差 {v['max_abs']:.4g}）" for e, v in imbalances.items()))
+
+    # 工作簿只覆盖 MODEL_YEARS 年情景，比较前把另一方截取为同一子集
+    report = {'scenarios': len(scenarios), 'timings': timings, 'workbook_errors': workbook_errors,
+              'balance_imbalances': imbalances, 'pairs': {}}
+    for i, first in enumerate(engines):
+        for second in engines[i + 1:]:
+            left, right, pair_years = results[first], results[second], years
+            if 'excel' in (first, second):
+                pick = lambda data: data if data is results['excel'] else {k: v[workbook_subset] for k, v in data.items()}
+                left, right, pair_years = pick(left), pick(right), years[workbook_subset]
+            if not len(pair_years):
+                continue
+            rows = compare(left, right, pair_years, args.rtol, args.atol)
+            pair = f'{first}:{second}'
+            report['pairs'][pair] = rows
+            print_pair(pair, rows, len(pair_years), args.rows)
+
+    if args.report:
+        with open(args.report, 'w', encoding='utf-8') as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+
+    gated = [p for p in args.gate.split(',') if p]
+    failed = [p for p in gated if any(r['failures'] for r in report['pairs'].get(p, []))]
+    if 'excel' in engines and workbook_errors and any('excel' in p for p in gated):
+        failed.append('excel（公式错误）')
+    print(f"\n结果: {'不一致 - ' + ', '.join(failed) if failed else '一致'}")
+    return 1 if failed else 0
+
+if __name__ == '__main__':
+    sys.exit(main())
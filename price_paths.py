@@ -0,0 +1,340 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+德国独立储能电站财务测算系统 - 现货价格随机路径
+@description 以日价差（每日最高 duration 小时均价 - 最低 duration 小时均价，EUR/MWh）为状态变量生成随机价格路径：
+             均值回复（离散OU过程）+ 泊松跳跃（尖峰按回复速度衰减）+ 两状态马尔可夫体制（平稳/高波动），
+             参数由本地德国日前市场历史价格CSV标定；逐日价差按 时长 × 往返效率 × 日循环次数 折算为
+             套利收入（EUR/MW/年），输出 (路径数, 年数) 矩阵可直接作为 model_engine.run_arrays 的现货价格，
+             也可输出 (路径数, 天数) 逐日矩阵；随机数按 (种子, 分块号) 生成，分块计算，内存占用与总路径数无关
+@usage python price_paths.py calibrate 德国日前价格.csv --out 价格过程.json
+       python price_paths.py simulate --process 价格过程.json --paths 100000 --model 模型.json
+@version 1.0
+"""
+
+import argparse
+import csv
+import datetime
+import json
+import sys
+import time
+
+import numpy as np
+
+import model_engine
+
+DAYS_PER_YEAR = 365
+
+# 默认内存预算（MB）：决定每个分块的路径数
+DEFAULT_BUDGET_MB = 256
+
+# 随机数块的路径数：第b块（路径 b*RNG_BLOCK 起）的随机数由 (seed, b) 确定，与内存分块大小无关
+RNG_BLOCK = 256
+
+# 每条路径按一年天数预抽的随机数组个数（正态扰动、体制切换、跳跃发生与幅度）
+_ARRAYS_PER_DAY = 4
+
+# run_arrays 每个情景每年的峰值内存约为多少个float64（各分节逐年表与中间数组，实测约75~80）
+_MODEL_ARRAYS_PER_YEAR = 80
+
+# 残差超过该倍数的稳健标准差时视为跳跃
+JUMP_THRESHOLD = 3.0
+
+# 体制划分：滚动窗口（天）与高波动阈值（相对滚动标准差中位数）
+REGIME_WINDOW = 7
+REGIME_THRESHOLD = 1.5
+
+# 未标定时的默认过程：首年套利收入约为 DEFAULT_SPOT_BASE_PRICE（2小时、往返效率0.9025、每日一循环）
+DEFAULT_PROCESS = {
+    'mean_spread': 53.1,         # 长期均值（EUR/MWh）
+    'escalation': model_engine.DEFAULT_SPOT_ESCALATION,
+    'phi': 0.8,                  # 日自回归系数 exp(-κ)
+    'sigma': [12.0, 30.0],       # 平稳/高波动体制下的日波动（EUR/MWh）
+    'regime_shift': [0.0, 15.0], # 两个体制的均值偏移（EUR/MWh）
+    'transition': [0.03, 0.2],   # 每日转移概率：平稳→高波动、高波动→平稳
+    'jump_rate': 0.02,           # 每日跳跃概率
+    'jump_mean': 60.0,           # 跳跃幅度均值与标准差（EUR/MWh）
+    'jump_std': 30.0,
+}
+
+# ==================== 历史数据标定 ====================
+
+def read_prices(path):
+    """
+    读取历史价格CSV：第一列为时间戳（ISO格式，如 2024-01-01T00:00），第二列为价格（EUR/MWh）；有表头时自动跳过
+    @return: {日期: [当日价格, ...]}（按时间顺序）
+    """
+    days = {}
+    with open(path, newline='', encoding='utf-8-sig') as f:
+        for row in csv.reader(f):
+            if len(row) < 2 or not row[1].strip():
+                continue
+            try:
+                stamp = datetime.datetime.fromisoformat(row[0].strip().replace('Z', '+00:00'))
+                price = float(row[1])
+            except ValueError:
+                continue
+            days.setdefault(stamp.date(), []).append(price)
+    return days
+
+def daily_spreads(days, duration_hours=2):
+    """
+    逐日价差：当日最高 duration 小时均价 - 最低 duration 小时均价（按每日数据点数推断时间粒度，如24点为小时、96点为15分钟）
+    数据不足一半时段的日期跳过
+    """
+    spreads = []
+    for day in sorted(days):
+        prices = np.sort(np.asarray(days[day]))
+        per_hour = max(1, round(len(prices) / 24))
+        if len(prices) < 12 * per_hour:
+            continue
+        k = max(1, round(duration_hours * per_hour))
+        spreads.append(prices[-k:].mean() - prices[:k].mean())
+    return np.array(spreads)
+
+def _robust_std(values):
+    return 1.4826 * float(np.median(np.abs(values - np.median(values))))
+
+def calibrate(spreads, escalation=model_engine.DEFAULT_SPOT_ESCALATION):
+    """
+    由逐日价差序列标定价格过程参数
+    AR(1) 最小二乘得回复系数；残差超过 JUMP_THRESHOLD 倍稳健标准差记为跳跃；
+    其余残差按滚动标准差划分体制，统计各体制波动、均值偏移与转移概率
+    长期增长率无法由数年历史可靠估计，沿用给定值
+    """
+    spreads = np.asarray(spreads, dtype=float)
+    if len(spreads) < 4 * REGIME_WINDOW:
+        raise ValueError(f'历史数据不足（至少需要 {4 * REGIME_WINDOW} 天）')
+    mean = float(spreads.mean())
+    x = spreads - mean
+    phi = float(np.clip(np.dot(x[:-1], x[1:]) / np.dot(x[:-1], x[:-1]), 0.0, 0.999))
+    residuals = x[1:] - phi * x[:-1]
+
+    scale = _robust_std(residuals)
+    jumps = np.abs(residuals) > JUMP_THRESHOLD * scale
+    jump_sizes = residuals[jumps]
+
+    rolling = np.array([residuals[max(0, i - REGIME_WINDOW + 1):i + 1].std() for i in range(len(residuals))])
+    regime = (rolling > REGIME_THRESHOLD * np.median(rolling)).astype(int)
+    calm = ~jumps
+    sigma, shift = [], []
+    for state in (0, 1):
+        selected = residuals[calm & (regime == state)]
+        sigma.append(float(selected.std()) if len(selected) > 1 else scale)
+        # 残差均值偏移折算为状态水平偏移（稳态：shift / (1 - phi)）
+        shift.append(float(selected.mean() / (1 - phi)) if len(selected) > 1 else 0.0)
+    shift = [value - shift[0] for value in shift]
+    transition = []
+    for state in (0, 1):
+        stay = regime[:-1] == state
+        transition.append(float(np.mean(regime[1:][stay] != state)) if stay.any() else 0.0)
+
+    return {
+        'mean_spread': mean,
+        'escalation': escalation,
+        'phi': phi,
+        'sigma': sigma,
+        'regime_shift': shift,
+        'transition': transition,
+        'jump_rate': float(jumps.mean()),
+        'jump_mean': float(jump_sizes.mean()) if len(jump_sizes) else 0.0,
+        'jump_std': float(jump_sizes.std()) if len(jump_sizes) > 1 else 0.0,
+        'days': int(len(spreads)),
+    }
+
+# ==================== 路径生成 ====================
+
+def daily_cycles(parameters):
+    """可兑现日价差的日循环次数：年循环次数 / 365，至多每天1次（日价差每天只能套利一次）"""
+    return min(1.0, float(parameters['annual_cycles']) / DAYS_PER_YEAR)
+
+def storage_factor(parameters):
+    """每MWh日价差对应的年化单位功率收入系数：时长 × 往返效率 × 日循环次数（EUR/MW）"""
+    p = dict(model_engine.DEFAULT_PARAMETERS, **(parameters or {}))
+    duration = float(p['capacity_mwh']) / float(p['power_mw'])
+    return duration * float(p['charge_efficiency']) * float(p['discharge_efficiency']) * daily_cycles(p)
+
+def simulate(process, paths, years, rng, factor=1.0, daily=False):
+    """
+    生成一批路径
+    @param factor: storage_factor()，逐日价差折算为单位功率收入的系数
+    @param daily: 为真时返回 (paths, years*365) 逐日收入（EUR/MW/日），否则返回 (paths, years) 年收入（EUR/MW/年）
+    """
+    p = dict(DEFAULT_PROCESS, **process)
+    phi = p['phi']
+    sigma = np.asarray(p['sigma'], dtype=float)
+    shift = np.asarray(p['regime_shift'], dtype=float)
+    to_high, to_calm = p['transition']
+    stationary_high = to_high / (to_high + to_calm) if to_high + to_calm > 0 else 0.0
+
+    state = np.zeros(paths)
+    regime = (rng.random(paths) < stationary_high).astype(np.intp)
+    levels = p['mean_spread'] * (1 + p['escalation']) ** np.arange(years)
+    out = np.zeros((paths, years * DAYS_PER_YEAR if daily else years))
+
+    for year in range(years):
+        # 一年的随机数一次抽取，逐日只做递推
+        noise = rng.standard_normal((DAYS_PER_YEAR, paths))
+        switch = rng.random((DAYS_PER_YEAR, paths))
+        jumps = (rng.random((DAYS_PER_YEAR, paths)) < p['jump_rate']) * \
+            rng.normal(p['jump_mean'], p['jump_std'], (DAYS_PER_YEAR, paths))
+        total = out[:, year] if not daily else None
+        for day in range(DAYS_PER_YEAR):
+            regime = np.where(regime == 1, switch[day] >= to_calm, switch[day] < to_high).astype(np.intp)
+            state = phi * state + sigma[regime] * noise[day] + jumps[day]
+            spread = np.maximum(0.0, levels[year] + shift[regime] + state)
+            if daily:
+                out[:, year * DAYS_PER_YEAR + day] = spread * factor
+            else:
+                total += spread
+        if not daily:
+            total *= factor
+    return out
+
+def chunk_size_for_budget(years, budget_mb=DEFAULT_BUDGET_MB, daily=False, evaluate=False):
+    """
+    内存预算内每个分块可容纳的路径数
+    @param evaluate: 为真时计入对分块运行模型（run_arrays）的内存：逐路径参数列与约 _MODEL_ARRAYS_PER_YEAR 个逐年数组
+    """
+    width = years * DAYS_PER_YEAR if daily else years
+    per_path = 8 * (width + _ARRAYS_PER_DAY * DAYS_PER_YEAR)
+    if evaluate:
+        per_path += 8 * (len(model_engine.DEFAULT_PARAMETERS) + _MODEL_ARRAYS_PER_YEAR * years)
+    return max(1, int(budget_mb * 1024 * 1024 // per_path))
+
+def generate_paths(process, paths, years, seed=1, chunk_size=None, factor=1.0, daily=False,
+                   budget_mb=DEFAULT_BUDGET_MB):
+    """
+    分块生成路径：逐块产出 (起始路径号, 路径矩阵)
+    随机数按 RNG_BLOCK 条路径一块抽取，第b块由 (seed, b) 确定，末块也按整块模拟后截取；
+    因此第i条路径只取决于种子，与分块大小、内存预算和总路径数无关。分块取 RNG_BLOCK 的整数倍
+    """
+    chunk_size = chunk_size or chunk_size_for_budget(years, budget_mb, daily)
+    chunk_size = max(RNG_BLOCK, chunk_size // RNG_BLOCK * RNG_BLOCK)
+    width = years * DAYS_PER_YEAR if daily else years
+    for start in range(0, paths, chunk_size):
+        count = min(chunk_size, paths - start)
+        chunk = np.empty((count, width))
+        for offset in range(0, count, RNG_BLOCK):
+            rng = np.random.default_rng([seed, (start + offset) // RNG_BLOCK])
+            size = min(RNG_BLOCK, count - offset)
+            chunk[offset:offset + size] = simulate(process, RNG_BLOCK, years, rng, factor, daily)[:size]
+        yield start, chunk
+
+def evaluate(model_data, process, paths, seed=1, chunk_size=None, budget_mb=DEFAULT_BUDGET_MB,
+             indicators=('project_irr', 'equity_irr', 'npv', 'min_dscr')):
+    """
+    以随机价格路径批量运行模型（其余参数取模型文件的值）
+    @return: (年收入分位数 {p5, p50, p95}（各为逐年列表）, {指标名: 各路径取值})
+    """
+    parameters = dict(model_engine.DEFAULT_PARAMETERS, **model_data.get('parameters', {}))
+    years = int(parameters['operation_years'])
+    base = model_engine.stack_parameters([parameters])
+    factor = storage_factor(parameters)
+    columns = {name: np.empty(paths) for name in indicators}
+    quantiles = []
+    chunk_size = chunk_size or chunk_size_for_budget(years, budget_mb, evaluate=True)
+    for start, spot in generate_paths(process, paths, years, seed, chunk_size, factor):
+        count = len(spot)
+        arrays = {name: np.repeat(values, count, axis=0) for name, values in base.items()}
+        results = model_engine.run_arrays(arrays, spot)['indicators']
+        for name in indicators:
+            columns[name][start:start + count] = results[name]
+        quantiles.append((count, np.percentile(spot, [5, 50, 95], axis=0)))
+    # 分块分位数按路径数加权平均（近似值，仅用于摘要）
+    weights = np.array([count for count, _ in quantiles], dtype=float)
+    merged = np.tensordot(weights / weights.sum(), np.array([q for _, q in quantiles]), axes=1)
+    return {name: merged[i].tolist() for i, name in enumerate(('p5', 'p50', 'p95'))}, columns
+
+# ==================== 命令行 ====================
+
+def load_process(path):
+    if not path:
+        return dict(DEFAULT_PROCESS)
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+def main():
+    parser = argparse.ArgumentParser(description='现货价格随机路径：历史数据标定与批量模拟')
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    calib = commands.add_parser('calibrate', help='由历史价格CSV标定价格过程')
+    calib.add_argument('csv', help='历史价格CSV（时间戳, EUR/MWh），小时或15分钟粒度')
+    calib.add_argument('--duration', type=float, default=2, help='储能时长（小时），决定日价差的取价时段数')
+    calib.add_argument('--escalation', type=float, default=model_engine.DEFAULT_SPOT_ESCALATION,
+                       help='价差长期年增长率')
+    calib.add_argument('--out', help='输出参数文件（JSON），缺省打印')
+
+    sim = commands.add_parser('simulate', help='生成路径并（可选）批量运行模型')
+    sim.add_argument('--process', help='calibrate 输出的参数文件，缺省使用内置默认过程')
+    sim.add_argument('--paths', type=int, default=10000, help='路径数')
+    sim.add_argument('--years', type=int, default=None, help='年数（缺省取模型运营年限或20）')
+    sim.add_argument('--seed', type=int, default=1, help='随机种子')
+    sim.add_argument('--budget-mb', type=float, default=DEFAULT_BUDGET_MB, help='内存预算（MB），决定分块大小')
+    sim.add_argument('--chunk-size', type=int, default=None, help='每个分块的路径数（覆盖 --budget-mb）')
+    sim.add_argument('--model', help='saveModel() 导出的模型文件：给出时以路径运行模型并输出指标分布')
+    sim.add_argument('--daily', action='store_true', help='输出逐日收入矩阵（仅与 --out 同用）')
+    sim.add_argument('--out', help='把路径矩阵写入 .npy 文件（分块写入内存映射文件）')
+
+    args = parser.parse_args()
+    if args.command == 'calibrate':
+        spreads = daily_spreads(read_prices(args.csv), args.duration)
+        try:
+            process = calibrate(spreads, args.escalation)
+        except ValueError as e:
+            print(f'标定失败: {e}')
+            return 1
+        text = json.dumps(process, ensure_ascii=False, indent=2)
+        if args.out:
+            with open(args.out, 'w', encoding='utf-8') as f:
+                f.write(text)
+            print(f"已标定 {process['days']} 天数据，参数写入 {args.out}")
+        else:
+            print(text)
+        return 0
+
+    process = load_process(args.process)
+    model_data = None
+    if args.model:
+        from model_loader import migrate
+        from scenario_store import normalize_model_data
+        with open(args.model, 'r', encoding='utf-8') as f:
+            model_data = normalize_model_data(migrate(json.load(f)))
+    parameters = dict(model_engine.DEFAULT_PARAMETERS, **(model_data or {}).get('parameters', {}))
+    years = args.years or int(parameters['operation_years'])
+    factor = storage_factor(parameters)
+    start_time = time.perf_counter()
+
+    if args.out:
+        width = years * DAYS_PER_YEAR if args.daily else years
+        matrix = np.lib.format.open_memmap(args.out, mode='w+', dtype=float, shape=(args.paths, width))
+        for start, block in generate_paths(process, args.paths, years, args.seed, args.chunk_size, factor,
+                                           args.daily, args.budget_mb):
+            matrix[start:start + len(block)] = block
+        matrix.flush()
+        print(f'已写入 {args.out}：{args.paths} × {width}（{time.perf_counter() - start_time:.2f} 秒）')
+
+    if model_data is not None:
+        parameters['operation_years'] = years
+        quantiles, columns = evaluate({'parameters': parameters}, process, args.paths, args.seed, args.chunk_size,
+                                      args.budget_mb)
+        print(f'{args.paths} 条路径，{years} 年（{time.perf_counter() - start_time:.2f} 秒）')
+        print(f"首年套利收入 (EUR/MW/年): P5 {quantiles['p5'][0]:,.0f}  P50 {quantiles['p50'][0]:,.0f}  "
+              f"P95 {quantiles['p95'][0]:,.0f}")
+        for name, values in columns.items():
+            finite = values[np.isfinite(values)]
+            if len(finite):
+                p5, p50, p95 = np.percentile(finite, [5, 50, 95])
+                print(f'{name:<14} P5 {p5:>12.2f}  P50 {p50:>12.2f}  P95 {p95:>12.2f}  （有效 {len(finite)}）')
+            else:
+                print(f'{name:<14} 无有效值')
+    elif not args.out:
+        _, sample = next(generate_paths(process, min(args.paths, 2000), years, args.seed, 2048, factor))
+        p5, p50, p95 = np.percentile(sample, [5, 50, 95], axis=0)
+        print(f"{'年份':>4}  {'P5':>10}  {'P50':>10}  {'P95':>10}   (EUR/MW/年，前 {len(sample)} 条路径)")
+        for year in range(years):
+            print(f'{year + 1:>4}  {p5[year]:>10,.0f}  {p50[year]:>10,.0f}  {p95[year]:>10,.0f}')
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
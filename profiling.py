@@ -0,0 +1,127 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+德国独立储能电站财务测算系统 - 分阶段性能剖析
+@description 可选开启的计时工具：记录Excel生成各阶段的耗时与内存分配，导出Chrome Trace JSON与汇总表；
+             关闭时 stage() 返回空上下文，不引入额外开销
+@version 1.0
+"""
+
+import contextlib
+import json
+import os
+import time
+import tracemalloc
+
+# 环境变量 BESS_PROFILE=1 时默认开启
+PROFILE_ENV_VAR = 'BESS_PROFILE'
+
+# ==================== 剖析器 ====================
+
+class StageProfiler:
+    """阶段剖析器"""
+
+    def __init__(self, enabled=False, trace_memory=True):
+        self.enabled = enabled
+        self.trace_memory = trace_memory
+        self._started_tracemalloc = False
+        self.reset()
+
+    def reset(self):
+        """清空已有记录"""
+        self.events = []
+        self.stats = {}
+        self.depth = 0
+        self.origin = time.perf_counter()
+
+    def enable(self, trace_memory=None):
+        """开启剖析（同时清空已有记录）"""
+        if trace_memory is not None:
+            self.trace_memory = trace_memory
+        self.reset()
+        self.enabled = True
+        if self.trace_memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracemalloc = True
+
+    def disable(self):
+        """关闭剖析，停止由本剖析器启动的tracemalloc"""
+        self.enabled = False
+        if self._started_tracemalloc:
+            tracemalloc.stop()
+            self._started_tracemalloc = False
+
+    def stage(self, name):
+        """返回阶段上下文管理器，未开启时为空上下文"""
+        if not self.enabled:
+            return contextlib.nullcontext()
+        return self._timed(name)
+
+    @contextlib.contextmanager
+    def _timed(self, name):
+        tracing = tracemalloc.is_tracing()
+        memory_before = tracemalloc.get_traced_memory()[0] if tracing else 0
+        start = time.perf_counter()
+        self.depth += 1
+        try:
+            yield
+        finally:
+            self.depth -= 1
+            duration = time.perf_counter() - start
+            memory_delta = (tracemalloc.get_traced_memory()[0] - memory_before) if tracing else 0
+            self.record(name, start, duration, memory_delta)
+
+    def record(self, name, start, duration, memory_delta):
+        """记录一次阶段执行（时间单位：秒，内存单位：字节）"""
+        self.events.append({
+            'name': name,
+            'cat': name.split('.')[0],
+            'ph': 'X',
+            'ts': round((start - self.origin) * 1e6),
+            'dur': round(duration * 1e6),
+            'pid': os.getpid(),
+            'tid': 1,
+            'args': {'memoryDelta': memory_delta, 'depth': self.depth},
+        })
+        stat = self.stats.setdefault(name, {'calls': 0, 'total_ms': 0.0, 'max_ms': 0.0, 'memory_bytes': 0})
+        stat['calls'] += 1
+        stat['total_ms'] += duration * 1000
+        stat['max_ms'] = max(stat['max_ms'], duration * 1000)
+        stat['memory_bytes'] += memory_delta
+
+    def summary(self):
+        """生成汇总表（按总耗时降序）"""
+        rows = []
+        for name, stat in self.stats.items():
+            rows.append({
+                'stage': name,
+                'calls': stat['calls'],
+                'total_ms': stat['total_ms'],
+                'avg_ms': stat['total_ms'] / stat['calls'],
+                'max_ms': stat['max_ms'],
+                'memory_kb': stat['memory_bytes'] / 1024,
+            })
+        return sorted(rows, key=lambda row: row['total_ms'], reverse=True)
+
+    def print_summary(self):
+        """打印汇总表"""
+        print(f"{'阶段':<32}{'次数':>6}{'总耗时ms':>12}{'平均ms':>10}{'最大ms':>10}{'内存KB':>12}")
+        for row in self.summary():
+            print(f"{row['stage']:<32}{row['calls']:>6}{row['total_ms']:>12.2f}{row['avg_ms']:>10.2f}"
+                  f"{row['max_ms']:>10.2f}{row['memory_kb']:>12.1f}")
+
+    def to_chrome_trace(self):
+        """导出Chrome Trace格式（chrome://tracing / Perfetto可直接打开）"""
+        return {'traceEvents': self.events, 'displayTimeUnit': 'ms'}
+
+    def write_chrome_trace(self, filepath):
+        """写入Chrome Trace JSON文件"""
+        with open(filepath, 'w', encoding='utf-8') as f:
+            json.dump(self.to_chrome_trace(), f, ensure_ascii=False)
+        return filepath
+
+
+# 全局剖析器实例
+profiler = StageProfiler(enabled=os.environ.get(PROFILE_ENV_VAR) == '1')
+if profiler.enabled:
+    profiler.enable()
@@ -0,0 +1,284 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+德国独立储能电站财务测算系统 - 多市场收入叠加优化
+@description 逐日求解线性规划，把电站功率分配到一次调频（FCR）、二次调频（aFRR上调/下调，容量+预期激活收益）与现货套利：
+             每个4小时竞价时段内各产品占用的充放电功率与能量裕度不超过电站能力，套利功率全天共用；
+             单纯形法逐日以前一天的最优基热启动（价格形状相近时通常无需换基），按价格形状缓存最优基，
+             各年相互独立、可多进程并行求解；逐年叠加收入（EUR/MW/年）直接作为模型的现货价格输入
+@usage python revenue_stacking.py 模型.json --profile 市场价格.json --workers 4 --out 模型_叠加收入.json
+@version 1.0
+"""
+
+import argparse
+import copy
+import datetime
+import json
+import multiprocessing
+import sys
+import time
+
+import numpy as np
+
+import model_engine
+from price_paths import daily_cycles
+
+DAYS_PER_YEAR = 365
+
+# 平衡市场产品（FCR为对称产品，aFRR分上调、下调）
+RESERVE_MARKETS = ('fcr', 'afrr_pos', 'afrr_neg')
+MARKETS = RESERVE_MARKETS + ('arbitrage',)
+
+# 默认市场价格：容量价格（EUR/MW/h，aFRR含预期激活收益），按6个4小时时段给出；套利为日价差（EUR/MWh）
+DEFAULT_PROFILE = {
+    'blocks': 6,
+    'fcr': {'price': [14.0, 12.0, 11.0, 10.0, 12.5, 13.0], 'escalation': -0.03},
+    'afrr_pos': {'price': [5.0, 4.0, 6.0, 5.5, 8.0, 6.5], 'escalation': -0.02},
+    'afrr_neg': {'price': [6.0, 5.0, 4.0, 6.5, 3.5, 4.5], 'escalation': -0.02},
+    'arbitrage': {'spread': 53.1, 'escalation': model_engine.DEFAULT_SPOT_ESCALATION},
+    # 各产品每MW需预留的能量（MWh）：FCR 15分钟准则双向各0.25h，aFRR按1小时持续激活
+    'energy_hours': {'fcr': 0.5, 'afrr_pos': 1.0, 'afrr_neg': 1.0},
+    # 各月容量价格系数（1月..12月），缺省全年相同
+    'monthly_scale': [1.0] * 12,
+}
+
+# 缓存键中价格的取整位数（EUR）：形状相近的日期共用缓存的最优基，再按精确价格验证最优性
+CACHE_DECIMALS = 0
+
+# 数值容差
+_TOL = 1e-9
+
+# 换基超过该次数后改用Bland规则
+BLAND_AFTER = 50
+
+# ==================== 单纯形法 ====================
+
+def solve_lp(c, A, b, basis=None, max_pivots=1000):
+    """
+    求解 max c·x，s.t. A x ≤ b，x ≥ 0（b ≥ 0，松弛变量基可行）
+    @param basis: 热启动的初始基（变量序号，松弛变量为 n..n+m-1）；不可行或奇异时退回松弛变量基
+    @return: (x, 目标值, 最优基, 换基次数)
+    """
+    m, n = A.shape
+    full = np.hstack([A, np.eye(m), b[:, None]])
+    costs = np.concatenate([c, np.zeros(m)])
+    basic = list(range(n, n + m))
+    tableau = full.copy()
+    if basis is not None:
+        try:
+            rows = np.linalg.solve(full[:, basis], full)
+            if rows[:, -1].min() >= -_TOL:
+                tableau, basic = rows, list(basis)
+        except np.linalg.LinAlgError:
+            pass
+    # 目标行：检验数 c_B B^-1 a_j - c_j，最后一列为当前目标值
+    objective = costs[basic] @ tableau - np.append(costs, 0.0)
+
+    pivots = 0
+    while pivots < max_pivots:
+        # Dantzig规则选入基变量；换基次数较多时改用Bland规则防止退化循环
+        bland = pivots > BLAND_AFTER
+        candidates = np.flatnonzero(objective[:-1] < -_TOL)
+        if not len(candidates):
+            break
+        entering = candidates[0] if bland else candidates[np.argmin(objective[candidates])]
+        column = tableau[:, entering]
+        positive = column > _TOL
+        if not positive.any():
+            raise ValueError('线性规划无界')
+        ratios = np.full(m, np.inf)
+        ratios[positive] = tableau[positive, -1] / column[positive]
+        leaving = int(np.argmin(ratios))
+        if bland:
+            # Bland规则：最小比值并列时，出基变量取序号最小者
+            ties = np.flatnonzero(ratios <= ratios[leaving] + _TOL)
+            leaving = int(min(ties, key=lambda row: basic[row]))
+        tableau[leaving] /= tableau[leaving, entering]
+        others = np.arange(m) != leaving
+        tableau[others] -= np.outer(tableau[others, entering], tableau[leaving])
+        objective -= objective[entering] * tableau[leaving]
+        basic[leaving] = entering
+        pivots += 1
+
+    x = np.zeros(n + m)
+    x[basic] = tableau[:, -1]
+    return x[:n], float(objective[-1]), basic, pivots
+
+# ==================== 逐日分配模型 ====================
+
+def build_constraints(blocks, duration, energy_hours):
+    """
+    约束矩阵（每MW功率归一化）：变量依次为 FCR[时段]、aFRR上调[时段]、aFRR下调[时段]、套利功率
+    每个时段：放电方向 FCR + aFRR上调 + 套利 ≤ 1，充电方向 FCR + aFRR下调 + 套利 ≤ 1，
+    能量裕度 Σ 产品功率 × 预留小时 + 套利功率 × 储能时长 ≤ 储能时长
+    """
+    n = 3 * blocks + 1
+    A = np.zeros((3 * blocks, n))
+    for k in range(blocks):
+        fcr, pos, neg = k, blocks + k, 2 * blocks + k
+        A[3 * k, [fcr, pos, n - 1]] = 1
+        A[3 * k + 1, [fcr, neg, n - 1]] = 1
+        A[3 * k + 2, fcr] = energy_hours['fcr']
+        A[3 * k + 2, pos] = energy_hours['afrr_pos']
+        A[3 * k + 2, neg] = energy_hours['afrr_neg']
+        A[3 * k + 2, n - 1] = duration
+    b = np.tile([1.0, 1.0, duration], blocks)
+    return A, b
+
+class DailyStacker:
+    """
+    逐日求解收入叠加线性规划：前一天的最优基作为热启动，按取整后的价格形状缓存最优基
+    """
+
+    def __init__(self, profile, duration, round_trip, cycles_per_day):
+        self.profile = dict(DEFAULT_PROFILE, **profile)
+        self.blocks = int(self.profile['blocks'])
+        self.hours = 24 / self.blocks
+        self.arbitrage_factor = duration * round_trip * cycles_per_day
+        self.A, self.b = build_constraints(self.blocks, duration,
+                                           dict(DEFAULT_PROFILE['energy_hours'], **self.profile['energy_hours']))
+        self.basis = None
+        self.cache = {}
+        self.stats = {'solves': 0, 'cache_hits': 0, 'pivots': 0}
+
+    def objective(self, capacity_prices, spread):
+        """目标系数（EUR/MW/日）：容量价格 × 时段小时数；套利为 日价差 × 时长 × 往返效率 × 日循环次数"""
+        return np.concatenate([np.concatenate(capacity_prices) * self.hours, [spread * self.arbitrage_factor]])
+
+    def solve(self, capacity_prices, spread):
+        """
+        求解一天的分配
+        @param capacity_prices: 各平衡市场产品的时段容量价格 [FCR, aFRR上调, aFRR下调]
+        @return: (各产品功率分配, {市场: 收入 EUR/MW/日})
+        """
+        c = self.objective(capacity_prices, spread)
+        key = tuple(np.round(c, CACHE_DECIMALS))
+        cached = self.cache.get(key)
+        if cached is not None:
+            self.stats['cache_hits'] += 1
+        x, _, basis, pivots = solve_lp(c, self.A, self.b, cached if cached is not None else self.basis)
+        self.basis = basis
+        self.cache.setdefault(key, basis)
+        self.stats['solves'] += 1
+        self.stats['pivots'] += pivots
+        revenue = c * x
+        k = self.blocks
+        return x, {'fcr': revenue[:k].sum(), 'afrr_pos': revenue[k:2 * k].sum(),
+                   'afrr_neg': revenue[2 * k:3 * k].sum(), 'arbitrage': revenue[-1]}
+
+# ==================== 逐年叠加收入 ====================
+
+def _month_of_day(day):
+    return min(11, day * 12 // DAYS_PER_YEAR)
+
+def storage_terms(parameters):
+    """由模型参数取储能时长、往返效率与日循环次数"""
+    p = dict(model_engine.DEFAULT_PARAMETERS, **(parameters or {}))
+    duration = float(p['capacity_mwh']) / float(p['power_mw'])
+    round_trip = float(p['charge_efficiency']) * float(p['discharge_efficiency'])
+    return duration, round_trip, daily_cycles(p)
+
+def solve_year(task):
+    """
+    求解一年（供进程池调用）
+    @param task: (年序号, 市场价格, 储能参数, 当年逐日价差或None)
+    @return: (年序号, {市场: EUR/MW/年}, 统计)
+    """
+    year, profile, terms, spreads = task
+    profile = dict(DEFAULT_PROFILE, **profile)
+    stacker = DailyStacker(profile, *terms)
+    growth = {name: (1 + profile[name].get('escalation', 0)) ** year for name in MARKETS}
+    base = [np.asarray(profile[name]['price'], dtype=float) * growth[name] for name in RESERVE_MARKETS]
+    if spreads is None:
+        spreads = np.full(DAYS_PER_YEAR, profile['arbitrage']['spread'] * growth['arbitrage'])
+    totals = dict.fromkeys(MARKETS, 0.0)
+    for day in range(DAYS_PER_YEAR):
+        scale = profile['monthly_scale'][_month_of_day(day)]
+        _, revenue = stacker.solve([prices * scale for prices in base], float(spreads[day]))
+        for name in MARKETS:
+            totals[name] += revenue[name]
+    return year, totals, stacker.stats
+
+def stack_revenue(parameters, profile=None, years=None, daily_spreads=None, workers=1):
+    """
+    逐年叠加收入
+    @param daily_spreads: 可选 (年数*365,) 逐日价差（EUR/MWh，如 price_paths 生成的一条路径），缺省按价差均值与增长率
+    @param workers: 并行进程数（各年独立求解）
+    @return: ({市场: 逐年收入列表（EUR/MW/年）}, 合计统计)
+    """
+    profile = dict(DEFAULT_PROFILE, **(profile or {}))
+    p = dict(model_engine.DEFAULT_PARAMETERS, **(parameters or {}))
+    years = years or int(p['operation_years'])
+    terms = storage_terms(p)
+    tasks = [(year, profile, terms,
+              None if daily_spreads is None else daily_spreads[year * DAYS_PER_YEAR:(year + 1) * DAYS_PER_YEAR])
+             for year in range(years)]
+    if workers and workers > 1:
+        with multiprocessing.Pool(min(workers, years)) as pool:
+            results = pool.map(solve_year, tasks)
+    else:
+        results = [solve_year(task) for task in tasks]
+    results.sort(key=lambda item: item[0])
+    by_market = {name: [totals[name] for _, totals, _ in results] for name in MARKETS}
+    stats = {key: sum(stats[key] for _, _, stats in results) for key in ('solves', 'cache_hits', 'pivots')}
+    return by_market, stats
+
+def stacked_spot_prices(by_market):
+    """各市场逐年收入之和：替代模型中的现货价格（EUR/MW/年）"""
+    return [round(sum(values), 2) for values in zip(*by_market.values())]
+
+# ==================== 命令行 ====================
+
+def main():
+    parser = argparse.ArgumentParser(description='多市场收入叠加优化（FCR、aFRR、现货套利）')
+    parser.add_argument('model', nargs='?', help='saveModel() 导出的模型文件（缺省使用默认参数）')
+    parser.add_argument('--profile', help='市场价格文件（JSON，结构同 DEFAULT_PROFILE，可只给需覆盖的项）')
+    parser.add_argument('--process', help='price_paths.py 标定的价格过程：套利价差改用一条随机路径')
+    parser.add_argument('--seed', type=int, default=1, help='随机路径种子（与 --process 同用）')
+    parser.add_argument('--workers', type=int, default=1, help='并行进程数（按年分解）')
+    parser.add_argument('--out', help='把叠加收入写入模型的现货价格并另存为该文件')
+    args = parser.parse_args()
+
+    from model_loader import CURRENT_MODEL_VERSION, migrate
+    from scenario_store import normalize_model_data
+    if args.model:
+        with open(args.model, 'r', encoding='utf-8') as f:
+            original = migrate(json.load(f))
+    else:
+        original = {'modelVersion': CURRENT_MODEL_VERSION, 'modelName': '多市场收入叠加',
+                    'savedAt': datetime.datetime.now().isoformat(), 'parameters': {}}
+    model_data = normalize_model_data(original)
+    profile = {}
+    if args.profile:
+        with open(args.profile, 'r', encoding='utf-8') as f:
+            profile = json.load(f)
+    parameters = dict(model_engine.DEFAULT_PARAMETERS, **model_data['parameters'])
+    years = int(parameters['operation_years'])
+
+    daily_spreads = None
+    if args.process:
+        import price_paths
+        rng = np.random.default_rng([args.seed, 0])
+        daily_spreads = price_paths.simulate(price_paths.load_process(args.process), 1, years, rng, daily=True)[0]
+
+    start = time.perf_counter()
+    by_market, stats = stack_revenue(parameters, profile, years, daily_spreads, args.workers)
+    elapsed = time.perf_counter() - start
+    spot = stacked_spot_prices(by_market)
+
+    print(f"{'年份':>4}" + ''.join(f'{name:>12}' for name in MARKETS) + f"{'合计':>12}   (EUR/MW/年)")
+    for year in range(years):
+        print(f'{year + 1:>4}' + ''.join(f'{by_market[name][year]:>12,.0f}' for name in MARKETS) + f'{spot[year]:>12,.0f}')
+    print(f"{stats['solves']} 次求解，缓存命中 {stats['cache_hits']} 次，换基 {stats['pivots']} 次（{elapsed:.2f} 秒）")
+
+    if args.out:
+        # 保留原模型文件的结构（版本号、名称、参数原样），只替换现货价格，网页版与 model_loader 均可直接导入
+        result = copy.deepcopy(original)
+        result['spotPrices'] = spot
+        with open(args.out, 'w', encoding='utf-8') as f:
+            json.dump(result, f, ensure_ascii=False, indent=2)
+        print(f'已写入 {args.out}')
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
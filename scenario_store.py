@@ -0,0 +1,340 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+德国独立储能电站财务测算系统 - 本地情景库
+@description 以SQLite保存参数情景（saveModel() 的 modelData 结构）及其逐年计算结果与财务指标；
+             结果按参数内容哈希存放，相同参数只计算一次；站点、保存日期与关键指标建有索引，
+             可按"资本金IRR > 9% 且最低DSCR > 1.3"之类的条件快速筛选
+@usage python scenario_store.py import 模型1.json 模型2.json --site Brandenburg
+       python scenario_store.py query "equity_irr>9" "min_dscr>1.3"
+@version 1.0
+"""
+
+import argparse
+import datetime
+import hashlib
+import json
+import os
+import re
+import sqlite3
+import sys
+import time
+
+import model_engine
+from model_loader import migrate
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_DB = os.path.join(BASE_DIR, 'scenarios.db')
+
+# 结果版本：计算逻辑变化时递增，旧结果不再命中而按需重算（与 model-cache.js 的 MODEL_CACHE_VERSION 保持一致，两处一起递增）
+RESULT_VERSION = '4'
+
+# 参数哈希前数字统一的有效位数（与 CACHE_FLOAT_PRECISION 一致）
+HASH_FLOAT_PRECISION = 12
+
+# 单独成列、可用于筛选与排序的指标；其中建索引的关键指标
+INDICATOR_COLUMNS = (
+    'project_irr', 'equity_irr', 'npv', 'min_dscr', 'dscr', 'lcoe', 'roi', 'roe_year3',
+    'static_payback', 'dynamic_payback', 'total_revenue', 'dynamic_investment',
+)
+INDEXED_INDICATORS = ('project_irr', 'equity_irr', 'npv', 'min_dscr', 'lcoe')
+
+# 可用于筛选的情景字段（其余为 INDICATOR_COLUMNS）
+SCENARIO_COLUMNS = ('id', 'name', 'site', 'saved_at')
+
+# 逐年分节及其是否含第0年（建设期）列
+YEARLY_SECTIONS = {
+    'opexData': False, 'revenueData': False, 'depreciationData': False, 'loanData': False,
+    'incomeData': False, 'cashFlowData': True, 'balanceData': True,
+}
+
+SCHEMA = f"""
+CREATE TABLE IF NOT EXISTS scenarios (
+    id INTEGER PRIMARY KEY,
+    name TEXT,
+    site TEXT,
+    saved_at TEXT,
+    params_hash TEXT NOT NULL,
+    model_data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_scenarios_site ON scenarios(site);
+CREATE INDEX IF NOT EXISTS idx_scenarios_saved_at ON scenarios(saved_at);
+CREATE INDEX IF NOT EXISTS idx_scenarios_hash ON scenarios(params_hash);
+CREATE TABLE IF NOT EXISTS results (
+    params_hash TEXT PRIMARY KEY,
+    computed_at TEXT,
+    {', '.join(f'{name} REAL' for name in INDICATOR_COLUMNS)},
+    capex TEXT,
+    indicators TEXT,
+    schedules TEXT
+);
+{''.join(f'CREATE INDEX IF NOT EXISTS idx_results_{name} ON results({name});' for name in INDEXED_INDICATORS)}
+"""
+
+# 筛选条件：字段 运算符 数值，如 equity_irr>9、min_dscr>=1.3
+FILTER_PATTERN = re.compile(r'^\s*(\w+)\s*(>=|<=|!=|>|<|=)\s*(\S+)\s*$')
+
+# ==================== 参数规范化与哈希 ====================
+
+def _canonical(value):
+    """规范化参数值：数字统一有效位数（整数与等值浮点数相同），对象键排序"""
+    if isinstance(value, bool) or value is None or isinstance(value, str):
+        return value
+    if isinstance(value, (int, float)):
+        return float(f'{float(value):.{HASH_FLOAT_PRECISION}g}')
+    if isinstance(value, dict):
+        return {key: _canonical(value[key]) for key in sorted(value)}
+    return [_canonical(v) for v in value]
+
+def normalize_model_data(model_data):
+    """补全缺省参数与现货价格，返回参与计算的 {'parameters', 'spotPrices'}"""
+    parameters = dict(model_engine.DEFAULT_PARAMETERS)
+    parameters.update(model_data.get('parameters') or {})
+    years = int(parameters['operation_years'])
+    spot = model_data.get('spotPrices') or model_engine.default_spot_prices(years)
+    return {'parameters': parameters, 'spotPrices': list(spot)}
+
+def params_hash(model_data):
+    """参数内容哈希：缺省参数按默认值补全后规范化，等价的参数组得到相同哈希"""
+    normalized = _canonical(normalize_model_data(model_data))
+    text = RESULT_VERSION + '|' + json.dumps(normalized, sort_keys=True, separators=(',', ':'))
+    return hashlib.sha1(text.encode('utf-8')).hexdigest()
+
+# ==================== 批量结果拆分 ====================
+
+def _number(value):
+    """数组元素转为可入库的数值（NaN、inf 存为NULL）"""
+    value = float(value)
+    return value if value == value and abs(value) != float('inf') else None
+
+def split_batch(batch):
+    """把 run_batch 的批量结果拆为逐情景的 (CAPEX, 指标, 逐年数据) 字典列表"""
+    years = batch['years']
+    records = []
+    for s, y in enumerate(years):
+        capex = {name: _number(values[s]) for name, values in batch['capex'].items()}
+        indicators = {name: _number(values[s]) for name, values in batch['indicators'].items()}
+        schedules = {}
+        for section, with_initial in YEARLY_SECTIONS.items():
+            width = int(y) + with_initial
+            schedules[section] = {name: [_number(v) for v in values[s, :width]]
+                                  for name, values in batch[section].items()}
+        records.append((capex, indicators, schedules))
+    return records
+
+# ==================== 情景库 ====================
+
+class ScenarioStore:
+    """SQLite 情景库：情景表记录每次保存/导入，结果表按参数哈希去重"""
+
+    def __init__(self, path=DEFAULT_DB):
+        self.path = path
+        self.connection = sqlite3.connect(path)
+        self.connection.row_factory = sqlite3.Row
+        self.connection.execute('PRAGMA journal_mode=WAL')
+        self.connection.execute('PRAGMA synchronous=NORMAL')
+        self.connection.executescript(SCHEMA)
+
+    def close(self):
+        self.connection.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def add(self, models, site=None):
+        """
+        保存一批情景并计算缺少的结果
+        @param models: modelData 列表（含 parameters、spotPrices，可含 modelName、savedAt、site）
+        @param site: 站点名称，缺省时取 modelData 中的 site
+        @return: (新增情景ID列表, 本次实际计算的参数组数)；与库中已有情景（参数哈希、站点、modelData均相同）重复的不再新增
+        """
+        now = datetime.datetime.now().isoformat(timespec='seconds')
+        hashes = [params_hash(model) for model in models]
+        computed = self.compute_missing(dict(zip(hashes, models)))
+        ids = []
+        with self.connection:
+            for model, digest in zip(models, hashes):
+                model_site = site or model.get('site')
+                text = json.dumps(model, ensure_ascii=False)
+                # 重复导入同一文件：按参数哈希索引查找，站点与原始modelData也相同时跳过
+                if self.connection.execute(
+                        'SELECT 1 FROM scenarios WHERE params_hash = ? AND site IS ? AND model_data = ?',
+                        (digest, model_site, text)).fetchone():
+                    continue
+                cursor = self.connection.execute(
+                    'INSERT INTO scenarios (name, site, saved_at, params_hash, model_data) VALUES (?, ?, ?, ?, ?)',
+                    (model.get('modelName'), model_site, model.get('savedAt') or now, digest, text))
+                ids.append(cursor.lastrowid)
+        return ids, computed
+
+    def compute_missing(self, models_by_hash):
+        """对结果表中尚不存在的参数组整批调用 model_engine 计算并入库，返回计算的组数"""
+        missing = [digest for digest in models_by_hash if not self.has_result(digest)]
+        if not missing:
+            return 0
+        batch = model_engine.run_batch([normalize_model_data(models_by_hash[d]) for d in missing])
+        now = datetime.datetime.now().isoformat(timespec='seconds')
+        columns = ', '.join(INDICATOR_COLUMNS)
+        placeholders = ', '.join('?' * (len(INDICATOR_COLUMNS) + 5))
+        rows = []
+        for digest, (capex, indicators, schedules) in zip(missing, split_batch(batch)):
+            rows.append((digest, now, *[indicators.get(name) for name in INDICATOR_COLUMNS],
+                         json.dumps(capex), json.dumps(indicators), json.dumps(schedules)))
+        with self.connection:
+            self.connection.executemany(
+                f'INSERT OR REPLACE INTO results (params_hash, computed_at, {columns}, capex, indicators, schedules) '
+                f'VALUES ({placeholders})', rows)
+        return len(missing)
+
+    def has_result(self, digest):
+        return self.connection.execute('SELECT 1 FROM results WHERE params_hash = ?', (digest,)).fetchone() is not None
+
+    def query(self, filters=(), site=None, since=None, until=None, order_by=None, descending=True, limit=None):
+        """
+        按条件筛选情景
+        @param filters: [(字段, 运算符, 数值), ...]，字段为 INDICATOR_COLUMNS 或 id，如 ('equity_irr', '>', 9)
+        @param site / since / until: 站点、保存日期范围（ISO日期文本）
+        @return: 情景摘要（id、名称、站点、保存时间及各指标）字典列表
+        """
+        where, args = [], []
+        for name, op, value in filters:
+            if name not in INDICATOR_COLUMNS and name != 'id':
+                raise ValueError(f'不支持的筛选字段: {name}')
+            if op not in ('>', '<', '>=', '<=', '=', '!='):
+                raise ValueError(f'不支持的运算符: {op}')
+            where.append(f'{"s." if name == "id" else "r."}{name} {op} ?')
+            args.append(value)
+        if site is not None:
+            where.append('s.site = ?')
+            args.append(site)
+        if since is not None:
+            where.append('s.saved_at >= ?')
+            args.append(since)
+        if until is not None:
+            where.append('s.saved_at < ?')
+            args.append(until)
+        sql = (f'SELECT s.id, s.name, s.site, s.saved_at, s.params_hash, '
+               f'{", ".join("r." + name for name in INDICATOR_COLUMNS)} '
+               f'FROM scenarios s JOIN results r ON r.params_hash = s.params_hash')
+        if where:
+            sql += ' WHERE ' + ' AND '.join(where)
+        if order_by is not None:
+            if order_by not in INDICATOR_COLUMNS and order_by not in SCENARIO_COLUMNS:
+                raise ValueError(f'不支持的排序字段: {order_by}')
+            prefix = 's.' if order_by in SCENARIO_COLUMNS else 'r.'
+            sql += f' ORDER BY {prefix}{order_by} {"DESC" if descending else "ASC"}'
+        if limit is not None:
+            sql += f' LIMIT {int(limit)}'
+        return [dict(row) for row in self.connection.execute(sql, args)]
+
+    def get(self, scenario_id):
+        """读取单个情景的完整记录：modelData、CAPEX、全部指标与逐年数据"""
+        row = self.connection.execute(
+            'SELECT s.id, s.name, s.site, s.saved_at, s.params_hash, s.model_data, r.capex, r.indicators, r.schedules '
+            'FROM scenarios s LEFT JOIN results r ON r.params_hash = s.params_hash WHERE s.id = ?',
+            (scenario_id,)).fetchone()
+        if row is None:
+            return None
+        record = dict(row)
+        for key in ('model_data', 'capex', 'indicators', 'schedules'):
+            record[key] = json.loads(record[key]) if record[key] else None
+        return record
+
+    def recompute_stale(self):
+        """结果版本变化后，为库中情景补算新版本哈希下的结果，返回计算的组数"""
+        models, updates = {}, []
+        for row in self.connection.execute('SELECT id, params_hash, model_data FROM scenarios'):
+            model = json.loads(row['model_data'])
+            digest = params_hash(model)
+            models[digest] = model
+            if digest != row['params_hash']:
+                updates.append((digest, row['id']))
+        computed = self.compute_missing(models)
+        with self.connection:
+            self.connection.executemany('UPDATE scenarios SET params_hash = ? WHERE id = ?', updates)
+            self.connection.execute('DELETE FROM results WHERE params_hash NOT IN (SELECT params_hash FROM scenarios)')
+        return computed
+
+# ==================== 命令行 ====================
+
+def parse_filter(text):
+    """解析筛选条件，如 'equity_irr>9' -> ('equity_irr', '>', 9.0)"""
+    match = FILTER_PATTERN.match(text)
+    if not match:
+        raise argparse.ArgumentTypeError(f'无法解析筛选条件: {text}（格式如 equity_irr>9）')
+    name, op, value = match.groups()
+    return name, op, float(value)
+
+def load_models(path):
+    """读取 saveModel() 导出的模型文件（按 modelVersion 迁移），或 modelData 列表（如 parity_check.py --save 的输出）"""
+    with open(path, encoding='utf-8') as f:
+        data = json.load(f)
+    models = data if isinstance(data, list) else [data]
+    name = os.path.splitext(os.path.basename(path))[0]
+    if isinstance(data, list):
+        # 情景列表（parity_check.py --save）不带版本号，按当前格式处理
+        return [dict(model, modelName=model.get('modelName', name)) for model in models]
+    model = migrate(data)
+    model.setdefault('modelName', name)
+    return [model]
+
+def main():
+    parser = argparse.ArgumentParser(description='本地情景库：保存参数情景与计算结果，按指标快速筛选')
+    parser.add_argument('--db', default=DEFAULT_DB, help='数据库文件（默认脚本目录下 scenarios.db）')
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    add = commands.add_parser('import', help='导入模型文件并计算缺少的结果')
+    add.add_argument('files', nargs='+', help='saveModel() 导出的JSON或modelData列表')
+    add.add_argument('--site', help='站点名称')
+
+    query = commands.add_parser('query', help='按条件筛选情景')
+    query.add_argument('filters', nargs='*', type=parse_filter, help='筛选条件，如 equity_irr>9 min_dscr>1.3')
+    query.add_argument('--site', help='站点名称')
+    query.add_argument('--since', help='保存日期下限（含），如 2025-01-01')
+    query.add_argument('--until', help='保存日期上限（不含）')
+    query.add_argument('--order-by', default='equity_irr', help='排序字段（默认 equity_irr，降序）')
+    query.add_argument('--limit', type=int, default=50, help='最多显示条数')
+
+    show = commands.add_parser('show', help='输出单个情景的完整记录（JSON）')
+    show.add_argument('id', type=int)
+
+    commands.add_parser('recompute', help='模型版本更新后补算结果')
+
+    args = parser.parse_args()
+    with ScenarioStore(args.db) as store:
+        if args.command == 'import':
+            models = [model for path in args.files for model in load_models(path)]
+            start = time.perf_counter()
+            ids, computed = store.add(models, site=args.site)
+            print(f'导入 {len(ids)} 个情景（{len(models) - len(ids)} 个已在库中，跳过），计算 {computed} 组参数，'
+                  f'{len(models) - computed} 个复用已有结果（{time.perf_counter() - start:.2f} 秒）')
+        elif args.command == 'query':
+            start = time.perf_counter()
+            rows = store.query(args.filters, site=args.site, since=args.since, until=args.until,
+                               order_by=args.order_by, limit=args.limit)
+            elapsed = (time.perf_counter() - start) * 1000
+            print(f"{'ID':>6}  {'名称':<24}{'站点':<14}{'保存时间':<21}{'全投资IRR':>10}{'资本金IRR':>10}"
+                  f"{'最低DSCR':>10}{'NPV':>12}")
+            for row in rows:
+                values = [row[k] if row[k] is not None else float('nan')
+                          for k in ('project_irr', 'equity_irr', 'min_dscr', 'npv')]
+                print(f"{row['id']:>6}  {str(row['name'])[:22]:<24}{str(row['site'] or '')[:12]:<14}"
+                      f"{str(row['saved_at'])[:19]:<21}{values[0]:>10.2f}{values[1]:>10.2f}{values[2]:>10.2f}"
+                      f"{values[3]:>12.1f}")
+            print(f'共 {len(rows)} 条（查询 {elapsed:.1f} 毫秒）')
+        elif args.command == 'show':
+            record = store.get(args.id)
+            if record is None:
+                print(f'情景 {args.id} 不存在')
+                return 1
+            json.dump(record, sys.stdout, ensure_ascii=False, indent=2)
+            print()
+        elif args.command == 'recompute':
+            print(f'补算 {store.recompute_stale()} 组参数')
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,214 @@
+/**
+ * 德国独立储能电站投资测算系统 - 敏感性分析Worker池
+ * @description 把敏感性网格拆成若干任务块，分发给每核一个的Web Worker并行计算，结果逐段回传；
+ *              浏览器不支持Worker（或以 file:// 打开页面）时在主线程分段计算并定时让出，页面同样保持响应
+ * @version 1.0
+ */
+
+// ==================== 池配置 ====================
+
+/** @type {Object} Worker池配置 */
+const SENSITIVITY_POOL_CONFIG = {
+    workerScript: 'sensitivity-worker.js',
+    blocksPerWorker: 4,          // 每个Worker平均分到的任务块数（块越小负载越均衡，消息越多）
+    streamCells: 8,              // Worker每算完多少个格点回传一次
+    inlineSliceMs: 30            // 主线程计算时每段连续计算的时长（毫秒），其后让出给页面
+};
+
+// ==================== Worker池 ====================
+
+/**
+ * 敏感性分析Worker池
+ */
+class SensitivityWorkerPool {
+    /**
+     * @param {number} [size] Worker数，缺省为CPU核数
+     */
+    constructor(size) {
+        this.size = size || (typeof navigator !== 'undefined' && navigator.hardwareConcurrency) || 4;
+        this.workers = [];
+        this.disabled = !SensitivityWorkerPool.supported();
+        this.current = null;
+        this.nextRunId = 1;
+    }
+
+    /**
+     * 当前环境能否使用Worker（file:// 页面无法加载Worker脚本）
+     * @returns {boolean}
+     */
+    static supported() {
+        return typeof Worker !== 'undefined' &&
+               !(typeof location !== 'undefined' && location.protocol === 'file:');
+    }
+
+    /**
+     * 计算整个网格（会取消尚未完成的上一次计算）
+     * @param {Object} job 网格定义（createSensitivityJob）
+     * @param {Function} [onProgress] 进度回调 (values, completed, total)，values 中未算出的格点为NaN
+     * @returns {Promise<Float64Array>} 全部格点值；被新的计算取消时以 error.cancelled 为真拒绝
+     */
+    run(job, onProgress) {
+        this.cancel();
+        const blockSize = Math.max(1, Math.ceil(job.cells / (this.size * SENSITIVITY_POOL_CONFIG.blocksPerWorker)));
+        const blocks = [];
+        for (let start = 0; start < job.cells; start += blockSize) {
+            blocks.push({ start, next: start, end: Math.min(job.cells, start + blockSize) });
+        }
+        const run = {
+            id: this.nextRunId++,
+            job,
+            onProgress: onProgress || (() => {}),
+            values: new Float64Array(job.cells).fill(NaN),
+            completed: 0,
+            queue: blocks,
+            active: new Map()
+        };
+        run.promise = new Promise((resolve, reject) => {
+            run.resolve = resolve;
+            run.reject = reject;
+        });
+        this.current = run;
+
+        if (job.cells === 0) {
+            this.finish(run);
+        } else if (this.disabled || !this.startWorkers(run)) {
+            this.runInline(run);
+        }
+        return run.promise;
+    }
+
+    /**
+     * 取消当前计算：正在计算的Worker直接终止（下次计算时重建）
+     */
+    cancel() {
+        const run = this.current;
+        if (!run) return;
+        this.current = null;
+        if (run.active.size > 0) {
+            this.terminate();
+        }
+        const error = new Error('敏感性分析已取消');
+        error.cancelled = true;
+        run.reject(error);
+    }
+
+    /**
+     * 终止全部Worker
+     */
+    terminate() {
+        this.workers.forEach(worker => worker.terminate());
+        this.workers = [];
+    }
+
+    /**
+     * 创建（或复用）Worker并分发首批任务块
+     * @returns {boolean} Worker不可用时返回false
+     */
+    startWorkers(run) {
+        try {
+            while (this.workers.length < Math.min(this.size, run.queue.length)) {
+                const worker = new Worker(SENSITIVITY_POOL_CONFIG.workerScript);
+                worker.onmessage = event => this.onMessage(worker, event.data);
+                worker.onerror = event => this.onWorkerError(event);
+                this.workers.push(worker);
+            }
+        } catch (e) {
+            console.warn('[敏感性分析] Worker不可用，改为主线程计算:', e.message);
+            this.disabled = true;
+            this.terminate();
+            return false;
+        }
+        this.workers.forEach(worker => this.dispatch(run, worker));
+        return true;
+    }
+
+    /**
+     * 给空闲的Worker分配下一个任务块
+     */
+    dispatch(run, worker) {
+        const block = run.queue.shift();
+        if (!block) return;
+        run.active.set(worker, block);
+        worker.postMessage({
+            runId: run.id,
+            job: run.job,
+            start: block.next,
+            end: block.end,
+            stream: SENSITIVITY_POOL_CONFIG.streamCells
+        });
+    }
+
+    /**
+     * 接收Worker回传的一段格点值
+     */
+    onMessage(worker, data) {
+        const run = this.current;
+        if (!run || data.runId !== run.id) return;
+        const block = run.active.get(worker);
+        run.values.set(data.values, data.start);
+        block.next = data.start + data.values.length;
+        this.record(run, data.values.length);
+        if (block.next >= block.end) {
+            run.active.delete(worker);
+            this.dispatch(run, worker);
+        }
+    }
+
+    /**
+     * Worker加载或运行出错：停用Worker，未完成的格点改在主线程计算
+     */
+    onWorkerError(event) {
+        if (event && event.preventDefault) event.preventDefault();
+        console.warn('[敏感性分析] Worker出错，改为主线程计算:', event && event.message);
+        this.disabled = true;
+        this.terminate();
+        const run = this.current;
+        if (!run) return;
+        run.queue = Array.from(run.active.values()).concat(run.queue);
+        run.active.clear();
+        this.runInline(run);
+    }
+
+    /**
+     * 在主线程分段计算剩余任务块，每段计算 inlineSliceMs 毫秒后让出
+     */
+    runInline(run) {
+        const slice = () => {
+            if (this.current !== run) return;
+            const deadline = Date.now() + SENSITIVITY_POOL_CONFIG.inlineSliceMs;
+            let computed = 0;
+            while (run.queue.length > 0 && (computed === 0 || Date.now() < deadline)) {
+                const block = run.queue[0];
+                const end = Math.min(block.end, block.next + SENSITIVITY_POOL_CONFIG.streamCells);
+                run.values.set(calculateSensitivityCells(run.job, block.next, end), block.next);
+                computed += end - block.next;
+                block.next = end;
+                if (block.next >= block.end) run.queue.shift();
+            }
+            if (computed > 0) this.record(run, computed);
+            if (run.queue.length > 0 && this.current === run) {
+                setTimeout(slice, 0);
+            }
+        };
+        slice();
+    }
+
+    /**
+     * 记录进度，全部完成时结束本次计算
+     */
+    record(run, count) {
+        run.completed += count;
+        if (run.completed >= run.job.cells) {
+            this.finish(run);
+        } else {
+            run.onProgress(run.values, run.completed, run.job.cells);
+        }
+    }
+
+    finish(run) {
+        if (this.current === run) {
+            this.current = null;
+        }
+        run.resolve(run.values);
+    }
+}
@@ -0,0 +1,20 @@
+/**
+ * 德国独立储能电站投资测算系统 - 敏感性分析Worker
+ * @description 在Web Worker中计算敏感性网格的一段格点（纯计算，不访问DOM），
+ *              每算完若干格点即以可转移的Float64Array回传，主线程据此刷新进度
+ * @version 1.0
+ */
+
+importScripts('model-cache.js', 'model-profiler.js', 'escalation-index.js', 'tax-model.js', 'model-core.js');
+
+/**
+ * 消息格式：{ runId, job, start, end, stream }
+ * 回传格式：{ runId, start, values }，values 为格点 start 起的指标值
+ */
+self.onmessage = function(event) {
+    const { runId, job, start, end, stream } = event.data;
+    for (let from = start; from < end; from += stream) {
+        const values = calculateSensitivityCells(job, from, Math.min(end, from + stream));
+        self.postMessage({ runId, start: from, values }, [values.buffer]);
+    }
+};
@@ -0,0 +1,217 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+德国独立储能电站财务测算系统 - 指标梯度与龙卷风图
+@description 一次批量计算得到全投资IRR、资本金IRR、NPV与最低DSCR对全部连续输入参数的偏导数：
+             复步长前向求导（每个参数一行、虚部携带导数，等价于对偶数前向模式且无截断误差），
+             经CAPEX、OPEX、收入、贷款、税费与现金流逐项传播；IRR导数按隐函数定理由现金流导数解析求出，
+             不受牛顿迭代收敛精度影响
+@usage python sensitivity.py 模型.json --top 15
+@version 1.0
+"""
+
+import argparse
+import json
+import math
+import sys
+
+import numpy as np
+
+import model_engine
+
+# 复步长：导数 = Im f(x + ih) / h；无相减抵消，可取极小值
+COMPLEX_STEP = 1e-20
+
+# 现货价格整体缩放系数（伪参数，基准值为1）
+SPOT_SCALE = 'spot_price_scale'
+
+# 输出的指标
+GRADIENT_INDICATORS = ('project_irr', 'equity_irr', 'npv', 'min_dscr')
+
+def default_inputs():
+    """可求导的输入：全部连续数值参数（不含整数型年限/数量与文本参数）及现货价格缩放"""
+    return [name for name in model_engine.DEFAULT_PARAMETERS
+            if name not in model_engine.TEXT_PARAMETERS and name not in model_engine.INTEGER_PARAMETERS] + [SPOT_SCALE]
+
+# ==================== 指标对现金流的解析导数 ====================
+
+def _discount(rate, width):
+    """(情景数, width) 折现系数 (1 + rate)^-t"""
+    return np.power(1 + np.asarray(rate, dtype=float)[:, None], -np.arange(width))
+
+def irr_gradient(cash_flows, tangents, irr_pct):
+    """
+    IRR对参数的导数（百分点）：NPV(r, θ) = 0 ⇒ dr/dθ = -(∂NPV/∂θ) / (∂NPV/∂r)
+    @param cash_flows: (情景数, 期数) 实数现金流；tangents: 同形状的现金流导数
+    """
+    rate = irr_pct / 100
+    width = cash_flows.shape[1]
+    with np.errstate(divide='ignore', invalid='ignore', over='ignore'):
+        discount = _discount(rate, width)
+        dnpv_dtheta = np.sum(tangents * discount, axis=1)
+        dnpv_drate = -np.sum(np.arange(width) * cash_flows * discount / (1 + rate)[:, None], axis=1)
+        return -dnpv_dtheta / dnpv_drate * 100
+
+def npv_gradient(tangents, discount_rate=model_engine.DISCOUNT_RATE):
+    """NPV对参数的导数（第0期不折现，与 calculate_npv 一致）"""
+    return np.sum(tangents * _discount(np.full(len(tangents), discount_rate), tangents.shape[1]), axis=1)
+
+def min_dscr_gradient(params, schedules, active):
+    """最低DSCR对参数的导数：取最低年份（按实部）的 EBITDA / 还本付息 的导数"""
+    loan = schedules['loanData']
+    servicing = model_engine.debt_service_years(params, {'payment': loan['payment'].real}, active)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        yearly = np.where(servicing, schedules['incomeData']['ebitda'] / loan['payment'], np.inf)
+    worst = np.argmin(yearly.real, axis=1)
+    value = yearly[np.arange(len(worst)), worst]
+    return np.where(np.isinf(value.real), 0, value.imag / COMPLEX_STEP)
+
+# ==================== 批量求导 ====================
+
+def gradients(model_data, inputs=None):
+    """
+    单次批量计算指标梯度
+    @param model_data: saveModel() 的 modelData（parameters、spotPrices）
+    @param inputs: 求导的参数名列表，缺省为 default_inputs()
+    @return: (基准结果, {指标: {参数名: 偏导数}})；IRR单位为百分点/参数单位
+    """
+    inputs = inputs or default_inputs()
+    base = model_engine.run_batch([model_data])
+    years = base['years']
+    width = int(years[0])
+    active = np.arange(width) < years[:, None]
+
+    # 每个输入一行，仅该行对应参数带虚部
+    count = len(inputs)
+    params = model_engine.stack_parameters([model_data['parameters']] * count)
+    for name in list(params):
+        if params[name].dtype.kind == 'f' and name != 'operation_years':
+            params[name] = params[name].astype(complex)
+    spot = model_engine.stack_spot_prices(
+        [model_data.get('spotPrices') or model_engine.default_spot_prices(width)] * count, years.repeat(count))
+    spot = spot.astype(complex)
+    for row, name in enumerate(inputs):
+        if name == SPOT_SCALE:
+            spot[row] *= 1 + 1j * COMPLEX_STEP
+        else:
+            params[name][row] += 1j * COMPLEX_STEP
+    schedules = model_engine.run_schedules(params, spot)
+
+    cash_flow = schedules['cashFlowData']
+    indicators = base['indicators']
+    lengths = years + 1
+    project_tangent = cash_flow['projectCashFlow'].imag / COMPLEX_STEP
+    equity_tangent = cash_flow['equityCashFlow'].imag / COMPLEX_STEP
+    project_cf = np.repeat(base['cashFlowData']['projectCashFlow'][:, :lengths[0]], count, axis=0)
+    equity_cf = np.repeat(base['cashFlowData']['equityCashFlow'][:, :lengths[0]], count, axis=0)
+    results = {
+        'project_irr': irr_gradient(project_cf, project_tangent, np.repeat(indicators['project_irr'], count)),
+        'equity_irr': irr_gradient(equity_cf, equity_tangent, np.repeat(indicators['equity_irr'], count)),
+        'npv': npv_gradient(project_tangent),
+        'min_dscr': min_dscr_gradient(params, schedules, np.repeat(active, count, axis=0)),
+    }
+    return base, {name: dict(zip(inputs, values.tolist())) for name, values in results.items()}
+
+def base_value(model_data, name):
+    """参数基准值（缺省取默认参数；现货价格缩放为1）"""
+    if name == SPOT_SCALE:
+        return 1.0
+    return float(model_data['parameters'].get(name, model_engine.DEFAULT_PARAMETERS[name]))
+
+def tornado(model_data, indicator='equity_irr', change=0.1, inputs=None, grads=None):
+    """
+    线性化龙卷风图：各参数变动 ±change（相对基准值）时指标的变化，按影响绝对值降序
+    @param grads: 已算出的 gradients() 梯度，缺省时计算
+    @return: [(参数名, 基准值, 下调时变化, 上调时变化), ...]；基准指标不是有限值时为空
+    """
+    if grads is None:
+        _, grads = gradients(model_data, inputs)
+    rows = []
+    for name, derivative in grads[indicator].items():
+        value = base_value(model_data, name)
+        swing = derivative * value * change
+        if np.isfinite(swing) and swing != 0:
+            rows.append((name, value, -swing, swing))
+    rows.sort(key=lambda row: abs(row[3]), reverse=True)
+    return rows
+
+def finite_difference_check(model_data, inputs=None, relative_step=1e-6, base=None, grads=None):
+    """
+    用中心差分（同样整批计算）核对梯度，返回 {指标: 最大相对偏差}
+    @param base / grads: 已算出的 gradients() 结果，缺省时计算
+    基准指标不是有限值（如不盈利时IRR为NaN）时该指标无从核对，偏差记为NaN
+    """
+    inputs = inputs or default_inputs()
+    if base is None or grads is None:
+        base, grads = gradients(model_data, inputs)
+    scenarios = []
+    steps = []
+    for name in inputs:
+        value = base_value(model_data, name)
+        step = relative_step * max(abs(value), 1e-3)
+        steps.append(step)
+        for sign in (1, -1):
+            shifted = json.loads(json.dumps(model_data))
+            if name == SPOT_SCALE:
+                years = int(shifted['parameters'].get('operation_years', 20))
+                prices = shifted.get('spotPrices') or model_engine.default_spot_prices(years)
+                shifted['spotPrices'] = [p * (1 + sign * step) for p in prices]
+            else:
+                shifted['parameters'][name] = value + sign * step
+            scenarios.append(shifted)
+    indicators = model_engine.run_batch(scenarios)['indicators']
+    report = {}
+    for indicator in GRADIENT_INDICATORS:
+        if not np.isfinite(base['indicators'][indicator][0]):
+            report[indicator] = math.nan
+            continue
+        values = indicators[indicator].reshape(len(inputs), 2)
+        numeric = (values[:, 0] - values[:, 1]) / (2 * np.array(steps))
+        analytic = np.array([grads[indicator][name] for name in inputs])
+        scale = np.maximum(np.abs(numeric), np.abs(analytic))
+        with np.errstate(divide='ignore', invalid='ignore'):
+            relative = np.where(scale > 1e-9, np.abs(numeric - analytic) / scale, 0)
+        relative = relative[np.isfinite(relative)]
+        report[indicator] = float(relative.max()) if len(relative) else math.nan
+    return report
+
+# ==================== 命令行 ====================
+
+def main():
+    parser = argparse.ArgumentParser(description='指标梯度与线性化龙卷风图（一次批量计算）')
+    parser.add_argument('model', nargs='?', help='saveModel() 导出的模型文件，缺省用默认参数')
+    parser.add_argument('--indicator', default='equity_irr', choices=GRADIENT_INDICATORS, help='排序指标')
+    parser.add_argument('--change', type=float, default=10, help='参数相对变动幅度（%%，默认10）')
+    parser.add_argument('--top', type=int, default=20, help='显示影响最大的前N个参数')
+    parser.add_argument('--json', metavar='FILE', help='写出全部指标的梯度')
+    parser.add_argument('--check', action='store_true', help='用中心差分核对梯度')
+    args = parser.parse_args()
+
+    if args.model:
+        from model_loader import migrate
+        with open(args.model, encoding='utf-8') as f:
+            model_data = migrate(json.load(f))
+    else:
+        model_data = {'parameters': dict(model_engine.DEFAULT_PARAMETERS), 'spotPrices': None}
+
+    base, grads = gradients(model_data)
+    print('基准: ' + '  '.join(f'{name}={base["indicators"][name][0]:.4g}' for name in GRADIENT_INDICATORS))
+    if np.isfinite(base['indicators'][args.indicator][0]):
+        rows = tornado(model_data, args.indicator, args.change / 100, grads=grads)
+        print(f'\n{args.indicator} 对各参数 ±{args.change:g}% 的变化（线性化，按影响排序）')
+        print(f'  {"参数":<30}{"基准值":>11}{"下调":>10}{"上调":>10}')
+        for name, value, down, up in rows[:args.top]:
+            print(f'  {name:<32}{value:>14.6g}{down:>+12.4f}{up:>+12.4f}')
+    else:
+        print(f'\n基准 {args.indicator} 不是有限值（如项目不盈利时IRR无解），无法线性化，请用 --indicator 选择其他指标')
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(grads, f, ensure_ascii=False, indent=2)
+    if args.check:
+        report = finite_difference_check(model_data, base=base, grads=grads)
+        print('\n中心差分核对（最大相对偏差，基准值无效的指标为nan）: ' +
+              '  '.join(f'{name}={value:.2e}' for name, value in report.items()))
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,179 @@
+/**
+ * 德国独立储能电站投资测算系统 - 报表表格渲染
+ * @description 利润表、现金流量表、资产负债表的增量渲染：表格结构（行定义、列数、可见列范围）变化时一次性生成整表HTML，
+ *              否则只改写数值变化的单元格；年份列较多时按横向滚动位置只渲染可见列，两侧以占位列撑开宽度，滚动时按需补渲染
+ * @version 1.0
+ */
+
+// ==================== 渲染配置 ====================
+
+/** @type {Object} 报表渲染配置 */
+const STATEMENT_RENDER_CONFIG = {
+    virtualizeAbove: 40,         // 年份列超过该数目时启用列虚拟化
+    columnWidth: 110,            // 年份列宽度（px），用于计算可见范围与占位宽度
+    overscan: 4                  // 可见范围两侧额外渲染的列数
+};
+
+// ==================== 可见列计算 ====================
+
+/**
+ * 计算需要渲染的年份列范围
+ * @param {number} count 年份列总数
+ * @param {number} scrollLeft 横向滚动位置（px）
+ * @param {number} viewportWidth 可视宽度（px），未知时为0
+ * @returns {{first: number, last: number}} 渲染列 [first, last)
+ */
+function statementColumnWindow(count, scrollLeft, viewportWidth) {
+    const config = STATEMENT_RENDER_CONFIG;
+    if (count <= config.virtualizeAbove || !viewportWidth) {
+        return { first: 0, last: count };
+    }
+    const first = Math.max(0, Math.floor(scrollLeft / config.columnWidth) - config.overscan);
+    const visible = Math.ceil(viewportWidth / config.columnWidth) + 2 * config.overscan;
+    return { first: first, last: Math.min(count, first + visible) };
+}
+
+/**
+ * 转义单元格文本
+ * @param {string} text 文本
+ * @returns {string} HTML安全文本
+ */
+function escapeCellText(text) {
+    return String(text).replace(/[&<>"]/g, ch => ({ '&': '&amp;', '<': '&lt;', '>': '&gt;', '"': '&quot;' })[ch]);
+}
+
+// ==================== 报表表格 ====================
+
+/**
+ * 报表表格：行为项目、列为年份
+ */
+class StatementTable {
+    /**
+     * @param {string} tableId 表格元素ID
+     * @param {string} bodyId 表体元素ID
+     */
+    constructor(tableId, bodyId) {
+        this.tableId = tableId;
+        this.bodyId = bodyId;
+        this.structureKey = null;
+        this.cells = [];             // 各数值行的可见单元格元素
+        this.texts = [];             // 各数值行当前显示的文本（按年份列序号）
+        this.view = null;            // 最近一次渲染的 {rows, data, columnLabel, format}
+        this.scrollBound = null;
+    }
+
+    /**
+     * 渲染表格
+     * @param {Object[]} rows 行定义 {label, key, class}，key 为 null 时为分节标题行
+     * @param {Object[]} data 逐年数据
+     * @param {Function} columnLabel 年份列标题 (逐年数据) => 文本
+     * @param {Function} [format] 数值格式化函数，缺省为 formatNumber
+     * @returns {number} 写入的数值单元格数（结构未变时为文本变化的单元格数）
+     */
+    render(rows, data, columnLabel, format = formatNumber) {
+        this.view = { rows, data, columnLabel, format };
+        const table = document.getElementById(this.tableId);
+        const scroller = table.closest ? table.closest('.table-scroll') : null;
+        this.bindScroll(scroller);
+        const range = statementColumnWindow(data.length, scroller ? scroller.scrollLeft : 0,
+                                             scroller ? scroller.clientWidth : 0);
+        const key = [rows.map(row => row.label + '|' + row.key).join(';'), data.length, range.first, range.last,
+                     data.map(columnLabel).join('|')].join('#');
+        if (key !== this.structureKey) {
+            this.structureKey = key;
+            return this.rebuild(table, range);
+        }
+        return this.patch(range);
+    }
+
+    /**
+     * 结构变化：一次生成表头与表体HTML
+     * @returns {number} 渲染的数值单元格数
+     */
+    rebuild(table, range) {
+        const { rows, data, columnLabel, format } = this.view;
+        const config = STATEMENT_RENDER_CONFIG;
+        const before = range.first * config.columnWidth;
+        const after = (data.length - range.last) * config.columnWidth;
+        const spacer = (width, tag) => width > 0
+            ? `<${tag} class="column-spacer" style="min-width:${width}px;width:${width}px;padding:0"></${tag}>`
+            : '';
+        const span = range.last - range.first + (before > 0) + (after > 0) + 1;
+
+        let head = '<th>项目（万EUR）</th>' + spacer(before, 'th');
+        for (let c = range.first; c < range.last; c++) {
+            head += `<th>${escapeCellText(columnLabel(data[c]))}</th>`;
+        }
+        table.querySelector('thead tr').innerHTML = head + spacer(after, 'th');
+
+        this.texts = [];
+        let body = '';
+        rows.forEach(row => {
+            if (row.key === null) {
+                body += `<tr class="${row.class}"><td colspan="${span}">${row.label}</td></tr>`;
+                return;
+            }
+            const texts = new Array(data.length);
+            body += `<tr class="${row.class}"><td>${row.label}</td>${spacer(before, 'td')}`;
+            for (let c = range.first; c < range.last; c++) {
+                texts[c] = format(data[c][row.key]);
+                body += `<td>${escapeCellText(texts[c])}</td>`;
+            }
+            body += spacer(after, 'td') + '</tr>';
+            this.texts.push(texts);
+        });
+        const tbody = document.getElementById(this.bodyId);
+        tbody.innerHTML = body;
+
+        // 记录数值单元格，供后续增量更新
+        this.cells = [];
+        const offset = before > 0 ? 2 : 1;
+        Array.from(tbody.rows || []).forEach((tr, i) => {
+            if (rows[i].key !== null) {
+                this.cells.push(Array.from(tr.cells).slice(offset, offset + range.last - range.first));
+            }
+        });
+        return this.texts.length * (range.last - range.first);
+    }
+
+    /**
+     * 结构未变：只改写文本变化的单元格
+     * @returns {number} 改写的单元格数
+     */
+    patch(range) {
+        const { rows, data, format } = this.view;
+        let changed = 0;
+        rows.filter(row => row.key !== null).forEach((row, r) => {
+            const texts = this.texts[r];
+            const cells = this.cells[r] || [];
+            for (let c = range.first; c < range.last; c++) {
+                const text = format(data[c][row.key]);
+                if (text !== texts[c]) {
+                    texts[c] = text;
+                    const cell = cells[c - range.first];
+                    if (cell) cell.textContent = text;
+                    changed++;
+                }
+            }
+        });
+        return changed;
+    }
+
+    /**
+     * 监听横向滚动：可见列范围变化时按帧重新渲染
+     */
+    bindScroll(scroller) {
+        if (!scroller || this.scrollBound === scroller) return;
+        this.scrollBound = scroller;
+        let scheduled = false;
+        scroller.addEventListener('scroll', () => {
+            if (scheduled || !this.view || this.view.data.length <= STATEMENT_RENDER_CONFIG.virtualizeAbove) return;
+            scheduled = true;
+            requestAnimationFrame(() => {
+                scheduled = false;
+                const { rows, data, columnLabel, format } = this.view;
+                this.render(rows, data, columnLabel, format);
+            });
+        }, { passive: true });
+    }
+}
@@ -1,71 +1,104 @@
-#!/usr/bin/env python
-# -*- coding: utf-8 -*-
-"""
-Excel版本同步脚本
-@description 监听网页版文件变化，自动更新Excel版本
-@version 1.0
-"""
-
-import os
-import time
-from datetime import datetime
-from pathlib import Path
-import hashlib
-
-def get_file_hash(filepath):
-    """计算文件MD5哈希值"""
-    if not os.path.exists(filepath):
-        return None
-    with open(filepath, 'rb') as f:
-        return hashlib.md5(f.read()).hexdigest()
-
-def check_files_changed():
-    """检查关键文件是否发生变化"""
-    key_files = [
-        'financial-model.js',
-        'index.html',
-    ]
-    
-    hash_file = '.excel_sync_hash.json'
-    current_hashes = {}
-    
-    # 读取之前的哈希值
-    old_hashes = {}
-    if os.path.exists(hash_file):
-        import json
-        with open(hash_file, 'r', encoding='utf-8') as f:
-            old_hashes = json.load(f)
-    
-    # 计算当前哈希值
-    changed = False
-    for file in key_files:
-        if os.path.exists(file):
-            current_hash = get_file_hash(file)
-            current_hashes[file] = current_hash
-            if file not in old_hashes or old_hashes[file] != current_hash:
-                changed = True
-                print(f"检测到文件变化: {file}")
-    
-    # 保存当前哈希值
-    if changed:
-        import json
-        with open(hash_file, 'w', encoding='utf-8') as f:
-            json.dump(current_hashes, f, indent=2)
-    
-    return changed
-
-def sync_excel():
-    """同步生成Excel文件"""
-    if check_files_changed():
-        print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] 检测到文件变化，开始生成Excel...")
-        try:
-            from generate_excel import create_excel_file
-            create_excel_file()
-            print("✓ Excel文件已同步更新")
-        except Exception as e:
-            print(f"✗ 生成Excel文件时出错: {e}")
-    else:
-        print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] 文件未变化，无需更新")
-
-if __name__ == "__main__":
-    sync_excel()
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Excel版本同步脚本
+@description 监听网页版文件变化，自动更新Excel版本；
+             未变化时仅比较文件的修改时间与大小（不读文件、不导入openpyxl），适合在钩子和定时任务中频繁调用
+@version 1.1
+"""
+
+import os
+import time
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# 监听的关键文件：网页版页面与计算脚本（计算集中在 model-core.js，税务与指数曲线各有独立脚本），以及Excel生成器本身（含工作表组装模块）
+KEY_FILES = [
+    'financial-model.js',
+    'model-core.js',
+    'tax-model.js',
+    'escalation-index.js',
+    'index.html',
+    'generate_excel.py',
+    'excel_parts.py',
+]
+
+# 同步状态文件：每行 "文件名<TAB>修改时间(ns)<TAB>大小<TAB>MD5"
+STATE_FILE = os.path.join(BASE_DIR, '.excel_sync_state')
+
+def get_file_hash(filepath):
+    """计算文件MD5哈希值"""
+    import hashlib
+    if not os.path.exists(filepath):
+        return None
+    with open(filepath, 'rb') as f:
+        return hashlib.md5(f.read()).hexdigest()
+
+def load_state():
+    """读取上次同步时记录的 {文件名: (修改时间, 大小, MD5)}"""
+    state = {}
+    try:
+        with open(STATE_FILE, encoding='utf-8') as f:
+            for line in f:
+                parts = line.rstrip('\n').split('\t')
+                if len(parts) == 4:
+                    state[parts[0]] = (int(parts[1]), int(parts[2]), parts[3])
+    except (OSError, ValueError):
+        pass
+    return state
+
+def save_state(state):
+    """写入同步状态"""
+    with open(STATE_FILE, 'w', encoding='utf-8') as f:
+        for name, (mtime, size, digest) in sorted(state.items()):
+            f.write(f"{name}\t{mtime}\t{size}\t{digest}\n")
+
+def check_files_changed():
+    """
+    检查关键文件是否发生变化（修改时间和大小均未变时视为未变化，否则再比较MD5）
+    @return: (是否变化, 新的同步状态)；有变化时状态由调用方在生成成功后保存，失败时下次重试
+    """
+    old_state = load_state()
+    new_state = {}
+    changed = False
+    for file in KEY_FILES:
+        path = os.path.join(BASE_DIR, file)
+        try:
+            stat = os.stat(path)
+        except OSError:
+            continue
+        previous = old_state.get(file)
+        if previous and previous[:2] == (stat.st_mtime_ns, stat.st_size):
+            new_state[file] = previous
+            continue
+        # 修改时间或大小变化：仅内容变化才需要重新生成（例如 touch 只更新状态）
+        digest = get_file_hash(path)
+        new_state[file] = (stat.st_mtime_ns, stat.st_size, digest)
+        if not previous or previous[2] != digest:
+            changed = True
+            print(f"检测到文件变化: {file}")
+
+    if not changed and new_state != old_state:
+        save_state(new_state)
+
+    return changed, new_state
+
+def sync_excel():
+    """同步生成Excel文件"""
+    timestamp = time.strftime('%Y-%m-%d %H:%M:%S')
+    changed, state = check_files_changed()
+    if changed:
+        print(f"[{timestamp}] 检测到文件变化，开始生成Excel...")
+        try:
+            # 仅在需要生成时才导入 openpyxl
+            from generate_excel import create_excel_file
+            create_excel_file()
+            save_state(state)
+            print("✓ Excel文件已同步更新")
+        except Exception as e:
+            print(f"✗ 生成Excel文件时出错: {e}")
+    else:
+        print(f"[{timestamp}] 文件未变化，无需更新")
+
+if __name__ == "__main__":
+    sync_excel()
@@ -0,0 +1,117 @@
+/**
+ * 德国独立储能电站投资测算系统 - 税务计算
+ * @description 德国企业税制逐年扫描：企业所得税+团结附加税与贸易税分别计税基础，
+ *              亏损结转（最低课税：全额抵扣限额以内全额抵扣，超出部分按比例抵扣）、
+ *              利息限制（超过免征额时可扣除利息不超过EBITDA的一定比例，超出部分结转以后年度）、
+ *              贸易税利息加计；tax_method 为 'flat' 时沿用综合税率 × 当年利润（亏损不结转）
+ * @version 1.0
+ */
+
+// ==================== 税务参数 ====================
+
+/** @type {Object} 德国税制参数默认值（金额单位EUR，比例为小数） */
+const GERMAN_TAX_DEFAULTS = {
+    tax_method: 'german',                    // 'german' 德国税法 / 'flat' 综合税率
+    loss_offset_threshold: 1000000,          // 亏损全额抵扣限额（§10d EStG，100万EUR）
+    min_taxation_ratio: 0.6,                 // 超出限额部分可抵扣比例（最低课税60%）
+    interest_barrier_ratio: 0.3,             // 利息限制：可扣除净利息上限为EBITDA的30%（§4h EStG）
+    interest_barrier_threshold: 3000000,     // 利息限制免征额（净利息低于300万EUR时全额扣除）
+    trade_tax_addback_ratio: 0.25,           // 贸易税利息加计比例（§8 Nr.1 GewStG）
+    trade_tax_addback_allowance: 200000      // 贸易税利息加计免征额
+};
+
+/**
+ * 读取税务参数（旧版保存的参数缺少新字段时取默认值）
+ * @param {Object} params 参数
+ * @param {string} name 参数名
+ * @returns {*} 参数值
+ */
+function taxParameter(params, name) {
+    return params[name] !== undefined && params[name] !== null ? params[name] : GERMAN_TAX_DEFAULTS[name];
+}
+
+// ==================== 逐年扫描 ====================
+
+/**
+ * 以结转亏损抵扣当年所得（最低课税）
+ * @param {number} income 当年所得（万EUR，可为负）
+ * @param {number} pool 期初结转亏损（万EUR）
+ * @param {number} threshold 全额抵扣限额（万EUR）
+ * @param {number} ratio 超出限额部分的可抵扣比例
+ * @returns {number} 本年抵扣额
+ */
+function lossOffset(income, pool, threshold, ratio) {
+    if (income <= 0) return 0;
+    return Math.min(pool, Math.min(income, threshold) + ratio * Math.max(0, income - threshold));
+}
+
+/**
+ * 逐年计算税费
+ * @param {Object} params 参数
+ * @param {Object[]} rows 逐年利润数据，需含 ebitda、ebit、interest、ebt（万EUR）
+ * @returns {Object[]} 逐年税费：tax 合计及企业所得税、团结附加税、贸易税、其他税费分项，
+ *                     可扣除利息与期末利息结转、期末企业所得税/贸易税结转亏损
+ */
+function calculateTaxSchedule(params, rows) {
+    const otherRate = params.other_tax_rate || 0;
+
+    if (taxParameter(params, 'tax_method') === 'flat') {
+        const effectiveTaxRate = params.corporate_tax_rate * (1 + params.solidarity_tax_rate) +
+                                 params.trade_tax_rate + otherRate;
+        return rows.map(row => ({
+            tax: Math.max(0, row.ebt * effectiveTaxRate),
+            corporateTax: 0, solidarityTax: 0, tradeTax: 0, otherTax: 0,
+            deductibleInterest: row.interest, interestCarryforward: 0,
+            lossCarryforward: 0, tradeLossCarryforward: 0
+        }));
+    }
+
+    const lossThreshold = taxParameter(params, 'loss_offset_threshold') / 10000;
+    const minTaxationRatio = taxParameter(params, 'min_taxation_ratio');
+    const barrierRatio = taxParameter(params, 'interest_barrier_ratio');
+    const barrierThreshold = taxParameter(params, 'interest_barrier_threshold') / 10000;
+    const addbackRatio = taxParameter(params, 'trade_tax_addback_ratio');
+    const addbackAllowance = taxParameter(params, 'trade_tax_addback_allowance') / 10000;
+
+    let interestCarryforward = 0;
+    let lossPool = 0;
+    let tradeLossPool = 0;
+
+    return rows.map(row => {
+        // 利息限制：当年利息加上期结转，低于免征额时全额扣除，否则以EBITDA的一定比例为上限
+        const interestClaim = row.interest + interestCarryforward;
+        const deductibleInterest = interestClaim < barrierThreshold
+            ? interestClaim
+            : Math.min(interestClaim, barrierRatio * Math.max(0, row.ebitda));
+        interestCarryforward = interestClaim - deductibleInterest;
+
+        // 企业所得税（含团结附加税）：所得 = EBIT - 可扣除利息
+        const income = row.ebit - deductibleInterest;
+        const offset = lossOffset(income, lossPool, lossThreshold, minTaxationRatio);
+        lossPool = lossPool - offset + Math.max(0, -income);
+        const taxableIncome = Math.max(0, income - offset);
+
+        // 贸易税：所得加计部分利息后单独结转亏损
+        const tradeIncome = income + addbackRatio * Math.max(0, deductibleInterest - addbackAllowance);
+        const tradeOffset = lossOffset(tradeIncome, tradeLossPool, lossThreshold, minTaxationRatio);
+        tradeLossPool = tradeLossPool - tradeOffset + Math.max(0, -tradeIncome);
+        const taxableTradeIncome = Math.max(0, tradeIncome - tradeOffset);
+
+        const corporateTax = taxableIncome * params.corporate_tax_rate;
+        const solidarityTax = corporateTax * params.solidarity_tax_rate;
+        const tradeTax = taxableTradeIncome * params.trade_tax_rate;
+        const otherTax = Math.max(0, row.ebt) * otherRate;
+
+        return {
+            tax: corporateTax + solidarityTax + tradeTax + otherTax,
+            corporateTax: corporateTax,
+            solidarityTax: solidarityTax,
+            tradeTax: tradeTax,
+            otherTax: otherTax,
+            deductibleInterest: deductibleInterest,
+            interestCarryforward: interestCarryforward,
+            lossCarryforward: lossPool,
+            tradeLossCarryforward: tradeLossPool
+        };
+    });
+}
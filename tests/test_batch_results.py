@@ -0,0 +1,42 @@
+# -*- coding: utf-8 -*-
+"""batch_results：运营年限不同的情景分块写出"""
+
+import csv
+import os
+import sys
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import model_engine
+from batch_results import BatchResults
+
+def _mixed_results():
+    """运营年限为 20、10、10、10 的四个情景"""
+    scenarios = [{'parameters': dict(model_engine.DEFAULT_PARAMETERS, operation_years=years), 'spotPrices': None}
+                 for years in (20, 10, 10, 10)]
+    return BatchResults.from_run(model_engine.run_batch(scenarios))
+
+def _read(path):
+    with open(path, encoding='utf-8') as f:
+        return list(csv.reader(f))
+
+def test_slice_keeps_batch_width():
+    results = _mixed_results()
+    part = results.slice(2, 4)
+    assert part.width == results.width == 21
+    columns = part.long_columns(['income.netProfit'])
+    assert len(columns['scenario']) == len(columns['year']) == len(columns['income.netProfit']) == 2 * 21
+    active = part.long_columns(['income.netProfit'], active_only=True)
+    assert len(active['year']) == 2 * 11
+
+def test_write_csv_block_smaller_than_batch(tmp_path):
+    results = _mixed_results()
+    results.write_csv(tmp_path / 'block2.csv', ['income.netProfit'], block=2)
+    results.write_csv(tmp_path / 'whole.csv', ['income.netProfit'])
+    rows = _read(tmp_path / 'block2.csv')
+    assert rows == _read(tmp_path / 'whole.csv')
+    assert len(rows) == 1 + 21 + 3 * 11
+    scenarios = np.array([int(row[0]) for row in rows[1:]])
+    assert np.array_equal(np.bincount(scenarios), [21, 11, 11, 11])
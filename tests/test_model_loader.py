@@ -0,0 +1,31 @@
+# -*- coding: utf-8 -*-
+"""model_loader：参数值校验的错误信息"""
+
+import json
+import math
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import model_engine
+from model_loader import load_model_file
+
+def _errors(tmp_path, name, value):
+    path = tmp_path / 'model.json'
+    parameters = dict(model_engine.DEFAULT_PARAMETERS, **{name: value})
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump({'parameters': parameters}, f)
+    return load_model_file(str(path))[-1]
+
+@pytest.mark.parametrize('name', ['power_mw', 'operation_years'])
+@pytest.mark.parametrize('value', ['abc', math.nan, 'inf'])
+def test_invalid_number_reports_single_error(tmp_path, name, value):
+    errors = _errors(tmp_path, name, value)
+    assert len(errors) == 1
+    assert '超出范围' not in errors[0]
+
+def test_out_of_range_reported(tmp_path):
+    assert _errors(tmp_path, 'operation_years', 99) == ['operation_years=99 超出范围 [1, 50]']
@@ -0,0 +1,55 @@
+# -*- coding: utf-8 -*-
+"""model_engine.precision_report 的判定：偏差阈值与NaN不一致"""
+
+import os
+import sys
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import model_engine
+
+# 容差以内的IRR偏差（百分点）
+IRR_HALF_TOLERANCE = model_engine.IRR_TOLERANCE_BP / 2
+
+def _fake_run(values):
+    """按精度返回给定指标的 run_arrays 替身"""
+    def run_arrays(params, spot, dtype=None):
+        return {'indicators': {name: np.array(column[dtype]) for name, column in values.items()}}
+    return run_arrays
+
+def _report(monkeypatch, project_irr, npv=None):
+    values = {'project_irr': project_irr, 'equity_irr': {'float64': [10.0, 12.0], 'float32': [10.0, 12.0]},
+              'npv': npv or {'float64': [1.0, 2.0], 'float32': [1.0, 2.0]}}
+    monkeypatch.setattr(model_engine, 'run_arrays', _fake_run(values))
+    params = {'power_mw': np.array([100.0, 100.0])}
+    return model_engine.precision_report(params, np.zeros((2, 20)), indicators=('project_irr', 'equity_irr', 'npv'))
+
+def test_within_tolerance(monkeypatch):
+    report = _report(monkeypatch, {'float64': [8.0, 9.0], 'float32': [8.0, 9.0 + IRR_HALF_TOLERANCE]})
+    assert report['nan_mismatch'] == 0
+    assert report['irr_within_tolerance']
+
+def test_nan_mismatch_fails_tolerance(monkeypatch):
+    report = _report(monkeypatch, {'float64': [8.0, 9.0], 'float32': [8.0, np.nan]})
+    assert report['nan_mismatch'] == 1
+    assert report['indicators']['project_irr'] == 0.0
+    assert not report['irr_within_tolerance']
+
+def test_deviation_above_tolerance(monkeypatch):
+    report = _report(monkeypatch, {'float64': [8.0, 9.0], 'float32': [8.0, 9.0 + 2 * model_engine.IRR_TOLERANCE_BP]})
+    assert not report['irr_within_tolerance']
+
+def test_other_indicator_mismatch_keeps_irr_verdict(monkeypatch):
+    report = _report(monkeypatch, {'float64': [8.0, 9.0], 'float32': [8.0, 9.0]},
+                     npv={'float64': [1.0, np.nan], 'float32': [1.0, 2.0]})
+    assert report['nan_mismatch'] == 1
+    assert report['nan_mismatch_by_indicator'] == {'project_irr': 0, 'equity_irr': 0, 'npv': 1}
+    assert report['irr_within_tolerance']
+
+def test_nan_mismatch_counts_scenarios(monkeypatch):
+    report = _report(monkeypatch, {'float64': [8.0, 9.0], 'float32': [8.0, np.nan]},
+                     npv={'float64': [1.0, np.nan], 'float32': [1.0, 2.0]})
+    assert report['nan_mismatch'] == 1
+    assert not report['irr_within_tolerance']
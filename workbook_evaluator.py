@@ -0,0 +1,440 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+德国独立储能电站财务测算系统 - 工作簿公式求值器
+@description 在本地直接计算 openpyxl 工作簿中的公式（无需Excel），输入单元格可替换为 (情景数,) 数组，
+             一次求值即得到整批情景的结果；支持生成器用到的函数子集，不支持的公式报 FormulaError
+@version 1.0
+"""
+
+import re
+
+import numpy as np
+from openpyxl.utils import column_index_from_string, get_column_letter
+
+# ==================== 公式解析 ====================
+
+class FormulaError(Exception):
+    """公式无法解析或包含不支持的函数/写法"""
+
+class CircularReferenceError(FormulaError):
+    """公式存在循环引用"""
+
+_TOKEN_PATTERN = re.compile(r'''
+    (?P<ws>\s+)
+  | (?P<string>"(?:[^"]|"")*")
+  | (?P<func>[A-Z][A-Z0-9.]*(?=\())
+  | (?P<ref>(?:(?:'(?:[^']|'')+'|[^\s!'"(),+\-*/^&=<>:%{}]+)!)?
+        (?:\$?[A-Z]{1,3}\$?\d+(?::\$?[A-Z]{1,3}\$?\d+)?|\$?[A-Z]{1,3}:\$?[A-Z]{1,3}))
+  | (?P<number>\d+(?:\.\d*)?(?:[eE][+-]?\d+)?|\.\d+(?:[eE][+-]?\d+)?)
+  | (?P<bool>TRUE|FALSE)
+  | (?P<op><>|<=|>=|[-+*/^&=<>%(),])
+''', re.VERBOSE)
+
+_BINARY_PRECEDENCE = {
+    '=': 1, '<>': 1, '<': 1, '>': 1, '<=': 1, '>=': 1,
+    '&': 2,
+    '+': 3, '-': 3,
+    '*': 4, '/': 4,
+    '^': 5,
+}
+
+def _tokenize(formula):
+    """将公式文本（不含开头的=）切分为记号"""
+    tokens = []
+    pos = 0
+    while pos < len(formula):
+        match = _TOKEN_PATTERN.match(formula, pos)
+        if match is None:
+            raise FormulaError(f'无法解析: {formula[pos:pos + 20]!r}')
+        pos = match.end()
+        kind = match.lastgroup
+        if kind != 'ws':
+            tokens.append((kind, match.group()))
+    return tokens
+
+def _parse_reference(text, sheet):
+    """解析单元格/区域引用为 ('ref', 工作表, 列, 行) 或 ('range', 工作表, 起始列, 起始行, 结束列, 结束行)"""
+    if '!' in text:
+        sheet, text = text.rsplit('!', 1)
+        if sheet.startswith("'"):
+            sheet = sheet[1:-1].replace("''", "'")
+    text = text.replace('$', '')
+    if ':' not in text:
+        col, row = re.match(r'([A-Z]+)(\d+)', text).groups()
+        return ('ref', sheet, column_index_from_string(col), int(row))
+    start, end = text.split(':')
+    first = re.match(r'([A-Z]+)(\d*)', start).groups()
+    last = re.match(r'([A-Z]+)(\d*)', end).groups()
+    return ('range', sheet,
+            column_index_from_string(first[0]), int(first[1]) if first[1] else None,
+            column_index_from_string(last[0]), int(last[1]) if last[1] else None)
+
+class _Parser:
+    """递归下降解析器，生成元组形式的语法树"""
+
+    def __init__(self, formula, sheet):
+        self.tokens = _tokenize(formula)
+        self.pos = 0
+        self.sheet = sheet
+
+    def peek(self):
+        return self.tokens[self.pos] if self.pos < len(self.tokens) else (None, None)
+
+    def take(self, value=None):
+        token = self.peek()
+        if value is not None and token[1] != value:
+            raise FormulaError(f'期望 {value!r}，实际为 {token[1]!r}')
+        self.pos += 1
+        return token
+
+    def parse(self):
+        node = self.expression(0)
+        if self.pos != len(self.tokens):
+            raise FormulaError(f'多余的记号: {self.peek()[1]!r}')
+        return node
+
+    def expression(self, min_precedence):
+        left = self.unary()
+        while True:
+            kind, value = self.peek()
+            precedence = _BINARY_PRECEDENCE.get(value) if kind == 'op' else None
+            if precedence is None or precedence < min_precedence:
+                return left
+            self.take()
+            # ^ 在Excel中同样为左结合
+            right = self.expression(precedence + 1)
+            left = ('binary', value, left, right)
+
+    def unary(self):
+        kind, value = self.peek()
+        if kind == 'op' and value in '+-':
+            self.take()
+            operand = self.unary()
+            return ('negate', operand) if value == '-' else operand
+        return self.postfix()
+
+    def postfix(self):
+        node = self.primary()
+        while self.peek() == ('op', '%'):
+            self.take()
+            node = ('binary', '/', node, ('number', 100.0))
+        return node
+
+    def primary(self):
+        kind, value = self.take()
+        if kind == 'number':
+            return ('number', float(value))
+        if kind == 'string':
+            return ('string', value[1:-1].replace('""', '"'))
+        if kind == 'bool':
+            return ('bool', value == 'TRUE')
+        if kind == 'ref':
+            return _parse_reference(value, self.sheet)
+        if kind == 'func':
+            self.take('(')
+            args = []
+            if self.peek() != ('op', ')'):
+                args.append(self.expression(0))
+                while self.peek() == ('op', ','):
+                    self.take()
+                    args.append(self.expression(0))
+            self.take(')')
+            return ('call', value, args)
+        if value == '(':
+            node = self.expression(0)
+            self.take(')')
+            return node
+        raise FormulaError(f'意外的记号: {value!r}')
+
+def parse_formula(formula, sheet):
+    """解析公式（含开头的=），返回语法树"""
+    return _Parser(formula[1:], sheet).parse()
+
+# ==================== 值处理 ====================
+
+def _is_text(value):
+    return isinstance(value, str) or (isinstance(value, np.ndarray) and value.dtype.kind in 'OUS')
+
+def _to_number(value):
+    """按Excel规则转为数值：空单元格为0，数字文本转数值，其他文本为错误（NaN）"""
+    if value is None:
+        return 0.0
+    if isinstance(value, bool):
+        return float(value)
+    if isinstance(value, str):
+        try:
+            return float(value)
+        except ValueError:
+            return np.nan
+    if isinstance(value, np.ndarray) and value.dtype.kind in 'OUS':
+        return np.array([_to_number(v) for v in value.ravel()]).reshape(value.shape)
+    return value
+
+def _is_error(value):
+    """Excel错误值在本求值器中以NaN/±inf表示"""
+    return ~np.isfinite(value)
+
+def _compare(op, left, right):
+    if _is_text(left) or _is_text(right):
+        left = np.char.lower(np.asarray(left, dtype=str)) if left is not None else ''
+        right = np.char.lower(np.asarray(right, dtype=str)) if right is not None else ''
+    else:
+        left, right = _to_number(left), _to_number(right)
+    return {
+        '=': np.equal, '<>': np.not_equal, '<': np.less, '>': np.greater,
+        '<=': np.less_equal, '>=': np.greater_equal,
+    }[op](left, right)
+
+def _criteria_mask(values, criteria):
+    """SUMIF条件：支持 ">0"、"<=5"、"文本" 等写法"""
+    match = re.match(r'^(<>|<=|>=|<|>|=)?(.*)$', str(criteria))
+    op, operand = match.group(1) or '=', match.group(2)
+    try:
+        operand = float(operand)
+    except ValueError:
+        pass
+    return _compare(op, values, operand)
+
+# ==================== 财务函数 ====================
+
+def excel_pmt(rate, nper, pv, fv=0.0, when=0.0):
+    """PMT（与Excel一致的符号约定）"""
+    rate, nper, pv = np.asarray(rate, float), np.asarray(nper, float), np.asarray(pv, float)
+    with np.errstate(divide='ignore', invalid='ignore', over='ignore'):
+        growth = np.power(1 + rate, nper)
+        annuity = -(fv + pv * growth) * rate / ((1 + rate * when) * (growth - 1))
+        return np.where(rate == 0, -(fv + pv) / nper, annuity)
+
+def excel_npv(rate, values):
+    """NPV：第一笔现金流折现一期（Excel语义）"""
+    periods = np.arange(1, values.shape[0] + 1).reshape((-1,) + (1,) * (values.ndim - 1))
+    return np.sum(values / np.power(1 + np.asarray(rate, float), periods), axis=0)
+
+def excel_irr(values, guess=0.1, max_iterations=20, tolerance=1e-7):
+    """IRR：逐情景牛顿迭代（与Excel相同：最多20次、精度0.00001%），未收敛或不高于-100%时返回错误（NaN）"""
+    values = np.asarray(values, dtype=float)
+    if values.ndim == 1:
+        values = values[:, None]
+    periods = np.arange(values.shape[0])[:, None]
+    rate = np.full(values.shape[1], float(guess))
+    converged = np.zeros(values.shape[1], dtype=bool)
+    with np.errstate(divide='ignore', invalid='ignore', over='ignore'):
+        for _ in range(max_iterations):
+            discount = np.power(1 + rate, periods)
+            npv = np.sum(values / discount, axis=0)
+            dnpv = -np.sum(periods * values / (discount * (1 + rate)), axis=0)
+            step = npv / dnpv
+            rate = np.where(converged, rate, rate - step)
+            converged |= np.abs(step) < tolerance
+            if converged.all():
+                break
+    return np.where(converged & np.isfinite(rate) & (rate > -1), rate, np.nan)
+
+# ==================== 求值器 ====================
+
+class WorkbookEvaluator:
+    """
+    工作簿公式求值器
+    @description 单元格按需递归求值并缓存；通过 inputs 覆盖输入单元格，值可为标量、文本或 (情景数,) 数组。
+                 strict=False 时单元格公式出错（无法解析、循环引用等）记入 errors 并按错误值（NaN）继续计算
+    """
+
+    def __init__(self, workbook, inputs=None, strict=True):
+        self.workbook = workbook
+        self.inputs = dict(inputs or {})
+        self.strict = strict
+        self.cache = {}
+        self.errors = {}
+        self.evaluating = set()
+        self.parsed = {}
+
+    def set_inputs(self, inputs):
+        """替换输入单元格并清空计算缓存（解析结果保留，可对多批情景复用）"""
+        self.inputs = dict(inputs)
+        self.cache = {}
+        self.errors = {}
+
+    def value(self, sheet, coordinate):
+        """读取单元格的值，如 value('利润表', 'K4')"""
+        match = re.match(r'([A-Z]+)(\d+)', coordinate)
+        return self.cell(sheet, column_index_from_string(match.group(1)), int(match.group(2)))
+
+    def cell(self, sheet, col, row):
+        key = (sheet, col, row)
+        if key in self.cache:
+            return self.cache[key]
+        coordinate = f'{get_column_letter(col)}{row}'
+        if (sheet, coordinate) in self.inputs:
+            result = self.inputs[(sheet, coordinate)]
+        else:
+            raw = self.workbook[sheet].cell(row, col).value
+            if isinstance(raw, str) and raw.startswith('='):
+                if key in self.evaluating:
+                    raise CircularReferenceError(f'循环引用: {sheet}!{coordinate}')
+                self.evaluating.add(key)
+                try:
+                    if key not in self.parsed:
+                        self.parsed[key] = parse_formula(raw, sheet)
+                    result = self.evaluate(self.parsed[key])
+                except FormulaError as e:
+                    if self.strict:
+                        raise
+                    self.errors.setdefault(f'{sheet}!{coordinate}', str(e))
+                    result = np.nan
+                finally:
+                    self.evaluating.discard(key)
+            else:
+                result = raw
+        self.cache[key] = result
+        return result
+
+    def range_cells(self, node):
+        """展开区域为单元格值列表（整列区域截至工作表的最大行）"""
+        _, sheet, col1, row1, col2, row2 = node
+        if row1 is None:
+            row1, row2 = 1, self.workbook[sheet].max_row
+        return [self.cell(sheet, col, row)
+                for row in range(row1, row2 + 1)
+                for col in range(col1, col2 + 1)]
+
+    def numbers(self, args):
+        """聚合函数的数值参数：区域中的文本与空单元格被忽略，返回 (项数, 情景数) 数组"""
+        items = []
+        for arg in args:
+            if arg[0] == 'range':
+                items.extend(v for v in self.range_cells(arg) if v is not None and not _is_text(v))
+            else:
+                items.append(_to_number(self.evaluate(arg)))
+        if not items:
+            return np.zeros((1, 1))
+        return np.stack(np.broadcast_arrays(*[np.asarray(v, dtype=float) for v in items]))
+
+    def evaluate(self, node):
+        kind = node[0]
+        if kind in ('number', 'string', 'bool'):
+            return node[1]
+        if kind == 'ref':
+            return self.cell(node[1], node[2], node[3])
+        if kind == 'range':
+            raise FormulaError('区域只能作为函数参数使用')
+        if kind == 'negate':
+            return -_to_number(self.evaluate(node[1]))
+        if kind == 'binary':
+            return self.binary(node[1], self.evaluate(node[2]), self.evaluate(node[3]))
+        if kind == 'call':
+            handler = getattr(self, f'fn_{node[1].replace(".", "_")}', None)
+            if handler is None:
+                raise FormulaError(f'不支持的函数: {node[1]}')
+            return handler(node[2])
+        raise FormulaError(f'未知节点: {kind}')
+
+    def binary(self, op, left, right):
+        if op in ('=', '<>', '<', '>', '<=', '>='):
+            return _compare(op, left, right)
+        if op == '&':
+            return np.char.add(np.asarray(left, dtype=str), np.asarray(right, dtype=str))
+        left, right = _to_number(left), _to_number(right)
+        with np.errstate(divide='ignore', invalid='ignore', over='ignore'):
+            if op == '+':
+                return np.add(left, right)
+            if op == '-':
+                return np.subtract(left, right)
+            if op == '*':
+                return np.multiply(left, right)
+            if op == '/':
+                return np.true_divide(left, right)
+            return np.power(left, right)
+
+    # ---------- 逻辑函数 ----------
+
+    def fn_IF(self, args):
+        condition = self.evaluate(args[0])
+
+        def branch(index, default):
+            return self.evaluate(args[index]) if len(args) > index else default
+
+        # 条件为标量时与Excel一样只计算被选中的分支
+        if np.ndim(condition) == 0:
+            return branch(1, True) if condition else branch(2, False)
+        return np.where(condition, _to_number(branch(1, True)), _to_number(branch(2, False)))
+
+    def fn_IFERROR(self, args):
+        value = _to_number(self.evaluate(args[0]))
+        fallback = _to_number(self.evaluate(args[1]))
+        return np.where(_is_error(value), fallback, value)
+
+    def fn_AND(self, args):
+        return np.logical_and.reduce([np.asarray(self.evaluate(arg), dtype=bool) for arg in args])
+
+    def fn_OR(self, args):
+        return np.logical_or.reduce([np.asarray(self.evaluate(arg), dtype=bool) for arg in args])
+
+    # ---------- 数学与统计函数 ----------
+
+    def fn_SUM(self, args):
+        return self.numbers(args).sum(axis=0)
+
+    def fn_AVERAGE(self, args):
+        return self.numbers(args).mean(axis=0)
+
+    def fn_MAX(self, args):
+        return self.numbers(args).max(axis=0)
+
+    def fn_MIN(self, args):
+        return self.numbers(args).min(axis=0)
+
+    def fn_ABS(self, args):
+        return np.abs(_to_number(self.evaluate(args[0])))
+
+    def fn_POWER(self, args):
+        with np.errstate(divide='ignore', invalid='ignore', over='ignore'):
+            return np.power(_to_number(self.evaluate(args[0])), _to_number(self.evaluate(args[1])))
+
+    def fn_SUMIF(self, args):
+        criteria_values = self.range_cells(args[0])
+        sum_values = self.range_cells(args[2]) if len(args) > 2 else criteria_values
+        criteria = self.evaluate(args[1])
+        total = 0.0
+        for test, value in zip(criteria_values, sum_values):
+            if value is None or _is_text(value):
+                continue
+            total = total + np.where(_criteria_mask(test, criteria), value, 0.0)
+        return total
+
+    # ---------- 查找函数 ----------
+
+    def fn_MATCH(self, args):
+        lookup = self.evaluate(args[0])
+        match_type = _to_number(self.evaluate(args[2])) if len(args) > 2 else 1
+        if match_type != 0 or np.ndim(lookup) != 0:
+            raise FormulaError('MATCH仅支持精确匹配标量查找值')
+        for position, candidate in enumerate(self.range_cells(args[1]), 1):
+            if np.ndim(candidate) == 0 and candidate is not None and \
+                    str(candidate).lower() == str(lookup).lower():
+                return position
+        return np.nan
+
+    def fn_INDEX(self, args):
+        _, sheet, col1, row1, col2, row2 = args[0]
+        row_offset = _to_number(self.evaluate(args[1]))
+        col_offset = _to_number(self.evaluate(args[2])) if len(args) > 2 else 1
+        if np.ndim(row_offset) != 0 or np.ndim(col_offset) != 0:
+            raise FormulaError('INDEX仅支持标量位置')
+        if not np.isfinite(row_offset):
+            return np.nan
+        return self.cell(sheet, col1 + int(col_offset) - 1, (row1 or 1) + int(row_offset) - 1)
+
+    # ---------- 财务函数 ----------
+
+    def fn_PMT(self, args):
+        values = [_to_number(self.evaluate(arg)) for arg in args]
+        return excel_pmt(*values)
+
+    def fn_NPV(self, args):
+        rate = _to_number(self.evaluate(args[0]))
+        return excel_npv(rate, self.numbers(args[1:]))
+
+    def fn_IRR(self, args):
+        guess = _to_number(self.evaluate(args[1])) if len(args) > 1 else 0.1
+        return excel_irr(self.numbers(args[:1]), guess)